@@ -7,230 +7,372 @@ Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
 
 import streamlit as st
 import pandas as pd
+import io
 import sys
+from datetime import date, timedelta
 from pathlib import Path
 
 # Agregar path para imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.auth import AuthSystem
 from utils.navegacion import mostrar_sidebar_navegacion
+from utils.publicacion import leer_bytes, publicar_dataset
+from utils.metricas import FASES, obtener_percentiles
+from utils.perfilado import (
+    ORDENES, armar_perfilado, desarmar_perfilado, perfilados_armados,
+    listar_perfiles, obtener_perfil_prof, eliminar_perfil, tabla_perfil
+)
+from utils.retencion import RETENCION_DIAS, aplicar_retencion, años_archivados, fecha_corte, ultimos_mantenimientos
+
 
 # Inicializar sistema de autenticación
 auth = AuthSystem()
 
-# Sidebar de navegación
-mostrar_sidebar_navegacion('admin')
+# Filas por página de los reportes de auditoría
+TAMAÑOS_PAGINA = (50, 100, 250, 500)
+
+# Los resúmenes incluyen lo archivado por la retención; el detalle, solo la base viva
+AVISO_ARCHIVADO = ("El detalle de este período ya fue archivado por la retención: "
+                   "consultalo por año en la pestaña 🗄️ Archivo.")
+
+
+def elegir_periodo(clave):
+    """Rango de fechas de un reporte de auditoría (por defecto, los últimos 30 días)"""
+    hoy = date.today()
+    elegido = st.date_input("Período", value=(hoy - timedelta(days=30), hoy), max_value=hoy, key=f"periodo_{clave}")
+    if isinstance(elegido, (tuple, list)):
+        if len(elegido) == 2:
+            return elegido[0], elegido[1]
+        if len(elegido) == 1:
+            # Mientras se elige el rango, solo el primer día
+            return elegido[0], elegido[0]
+        return None, None
+    return elegido, elegido
+
+
+def paginar_auditoria(clave, filtros, consultar):
+    """
+    Página actual de un reporte de auditoría, con botones para recorrerlo.
+    
+    La paginación es por cursor (fecha_hora, id) de la última fila: cada
+    página es una búsqueda en el índice, sin importar cuán atrás esté.
+    Los cursores de las páginas ya vistas se guardan en la sesión y se
+    descartan cuando cambian los filtros o el tamaño de página.
+    
+    Args:
+        clave: Prefijo de las claves de sesión y de los widgets
+        filtros: Valor hasheable con los filtros del reporte
+        consultar: Función (limit, antes_de) -> lista de filas con 'fecha_hora' e 'id'
+        
+    Returns:
+        Filas de la página actual
+    """
+    tamaño = st.selectbox("Registros por página", TAMAÑOS_PAGINA, index=1, key=f"tam_{clave}")
+    
+    estado = st.session_state.get(f"pag_{clave}")
+    if not estado or estado['filtros'] != (filtros, tamaño):
+        estado = {'filtros': (filtros, tamaño), 'cursores': [None]}
+        st.session_state[f"pag_{clave}"] = estado
+    cursores = estado['cursores']
+    
+    # Una fila de más indica si hay página siguiente
+    filas = consultar(tamaño + 1, cursores[-1])
+    hay_siguiente = len(filas) > tamaño
+    filas = filas[:tamaño]
+    
+    col_ant, col_pag, col_sig = st.columns([1, 2, 1])
+    with col_ant:
+        if st.button("⬅️ Más recientes", key=f"ant_{clave}", disabled=len(cursores) == 1):
+            cursores.pop()
+            st.rerun()
+    with col_pag:
+        st.caption(f"Página {len(cursores)}")
+    with col_sig:
+        if st.button("Más antiguos ➡️", key=f"sig_{clave}", disabled=not hay_siguiente):
+            cursores.append((filas[-1]['fecha_hora'], filas[-1]['id']))
+            st.rerun()
+    
+    return filas
+
+
+def paginar_busqueda(clave, texto, buscar):
+    """
+    Página actual de los resultados de una búsqueda, con botones para recorrerlos.
+    
+    Los resultados van por relevancia, así que se pagina por desplazamiento;
+    la página vuelve a la primera cuando cambia el texto o el tamaño.
+    
+    Args:
+        clave: Prefijo de las claves de sesión y de los widgets
+        texto: Texto buscado
+        buscar: Función (limit, desplazamiento) -> lista de resultados
+        
+    Returns:
+        Resultados de la página actual
+    """
+    tamaño = st.selectbox("Resultados por página", TAMAÑOS_PAGINA, index=0, key=f"tam_{clave}")
+    
+    estado = st.session_state.get(f"pag_{clave}")
+    if not estado or estado['filtros'] != (texto, tamaño):
+        estado = {'filtros': (texto, tamaño), 'pagina': 0}
+        st.session_state[f"pag_{clave}"] = estado
+    
+    # Un resultado de más indica si hay página siguiente
+    filas = buscar(tamaño + 1, estado['pagina'] * tamaño)
+    hay_siguiente = len(filas) > tamaño
+    filas = filas[:tamaño]
+    
+    col_ant, col_pag, col_sig = st.columns([1, 2, 1])
+    with col_ant:
+        if st.button("⬅️ Anteriores", key=f"ant_{clave}", disabled=estado['pagina'] == 0):
+            estado['pagina'] -= 1
+            st.rerun()
+    with col_pag:
+        st.caption(f"Página {estado['pagina'] + 1}")
+    with col_sig:
+        if st.button("Siguientes ➡️", key=f"sig_{clave}", disabled=not hay_siguiente):
+            estado['pagina'] += 1
+            st.rerun()
+    
+    return filas
+
+
+def render():
+    """Dibuja el panel de administración (se ejecuta en cada rerun)"""
+    # Sidebar de navegación
+    mostrar_sidebar_navegacion('admin')
 
-st.markdown("# ⚙️ ADMINISTRACIÓN DEL SISTEMA")
-st.markdown("---")
+    st.markdown("# ⚙️ ADMINISTRACIÓN DEL SISTEMA")
+    st.markdown("---")
 
-# Verificar nivel de acceso
-if 'usuario' not in st.session_state or st.session_state.usuario.get('nivel') not in ['superadmin', 'admin']:
-    st.error("⚠️ Acceso denegado. Solo administradores pueden acceder a esta sección.")
-    st.stop()
+    # Verificar nivel de acceso
+    if 'usuario' not in st.session_state or st.session_state.usuario.get('nivel') not in ['superadmin', 'admin']:
+        st.error("⚠️ Acceso denegado. Solo administradores pueden acceder a esta sección.")
+        st.stop()
 
-es_superadmin = st.session_state.usuario.get('nivel') == 'superadmin'
-es_admin = st.session_state.usuario.get('nivel') == 'admin'
+    es_superadmin = st.session_state.usuario.get('nivel') == 'superadmin'
+    es_admin = st.session_state.usuario.get('nivel') == 'admin'
 
-# Tabs según nivel de acceso
-if es_superadmin:
-    tabs = st.tabs(["👥 Gestión de Usuarios", "📊 Edición de Datasets", "📈 Reportes de Auditoría"])
-    tab1, tab2, tab3 = tabs[0], tabs[1], tabs[2]
-else:  # admin
-    tab1 = st.tabs(["👥 Gestión de Usuarios"])[0]
-    tab2 = None
-    tab3 = None
+    # Tabs según nivel de acceso
+    if es_superadmin:
+        tabs = st.tabs(["👥 Gestión de Usuarios", "📊 Edición de Datasets", "📈 Reportes de Auditoría"])
+        tab1, tab2, tab3 = tabs[0], tabs[1], tabs[2]
+    else:  # admin
+        tab1 = st.tabs(["👥 Gestión de Usuarios"])[0]
+        tab2 = None
+        tab3 = None
 
-# TAB 1: GESTIÓN DE USUARIOS
-with tab1:
-    st.markdown("## 👥 Gestión de Usuarios")
+    # TAB 1: GESTIÓN DE USUARIOS
+    with tab1:
+        st.markdown("## 👥 Gestión de Usuarios")
     
-    subtab1, subtab2, subtab3 = st.tabs(["Crear Usuario", "Ver Usuarios", "Modificar"])
+        subtab1, subtab2, subtab3 = st.tabs(["Crear Usuario", "Ver Usuarios", "Modificar"])
     
-    with subtab1:
-        st.markdown("### ➕ Crear Nuevo Usuario")
+        with subtab1:
+            st.markdown("### ➕ Crear Nuevo Usuario")
         
-        with st.form("form_crear_usuario"):
-            col1, col2 = st.columns(2)
+            with st.form("form_crear_usuario"):
+                col1, col2 = st.columns(2)
             
-            with col1:
-                nuevo_username = st.text_input("Nombre de usuario*", max_chars=50)
-                nuevo_nombre = st.text_input("Nombre completo", max_chars=100)
-                nuevo_cargo = st.text_input("Cargo en el Tribunal", max_chars=100, 
-                                            placeholder="Ej: Juez, Secretario, Prosecretario, Empleado...")
+                with col1:
+                    nuevo_username = st.text_input("Nombre de usuario*", max_chars=50)
+                    nuevo_nombre = st.text_input("Nombre completo", max_chars=100)
+                    nuevo_cargo = st.text_input("Cargo en el Tribunal", max_chars=100, 
+                                                placeholder="Ej: Juez, Secretario, Prosecretario, Empleado...")
             
-            with col2:
-                nuevo_password = st.text_input("Contraseña*", type="password", max_chars=50)
-                nuevo_email = st.text_input("Email", max_chars=100)
+                with col2:
+                    nuevo_password = st.text_input("Contraseña*", type="password", max_chars=50)
+                    nuevo_email = st.text_input("Email", max_chars=100)
                 
-                # Niveles según quien crea
-                if es_superadmin:
-                    opciones_nivel = ["usuario", "admin", "superadmin"]
-                    ayuda_nivel = "superadmin: acceso total | admin: gestiona usuarios | usuario: solo usa apps"
-                else:  # admin
-                    opciones_nivel = ["usuario", "admin"]
-                    ayuda_nivel = "admin: gestiona usuarios | usuario: solo usa apps"
+                    # Niveles según quien crea
+                    if es_superadmin:
+                        opciones_nivel = ["usuario", "admin", "superadmin"]
+                        ayuda_nivel = "superadmin: acceso total | admin: gestiona usuarios | usuario: solo usa apps"
+                    else:  # admin
+                        opciones_nivel = ["usuario", "admin"]
+                        ayuda_nivel = "admin: gestiona usuarios | usuario: solo usa apps"
                 
-                nuevo_nivel = st.selectbox("Nivel de acceso*", opciones_nivel, help=ayuda_nivel)
+                    nuevo_nivel = st.selectbox("Nivel de acceso*", opciones_nivel, help=ayuda_nivel)
             
-            submitted = st.form_submit_button("Crear Usuario", use_container_width=True, type="primary")
+                submitted = st.form_submit_button("Crear Usuario", use_container_width=True, type="primary")
             
-            if submitted:
-                if not nuevo_username or not nuevo_password:
-                    st.error("Usuario y contraseña son obligatorios")
-                else:
-                    exito, mensaje = auth.crear_usuario(
-                        username=nuevo_username,
-                        password=nuevo_password,
-                        nivel=nuevo_nivel,
-                        nombre_completo=nuevo_nombre,
-                        cargo=nuevo_cargo,
-                        email=nuevo_email,
-                        creado_por=st.session_state.usuario['username']
-                    )
-                    
-                    if exito:
-                        st.success(mensaje)
-                        st.rerun()
+                if submitted:
+                    if not nuevo_username or not nuevo_password:
+                        st.error("Usuario y contraseña son obligatorios")
                     else:
-                        st.error(mensaje)
+                        exito, mensaje = auth.crear_usuario(
+                            username=nuevo_username,
+                            password=nuevo_password,
+                            nivel=nuevo_nivel,
+                            nombre_completo=nuevo_nombre,
+                            cargo=nuevo_cargo,
+                            email=nuevo_email,
+                            creado_por=st.session_state.usuario['username']
+                        )
+                    
+                        if exito:
+                            st.success(mensaje)
+                            st.rerun()
+                        else:
+                            st.error(mensaje)
     
-    with subtab2:
-        st.markdown("### 📋 Usuarios del Sistema")
+        with subtab2:
+            st.markdown("### 📋 Usuarios del Sistema")
         
-        usuarios = auth.listar_usuarios()
+            texto_usuarios = st.text_input("🔎 Buscar", placeholder="Usuario, nombre, cargo o email",
+                                           key="buscar_usuarios")
+            if texto_usuarios.strip():
+                usuarios = paginar_busqueda(
+                    "buscar_usuarios", texto_usuarios,
+                    lambda limit, desplazamiento: auth.buscar_usuarios(texto_usuarios, limit, desplazamiento)
+                )
+            else:
+                usuarios = auth.listar_usuarios()
         
-        if usuarios:
-            df_usuarios = pd.DataFrame(usuarios)
-            df_display = df_usuarios[['username', 'nivel', 'nombre_completo', 'cargo', 'email', 'ultimo_acceso', 'activo']].copy()
-            df_display.columns = ['Usuario', 'Nivel', 'Nombre', 'Cargo', 'Email', 'Último Acceso', 'Activo']
-            df_display['Activo'] = df_display['Activo'].map({1: '✅', 0: '❌'})
+            if usuarios:
+                df_usuarios = pd.DataFrame(usuarios)
+                df_display = df_usuarios[['username', 'nivel', 'nombre_completo', 'cargo', 'email', 'ultimo_acceso', 'activo']].copy()
+                df_display.columns = ['Usuario', 'Nivel', 'Nombre', 'Cargo', 'Email', 'Último Acceso', 'Activo']
+                df_display['Activo'] = df_display['Activo'].map({1: '✅', 0: '❌'})
             
-            st.dataframe(df_display, use_container_width=True, hide_index=True)
-            st.caption(f"Total de usuarios: {len(usuarios)}")
-        else:
-            st.info("No hay usuarios en el sistema")
+                st.dataframe(df_display, use_container_width=True, hide_index=True)
+                if not texto_usuarios.strip():
+                    st.caption(f"Total de usuarios: {len(usuarios)}")
+            elif texto_usuarios.strip():
+                st.info("Ningún usuario coincide con la búsqueda")
+            else:
+                st.info("No hay usuarios en el sistema")
     
-    with subtab3:
-        st.markdown("### ✏️ Modificar Usuario")
-        
-        usuarios = auth.listar_usuarios()
-        usernames = [u['username'] for u in usuarios]
-        
-        usuario_sel = st.selectbox("Seleccionar usuario", usernames)
-        usuario_data = auth.obtener_usuario(usuario_sel)
-        
-        if usuario_data:
-            # Mostrar datos actuales
-            st.info(f"**Nivel actual:** {usuario_data['nivel']} | **Cargo:** {usuario_data.get('cargo', 'N/A')}")
-            
-            # Editar datos básicos
-            st.markdown("#### ✏️ Editar Datos")
-            with st.form("form_editar_datos"):
-                col_a, col_b = st.columns(2)
-                with col_a:
-                    nuevo_nombre = st.text_input("Nombre completo", value=usuario_data.get('nombre_completo', ''))
-                    nuevo_cargo = st.text_input("Cargo", value=usuario_data.get('cargo', ''))
-                with col_b:
-                    nuevo_email = st.text_input("Email", value=usuario_data.get('email', ''))
-                    if es_superadmin:
-                        nuevo_nivel = st.selectbox("Nivel", ["usuario", "admin", "superadmin"], 
-                                                   index=["usuario", "admin", "superadmin"].index(usuario_data['nivel']))
-                    else:
-                        st.text_input("Nivel (no modificable)", value=usuario_data['nivel'], disabled=True)
-                        nuevo_nivel = usuario_data['nivel']
-                
-                if st.form_submit_button("💾 Guardar Cambios", use_container_width=True):
-                    exito, mensaje = auth.modificar_usuario(
-                        username=usuario_sel,
-                        modificado_por=st.session_state.usuario['username'],
-                        nombre_completo=nuevo_nombre,
-                        cargo=nuevo_cargo,
-                        email=nuevo_email,
-                        nivel=nuevo_nivel if es_superadmin else None
-                    )
-                    if exito:
-                        st.success(mensaje)
-                        st.rerun()
-                    else:
-                        st.error(mensaje)
-            
-            st.markdown("---")
-            
-            col1, col2 = st.columns(2)
-            
-            # Solo superadmin puede cambiar contraseñas
-            with col1:
-                st.markdown("#### 🔑 Cambiar Contraseña")
-                if es_superadmin:
-                    with st.form("form_cambiar_pass"):
-                        nueva_pass = st.text_input("Nueva contraseña", type="password")
-                        confirmar_pass = st.text_input("Confirmar contraseña", type="password")
-                        
-                        if st.form_submit_button("Cambiar Contraseña"):
-                            if nueva_pass != confirmar_pass:
-                                st.error("Las contraseñas no coinciden")
-                            elif nueva_pass:
-                                exito, mensaje = auth.cambiar_password(
-                                    username=usuario_sel,
-                                    nueva_password=nueva_pass,
-                                    cambiado_por=st.session_state.usuario['username']
-                                )
-                                if exito:
-                                    st.success(mensaje)
-                                else:
-                                    st.error(mensaje)
-                else:
-                    st.warning("⚠️ Solo el Administrador General puede cambiar contraseñas")
+        with subtab3:
+            st.markdown("### ✏️ Modificar Usuario")
+        
+            usuarios = auth.listar_usuarios()
+            usernames = [u['username'] for u in usuarios]
+        
+            usuario_sel = st.selectbox("Seleccionar usuario", usernames)
+            usuario_data = auth.obtener_usuario(usuario_sel)
+        
+            if usuario_data:
+                # Mostrar datos actuales
+                st.info(f"**Nivel actual:** {usuario_data['nivel']} | **Cargo:** {usuario_data.get('cargo', 'N/A')}")
             
-            # Superadmin y admin pueden eliminar usuarios
-            with col2:
-                st.markdown("#### 🗑️ Eliminar Usuario")
-                if es_superadmin or es_admin:
-                    st.warning(f"¿Eliminar usuario **{usuario_sel}**?")
-                    
-                    if st.button("🗑️ Eliminar", type="secondary", use_container_width=True):
-                        exito, mensaje = auth.eliminar_usuario(
+                # Editar datos básicos
+                st.markdown("#### ✏️ Editar Datos")
+                with st.form("form_editar_datos"):
+                    col_a, col_b = st.columns(2)
+                    with col_a:
+                        nuevo_nombre = st.text_input("Nombre completo", value=usuario_data.get('nombre_completo', ''))
+                        nuevo_cargo = st.text_input("Cargo", value=usuario_data.get('cargo', ''))
+                    with col_b:
+                        nuevo_email = st.text_input("Email", value=usuario_data.get('email', ''))
+                        if es_superadmin:
+                            nuevo_nivel = st.selectbox("Nivel", ["usuario", "admin", "superadmin"], 
+                                                       index=["usuario", "admin", "superadmin"].index(usuario_data['nivel']))
+                        else:
+                            st.text_input("Nivel (no modificable)", value=usuario_data['nivel'], disabled=True)
+                            nuevo_nivel = usuario_data['nivel']
+                
+                    if st.form_submit_button("💾 Guardar Cambios", use_container_width=True):
+                        exito, mensaje = auth.modificar_usuario(
                             username=usuario_sel,
-                            eliminado_por=st.session_state.usuario['username']
+                            modificado_por=st.session_state.usuario['username'],
+                            nombre_completo=nuevo_nombre,
+                            cargo=nuevo_cargo,
+                            email=nuevo_email,
+                            nivel=nuevo_nivel if es_superadmin else None
                         )
                         if exito:
                             st.success(mensaje)
                             st.rerun()
                         else:
                             st.error(mensaje)
-                else:
-                    st.warning("⚠️ Solo administradores pueden eliminar usuarios")
+            
+                st.markdown("---")
+            
+                col1, col2 = st.columns(2)
+            
+                # Solo superadmin puede cambiar contraseñas
+                with col1:
+                    st.markdown("#### 🔑 Cambiar Contraseña")
+                    if es_superadmin:
+                        with st.form("form_cambiar_pass"):
+                            nueva_pass = st.text_input("Nueva contraseña", type="password")
+                            confirmar_pass = st.text_input("Confirmar contraseña", type="password")
+                        
+                            if st.form_submit_button("Cambiar Contraseña"):
+                                if nueva_pass != confirmar_pass:
+                                    st.error("Las contraseñas no coinciden")
+                                elif nueva_pass:
+                                    exito, mensaje = auth.cambiar_password(
+                                        username=usuario_sel,
+                                        nueva_password=nueva_pass,
+                                        cambiado_por=st.session_state.usuario['username']
+                                    )
+                                    if exito:
+                                        st.success(mensaje)
+                                    else:
+                                        st.error(mensaje)
+                    else:
+                        st.warning("⚠️ Solo el Administrador General puede cambiar contraseñas")
+            
+                # Superadmin y admin pueden eliminar usuarios
+                with col2:
+                    st.markdown("#### 🗑️ Eliminar Usuario")
+                    if es_superadmin or es_admin:
+                        st.warning(f"¿Eliminar usuario **{usuario_sel}**?")
+                    
+                        if st.button("🗑️ Eliminar", type="secondary", use_container_width=True):
+                            exito, mensaje = auth.eliminar_usuario(
+                                username=usuario_sel,
+                                eliminado_por=st.session_state.usuario['username']
+                            )
+                            if exito:
+                                st.success(mensaje)
+                                st.rerun()
+                            else:
+                                st.error(mensaje)
+                    else:
+                        st.warning("⚠️ Solo administradores pueden eliminar usuarios")
 
-# TAB 2: EDICIÓN DE DATASETS (solo superadmin)
-if tab2 and es_superadmin:
-    with tab2:
-        st.markdown("## 📊 Edición de Datasets")
+    # TAB 2: EDICIÓN DE DATASETS (solo superadmin)
+    if tab2 and es_superadmin:
+        with tab2:
+            st.markdown("## 📊 Edición de Datasets")
     
-        datasets = {
-            "JUS": "data/Dataset_JUS.csv",
-            "IPC": "data/dataset_ipc.csv",
-            "RIPTE": "data/dataset_ripte.csv",
-            "Pisos Salariales": "data/dataset_pisos.csv",
-            "Tasa Activa": "data/dataset_tasa.csv"
-        }
+            datasets = {
+                "JUS": "data/Dataset_JUS.csv",
+                "IPC": "data/dataset_ipc.csv",
+                "RIPTE": "data/dataset_ripte.csv",
+                "Pisos Salariales": "data/dataset_pisos.csv",
+                "Tasa Activa": "data/dataset_tasa.csv"
+            }
+        
+            # Clave de cada dataset para publicar los cambios (ver utils/esquemas.py)
+            claves_dataset = {
+                "JUS": "jus",
+                "IPC": "ipc",
+                "RIPTE": "ripte",
+                "Pisos Salariales": "pisos",
+                "Tasa Activa": "tasa"
+            }
     
-        dataset_sel = st.selectbox("Seleccionar dataset", list(datasets.keys()))
-        archivo = datasets[dataset_sel]
+            dataset_sel = st.selectbox("Seleccionar dataset", list(datasets.keys()))
+            archivo = datasets[dataset_sel]
     
-        try:
-            df = pd.read_csv(archivo, encoding='utf-8')
+            try:
+                # Lectura de una versión completa aunque otro usuario esté publicando
+                df = pd.read_csv(io.BytesIO(leer_bytes(archivo)), encoding='utf-8')
         
-            st.markdown(f"### 📄 {dataset_sel}")
-            st.caption(f"📁 `{archivo}` • 📊 {len(df)} filas • 📋 {len(df.columns)} columnas")
+                st.markdown(f"### 📄 {dataset_sel}")
+                st.caption(f"📁 `{archivo}` • 📊 {len(df)} filas • 📋 {len(df.columns)} columnas")
         
-            st.markdown("---")
+                st.markdown("---")
               
-            # Sistema de edición custom
-            st.markdown("#### ✏️ Editor de Datos")
+                # Sistema de edición custom
+                st.markdown("#### ✏️ Editor de Datos")
         
-            # CSS para compactar filas
-            st.markdown("""
+                # CSS para compactar filas
+                st.markdown("""
             <style>
             /* Compactar contenedores */
             div[data-testid="stVerticalBlock"] > div:has(div[data-testid="column"]) {
@@ -272,336 +414,687 @@ if tab2 and es_superadmin:
             </style>
             """, unsafe_allow_html=True)
         
-            # Inicializar estado si no existe
-            if f'df_edit_{dataset_sel}' not in st.session_state:
-                st.session_state[f'df_edit_{dataset_sel}'] = df.copy()
-        
-            if f'editing_row_{dataset_sel}' not in st.session_state:
-                st.session_state[f'editing_row_{dataset_sel}'] = None
-        
-            # Estado de paginación
-            if f'rows_visible_{dataset_sel}' not in st.session_state:
-                st.session_state[f'rows_visible_{dataset_sel}'] = 10  # Mostrar 10 inicialmente
-        
-            df_trabajo = st.session_state[f'df_edit_{dataset_sel}']
-            rows_visible = st.session_state[f'rows_visible_{dataset_sel}']
-        
-            # Botón para agregar nueva fila - Pequeño a la izquierda
-            col_btn_agregar, col_espacio = st.columns([1, 5])
-            with col_btn_agregar:
-                if st.button("➕ Agregar", type="secondary", use_container_width=True, key=f"add_top_{dataset_sel}"):
-                    # Crear fila vacía
-                    nueva_fila = pd.DataFrame([{col: "" for col in df_trabajo.columns}])
-                    # Agregar al INICIO (arriba)
-                    df_trabajo = pd.concat([nueva_fila, df_trabajo], ignore_index=True)
-                    st.session_state[f'df_edit_{dataset_sel}'] = df_trabajo
-                    # Poner en modo edición la nueva fila (índice 0)
-                    st.session_state[f'editing_row_{dataset_sel}'] = 0
-                    st.rerun()
-        
-            st.markdown("")  # Pequeño espacio
-        
-            # ENCABEZADOS DE COLUMNAS
-            cols_header = st.columns([0.3] + [2] * len(df_trabajo.columns) + [0.8])
-        
-            with cols_header[0]:
-                st.markdown("<div class='compact-text'><b>#</b></div>", unsafe_allow_html=True)
-        
-            for col_idx, columna in enumerate(df_trabajo.columns):
-                with cols_header[col_idx + 1]:
-                    st.markdown(f"<div class='compact-text'><b>{columna}</b></div>", unsafe_allow_html=True)
-        
-            with cols_header[-1]:
-                st.markdown("<div class='compact-text'><b>Acciones</b></div>", unsafe_allow_html=True)
-        
-            st.markdown("<hr style='margin: 0.3rem 0; border-width: 2px; border-color: #333;'>", unsafe_allow_html=True)
-        
-            # Mostrar tabla con botones (solo filas visibles)
-            if len(df_trabajo) > 0:
-                # Determinar cuántas filas mostrar
-                filas_a_mostrar = min(rows_visible, len(df_trabajo))
-            
-                for idx in range(filas_a_mostrar):
-                    cols = st.columns([0.3] + [2] * len(df_trabajo.columns) + [0.8])
-                
-                    # Número de fila
-                    with cols[0]:
-                        st.markdown(f"<div class='compact-text'><b>{idx}</b></div>", unsafe_allow_html=True)
-                
-                    # Si está editando esta fila
-                    if st.session_state[f'editing_row_{dataset_sel}'] == idx:
-                        # Modo edición
-                        nuevos_valores = {}
-                        for col_idx, columna in enumerate(df_trabajo.columns):
-                            with cols[col_idx + 1]:
-                                valor_actual = df_trabajo.iloc[idx][columna]
-                                nuevos_valores[columna] = st.text_input(
-                                    columna,
-                                    value=str(valor_actual) if pd.notna(valor_actual) else "",
-                                    key=f"edit_{dataset_sel}_{idx}_{columna}",
-                                    label_visibility="collapsed"
-                                )
+                # Inicializar estado si no existe
+                if f'df_edit_{dataset_sel}' not in st.session_state:
+                    st.session_state[f'df_edit_{dataset_sel}'] = df.copy()
+        
+                if f'editing_row_{dataset_sel}' not in st.session_state:
+                    st.session_state[f'editing_row_{dataset_sel}'] = None
+        
+                # Estado de paginación
+                if f'rows_visible_{dataset_sel}' not in st.session_state:
+                    st.session_state[f'rows_visible_{dataset_sel}'] = 10  # Mostrar 10 inicialmente
+        
+                df_trabajo = st.session_state[f'df_edit_{dataset_sel}']
+                rows_visible = st.session_state[f'rows_visible_{dataset_sel}']
+        
+                # Botón para agregar nueva fila - Pequeño a la izquierda
+                col_btn_agregar, col_espacio = st.columns([1, 5])
+                with col_btn_agregar:
+                    if st.button("➕ Agregar", type="secondary", use_container_width=True, key=f"add_top_{dataset_sel}"):
+                        # Crear fila vacía
+                        nueva_fila = pd.DataFrame([{col: "" for col in df_trabajo.columns}])
+                        # Agregar al INICIO (arriba)
+                        df_trabajo = pd.concat([nueva_fila, df_trabajo], ignore_index=True)
+                        st.session_state[f'df_edit_{dataset_sel}'] = df_trabajo
+                        # Poner en modo edición la nueva fila (índice 0)
+                        st.session_state[f'editing_row_{dataset_sel}'] = 0
+                        st.rerun()
+        
+                st.markdown("")  # Pequeño espacio
+        
+                # ENCABEZADOS DE COLUMNAS
+                cols_header = st.columns([0.3] + [2] * len(df_trabajo.columns) + [0.8])
+        
+                with cols_header[0]:
+                    st.markdown("<div class='compact-text'><b>#</b></div>", unsafe_allow_html=True)
+        
+                for col_idx, columna in enumerate(df_trabajo.columns):
+                    with cols_header[col_idx + 1]:
+                        st.markdown(f"<div class='compact-text'><b>{columna}</b></div>", unsafe_allow_html=True)
+        
+                with cols_header[-1]:
+                    st.markdown("<div class='compact-text'><b>Acciones</b></div>", unsafe_allow_html=True)
+        
+                st.markdown("<hr style='margin: 0.3rem 0; border-width: 2px; border-color: #333;'>", unsafe_allow_html=True)
+        
+                # Mostrar tabla con botones (solo filas visibles)
+                if len(df_trabajo) > 0:
+                    # Determinar cuántas filas mostrar
+                    filas_a_mostrar = min(rows_visible, len(df_trabajo))
+            
+                    for idx in range(filas_a_mostrar):
+                        cols = st.columns([0.3] + [2] * len(df_trabajo.columns) + [0.8])
+                
+                        # Número de fila
+                        with cols[0]:
+                            st.markdown(f"<div class='compact-text'><b>{idx}</b></div>", unsafe_allow_html=True)
+                
+                        # Si está editando esta fila
+                        if st.session_state[f'editing_row_{dataset_sel}'] == idx:
+                            # Modo edición
+                            nuevos_valores = {}
+                            for col_idx, columna in enumerate(df_trabajo.columns):
+                                with cols[col_idx + 1]:
+                                    valor_actual = df_trabajo.iloc[idx][columna]
+                                    nuevos_valores[columna] = st.text_input(
+                                        columna,
+                                        value=str(valor_actual) if pd.notna(valor_actual) else "",
+                                        key=f"edit_{dataset_sel}_{idx}_{columna}",
+                                        label_visibility="collapsed"
+                                    )
                     
-                        # Botones de acción
-                        with cols[-1]:
-                            col_save, col_cancel = st.columns(2)
-                            with col_save:
-                                if st.button("✅", key=f"save_{dataset_sel}_{idx}", help="Guardar"):
-                                    # Actualizar fila
-                                    for col, val in nuevos_valores.items():
-                                        df_trabajo.at[idx, col] = val
-                                    st.session_state[f'df_edit_{dataset_sel}'] = df_trabajo
-                                    st.session_state[f'editing_row_{dataset_sel}'] = None
-                                    st.rerun()
+                            # Botones de acción
+                            with cols[-1]:
+                                col_save, col_cancel = st.columns(2)
+                                with col_save:
+                                    if st.button("✅", key=f"save_{dataset_sel}_{idx}", help="Guardar"):
+                                        # Actualizar fila
+                                        for col, val in nuevos_valores.items():
+                                            df_trabajo.at[idx, col] = val
+                                        st.session_state[f'df_edit_{dataset_sel}'] = df_trabajo
+                                        st.session_state[f'editing_row_{dataset_sel}'] = None
+                                        st.rerun()
                         
-                            with col_cancel:
-                                if st.button("❌", key=f"cancel_{dataset_sel}_{idx}", help="Cancelar"):
-                                    st.session_state[f'editing_row_{dataset_sel}'] = None
-                                    st.rerun()
-                    else:
-                        # Modo visualización
-                        for col_idx, columna in enumerate(df_trabajo.columns):
-                            with cols[col_idx + 1]:
-                                valor = df_trabajo.iloc[idx][columna]
-                                st.markdown(f"<div class='compact-text'>{str(valor) if pd.notna(valor) else ''}</div>", unsafe_allow_html=True)
+                                with col_cancel:
+                                    if st.button("❌", key=f"cancel_{dataset_sel}_{idx}", help="Cancelar"):
+                                        st.session_state[f'editing_row_{dataset_sel}'] = None
+                                        st.rerun()
+                        else:
+                            # Modo visualización
+                            for col_idx, columna in enumerate(df_trabajo.columns):
+                                with cols[col_idx + 1]:
+                                    valor = df_trabajo.iloc[idx][columna]
+                                    st.markdown(f"<div class='compact-text'>{str(valor) if pd.notna(valor) else ''}</div>", unsafe_allow_html=True)
                     
-                        # Botones de acción
-                        with cols[-1]:
-                            col_edit, col_delete = st.columns(2)
-                            with col_edit:
-                                if st.button("✏️", key=f"edit_btn_{dataset_sel}_{idx}", help="Editar"):
-                                    st.session_state[f'editing_row_{dataset_sel}'] = idx
-                                    st.rerun()
+                            # Botones de acción
+                            with cols[-1]:
+                                col_edit, col_delete = st.columns(2)
+                                with col_edit:
+                                    if st.button("✏️", key=f"edit_btn_{dataset_sel}_{idx}", help="Editar"):
+                                        st.session_state[f'editing_row_{dataset_sel}'] = idx
+                                        st.rerun()
                         
-                            with col_delete:
-                                if st.button("🗑️", key=f"delete_{dataset_sel}_{idx}", help="Eliminar"):
-                                    df_trabajo = df_trabajo.drop(idx).reset_index(drop=True)
-                                    st.session_state[f'df_edit_{dataset_sel}'] = df_trabajo
-                                    st.rerun()
+                                with col_delete:
+                                    if st.button("🗑️", key=f"delete_{dataset_sel}_{idx}", help="Eliminar"):
+                                        df_trabajo = df_trabajo.drop(idx).reset_index(drop=True)
+                                        st.session_state[f'df_edit_{dataset_sel}'] = df_trabajo
+                                        st.rerun()
                 
-                    st.markdown("<hr style='margin: 0.15rem 0; border-color: #e0e0e0;'>", unsafe_allow_html=True)
+                        st.markdown("<hr style='margin: 0.15rem 0; border-color: #e0e0e0;'>", unsafe_allow_html=True)
             
-                # Botones de paginación
-                total_filas = len(df_trabajo)
-                if total_filas > 10:
-                    st.markdown("")  # Espacio
+                    # Botones de paginación
+                    total_filas = len(df_trabajo)
+                    if total_filas > 10:
+                        st.markdown("")  # Espacio
                 
-                    col_pag1, col_pag2, col_pag3, col_pag4 = st.columns([2, 2, 2, 4])
+                        col_pag1, col_pag2, col_pag3, col_pag4 = st.columns([2, 2, 2, 4])
                 
-                    with col_pag1:
-                        # Botón cargar 10 más
-                        if rows_visible < total_filas:
-                            if st.button("⬇️ Cargar 10 más", use_container_width=True, key=f"load_more_{dataset_sel}"):
-                                st.session_state[f'rows_visible_{dataset_sel}'] = min(rows_visible + 10, total_filas)
-                                st.rerun()
+                        with col_pag1:
+                            # Botón cargar 10 más
+                            if rows_visible < total_filas:
+                                if st.button("⬇️ Cargar 10 más", use_container_width=True, key=f"load_more_{dataset_sel}"):
+                                    st.session_state[f'rows_visible_{dataset_sel}'] = min(rows_visible + 10, total_filas)
+                                    st.rerun()
                 
-                    with col_pag2:
-                        # Botón mostrar todo
-                        if rows_visible < total_filas:
-                            if st.button("📄 Mostrar Todo", use_container_width=True, key=f"show_all_{dataset_sel}"):
-                                st.session_state[f'rows_visible_{dataset_sel}'] = total_filas
-                                st.rerun()
+                        with col_pag2:
+                            # Botón mostrar todo
+                            if rows_visible < total_filas:
+                                if st.button("📄 Mostrar Todo", use_container_width=True, key=f"show_all_{dataset_sel}"):
+                                    st.session_state[f'rows_visible_{dataset_sel}'] = total_filas
+                                    st.rerun()
                 
-                    with col_pag3:
-                        # Botón colapsar
-                        if rows_visible > 10:
-                            if st.button("⬆️ Mostrar menos", use_container_width=True, key=f"collapse_{dataset_sel}"):
-                                st.session_state[f'rows_visible_{dataset_sel}'] = 10
-                                st.rerun()
+                        with col_pag3:
+                            # Botón colapsar
+                            if rows_visible > 10:
+                                if st.button("⬆️ Mostrar menos", use_container_width=True, key=f"collapse_{dataset_sel}"):
+                                    st.session_state[f'rows_visible_{dataset_sel}'] = 10
+                                    st.rerun()
                 
-                    with col_pag4:
-                        st.caption(f"Mostrando {rows_visible} de {total_filas} filas")
+                        with col_pag4:
+                            st.caption(f"Mostrando {rows_visible} de {total_filas} filas")
         
-            else:
-                st.info("📝 No hay datos. Usa el botón '➕ Agregar' de arriba para comenzar.")
+                else:
+                    st.info("📝 No hay datos. Usa el botón '➕ Agregar' de arriba para comenzar.")
         
-            st.markdown("---")
+                st.markdown("---")
         
-            # Botones de acción
-            col1, col2, col3 = st.columns([2, 2, 6])
+                # Botones de acción
+                col1, col2, col3 = st.columns([2, 2, 6])
         
-            with col1:
-                if st.button("💾 Guardar Cambios", type="primary", use_container_width=True):
-                    try:
-                        df_trabajo = st.session_state[f'df_edit_{dataset_sel}']
+                with col1:
+                    if st.button("💾 Guardar Cambios", type="primary", use_container_width=True):
+                        try:
+                            df_trabajo = st.session_state[f'df_edit_{dataset_sel}']
                     
-                        # Ordenar según el tipo de dataset
-                        if dataset_sel == "Tasa Activa":
-                            # Mantener orden descendente por fecha
-                            if 'Desde' in df_trabajo.columns:
-                                df_trabajo['Desde'] = pd.to_datetime(
-                                    df_trabajo['Desde'],
-                                    dayfirst=True,
-                                    format='mixed'
-                                )
-                                df_trabajo = df_trabajo.sort_values('Desde', ascending=False)
+                            # Ordenar según el tipo de dataset
+                            if dataset_sel == "Tasa Activa":
+                                # Mantener orden descendente por fecha (sin reescribir
+                                # la columna, que conserva el formato dd/mm/aaaa)
+                                if 'Desde' in df_trabajo.columns:
+                                    fechas_desde = pd.to_datetime(
+                                        df_trabajo['Desde'],
+                                        dayfirst=True,
+                                        format='mixed'
+                                    )
+                                    orden = fechas_desde.sort_values(ascending=False, kind='stable').index
+                                    df_trabajo = df_trabajo.loc[orden]
                     
-                        df_trabajo.to_csv(archivo, index=False, encoding='utf-8')
-                        st.success("✅ Cambios guardados exitosamente")
+                            # Nueva versión escrita aparte y reemplazo atómico del CSV vigente;
+                            # luego se invalida y reconstruye en segundo plano solo este dataset
+                            publicar_dataset(claves_dataset[dataset_sel], df_trabajo)
+                            st.success("✅ Cambios guardados exitosamente")
                     
-                        # Resetear estado
-                        del st.session_state[f'df_edit_{dataset_sel}']
-                        del st.session_state[f'editing_row_{dataset_sel}']
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"❌ Error al guardar: {str(e)}")
-        
-            with col2:
-                csv = df.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    label="📥 Descargar",
-                    data=csv,
-                    file_name=f"{dataset_sel}_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv",
-                    use_container_width=True
-                )
+                            # Resetear estado
+                            del st.session_state[f'df_edit_{dataset_sel}']
+                            del st.session_state[f'editing_row_{dataset_sel}']
+                            st.rerun()
+                        except Exception as e:
+                            st.error(f"❌ Error al guardar: {str(e)}")
+        
+                with col2:
+                    csv = df.to_csv(index=False).encode('utf-8')
+                    st.download_button(
+                        label="📥 Descargar",
+                        data=csv,
+                        file_name=f"{dataset_sel}_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
+                        mime="text/csv",
+                        use_container_width=True
+                    )
         
-            with col3:
-                if st.button("🔄 Recargar Original", use_container_width=True):
-                    # Resetear a los datos originales
-                    if f'df_edit_{dataset_sel}' in st.session_state:
-                        del st.session_state[f'df_edit_{dataset_sel}']
-                    if f'editing_row_{dataset_sel}' in st.session_state:
-                        del st.session_state[f'editing_row_{dataset_sel}']
-                    st.rerun()
+                with col3:
+                    if st.button("🔄 Recargar Original", use_container_width=True):
+                        # Resetear a los datos originales
+                        if f'df_edit_{dataset_sel}' in st.session_state:
+                            del st.session_state[f'df_edit_{dataset_sel}']
+                        if f'editing_row_{dataset_sel}' in st.session_state:
+                            del st.session_state[f'editing_row_{dataset_sel}']
+                        st.rerun()
     
-        except Exception as e:
-            st.error(f"❌ Error al cargar dataset: {str(e)}")
-            st.exception(e)
+            except Exception as e:
+                st.error(f"❌ Error al cargar dataset: {str(e)}")
+                st.exception(e)
 
-# TAB 3: REPORTES DE AUDITORÍA (solo superadmin)
-if tab3 and es_superadmin:
-    with tab3:
-        st.markdown("## 📈 Reportes de Auditoría")
-        
-        subtab_rep1, subtab_rep2, subtab_rep3 = st.tabs(["🔐 Logins", "👥 Acciones Usuarios", "📊 Acciones Tablas"])
-        
-        with subtab_rep1:
-            st.markdown("### 🔐 Historial de Logins")
-            
-            limit = st.slider("Cantidad de registros", 10, 500, 100)
-            
-            logins = auth.obtener_reporte_logins(limit=limit)
-            
-            if logins:
-                df_logins = pd.DataFrame(logins)
-                df_logins['fecha_hora'] = pd.to_datetime(df_logins['fecha_hora']).dt.strftime('%d/%m/%Y %H:%M:%S')
-                df_logins['exito'] = df_logins['exito'].map({True: '✅ Exitoso', False: '❌ Fallido'})
-                df_logins = df_logins.rename(columns={
-                    'username': 'Usuario',
-                    'fecha_hora': 'Fecha/Hora',
-                    'exito': 'Resultado',
-                    'ip_address': 'IP'
-                })
-                
-                st.dataframe(df_logins[['Usuario', 'Fecha/Hora', 'Resultado', 'IP']], use_container_width=True, hide_index=True)
-                
-                # Estadísticas
-                col_stats1, col_stats2, col_stats3 = st.columns(3)
-                with col_stats1:
-                    total = len(df_logins)
-                    st.metric("Total Intentos", total)
-                with col_stats2:
-                    exitosos = len(df_logins[df_logins['Resultado'] == '✅ Exitoso'])
-                    st.metric("Exitosos", exitosos, delta=f"{(exitosos/total*100):.1f}%")
-                with col_stats3:
-                    fallidos = len(df_logins[df_logins['Resultado'] == '❌ Fallido'])
-                    st.metric("Fallidos", fallidos, delta=f"{(fallidos/total*100):.1f}%", delta_color="inverse")
-                
-                # Descargar CSV
-                csv = df_logins.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    "📥 Descargar Reporte CSV",
-                    csv,
-                    f"reporte_logins_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}.csv",
-                    "text/csv"
-                )
-            else:
-                st.info("No hay registros de logins")
+    # TAB 3: REPORTES DE AUDITORÍA (solo superadmin)
+    if tab3 and es_superadmin:
+        with tab3:
+            st.markdown("## 📈 Reportes de Auditoría")
         
-        with subtab_rep2:
-            st.markdown("### 👥 Acciones sobre Usuarios")
+            subtab_rep1, subtab_rep2, subtab_rep3, subtab_rep4, subtab_rep5, subtab_rep6, subtab_rep7 = st.tabs(
+                ["🔐 Logins", "👥 Acciones Usuarios", "📊 Acciones Tablas", "⏱️ Rendimiento", "🔬 Perfilado", "🗄️ Archivo",
+                 "🔎 Buscar"]
+            )
+        
+            with subtab_rep1:
+                st.markdown("### 🔐 Historial de Logins")
             
-            limit2 = st.slider("Cantidad de registros", 10, 500, 100, key="limit_usuarios")
+                periodo = elegir_periodo("logins")
+                desde, hasta = periodo
             
-            acciones_usuarios = auth.obtener_reporte_acciones(limit=limit2, tipo="usuario")
+                # Estadísticas del período completo, contadas en la base
+                por_resultado = {f['clave']: f['cantidad'] for f in auth.resumen_logins('resultado', desde, hasta)}
+                total = sum(por_resultado.values())
             
-            if acciones_usuarios:
-                df_acc_usr = pd.DataFrame(acciones_usuarios)
-                df_acc_usr['fecha_hora'] = pd.to_datetime(df_acc_usr['fecha_hora']).dt.strftime('%d/%m/%Y %H:%M:%S')
+                if total:
+                    col_stats1, col_stats2, col_stats3 = st.columns(3)
+                    with col_stats1:
+                        st.metric("Total Intentos", total)
+                    with col_stats2:
+                        exitosos = por_resultado.get(True, 0)
+                        st.metric("Exitosos", exitosos, delta=f"{(exitosos/total*100):.1f}%")
+                    with col_stats3:
+                        fallidos = por_resultado.get(False, 0)
+                        st.metric("Fallidos", fallidos, delta=f"{(fallidos/total*100):.1f}%", delta_color="inverse")
                 
-                # Mapear acciones a emojis
-                emoji_map = {'crear': '➕', 'modificar': '✏️', 'eliminar': '🗑️'}
-                df_acc_usr['accion_emoji'] = df_acc_usr['accion'].map(emoji_map) + ' ' + df_acc_usr['accion'].str.capitalize()
+                    col_dia, col_usr = st.columns([2, 1])
+                    with col_dia:
+                        st.markdown("**Intentos por día**")
+                        por_dia = pd.DataFrame(auth.resumen_logins('dia', desde, hasta))
+                        if por_dia.empty:
+                            st.caption(AVISO_ARCHIVADO)
+                        else:
+                            st.bar_chart(por_dia.set_index('clave')['cantidad'])
+                    with col_usr:
+                        st.markdown("**Intentos por usuario**")
+                        por_usuario = pd.DataFrame(auth.resumen_logins('usuario', desde, hasta))
+                        st.dataframe(por_usuario.rename(columns={'clave': 'Usuario', 'cantidad': 'Intentos'}),
+                                    use_container_width=True, hide_index=True, height=250)
                 
-                df_acc_usr = df_acc_usr.rename(columns={
-                    'fecha_hora': 'Fecha/Hora',
-                    'usuario': 'Realizado Por',
-                    'accion_emoji': 'Acción',
-                    'objetivo': 'Usuario Afectado',
-                    'detalle': 'Detalle'
-                })
+                    st.markdown("**Detalle**")
+                    logins = paginar_auditoria(
+                        "logins", periodo,
+                        lambda limit, antes_de: auth.obtener_reporte_logins(limit, desde, hasta, antes_de=antes_de)
+                    )
                 
-                st.dataframe(df_acc_usr[['Fecha/Hora', 'Realizado Por', 'Acción', 'Usuario Afectado', 'Detalle']], 
-                            use_container_width=True, hide_index=True)
+                    if not logins:
+                        # Los totales incluyen los meses archivados; el detalle vivo no
+                        st.info(AVISO_ARCHIVADO)
+                    else:
+                        df_logins = pd.DataFrame(logins)
+                        df_logins['fecha_hora'] = pd.to_datetime(df_logins['fecha_hora']).dt.strftime('%d/%m/%Y %H:%M:%S')
+                        df_logins['exito'] = df_logins['exito'].map({True: '✅ Exitoso', False: '❌ Fallido'})
+                        df_logins = df_logins.rename(columns={
+                            'username': 'Usuario',
+                            'fecha_hora': 'Fecha/Hora',
+                            'exito': 'Resultado',
+                            'ip_address': 'IP'
+                        })
                 
-                # Estadísticas
-                col_s1, col_s2, col_s3 = st.columns(3)
-                with col_s1:
-                    creados = len(df_acc_usr[df_acc_usr['Acción'].str.contains('Crear')])
-                    st.metric("➕ Usuarios Creados", creados)
-                with col_s2:
-                    modificados = len(df_acc_usr[df_acc_usr['Acción'].str.contains('Modificar')])
-                    st.metric("✏️ Usuarios Modificados", modificados)
-                with col_s3:
-                    eliminados = len(df_acc_usr[df_acc_usr['Acción'].str.contains('Eliminar')])
-                    st.metric("🗑️ Usuarios Eliminados", eliminados)
-                
-                # Descargar CSV
-                csv2 = df_acc_usr.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    "📥 Descargar Reporte CSV",
-                    csv2,
-                    f"reporte_acciones_usuarios_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}.csv",
-                    "text/csv"
-                )
-            else:
-                st.info("No hay registros de acciones sobre usuarios")
+                        st.dataframe(df_logins[['Usuario', 'Fecha/Hora', 'Resultado', 'IP']], use_container_width=True, hide_index=True)
+                
+                        # Descargar CSV (página actual)
+                        csv = df_logins.to_csv(index=False).encode('utf-8')
+                        st.download_button(
+                            "📥 Descargar Página CSV",
+                            csv,
+                            f"reporte_logins_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}.csv",
+                            "text/csv"
+                        )
+                else:
+                    st.info("No hay registros de logins en el período")
         
-        with subtab_rep3:
-            st.markdown("### 📊 Acciones sobre Tablas/Datasets")
+            with subtab_rep2:
+                st.markdown("### 👥 Acciones sobre Usuarios")
             
-            limit3 = st.slider("Cantidad de registros", 10, 500, 100, key="limit_tablas")
+                periodo2 = elegir_periodo("acc_usuarios")
+                desde2, hasta2 = periodo2
             
-            acciones_tablas = auth.obtener_reporte_acciones(limit=limit3, tipo="tabla")
+                por_accion = {f['clave']: f['cantidad'] for f in auth.resumen_acciones('accion', 'usuario', desde2, hasta2)}
             
-            if acciones_tablas:
-                df_acc_tab = pd.DataFrame(acciones_tablas)
-                df_acc_tab['fecha_hora'] = pd.to_datetime(df_acc_tab['fecha_hora']).dt.strftime('%d/%m/%Y %H:%M:%S')
+                if por_accion:
+                    # Estadísticas del período completo, contadas en la base
+                    col_s1, col_s2, col_s3 = st.columns(3)
+                    with col_s1:
+                        st.metric("➕ Usuarios Creados", por_accion.get('crear', 0))
+                    with col_s2:
+                        st.metric("✏️ Usuarios Modificados", por_accion.get('modificar', 0))
+                    with col_s3:
+                        st.metric("🗑️ Usuarios Eliminados", por_accion.get('eliminar', 0))
                 
-                df_acc_tab = df_acc_tab.rename(columns={
-                    'fecha_hora': 'Fecha/Hora',
-                    'usuario': 'Realizado Por',
-                    'accion': 'Acción',
-                    'objetivo': 'Tabla',
-                    'detalle': 'Detalle'
-                })
+                    por_autor = pd.DataFrame(auth.resumen_acciones('usuario', 'usuario', desde2, hasta2))
+                    st.dataframe(por_autor.rename(columns={'clave': 'Realizado Por', 'cantidad': 'Acciones'}),
+                                use_container_width=True, hide_index=True)
                 
-                df_acc_tab['Acción'] = df_acc_tab['Acción'].str.capitalize()
+                    st.markdown("**Detalle**")
+                    acciones_usuarios = paginar_auditoria(
+                        "acc_usuarios", periodo2,
+                        lambda limit, antes_de: auth.obtener_reporte_acciones(limit, "usuario", desde2, hasta2, antes_de=antes_de)
+                    )
                 
-                st.dataframe(df_acc_tab[['Fecha/Hora', 'Realizado Por', 'Acción', 'Tabla', 'Detalle']], 
-                            use_container_width=True, hide_index=True)
+                    if not acciones_usuarios:
+                        # Los totales incluyen los meses archivados; el detalle vivo no
+                        st.info(AVISO_ARCHIVADO)
+                    else:
+                        df_acc_usr = pd.DataFrame(acciones_usuarios)
+                        df_acc_usr['fecha_hora'] = pd.to_datetime(df_acc_usr['fecha_hora']).dt.strftime('%d/%m/%Y %H:%M:%S')
                 
-                # Descargar CSV
-                csv3 = df_acc_tab.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    "📥 Descargar Reporte CSV",
-                    csv3,
-                    f"reporte_acciones_tablas_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}.csv",
-                    "text/csv"
-                )
-            else:
-                st.info("No hay registros de acciones sobre tablas")
+                        # Mapear acciones a emojis
+                        emoji_map = {'crear': '➕', 'modificar': '✏️', 'eliminar': '🗑️'}
+                        df_acc_usr['accion_emoji'] = df_acc_usr['accion'].map(emoji_map) + ' ' + df_acc_usr['accion'].str.capitalize()
+                
+                        df_acc_usr = df_acc_usr.rename(columns={
+                            'fecha_hora': 'Fecha/Hora',
+                            'usuario': 'Realizado Por',
+                            'accion_emoji': 'Acción',
+                            'objetivo': 'Usuario Afectado',
+                            'detalle': 'Detalle'
+                        })
+                
+                        st.dataframe(df_acc_usr[['Fecha/Hora', 'Realizado Por', 'Acción', 'Usuario Afectado', 'Detalle']], 
+                                    use_container_width=True, hide_index=True)
+                
+                        # Descargar CSV (página actual)
+                        csv2 = df_acc_usr.to_csv(index=False).encode('utf-8')
+                        st.download_button(
+                            "📥 Descargar Página CSV",
+                            csv2,
+                            f"reporte_acciones_usuarios_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}.csv",
+                            "text/csv"
+                        )
+                else:
+                    st.info("No hay registros de acciones sobre usuarios en el período")
+        
+            with subtab_rep3:
+                st.markdown("### 📊 Acciones sobre Tablas/Datasets")
+            
+                periodo3 = elegir_periodo("acc_tablas")
+                desde3, hasta3 = periodo3
+            
+                por_accion3 = auth.resumen_acciones('accion', 'tabla', desde3, hasta3)
+            
+                if por_accion3:
+                    columnas_acc = st.columns(len(por_accion3))
+                    for columna, fila in zip(columnas_acc, por_accion3):
+                        with columna:
+                            st.metric(fila['clave'].capitalize(), fila['cantidad'])
+                
+                    st.markdown("**Detalle**")
+                    acciones_tablas = paginar_auditoria(
+                        "acc_tablas", periodo3,
+                        lambda limit, antes_de: auth.obtener_reporte_acciones(limit, "tabla", desde3, hasta3, antes_de=antes_de)
+                    )
+                
+                    if not acciones_tablas:
+                        # Los totales incluyen los meses archivados; el detalle vivo no
+                        st.info(AVISO_ARCHIVADO)
+                    else:
+                        df_acc_tab = pd.DataFrame(acciones_tablas)
+                        df_acc_tab['fecha_hora'] = pd.to_datetime(df_acc_tab['fecha_hora']).dt.strftime('%d/%m/%Y %H:%M:%S')
+                
+                        df_acc_tab = df_acc_tab.rename(columns={
+                            'fecha_hora': 'Fecha/Hora',
+                            'usuario': 'Realizado Por',
+                            'accion': 'Acción',
+                            'objetivo': 'Tabla',
+                            'detalle': 'Detalle'
+                        })
+                
+                        df_acc_tab['Acción'] = df_acc_tab['Acción'].str.capitalize()
+                
+                        st.dataframe(df_acc_tab[['Fecha/Hora', 'Realizado Por', 'Acción', 'Tabla', 'Detalle']], 
+                                    use_container_width=True, hide_index=True)
+                
+                        # Descargar CSV (página actual)
+                        csv3 = df_acc_tab.to_csv(index=False).encode('utf-8')
+                        st.download_button(
+                            "📥 Descargar Página CSV",
+                            csv3,
+                            f"reporte_acciones_tablas_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}.csv",
+                            "text/csv"
+                        )
+                else:
+                    st.info("No hay registros de acciones sobre tablas en el período")
+        
+            with subtab_rep4:
+                st.markdown("### ⏱️ Tiempos de Ejecución por Aplicación")
+                st.caption("Percentiles del tiempo de cada ejecución (rerun) de las aplicaciones, desglosado por fase")
+            
+                ventanas = {
+                    "Última hora": 1,
+                    "Últimas 24 horas": 24,
+                    "Últimos 7 días": 24 * 7,
+                    "Últimos 30 días": 24 * 30,
+                    "Todo el historial": None
+                }
+                col_v1, col_v2 = st.columns(2)
+                with col_v1:
+                    ventana = st.selectbox("Ventana", list(ventanas.keys()), index=1, key="ventana_metricas")
+            
+                percentiles = obtener_percentiles(horas=ventanas[ventana])
+            
+                if percentiles:
+                    df_perc = pd.DataFrame(percentiles)
+                
+                    with col_v2:
+                        apps_metricas = ["Todas"] + sorted(df_perc['app'].unique())
+                        app_sel = st.selectbox("Aplicación", apps_metricas, key="app_metricas")
+                    if app_sel != "Todas":
+                        df_perc = df_perc[df_perc['app'] == app_sel]
+                
+                    nombres_fase = {
+                        'total': 'Total',
+                        'modulo': 'Módulo',
+                        'datasets': 'Carga datasets',
+                        'indices': 'Índices',
+                        'calculo': 'Cálculo',
+                        'render': 'PDF/HTML'
+                    }
+                    orden_fase = {fase: i for i, fase in enumerate(('total',) + FASES)}
+                    df_perc = df_perc.sort_values(['app', 'fase'], key=lambda s: s.map(orden_fase) if s.name == 'fase' else s)
+                    df_perc['fase'] = df_perc['fase'].map(nombres_fase)
+                    df_perc = df_perc.rename(columns={
+                        'app': 'Aplicación',
+                        'fase': 'Fase',
+                        'ejecuciones': 'Ejecuciones',
+                        'p50_ms': 'p50 (ms)',
+                        'p95_ms': 'p95 (ms)',
+                        'p99_ms': 'p99 (ms)',
+                        'max_ms': 'Máx (ms)'
+                    })
+                
+                    # Resumen del total por aplicación
+                    totales = df_perc[df_perc['Fase'] == 'Total']
+                    cols_apps = st.columns(min(len(totales), 4) or 1)
+                    for i, (_, fila) in enumerate(totales.iterrows()):
+                        with cols_apps[i % len(cols_apps)]:
+                            st.metric(
+                                f"{fila['Aplicación']} (p95)",
+                                f"{fila['p95 (ms)']:,.0f} ms",
+                                help=f"p50 {fila['p50 (ms)']:,.0f} ms · p99 {fila['p99 (ms)']:,.0f} ms · {fila['Ejecuciones']} ejecuciones"
+                            )
+                
+                    st.dataframe(
+                        df_perc,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={
+                            c: st.column_config.NumberColumn(format="%.1f")
+                            for c in ['p50 (ms)', 'p95 (ms)', 'p99 (ms)', 'Máx (ms)']
+                        }
+                    )
+                
+                    # Descargar CSV
+                    csv4 = df_perc.to_csv(index=False).encode('utf-8')
+                    st.download_button(
+                        "📥 Descargar Reporte CSV",
+                        csv4,
+                        f"reporte_rendimiento_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}.csv",
+                        "text/csv"
+                    )
+                else:
+                    st.info("No hay ejecuciones registradas en la ventana seleccionada")
+        
+            with subtab_rep5:
+                st.markdown("### 🔬 Perfilado de Ejecuciones (cProfile)")
+                st.caption("Las próximas ejecuciones de la aplicación o usuario elegidos corren bajo cProfile; "
+                           "sin perfilados armados no hay costo adicional")
+            
+                apps_perfilables = {
+                    'Cualquiera': None,
+                    '💰 IBM': 'ibm',
+                    '📈 Actualización': 'actualizacion',
+                    '🧮 LRT': 'lrt',
+                    '📊 Despidos': 'despidos',
+                    '💵 Honorarios': 'honorarios',
+                    '⚙️ Admin': 'admin'
+                }
+            
+                with st.form("form_armar_perfilado"):
+                    col_p1, col_p2, col_p3 = st.columns(3)
+                    with col_p1:
+                        app_perf = st.selectbox("Aplicación", list(apps_perfilables.keys()), index=3)
+                    with col_p2:
+                        usuario_perf = st.text_input("Usuario (opcional)", placeholder="Cualquiera")
+                    with col_p3:
+                        ejecuciones_perf = st.number_input("Próximas ejecuciones", 1, 50, 1)
+                
+                    if st.form_submit_button("🎯 Armar perfilado", type="primary"):
+                        if apps_perfilables[app_perf] is None and not usuario_perf.strip():
+                            st.error("❌ Elegí una aplicación o un usuario")
+                        else:
+                            armar_perfilado(
+                                int(ejecuciones_perf),
+                                st.session_state.usuario['username'],
+                                app=apps_perfilables[app_perf],
+                                usuario=usuario_perf.strip() or None
+                            )
+                            st.success("✅ Perfilado armado")
+            
+                armados = perfilados_armados()
+                if armados:
+                    st.markdown("#### Armados pendientes")
+                    for armado in armados:
+                        col_a1, col_a2 = st.columns([5, 1])
+                        with col_a1:
+                            st.write(
+                                f"**{armado.app or 'cualquier app'}** · usuario {armado.usuario or 'cualquiera'} · "
+                                f"{armado.restantes} ejecuciones restantes · armado por {armado.armado_por} el "
+                                f"{pd.Timestamp(armado.fecha_hora).strftime('%d/%m/%Y %H:%M')}"
+                            )
+                        with col_a2:
+                            if st.button("✖️ Cancelar", key=f"desarmar_{armado.id}"):
+                                desarmar_perfilado(armado.id)
+                                st.rerun()
+            
+                st.markdown("#### Perfiles capturados")
+                perfiles = listar_perfiles(limit=200)
+            
+                if perfiles:
+                    df_perfiles = pd.DataFrame(perfiles)
+                    df_perfiles['fecha_hora'] = pd.to_datetime(df_perfiles['fecha_hora']).dt.strftime('%d/%m/%Y %H:%M:%S')
+                    df_perfiles['KB'] = (df_perfiles['bytes_guardados'] / 1024).round(1)
+                    st.dataframe(
+                        df_perfiles.rename(columns={
+                            'id': 'ID',
+                            'fecha_hora': 'Fecha/Hora',
+                            'app': 'Aplicación',
+                            'usuario': 'Usuario',
+                            'duracion_ms': 'Duración (ms)',
+                            'funciones': 'Funciones'
+                        })[['ID', 'Fecha/Hora', 'Aplicación', 'Usuario', 'Duración (ms)', 'Funciones', 'KB']],
+                        use_container_width=True,
+                        hide_index=True
+                    )
+                
+                    etiquetas = {
+                        f"#{p['id']} - {p['app']} ({p['usuario']}) {p['fecha_hora'][:16].replace('T', ' ')}": p['id']
+                        for p in perfiles
+                    }
+                    col_s1, col_s2, col_s3 = st.columns([3, 2, 1])
+                    with col_s1:
+                        perfil_sel = etiquetas[st.selectbox("Perfil", list(etiquetas.keys()), key="perfil_sel")]
+                    with col_s2:
+                        nombres_orden = {'cumulative': 'Tiempo acumulado', 'tottime': 'Tiempo propio', 'ncalls': 'Llamadas'}
+                        orden = st.radio("Ordenar por", ORDENES, format_func=nombres_orden.get, horizontal=True, key="perfil_orden")
+                    with col_s3:
+                        top = st.number_input("Top", 10, 200, 30, step=10, key="perfil_top")
+                
+                    df_funciones = pd.DataFrame(tabla_perfil(perfil_sel, orden, int(top)))
+                    if not df_funciones.empty:
+                        st.dataframe(
+                            df_funciones.rename(columns={
+                                'funcion': 'Función',
+                                'ubicacion': 'Ubicación',
+                                'llamadas': 'Llamadas',
+                                'llamadas_primitivas': 'Primitivas',
+                                'tottime_ms': 'Propio (ms)',
+                                'cumtime_ms': 'Acumulado (ms)',
+                                'percall_ms': 'Por llamada (ms)'
+                            }),
+                            use_container_width=True,
+                            hide_index=True,
+                            column_config={
+                                c: st.column_config.NumberColumn(format="%.3f")
+                                for c in ['Propio (ms)', 'Acumulado (ms)', 'Por llamada (ms)']
+                            }
+                        )
+                
+                    col_d1, col_d2 = st.columns(2)
+                    with col_d1:
+                        st.download_button(
+                            "📥 Descargar .prof",
+                            obtener_perfil_prof(perfil_sel) or b'',
+                            f"perfil_{perfil_sel}.prof",
+                            "application/octet-stream",
+                            help="Se abre con python -m pstats o snakeviz"
+                        )
+                    with col_d2:
+                        if st.button("🗑️ Eliminar perfil", key=f"eliminar_perfil_{perfil_sel}"):
+                            eliminar_perfil(perfil_sel)
+                            st.rerun()
+                else:
+                    st.info("No hay perfiles capturados")
+        
+            with subtab_rep6:
+                st.markdown("### 🗄️ Retención y Archivo de Auditoría")
+                st.caption(f"Los logins y acciones de más de {RETENCION_DIAS} días pasan a un archivo por año; "
+                           "sus totales se conservan en resúmenes mensuales. El mantenimiento corre una vez por día.")
+            
+                db_auditoria = Path(auth.pool.db_path)
+            
+                mantenimientos = ultimos_mantenimientos(10, db_auditoria)
+                if mantenimientos:
+                    df_mant = pd.DataFrame(mantenimientos)
+                    df_mant['vacuum'] = df_mant['vacuum'].map({1: '✅', 0: '—'})
+                    st.dataframe(df_mant.rename(columns={
+                        'fecha_hora': 'Fecha/Hora',
+                        'corte': 'Archivado hasta',
+                        'logins_archivados': 'Logins',
+                        'acciones_archivadas': 'Acciones',
+                        'vacuum': 'VACUUM',
+                        'duracion_ms': 'Duración (ms)'
+                    }), use_container_width=True, hide_index=True)
+                else:
+                    st.info("Todavía no se corrió el mantenimiento")
+            
+                col_r1, col_r2 = st.columns([1, 2])
+                with col_r1:
+                    dias_retencion = st.number_input("Retención (días)", 30, 3650, RETENCION_DIAS, step=30, key="retencion_dias")
+                with col_r2:
+                    st.caption(f"Se archivaría lo anterior al {fecha_corte(int(dias_retencion)).strftime('%d/%m/%Y')}")
+                    if st.button("🗄️ Archivar y compactar ahora", key="aplicar_retencion"):
+                        with st.spinner("Archivando..."):
+                            resultado = aplicar_retencion(int(dias_retencion), db_auditoria)
+                        st.success(f"✅ {resultado['auditoria_logins']} logins y "
+                                   f"{resultado['auditoria_acciones']} acciones archivados")
+            
+                años = años_archivados(db_auditoria)
+                if años:
+                    st.markdown("#### Consultar archivo")
+                    col_a1, col_a2 = st.columns(2)
+                    with col_a1:
+                        año_archivo = st.selectbox("Año", años, key="archivo_año")
+                    with col_a2:
+                        tabla_archivo = st.radio("Registros", ["Logins", "Acciones"], horizontal=True, key="archivo_tabla")
+                
+                    if tabla_archivo == "Logins":
+                        filas_archivo = paginar_auditoria(
+                            "archivo_logins", año_archivo,
+                            lambda limit, antes_de: auth.obtener_reporte_logins(limit, antes_de=antes_de, archivo=año_archivo)
+                        )
+                        columnas_archivo = ['fecha_hora', 'username', 'exito', 'ip_address']
+                    else:
+                        filas_archivo = paginar_auditoria(
+                            "archivo_acciones", año_archivo,
+                            lambda limit, antes_de: auth.obtener_reporte_acciones(limit, antes_de=antes_de, archivo=año_archivo)
+                        )
+                        columnas_archivo = ['fecha_hora', 'usuario', 'accion', 'tipo', 'objetivo', 'detalle']
+                
+                    if filas_archivo:
+                        st.dataframe(pd.DataFrame(filas_archivo)[columnas_archivo], use_container_width=True, hide_index=True)
+        
+            with subtab_rep7:
+                st.markdown("### 🔎 Buscar en Acciones")
+                st.caption("Busca en el detalle, el objeto afectado y el autor de cada acción, sin distinguir "
+                           "mayúsculas ni acentos. Lo archivado por la retención se consulta en la pestaña Archivo.")
+            
+                col_b1, col_b2 = st.columns([3, 1])
+                with col_b1:
+                    texto_acciones = st.text_input("Palabras", placeholder="Ej.: ripte publicar", key="buscar_acciones")
+                with col_b2:
+                    orden_busqueda = st.radio("Orden", ["Relevancia", "Más recientes"], key="orden_busqueda")
+            
+                if texto_acciones.strip():
+                    recientes = orden_busqueda == "Más recientes"
+                    hallazgos = paginar_busqueda(
+                        "buscar_acciones", (texto_acciones, recientes),
+                        lambda limit, desplazamiento: auth.buscar_acciones(texto_acciones, limit, desplazamiento, recientes)
+                    )
+                
+                    if hallazgos:
+                        df_hallazgos = pd.DataFrame(hallazgos)
+                        df_hallazgos['fecha_hora'] = pd.to_datetime(df_hallazgos['fecha_hora']).dt.strftime('%d/%m/%Y %H:%M:%S')
+                        st.dataframe(df_hallazgos.rename(columns={
+                            'fecha_hora': 'Fecha/Hora',
+                            'usuario': 'Realizado Por',
+                            'accion': 'Acción',
+                            'tipo': 'Tipo',
+                            'objetivo': 'Objetivo',
+                            'fragmento': 'Coincidencia'
+                        })[['Fecha/Hora', 'Realizado Por', 'Acción', 'Tipo', 'Objetivo', 'Coincidencia']],
+                            use_container_width=True, hide_index=True)
+                    else:
+                        st.info("Ninguna acción coincide con la búsqueda")
 
-st.markdown("---")
-st.caption("**Administración del Sistema** | Tribunal de Trabajo N° 2 de Quilmes")
\ No newline at end of file
+    st.markdown("---")
+    st.caption("**Administración del Sistema** | Tribunal de Trabajo N° 2 de Quilmes")
@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks - Sistema de Cálculos y Herramientas
+Tribunal de Trabajo 2 de Quilmes
+
+Mide los caminos críticos de las calculadoras sobre datasets sintéticos de
+1x, 10x y 100x el tamaño actual de data/, y el tiempo de importación de
+main.py y de cada aplicación.
+
+Uso:
+    python -m benchmarks.suite [--escalas 1,10,100] [--umbral 0.25] [--filtro lrt]
+    python -m benchmarks.arranque [--filtro apps] [--factor 2]
+
+Módulos:
+    datos_sinteticos: Generador de CSV con el formato de data/ a cualquier escala
+    suite: Mediciones, historial JSON y control de regresiones
+    arranque: Presupuesto de tiempo de importación y dependencias prohibidas
+"""
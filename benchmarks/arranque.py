@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Presupuesto de tiempo de importación
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Importa main.py, cada calculadora de apps/ y los módulos del motor en un
+proceso nuevo con `python -X importtime`, y controla dos cosas:
+
+- que el tiempo acumulado de importación de cada módulo no supere su
+  presupuesto (en milisegundos, ajustable con --factor para máquinas lentas);
+- que no cargue dependencias pesadas que no necesita al arrancar: main.py
+  no importa pandas ni reportlab (el login y el menú no los usan), las
+  calculadoras no importan reportlab ni num2words (los PDF se generan al
+  pedirlos) y el motor no importa Streamlit ni pandas (las consultas
+  usan solo NumPy; pandas se carga al leer tablas o armar DataFrames).
+
+Streamlit se importa antes que cada objetivo (si está instalado), así que
+se mide solo lo que agrega el módulo. Termina con código 1 si algún
+objetivo se pasa del presupuesto o importa un módulo prohibido; los que no
+se pueden importar en este entorno se informan como omitidos.
+
+Administración no se incluye: al importarse abre data/usuarios.db.
+
+Uso:
+    python -m benchmarks.arranque
+    python -m benchmarks.arranque --filtro apps --repeticiones 5
+    python -m benchmarks.arranque --factor 2
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+# Módulos que cada grupo no debe cargar al importarse
+PROHIBIDOS_MAIN = ('pandas', 'numpy', 'reportlab')
+PROHIBIDOS_APPS = ('reportlab', 'num2words')
+PROHIBIDOS_MOTOR = ('streamlit', 'reportlab', 'pandas')
+
+# objetivo -> (presupuesto en ms, módulos prohibidos)
+# Las calculadoras necesitan pandas (~400 ms en frío), que entra en su
+# presupuesto; el motor solo NumPy (~120 ms en frío) y main.py ninguno.
+OBJETIVOS: Dict[str, Tuple[float, Sequence[str]]] = {
+    'main': (150, PROHIBIDOS_MAIN),
+    'apps.ibm': (900, PROHIBIDOS_APPS),
+    'apps.actualizacion': (900, PROHIBIDOS_APPS),
+    'apps.calculadora_despidos': (900, PROHIBIDOS_APPS),
+    'apps.calculadora_lrt': (900, PROHIBIDOS_APPS),
+    'apps.honorarios': (900, PROHIBIDOS_APPS),
+    'motor': (100, PROHIBIDOS_MOTOR),
+    'motor.lrt': (250, PROHIBIDOS_MOTOR),
+    'motor.actualizacion': (250, PROHIBIDOS_MOTOR),
+    'motor.despidos': (250, PROHIBIDOS_MOTOR),
+    'motor.ibm': (250, PROHIBIDOS_MOTOR),
+    'motor.honorarios': (250, PROHIBIDOS_MOTOR),
+    'utils.indices': (250, PROHIBIDOS_MOTOR),
+}
+
+REPETICIONES = 3
+
+_PRECARGA = "try:\n    import streamlit\nexcept ImportError:\n    pass\nimport {objetivo}\n"
+
+
+@dataclass
+class Resultado:
+    """Importación de un objetivo"""
+    objetivo: str
+    presupuesto_ms: float
+    tiempo_ms: Optional[float] = None
+    prohibidos: Tuple[str, ...] = ()
+    error: str = ''
+
+    @property
+    def omitido(self) -> bool:
+        return self.tiempo_ms is None
+
+    @property
+    def excedido(self) -> bool:
+        return not self.omitido and self.tiempo_ms > self.presupuesto_ms
+
+    @property
+    def falla(self) -> bool:
+        return self.excedido or bool(self.prohibidos)
+
+
+def _parsear_importtime(salida: str, objetivo: str) -> Tuple[float, List[str]]:
+    """
+    Tiempo acumulado del objetivo y módulos que cargó.
+
+    La salida de -X importtime lista cada módulo después de sus
+    dependencias; las líneas sin sangría son los imports de primer nivel.
+    Lo que importó el objetivo son las líneas entre el import de primer
+    nivel anterior (la precarga de Streamlit) y la del objetivo.
+
+    Args:
+        salida: stderr de `python -X importtime`
+        objetivo: Nombre del módulo importado
+
+    Returns:
+        (tiempo acumulado en ms, nombres de los módulos cargados)
+
+    Raises:
+        ValueError: Si el objetivo no aparece en la salida
+    """
+    modulos: List[str] = []
+    for linea in salida.splitlines():
+        if not linea.startswith('import time:'):
+            continue
+        partes = linea.split('|')
+        if len(partes) != 3 or not partes[1].strip().isdigit():
+            continue  # encabezado
+        nombre_crudo = partes[2]
+        nombre = nombre_crudo.strip()
+        primer_nivel = len(nombre_crudo) - len(nombre_crudo.lstrip()) <= 1
+        if primer_nivel and nombre == objetivo:
+            return int(partes[1]) / 1000, modulos
+        modulos.append(nombre)
+        if primer_nivel:
+            modulos = []
+    raise ValueError(f"'{objetivo}' no aparece en la salida de -X importtime")
+
+
+def medir_importacion(objetivo: str, repeticiones: int = REPETICIONES) -> Tuple[float, List[str]]:
+    """
+    Importa un módulo en procesos nuevos y devuelve el mejor tiempo.
+
+    Args:
+        objetivo: Módulo a importar ('apps.ibm')
+        repeticiones: Procesos a lanzar (se toma el mínimo)
+
+    Returns:
+        (tiempo acumulado en ms, módulos que cargó)
+
+    Raises:
+        RuntimeError: Si el módulo no se puede importar en este entorno
+    """
+    mejor: Optional[float] = None
+    modulos: List[str] = []
+    for _ in range(repeticiones):
+        proceso = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', _PRECARGA.format(objetivo=objetivo)],
+            cwd=RAIZ, capture_output=True, text=True
+        )
+        if proceso.returncode != 0:
+            ultima = proceso.stderr.strip().splitlines()[-1:] or ['sin salida']
+            raise RuntimeError(ultima[0])
+        tiempo, modulos = _parsear_importtime(proceso.stderr, objetivo)
+        mejor = tiempo if mejor is None else min(mejor, tiempo)
+    return mejor, modulos
+
+
+def _prohibidos_cargados(modulos: Sequence[str], prohibidos: Sequence[str]) -> Tuple[str, ...]:
+    """Paquetes prohibidos presentes entre los módulos cargados"""
+    raices = {m.split('.')[0] for m in modulos}
+    return tuple(p for p in prohibidos if p in raices)
+
+
+def controlar(objetivos: Dict[str, Tuple[float, Sequence[str]]] = OBJETIVOS,
+              repeticiones: int = REPETICIONES, factor: float = 1.0) -> List[Resultado]:
+    """
+    Mide cada objetivo y lo compara con su presupuesto.
+
+    Args:
+        objetivos: objetivo -> (presupuesto en ms, módulos prohibidos)
+        repeticiones: Procesos por objetivo
+        factor: Multiplicador de los presupuestos
+
+    Returns:
+        Lista de Resultado en el orden de los objetivos
+    """
+    resultados = []
+    for objetivo, (presupuesto, prohibidos) in objetivos.items():
+        resultado = Resultado(objetivo, presupuesto * factor)
+        try:
+            tiempo, modulos = medir_importacion(objetivo, repeticiones)
+        except (RuntimeError, ValueError) as e:
+            resultado.error = str(e)
+        else:
+            resultado.tiempo_ms = tiempo
+            resultado.prohibidos = _prohibidos_cargados(modulos, prohibidos)
+        resultados.append(resultado)
+    return resultados
+
+
+def imprimir_resultados(resultados: Sequence[Resultado]) -> None:
+    """Tabla de tiempos y presupuestos"""
+    print(f"{'objetivo':<28} {'ms':>9} {'presupuesto':>12}  estado")
+    for r in resultados:
+        if r.omitido:
+            print(f"{r.objetivo:<28} {'-':>9} {r.presupuesto_ms:>12.0f}  OMITIDO ({r.error})")
+            continue
+        estado = []
+        if r.excedido:
+            estado.append('EXCEDIDO')
+        if r.prohibidos:
+            estado.append(f"IMPORTA {', '.join(r.prohibidos)}")
+        print(f"{r.objetivo:<28} {r.tiempo_ms:>9.1f} {r.presupuesto_ms:>12.0f}  {' / '.join(estado) or 'ok'}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--filtro', default='', help='Solo los objetivos que contienen este texto')
+    parser.add_argument('--repeticiones', type=int, default=REPETICIONES,
+                        help='Procesos por objetivo (se toma el mejor tiempo)')
+    parser.add_argument('--factor', type=float, default=1.0,
+                        help='Multiplicador de los presupuestos (máquinas lentas)')
+    args = parser.parse_args(argv)
+
+    objetivos = {o: v for o, v in OBJETIVOS.items() if args.filtro in o}
+    if not objetivos:
+        print(f"Ningún objetivo contiene '{args.filtro}'")
+        return 2
+
+    resultados = controlar(objetivos, max(args.repeticiones, 1), args.factor)
+    imprimir_resultados(resultados)
+
+    fallas = [r for r in resultados if r.falla]
+    omitidos = [r for r in resultados if r.omitido]
+    if omitidos:
+        print(f"\n{len(omitidos)} objetivo(s) omitidos por no poder importarse en este entorno")
+    if fallas:
+        print(f"\n{len(fallas)} objetivo(s) fuera de presupuesto")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Datasets sintéticos para benchmarks
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Genera CSV con el mismo formato que los de data/ (columnas, formatos de fecha
+y de número, más reciente arriba) y una cantidad de filas proporcional a la
+actual: escala 10 sobre las ~1900 vigencias de tasa da unos 50 años de tasa
+diaria; escala 100 sobre los ~190 meses de RIPTE/IPC da ~19000 meses. Las
+series terminan en la misma fecha y se extienden hacia atrás, así que a
+escalas grandes llegan a siglos ficticios: solo importa el volumen.
+"""
+
+import csv
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+import numpy as np
+
+from utils.esquemas import ESQUEMAS
+
+# Fecha en la que terminan todas las series
+FECHA_FINAL = date(2025, 11, 30)
+
+MESES = ['Enero', 'Febrero', 'Marzo', 'Abril', 'Mayo', 'Junio', 'Julio',
+         'Agosto', 'Septiembre', 'Octubre', 'Noviembre', 'Diciembre']
+
+
+def filas_actuales() -> Dict[str, int]:
+    """Cantidad de filas de cada CSV de data/ (base de la escala 1x)"""
+    filas = {}
+    for nombre, esquema in ESQUEMAS.items():
+        with open(esquema.ruta, encoding='utf-8') as f:
+            filas[nombre] = max(sum(1 for linea in f if linea.strip()) - 1, 1)
+    return filas
+
+
+def _fecha_csv(fecha: date) -> str:
+    """DD/MM/YYYY con año de 4 dígitos también antes del año 1000 (strftime no lo garantiza)"""
+    return f"{fecha.day:02d}/{fecha.month:02d}/{fecha.year:04d}"
+
+
+def _meses_hacia_atras(cantidad: int) -> Iterator[Tuple[int, int]]:
+    """(año, mes) de los últimos `cantidad` meses hasta FECHA_FINAL, del más reciente al más antiguo"""
+    clave = FECHA_FINAL.year * 12 + FECHA_FINAL.month - 1
+    for i in range(cantidad):
+        año, mes = divmod(clave - i, 12)
+        yield año, mes + 1
+
+
+def _vigencias_hacia_atras(cantidad: int, rng: np.random.Generator,
+                           dias_min: int, dias_max: int) -> Iterator[Tuple[date, date]]:
+    """Intervalos contiguos (desde, hasta) que terminan en FECHA_FINAL, del más reciente al más antiguo"""
+    hasta = FECHA_FINAL
+    for largo in rng.integers(dias_min, dias_max + 1, size=cantidad):
+        desde = hasta - timedelta(days=int(largo) - 1)
+        yield desde, hasta
+        hasta = desde - timedelta(days=1)
+
+
+def _escribir_tasa(ruta: Path, filas: int, rng: np.random.Generator) -> None:
+    # Una fila por día (el caso más denso que admite el formato)
+    with open(ruta, 'w', encoding='utf-8', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(['Valor', 'Desde', 'Hasta', 'Año', 'Mes'])
+        valores = rng.uniform(1.5, 8.0, size=filas).round(3)
+        for i, valor in enumerate(valores):
+            dia = FECHA_FINAL - timedelta(days=i)
+            w.writerow([valor, _fecha_csv(dia), _fecha_csv(dia), dia.year, dia.month])
+
+
+def _escribir_ripte(ruta: Path, filas: int, rng: np.random.Generator) -> None:
+    # Se arma del más antiguo al más reciente y se escribe al revés; variaciones
+    # casi centradas en 0 para que el índice no desborde a escalas grandes
+    variaciones = rng.uniform(-1.0, 1.2, size=filas).round(1)
+    indices = 100.0 * np.cumprod(1 + variaciones[::-1] / 100)[::-1]
+    with open(ruta, 'w', encoding='utf-8', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(['año', 'mes', 'indice_ripte', 'variacion_mensual', 'monto_en_pesos'])
+        for (año, mes), indice, variacion in zip(_meses_hacia_atras(filas), indices, variaciones):
+            w.writerow([año, MESES[mes - 1], round(indice, 2), variacion, round(indice * 8.75, 2)])
+
+
+def _escribir_ipc(ruta: Path, filas: int, rng: np.random.Generator) -> None:
+    # Igual que RIPTE: la inflación acumulada de siglos no debe desbordar
+    with open(ruta, 'w', encoding='utf-8', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(['periodo', 'variacion_mensual'])
+        for (año, mes), variacion in zip(_meses_hacia_atras(filas), rng.uniform(-1.5, 2.0, size=filas).round(1)):
+            w.writerow([f"{año:04d}-{mes:02d}", variacion])
+
+
+def _escribir_jus(ruta: Path, filas: int, rng: np.random.Generator) -> None:
+    # Encabezados con el espacio final del archivo original; valor "$ 44.330"
+    with open(ruta, 'w', encoding='utf-8', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(['FECHA ENTRADA EN VIGENCIA ', 'FECHA DE FINALIZACION ', 'VALOR IUS', 'ACUERDO'])
+        valor = 44330.0
+        for i, (desde, hasta) in enumerate(_vigencias_hacia_atras(filas, rng, 30, 92)):
+            w.writerow([
+                _fecha_csv(desde), '' if i == 0 else _fecha_csv(hasta),
+                f"$ {max(int(valor), 1):,}".replace(',', '.'), f"Acuerdo {4200 - i}"
+            ])
+            valor /= 1 + rng.uniform(-0.02, 0.025)
+
+
+def _escribir_pisos(ruta: Path, filas: int, rng: np.random.Generator) -> None:
+    with open(ruta, 'w', encoding='utf-8', newline='') as f:
+        w = csv.writer(f)
+        w.writerow(['fecha_inicio', 'fecha_fin', 'norma', 'monto_minimo', 'enlace'])
+        monto = 87629423.0
+        for i, (desde, hasta) in enumerate(_vigencias_hacia_atras(filas, rng, 60, 184)):
+            w.writerow([_fecha_csv(desde), _fecha_csv(hasta), f"Res. S.R.T. {i + 1}/sint", int(monto), ''])
+            monto /= 1 + rng.uniform(-0.05, 0.06)
+
+
+ESCRITORES = {
+    'tasa': _escribir_tasa,
+    'ripte': _escribir_ripte,
+    'ipc': _escribir_ipc,
+    'jus': _escribir_jus,
+    'pisos': _escribir_pisos
+}
+
+
+def generar_datasets(destino: Path, escala: float = 1, semilla: int = 0) -> Dict[str, Path]:
+    """
+    Escribe los cinco datasets sintéticos en un directorio.
+
+    Args:
+        destino: Directorio de salida (se crea si no existe)
+        escala: Múltiplo de la cantidad de filas actual de cada dataset
+        semilla: Semilla del generador (mismos archivos para la misma semilla)
+
+    Returns:
+        Diccionario {dataset: ruta del CSV generado}
+    """
+    destino = Path(destino)
+    destino.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(semilla)
+
+    rutas = {}
+    for nombre, filas in filas_actuales().items():
+        ruta = destino / ESQUEMAS[nombre].archivo
+        ESCRITORES[nombre](ruta, max(int(round(filas * escala)), 1), rng)
+        rutas[nombre] = ruta
+    return rutas
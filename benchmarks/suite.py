@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Suite de benchmarks de las calculadoras
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Mide cada camino crítico (construcción de índices, tasa activa, coeficiente
+RIPTE, IBM, conversión a JUS, rubros de despido, actualizaciones, PDF) sobre
+datasets sintéticos de 1x, 10x y 100x el tamaño actual, agrega la corrida al
+historial JSON y termina con código 1 si algún camino empeoró más que el
+umbral respecto de las corridas anteriores en la misma máquina.
+
+Uso:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --escalas 1,10 --filtro lrt --sin-guardar
+    python -m benchmarks.suite --umbral 0.5 --historial /tmp/historial.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from motor.actualizacion import actualizar_monto
+from motor.despidos import actualizar_despido, liquidar_despido
+from motor.honorarios import convertir_a_jus
+from motor.ibm import calcular_ibm, obtener_nombre_mes, obtener_ripte
+from motor.lrt import Calculator, DataManager
+from motor.tipos import DatosIBM, InputData
+from utils.indices import PRECEDENCIA_VIGENCIAS, IndiceIPC, IndiceRipte, IndiceTasa, IndiceVigencias, leer_tabla
+
+from .datos_sinteticos import FECHA_FINAL, generar_datasets
+
+ESCALAS_DEFECTO = (1, 10, 100)
+
+# Empeoramiento relativo que se considera regresión, y diferencia mínima en
+# microsegundos para no marcar ruido en caminos muy rápidos
+UMBRAL_DEFECTO = 0.25
+MINIMO_US = 2.0
+
+# Corridas anteriores (misma máquina) que forman la referencia
+VENTANA_HISTORIAL = 5
+
+# Casos distintos por medición, repeticiones de cada medición y casos de la pasada LRT por lote
+CASOS = 200
+REPETICIONES = 5
+CASOS_LOTE_LRT = 1000
+
+HISTORIAL_DEFECTO = Path(__file__).resolve().parent / "historial.json"
+
+Preparador = Callable[['Contexto'], Tuple[Callable[[Any], Any], Sequence[Any]]]
+
+
+@dataclass
+class Medicion:
+    """Tiempo por llamada de un camino a una escala"""
+    camino: str
+    escala: float
+    llamadas: int
+    mediana_us: float
+    minimo_us: float
+
+
+class Contexto:
+    """Datasets sintéticos de una escala, sus índices ya construidos y casos al azar"""
+
+    def __init__(self, escala: float, directorio: Path, semilla: int = 0):
+        self.escala = escala
+        self.rutas = generar_datasets(directorio, escala, semilla)
+        self.rng = np.random.default_rng(semilla)
+
+        self.tabla_jus = leer_tabla('jus', self.rutas['jus'])
+        self.indice_tasa = IndiceTasa.desde_dataframe(leer_tabla('tasa', self.rutas['tasa']), completar_hasta=True)
+        self.indice_ripte = IndiceRipte.desde_dataframe(leer_tabla('ripte', self.rutas['ripte']))
+        self.indice_ipc = IndiceIPC.desde_dataframe(leer_tabla('ipc', self.rutas['ipc']))
+        self.indice_jus = IndiceVigencias.desde_dataframe(
+            self.tabla_jus, 'FECHA ENTRADA EN VIGENCIA', 'FECHA DE FINALIZACION', PRECEDENCIA_VIGENCIAS['jus']
+        )
+        self.indice_pisos = IndiceVigencias.desde_dataframe(
+            leer_tabla('pisos', self.rutas['pisos']), 'desde', 'hasta', PRECEDENCIA_VIGENCIAS['pisos']
+        )
+        self.data_mgr = DataManager.desde_indices(
+            self.indice_tasa, self.indice_ripte, self.indice_ipc, self.indice_pisos
+        )
+
+        # Las fechas de los casos cubren todo el rango de los datos (los meses de RIPTE/IPC son el más corto)
+        self.inicio = max(date(FECHA_FINAL.year - self.indice_ripte.meses // 12 + 1, 1, 1), date(1, 1, 1))
+
+    def fechas(self, cantidad: int) -> List[Tuple[date, date]]:
+        """Pares (desde, hasta) al azar dentro del rango de los datos"""
+        base = self.inicio.toordinal()
+        largo = FECHA_FINAL.toordinal() - base
+        a = self.rng.integers(0, largo, size=cantidad)
+        b = self.rng.integers(0, largo, size=cantidad)
+        return [(date.fromordinal(base + int(min(x, y))), date.fromordinal(base + int(max(x, y)) + 1))
+                for x, y in zip(a, b)]
+
+    def casos_lrt(self, cantidad: int) -> List[InputData]:
+        return [
+            InputData(pmi, final, float(ibm), int(edad), float(pct), True)
+            for (pmi, final), ibm, edad, pct in zip(
+                self.fechas(cantidad),
+                self.rng.uniform(1e5, 3e6, cantidad),
+                self.rng.integers(18, 70, cantidad),
+                self.rng.uniform(1, 100, cantidad).round(1)
+            )
+        ]
+
+
+# ============================================
+# CAMINOS MEDIDOS
+# ============================================
+# Cada preparador devuelve (función, casos): se mide una llamada por caso.
+
+def _construir_indice(nombre: str) -> Preparador:
+    def preparar(ctx: Contexto):
+        constructores = {
+            'tasa': lambda: IndiceTasa.desde_dataframe(leer_tabla('tasa', ctx.rutas['tasa']), completar_hasta=True),
+            'ripte': lambda: IndiceRipte.desde_dataframe(leer_tabla('ripte', ctx.rutas['ripte'])),
+            'ipc': lambda: IndiceIPC.desde_dataframe(leer_tabla('ipc', ctx.rutas['ipc'])),
+            'jus': lambda: IndiceVigencias.desde_dataframe(
+                leer_tabla('jus', ctx.rutas['jus']), 'FECHA ENTRADA EN VIGENCIA', 'FECHA DE FINALIZACION',
+                PRECEDENCIA_VIGENCIAS['jus']
+            ),
+            'pisos': lambda: IndiceVigencias.desde_dataframe(
+                leer_tabla('pisos', ctx.rutas['pisos']), 'desde', 'hasta', PRECEDENCIA_VIGENCIAS['pisos']
+            )
+        }
+        return (lambda _: constructores[nombre]()), [None]
+    return preparar
+
+
+def _tasa_activa(ctx: Contexto):
+    return (lambda c: ctx.data_mgr.calcular_tasa_activa(c[0], c[1], 1e6)), ctx.fechas(CASOS)
+
+
+def _ripte_coeficiente(ctx: Contexto):
+    return (lambda c: ctx.data_mgr.get_ripte_coeficiente(c[0], c[1])), ctx.fechas(CASOS)
+
+
+def _inflacion(ctx: Contexto):
+    return (lambda c: ctx.data_mgr.calcular_inflacion(c[0], c[1])), ctx.fechas(CASOS)
+
+
+def _piso_minimo(ctx: Contexto):
+    return (lambda c: ctx.data_mgr.get_piso_minimo(c[0])), ctx.fechas(CASOS)
+
+
+def _indemnizacion_lrt(ctx: Contexto):
+    calculadora = Calculator(ctx.data_mgr)
+    return calculadora.calcular_indemnizacion, ctx.casos_lrt(CASOS)
+
+
+def _indemnizaciones_lote_lrt(ctx: Contexto):
+    calculadora = Calculator(ctx.data_mgr)
+    return calculadora.calcular_indemnizaciones_lote, [ctx.casos_lrt(CASOS_LOTE_LRT)]
+
+
+def _obtener_ripte(ctx: Contexto):
+    meses = [(d.year, obtener_nombre_mes(d).split('.-')[0]) for d, _ in ctx.fechas(CASOS)]
+    return (lambda c: obtener_ripte(ctx.indice_ripte, c[0], c[1])), meses
+
+
+def _ibm(ctx: Contexto):
+    casos = [
+        DatosIBM(final, tuple(ctx.rng.uniform(1e5, 1e6, 12).round(2)))
+        for _, final in ctx.fechas(CASOS)
+    ]
+    return (lambda c: calcular_ibm(c, ctx.indice_ripte)), casos
+
+
+def _convertir_a_jus(ctx: Contexto):
+    casos = [(float(m), d) for m, (d, _) in zip(ctx.rng.uniform(1e4, 1e7, CASOS), ctx.fechas(CASOS))]
+    return (lambda c: convertir_a_jus(c[0], c[1], ctx.indice_jus)), casos
+
+
+def _rubros_despido(ctx: Contexto):
+    casos = [(ingreso, despido, float(s), bool(p)) for (ingreso, despido), s, p in zip(
+        ctx.fechas(CASOS), ctx.rng.uniform(3e5, 2e6, CASOS), ctx.rng.integers(0, 2, CASOS)
+    )]
+    return (lambda c: liquidar_despido(*c)), casos
+
+
+def _actualizar_despido(ctx: Contexto):
+    return (lambda c: actualizar_despido(
+        1e6, c[0], c[1], ctx.indice_ripte, ctx.indice_tasa, ctx.indice_ipc
+    )), ctx.fechas(CASOS)
+
+
+def _actualizar_monto(ctx: Contexto):
+    return (lambda c: actualizar_monto(
+        1e6, c[0], c[1], ctx.indice_ripte, ctx.indice_tasa, ctx.indice_ipc
+    )), ctx.fechas(CASOS)
+
+
+def _pdf_despidos(ctx: Contexto):
+    from utils.reportes_pdf import generar_pdf_despidos
+
+    casos = []
+    for ingreso, despido in ctx.fechas(20):
+        rubros = liquidar_despido(ingreso, despido, 850000.0, False)
+        datos_calculo = {
+            'fecha_ingreso': ingreso.strftime("%d/%m/%Y"),
+            'fecha_despido': despido.strftime("%d/%m/%Y"),
+            'salario': 850000.0,
+            'preaviso': 'Sin preaviso',
+            **rubros
+        }
+        casos.append((datos_calculo, actualizar_despido(
+            rubros['total'], despido, FECHA_FINAL, ctx.indice_ripte, ctx.indice_tasa, ctx.indice_ipc
+        )))
+    return (lambda c: generar_pdf_despidos(*c)), casos
+
+
+def _pdf_ibm(ctx: Contexto):
+    from utils.reportes_pdf import generar_pdf_ibm
+
+    casos = []
+    for _, final in ctx.fechas(20):
+        resultado = calcular_ibm(DatosIBM(final, (500000.0,) * 12), ctx.indice_ripte)
+        casos.append((list(resultado.filas), final, resultado.ibm))
+    return (lambda c: generar_pdf_ibm(*c)), casos
+
+
+CAMINOS: Dict[str, Preparador] = {
+    'indices.tasa.construir': _construir_indice('tasa'),
+    'indices.ripte.construir': _construir_indice('ripte'),
+    'indices.ipc.construir': _construir_indice('ipc'),
+    'indices.jus.construir': _construir_indice('jus'),
+    'indices.pisos.construir': _construir_indice('pisos'),
+    'lrt.calcular_tasa_activa': _tasa_activa,
+    'lrt.get_ripte_coeficiente': _ripte_coeficiente,
+    'lrt.calcular_inflacion': _inflacion,
+    'lrt.get_piso_minimo': _piso_minimo,
+    'lrt.calcular_indemnizacion': _indemnizacion_lrt,
+    'lrt.calcular_indemnizaciones_lote': _indemnizaciones_lote_lrt,
+    'ibm.obtener_ripte': _obtener_ripte,
+    'ibm.calcular_ibm': _ibm,
+    'honorarios.convertir_a_jus': _convertir_a_jus,
+    'despidos.liquidar_despido': _rubros_despido,
+    'despidos.actualizar_despido': _actualizar_despido,
+    'actualizacion.actualizar_monto': _actualizar_monto,
+    'pdf.despidos': _pdf_despidos,
+    'pdf.ibm': _pdf_ibm
+}
+
+
+# ============================================
+# MEDICIÓN
+# ============================================
+
+def medir(funcion: Callable[[Any], Any], casos: Sequence[Any], repeticiones: int = REPETICIONES) -> Tuple[float, float]:
+    """
+    Tiempo por llamada de una función sobre una lista de casos.
+
+    Se hace una pasada de calentamiento y luego `repeticiones` pasadas
+    completas; cada pasada da un tiempo promedio por llamada.
+
+    Returns:
+        (mediana, mínimo) de las pasadas, en microsegundos por llamada
+    """
+    for caso in casos:
+        funcion(caso)
+
+    por_llamada = []
+    for _ in range(repeticiones):
+        t0 = time.perf_counter_ns()
+        for caso in casos:
+            funcion(caso)
+        por_llamada.append((time.perf_counter_ns() - t0) / 1000 / len(casos))
+    return statistics.median(por_llamada), min(por_llamada)
+
+
+def ejecutar_suite(escalas: Sequence[float] = ESCALAS_DEFECTO, filtro: Optional[str] = None,
+                   repeticiones: int = REPETICIONES, informar: Callable[[str], None] = print) -> Tuple[List[Medicion], List[str]]:
+    """
+    Mide todos los caminos (o los que contienen `filtro`) a cada escala.
+
+    Returns:
+        (mediciones, caminos omitidos con el motivo)
+    """
+    caminos = {n: p for n, p in CAMINOS.items() if not filtro or filtro in n}
+    mediciones: List[Medicion] = []
+    omitidos: List[str] = []
+
+    with tempfile.TemporaryDirectory(prefix='bench_datasets_') as tmp:
+        for escala in escalas:
+            t0 = time.perf_counter()
+            ctx = Contexto(escala, Path(tmp) / f"x{escala:g}")
+            informar(f"Escala {escala:g}x: datasets generados e indexados en {time.perf_counter() - t0:.1f} s")
+
+            for nombre, preparar in caminos.items():
+                try:
+                    funcion, casos = preparar(ctx)
+                except ImportError as e:
+                    # Sin reportlab no se miden los PDF
+                    motivo = f"{nombre}: {e}"
+                    if motivo not in omitidos:
+                        omitidos.append(motivo)
+                    continue
+                mediana, minimo = medir(funcion, casos, repeticiones)
+                mediciones.append(Medicion(nombre, escala, len(casos), round(mediana, 3), round(minimo, 3)))
+    return mediciones, omitidos
+
+
+# ============================================
+# HISTORIAL Y REGRESIONES
+# ============================================
+
+def _clave(camino: str, escala: float) -> str:
+    return f"{camino}@{escala:g}x"
+
+
+def _commit_actual() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+            cwd=Path(__file__).resolve().parent, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def maquina_actual() -> str:
+    """Identificador de la máquina: solo se comparan corridas hechas en la misma"""
+    return f"{platform.node()}|{platform.machine()}|{platform.python_version()}"
+
+
+def cargar_historial(ruta: Path) -> List[Dict[str, Any]]:
+    """Corridas registradas (lista vacía si el archivo no existe)"""
+    if not ruta.exists():
+        return []
+    with open(ruta, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def guardar_corrida(ruta: Path, mediciones: List[Medicion]) -> None:
+    """Agrega la corrida al historial"""
+    historial = cargar_historial(ruta)
+    historial.append({
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'commit': _commit_actual(),
+        'maquina': maquina_actual(),
+        'mediciones': {_clave(m.camino, m.escala): asdict(m) for m in mediciones}
+    })
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump(historial, f, ensure_ascii=False, indent=1)
+
+
+def buscar_regresiones(mediciones: List[Medicion], historial: List[Dict[str, Any]],
+                       umbral: float = UMBRAL_DEFECTO) -> List[str]:
+    """
+    Compara cada medición con la mediana de las últimas corridas de la misma máquina.
+
+    Args:
+        mediciones: Corrida actual
+        historial: Corridas anteriores (sin la actual)
+        umbral: Empeoramiento relativo tolerado (0.25 = 25%)
+
+    Returns:
+        Descripción de cada camino que empeoró más que el umbral
+    """
+    maquina = maquina_actual()
+    anteriores = [c for c in historial if c.get('maquina') == maquina][-VENTANA_HISTORIAL:]
+
+    regresiones = []
+    for m in mediciones:
+        clave = _clave(m.camino, m.escala)
+        previos = [c['mediciones'][clave]['mediana_us'] for c in anteriores if clave in c['mediciones']]
+        if not previos:
+            continue
+        referencia = statistics.median(previos)
+        if m.mediana_us > referencia * (1 + umbral) and m.mediana_us - referencia > MINIMO_US:
+            regresiones.append(
+                f"{clave}: {m.mediana_us:,.1f} µs vs {referencia:,.1f} µs "
+                f"(+{(m.mediana_us / referencia - 1) * 100:.0f}%)"
+            )
+    return regresiones
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    """Punto de entrada de python -m benchmarks.suite"""
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.suite',
+        description='Mide los caminos críticos de las calculadoras sobre datasets sintéticos.'
+    )
+    parser.add_argument('--escalas', default=','.join(f"{e:g}" for e in ESCALAS_DEFECTO),
+                        help='Múltiplos del tamaño actual de los datasets, separados por coma')
+    parser.add_argument('--filtro', default=None, help='Medir solo los caminos que contienen este texto')
+    parser.add_argument('--repeticiones', type=int, default=REPETICIONES)
+    parser.add_argument('--umbral', type=float, default=UMBRAL_DEFECTO,
+                        help='Empeoramiento relativo que cuenta como regresión (0.25 = 25%%)')
+    parser.add_argument('--historial', type=Path, default=HISTORIAL_DEFECTO, help='Archivo JSON de historial')
+    parser.add_argument('--sin-guardar', action='store_true', help='No agregar la corrida al historial')
+    args = parser.parse_args(argumentos)
+
+    escalas = [float(e) for e in args.escalas.split(',') if e.strip()]
+    mediciones, omitidos = ejecutar_suite(escalas, args.filtro, args.repeticiones)
+
+    print("=" * 80)
+    print(f"{'CAMINO':<40}{'ESCALA':>8}{'MEDIANA µs':>16}{'MÍNIMO µs':>16}")
+    print("=" * 80)
+    for m in mediciones:
+        print(f"{m.camino:<40}{m.escala:>7g}x{m.mediana_us:>16,.1f}{m.minimo_us:>16,.1f}")
+    for motivo in omitidos:
+        print(f"Omitido: {motivo}")
+
+    regresiones = buscar_regresiones(mediciones, cargar_historial(args.historial), args.umbral)
+    if not args.sin_guardar:
+        guardar_corrida(args.historial, mediciones)
+        print(f"\nCorrida agregada a {args.historial}")
+
+    if regresiones:
+        print(f"\nREGRESIONES (umbral {args.umbral:.0%}):")
+        for r in regresiones:
+            print(f"   {r}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,6 +8,8 @@ Aplicación principal con autenticación y menú de acceso a todas las herramien
 """
 
 import streamlit as st
+import csv
+from datetime import datetime
 from pathlib import Path
 import sys
 
@@ -17,7 +19,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Importar módulo de autenticación
 from utils.auth import AuthSystem
 from utils.simple_session import SimpleSessionManager
-from utils.data_loader import get_ultimo_dato
+from utils.aplicaciones import cargar_aplicacion, iniciar_en_segundo_plano
+from utils.metricas import medir_ejecucion
+from utils.perfilado import perfilar_ejecucion
 
 # Configuración de la página
 st.set_page_config(
@@ -79,6 +83,22 @@ APLICACIONES = {
     }
 }
 
+def iniciar_servicios():
+    """Vigilante de los CSV de data/, servicio HTTP de las calculadoras (si TRIBUNAL_SERVICIO_API=1) y mantenimiento de la auditoría"""
+    # Imports diferidos: ambos cargan pandas y los índices, que el login no necesita
+    from utils.eventos import iniciar_vigilancia
+    from motor.servicio import iniciar_servicio
+    from utils.retencion import iniciar_mantenimiento
+    
+    iniciar_vigilancia()
+    iniciar_servicio()
+    iniciar_mantenimiento()
+
+def leer_ultimo_dato(ruta):
+    """Primera fila de un CSV de data/ (el dato más reciente) como dict, o None si está vacío"""
+    with open(ruta, encoding='utf-8', newline='') as f:
+        return next(csv.DictReader(f), None)
+
 # CSS personalizado para el sistema
 def load_custom_css():
     st.markdown("""
@@ -280,19 +300,17 @@ def ejecutar_aplicacion(app_key):
     
     try:
         # Ejecutar la aplicación directamente (sin botón volver ni título - ahora se maneja dentro de cada app)
-        import importlib.util
-        
         modulo_nombre = app_info['archivo']
         archivo_path = f"{modulo_nombre.replace('.', '/')}.py"
         
         try:
-            # Cargar módulo desde archivo
-            spec = importlib.util.spec_from_file_location(modulo_nombre, archivo_path)
-            modulo = importlib.util.module_from_spec(spec)
-            sys.modules[modulo_nombre] = modulo
-            
-            # Ejecutar el módulo
-            spec.loader.exec_module(modulo)
+            # El módulo se carga una vez por proceso (y de nuevo si cambia el
+            # archivo); en cada rerun solo se dibuja. Cada rerun se mide por
+            # fases y, si un superadmin lo armó, se perfila con cProfile
+            username = st.session_state.usuario.get('username', '')
+            with medir_ejecucion(app_key, username), perfilar_ejecucion(app_key, username):
+                aplicacion = cargar_aplicacion(modulo_nombre)
+                aplicacion.render()
             
         except FileNotFoundError:
             st.error(f"❌ No se encuentra el archivo: {archivo_path}")
@@ -378,28 +396,17 @@ def mostrar_menu_principal():
     
     # Mostrar últimos datos disponibles - ANTES DEL FOOTER
     try:
-        import pandas as pd
-        
-        # Cargar datasets
-        df_ripte = pd.read_csv("data/dataset_ripte.csv", encoding='utf-8')
-        
-        df_ipc = pd.read_csv("data/dataset_ipc.csv", encoding='utf-8')
-        df_ipc['periodo'] = pd.to_datetime(df_ipc['periodo'])
-        
-        df_tasa = pd.read_csv("data/dataset_tasa.csv", encoding='utf-8')
-        df_tasa['Desde'] = pd.to_datetime(df_tasa['Desde'], format='%d/%m/%Y', dayfirst=True)
-        df_tasa['Hasta'] = pd.to_datetime(df_tasa['Hasta'], format='%d/%m/%Y', dayfirst=True)
-        
-        df_jus = pd.read_csv("data/Dataset_JUS.csv", encoding='utf-8')
-        
-        df_pisos = pd.read_csv("data/dataset_pisos.csv", encoding='utf-8')
+        # Solo la primera fila de cada CSV (el dato más reciente está arriba):
+        # el menú no necesita pandas
+        ultimo_ripte = leer_ultimo_dato("data/dataset_ripte.csv")
+        ultimo_ipc = leer_ultimo_dato("data/dataset_ipc.csv")
+        ultima_tasa = leer_ultimo_dato("data/dataset_tasa.csv")
         
         # Obtener últimos datos con colores
         textos_datos = []
         
         # RIPTE - Color azul
-        if not df_ripte.empty:
-            ultimo_ripte = get_ultimo_dato(df_ripte)
+        if ultimo_ripte:
             
             # Usar directamente año y mes del dataframe
             año_ripte = ultimo_ripte['año']
@@ -419,35 +426,33 @@ def mostrar_menu_principal():
             
             # Intentar diferentes nombres de columna para el valor
             try:
-                valor_ripte = ultimo_ripte['índice RIPTE']
+                valor_ripte = float(ultimo_ripte['índice RIPTE'])
             except:
                 try:
-                    valor_ripte = ultimo_ripte['indice_ripte']
+                    valor_ripte = float(ultimo_ripte['indice_ripte'])
                 except:
-                    valor_ripte = ultimo_ripte.iloc[2]  # Tercera columna
+                    valor_ripte = float(list(ultimo_ripte.values())[2])  # Tercera columna
             
             textos_datos.append(f'<span style="color: #1f77b4; font-weight: 600;">RIPTE {mes_ripte}/{año_ripte}: {valor_ripte:,.0f}</span>')
         
         # IPC - Color verde
-        if not df_ipc.empty:
-            ultimo_ipc = get_ultimo_dato(df_ipc)
-            fecha_ipc = ultimo_ipc['periodo']
-            variacion_ipc = ultimo_ipc['variacion_mensual']
+        if ultimo_ipc:
+            fecha_ipc = datetime.strptime(ultimo_ipc['periodo'].strip()[:7], '%Y-%m')
+            variacion_ipc = float(ultimo_ipc['variacion_mensual'])
             mes_ipc = fecha_ipc.month
             año_ipc = fecha_ipc.year
             textos_datos.append(f'<span style="color: #2ca02c; font-weight: 600;">IPC {mes_ipc}/{año_ipc}: {variacion_ipc:.2f}%</span>')
         
         # TASA - Color naranja
-        if not df_tasa.empty:
-            ultima_tasa = get_ultimo_dato(df_tasa)
-            valor_tasa = ultima_tasa['Valor']
-            fecha_hasta = ultima_tasa['Hasta']
+        if ultima_tasa:
+            valor_tasa = float(ultima_tasa['Valor'])
+            fecha_hasta = datetime.strptime(ultima_tasa['Hasta'].strip(), '%d/%m/%Y')
             fecha_txt = fecha_hasta.strftime("%d/%m/%Y")
             textos_datos.append(f'<span style="color: #ff7f0e; font-weight: 600;">TASA {fecha_txt}: {valor_tasa:.2f}%</span>')
         
         # JUS - Color morado
         try:
-            ultimo_jus = get_ultimo_dato(df_jus)
+            ultimo_jus = leer_ultimo_dato("data/Dataset_JUS.csv")
             fecha_jus = ultimo_jus['FECHA ENTRADA EN VIGENCIA '].strip() if isinstance(ultimo_jus['FECHA ENTRADA EN VIGENCIA '], str) else ultimo_jus['FECHA ENTRADA EN VIGENCIA ']
             valor_jus_str = ultimo_jus['VALOR IUS'].strip()
             acuerdo_jus = ultimo_jus['ACUERDO'].strip()
@@ -464,7 +469,7 @@ def mostrar_menu_principal():
         
         # PISOS - Color rojo
         try:
-            ultimo_piso = get_ultimo_dato(df_pisos)
+            ultimo_piso = leer_ultimo_dato("data/dataset_pisos.csv")
             fecha_inicio = ultimo_piso['fecha_inicio']
             norma_piso = ultimo_piso['norma']
             monto_piso = float(ultimo_piso['monto_minimo'])
@@ -501,6 +506,11 @@ def mostrar_menu_principal():
 
 def main():
     """Función principal del sistema"""
+    # Vigilante de los CSV de data/ y servicio HTTP de las calculadoras
+    # (comparte los índices de este proceso): se inician una sola vez por
+    # proceso, en segundo plano, para que el login no espere a pandas
+    iniciar_en_segundo_plano('servicios', iniciar_servicios)
+    
     # Cargar estilos CSS
     load_custom_css()
     
@@ -519,27 +529,10 @@ def main():
         
         if username:
             # Token válido - obtener datos del usuario desde BD
-            import sqlite3
             try:
-                conn = sqlite3.connect('data/usuarios.db')
-                cursor = conn.cursor()
-                cursor.execute('SELECT * FROM usuarios WHERE username = ? AND activo = 1', (username,))
-                user_row = cursor.fetchone()
-                conn.close()
+                user_dict = AuthSystem().obtener_usuario(username)
                 
-                if user_row:
-                    # Recrear dict de usuario
-                    user_dict = {
-                        'id': user_row[0],
-                        'username': user_row[1],
-                        'nivel': user_row[3],
-                        'nombre_completo': user_row[4],
-                        'email': user_row[5],
-                        'fecha_creacion': user_row[6],
-                        'ultimo_acceso': user_row[7],
-                        'activo': user_row[8]
-                    }
-                    
+                if user_dict and user_dict['activo']:
                     # Restaurar sesión
                     st.session_state.autenticado = True
                     st.session_state.usuario = user_dict
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de cálculo - Sistema de Cálculos y Herramientas
+Tribunal de Trabajo 2 de Quilmes
+
+Lógica de cálculo de las calculadoras, separada de las páginas de Streamlit
+para poder usarla fuera de la interfaz (procesamiento por lotes, servicios,
+benchmarks). Ningún módulo del paquete importa Streamlit ni reportlab.
+
+Uso:
+    from motor import DatosDespido, calcular_despido
+    resultado = calcular_despido(DatosDespido(date(2015, 3, 1), date(2024, 5, 10), 850000.0))
+
+Módulos:
+    tipos: Datos de entrada y resultados tipados (solo biblioteca estándar)
+    lrt: Indemnizaciones Ley 24.557
+    despidos: Indemnizaciones por despido (Ley 20.744)
+    ibm: Ingreso Base Mensual
+    actualizacion: Actualización de montos por RIPTE, Tasa Activa e IPC
+    honorarios: Conversión de pesos a JUS
+    lote: Procesamiento por lotes desde CSV/JSONL
+    servicio: Servicio HTTP JSON (python -m motor.servicio)
+"""
+
+import importlib
+
+from .tipos import (
+    InputData,
+    Results,
+    DatosDespido,
+    ResultadoDespido,
+    DatosIBM,
+    ResultadoIBM,
+    DatosActualizacion,
+    ResultadoActualizacion,
+    DatosConversionJus,
+    ResultadoConversionJus
+)
+
+# Las funciones de cálculo se importan al usarlas por primera vez: importar
+# el paquete y sus tipos no carga pandas ni NumPy (ni nunca Streamlit).
+_CALCULOS = {
+    'calcular_lrt': 'lrt',
+    'calcular_despido': 'despidos',
+    'calcular_ibm': 'ibm',
+    'calcular_actualizacion': 'actualizacion',
+    'calcular_jus': 'honorarios'
+}
+
+
+def __getattr__(nombre):
+    if nombre not in _CALCULOS:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{_CALCULOS[nombre]}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+__all__ = [
+    'InputData',
+    'Results',
+    'DatosDespido',
+    'ResultadoDespido',
+    'DatosIBM',
+    'ResultadoIBM',
+    'DatosActualizacion',
+    'ResultadoActualizacion',
+    'DatosConversionJus',
+    'ResultadoConversionJus',
+    'calcular_lrt',
+    'calcular_despido',
+    'calcular_ibm',
+    'calcular_actualizacion',
+    'calcular_jus'
+]
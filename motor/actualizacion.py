@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de cálculo - Actualización de montos
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Actualización por RIPTE y por IPC (con tasa pura variable) y por Tasa
+Activa. Lo usan la calculadora de actualización y el procesamiento por lotes.
+"""
+
+from typing import Any, Dict
+
+from utils.indices import obtener_indice_tasa, obtener_indice_ripte, obtener_indice_ipc
+from utils.metricas import medido
+
+from .tipos import DatosActualizacion, ResultadoActualizacion
+
+
+# Función para actualizar por RIPTE con tasa pura variable
+def actualizar_ripte(monto_base, fecha_inicial, fecha_final, indice_ripte, tasa_pura):
+    """Actualiza un monto por RIPTE + tasa pura variable"""
+    if indice_ripte.meses == 0:
+        return monto_base, 1.0, 0.0
+
+    # Último RIPTE publicado a cada fecha (si no hay, el más reciente)
+    ripte_pmi = indice_ripte.ultimo_publicado(fecha_inicial)
+    if ripte_pmi is None:
+        ripte_pmi = indice_ripte.mas_reciente()
+
+    ripte_final = indice_ripte.ultimo_publicado(fecha_final)
+    if ripte_final is None:
+        ripte_final = indice_ripte.mas_reciente()
+
+    # Calcular coeficiente RIPTE
+    coeficiente = ripte_final / ripte_pmi if ripte_pmi > 0 else 1.0
+
+    # Aplicar RIPTE
+    ripte_actualizado = monto_base * coeficiente
+
+    # Aplicar tasa pura adicional
+    interes_puro = ripte_actualizado * (tasa_pura / 100)
+
+    total = ripte_actualizado + interes_puro
+
+    return total, coeficiente, interes_puro
+
+# Función para actualizar por Tasa Activa
+def actualizar_tasa(monto_base, fecha_inicial, fecha_final, indice_tasa):
+    """Actualiza un monto por Tasa Activa (suma prefija sobre el índice diario)"""
+    total_aporte_pct = indice_tasa.acumulado_pct(fecha_inicial, fecha_final)
+    total_actualizado = monto_base * (1.0 + total_aporte_pct / 100.0)
+
+    return total_actualizado, total_aporte_pct
+
+# Función para actualizar por IPC con tasa pura variable
+def actualizar_ipc(monto_base, fecha_inicial, fecha_final, indice_ipc, tasa_pura):
+    """Actualiza un monto por IPC + tasa pura variable"""
+    # Sin ningún IPC publicado en el rango no se actualiza (ni se suma la tasa pura)
+    if indice_ipc.meses_con_dato(fecha_inicial, fecha_final) == 0:
+        return monto_base, 0.0, 0.0
+
+    # Factor acumulado entre los meses de ambas fechas (suma de logaritmos)
+    factor_acumulado = indice_ipc.factor(fecha_inicial, fecha_final)
+    inflacion_acumulada = (factor_acumulado - 1) * 100
+
+    # Aplicar IPC
+    ipc_actualizado = monto_base * factor_acumulado
+
+    # Aplicar tasa pura adicional
+    interes_puro = ipc_actualizado * (tasa_pura / 100)
+
+    total = ipc_actualizado + interes_puro
+
+    return total, inflacion_acumulada, interes_puro
+
+# Función para calcular las tres actualizaciones de un monto
+@medido('calculo')
+def actualizar_monto(monto, fecha_inicial, fecha_final, indice_ripte, indice_tasa, indice_ipc,
+                     tasa_pura_ripte=3, tasa_pura_ipc=3) -> Dict[str, Any]:
+    """
+    Actualiza un monto por RIPTE, Tasa Activa e IPC.
+
+    Returns:
+        Diccionario con los totales, coeficientes e intereses de cada método,
+        los meses sin IPC publicado y los datos de entrada
+    """
+    ripte_total, ripte_coef, ripte_interes = actualizar_ripte(
+        monto, fecha_inicial, fecha_final, indice_ripte, tasa_pura_ripte
+    )
+
+    tasa_total, tasa_pct = actualizar_tasa(
+        monto, fecha_inicial, fecha_final, indice_tasa
+    )
+
+    ipc_total, ipc_inflacion, ipc_interes = actualizar_ipc(
+        monto, fecha_inicial, fecha_final, indice_ipc, tasa_pura_ipc
+    )
+
+    return {
+        'ripte_total': ripte_total,
+        'ripte_coef': ripte_coef,
+        'ripte_interes': ripte_interes,
+        'tasa_total': tasa_total,
+        'tasa_pct': tasa_pct,
+        'ipc_total': ipc_total,
+        'ipc_inflacion': ipc_inflacion,
+        'ipc_interes': ipc_interes,
+        'ipc_faltantes': indice_ipc.meses_faltantes(fecha_inicial, fecha_final),
+        'monto': monto,
+        'fecha_inicial': fecha_inicial,
+        'fecha_final': fecha_final,
+        'tasa_pura_ripte': tasa_pura_ripte,
+        'tasa_pura_ipc': tasa_pura_ipc
+    }
+
+# Función para validar los datos de un caso
+def error_entrada_actualizacion(datos: DatosActualizacion) -> str:
+    """
+    Motivo por el que una actualización no se puede calcular.
+
+    Args:
+        datos: Monto, fechas y tasas puras
+
+    Returns:
+        str: Descripción del problema, o '' si los datos son válidos
+    """
+    # Comparaciones por la positiva: NaN no pasa ninguna
+    if not datos.monto > 0:
+        return f"Monto inválido: {datos.monto:g} (debe ser mayor que 0)"
+    if datos.fecha_inicial >= datos.fecha_final:
+        return "La fecha inicial debe ser anterior a la fecha final"
+    for nombre, tasa in (('RIPTE', datos.tasa_pura_ripte), ('IPC', datos.tasa_pura_ipc)):
+        if not 0 <= tasa <= 100:
+            return f"Tasa pura {nombre} inválida: {tasa:g} (debe estar entre 0 y 100)"
+    return ""
+
+# Función para calcular un caso completo con datos tipados
+def calcular_actualizacion(datos: DatosActualizacion, indice_ripte=None, indice_tasa=None,
+                           indice_ipc=None) -> ResultadoActualizacion:
+    """
+    Actualiza un monto por RIPTE, Tasa Activa e IPC con datos tipados.
+
+    Args:
+        datos: Monto, fechas y tasas puras
+        indice_ripte, indice_tasa, indice_ipc: Índices a usar (por defecto,
+            los de los datasets vigentes)
+
+    Returns:
+        ResultadoActualizacion con los totales de cada método
+    """
+    if indice_ripte is None:
+        indice_ripte = obtener_indice_ripte()
+    if indice_tasa is None:
+        indice_tasa = obtener_indice_tasa()
+    if indice_ipc is None:
+        indice_ipc = obtener_indice_ipc()
+
+    r = actualizar_monto(
+        datos.monto, datos.fecha_inicial, datos.fecha_final,
+        indice_ripte, indice_tasa, indice_ipc,
+        datos.tasa_pura_ripte, datos.tasa_pura_ipc
+    )
+    return ResultadoActualizacion(
+        ripte_total=float(r['ripte_total']),
+        ripte_coef=float(r['ripte_coef']),
+        ripte_interes=float(r['ripte_interes']),
+        tasa_total=float(r['tasa_total']),
+        tasa_pct=float(r['tasa_pct']),
+        ipc_total=float(r['ipc_total']),
+        ipc_inflacion=float(r['ipc_inflacion']),
+        ipc_interes=float(r['ipc_interes']),
+        ipc_faltantes=tuple(r['ipc_faltantes'])
+    )
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de cálculo - Indemnizaciones por despido (Ley 20.744)
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Rubros de la liquidación y actualizaciones (RIPTE + 3%, Tasa Activa, IPC).
+Lo usan la calculadora de despidos y el procesamiento por lotes.
+"""
+
+from datetime import date
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Dict
+
+from utils.funciones_comunes import days_in_month
+from utils.indices import a_ordinal, obtener_indice_tasa, obtener_indice_ripte, obtener_indice_ipc
+from utils.metricas import medido
+
+from .tipos import DatosDespido, ResultadoDespido
+
+
+# Función para calcular antigüedad
+def calcular_antiguedad(fecha_ingreso, fecha_despido):
+    """Calcula años y meses de antigüedad"""
+    años = fecha_despido.year - fecha_ingreso.year
+    meses = fecha_despido.month - fecha_ingreso.month
+    dias = fecha_despido.day - fecha_ingreso.day
+
+    if dias < 0:
+        meses -= 1
+
+    if meses < 0:
+        años -= 1
+        meses += 12
+
+    # Si los meses son mayor a 3, se considera un año completo adicional
+    if meses > 3:
+        años += 1
+        meses = 0
+
+    return años, meses
+
+# Función para calcular días de vacaciones según antigüedad
+def calcular_dias_vacaciones(años_antiguedad):
+    """Calcula días de vacaciones según LCT 20744"""
+    if años_antiguedad < 5:
+        return 14
+    elif años_antiguedad < 10:
+        return 21
+    elif años_antiguedad < 20:
+        return 28
+    else:
+        return 35
+
+# Función para calcular los rubros de la liquidación
+@medido('calculo')
+def liquidar_despido(fecha_ingreso: date, fecha_despido: date, salario: float,
+                     se_pago_preaviso: bool) -> Dict[str, Any]:
+    """
+    Calcula los rubros de la indemnización por despido.
+
+    Cada concepto se calcula con Decimal y se redondea a 2 decimales antes
+    de sumar el total.
+
+    Args:
+        fecha_ingreso: Fecha de ingreso del trabajador
+        fecha_despido: Fecha del despido
+        salario: Salario mensual bruto
+        se_pago_preaviso: Si el preaviso fue pagado
+
+    Returns:
+        Diccionario con antigüedad, importe de cada rubro (float), total y
+        los datos auxiliares del detalle (días, semestre, salarios de preaviso)
+    """
+    # Calcular antigüedad
+    años, meses = calcular_antiguedad(fecha_ingreso, fecha_despido)
+
+    # Calcular conceptos con Decimal para precisión
+    # 1. Antigüedad Art. 245
+    antiguedad_245 = Decimal(str(salario)) * Decimal(str(años))
+
+    # 2. Sustitutiva de preaviso
+    if not se_pago_preaviso:
+        if años < 5:
+            sustitutiva_preaviso = Decimal(str(salario)) * Decimal('1')
+        else:
+            sustitutiva_preaviso = Decimal(str(salario)) * Decimal('2')
+        sac_preaviso = sustitutiva_preaviso / Decimal('12')
+    else:
+        sustitutiva_preaviso = Decimal('0')
+        sac_preaviso = Decimal('0')
+
+    # 3. Días trabajados del mes
+    dias_mes = days_in_month(fecha_despido)
+    dias_trabajados_mes = fecha_despido.day
+    dias_trabajados = (Decimal(str(salario)) / Decimal(str(dias_mes))) * Decimal(str(dias_trabajados_mes))
+
+    # 4. Integración mes de despido
+    if fecha_despido.day == dias_mes:
+        integracion_mes = Decimal('0')
+        sac_integracion = Decimal('0')
+    else:
+        dias_integracion = dias_mes - dias_trabajados_mes
+        integracion_mes = (Decimal(str(salario)) / Decimal(str(dias_mes))) * Decimal(str(dias_integracion))
+        sac_integracion = integracion_mes / Decimal('12')
+
+    # 5. SAC Proporcional
+    if fecha_despido.month <= 6:
+        dias_desde_sac = (fecha_despido - date(fecha_despido.year, 1, 1)).days
+    else:
+        dias_desde_sac = (fecha_despido - date(fecha_despido.year, 7, 1)).days
+
+    sac_proporcional = (Decimal(str(salario)) / Decimal('365')) * Decimal(str(dias_desde_sac))
+
+    # 6. Vacaciones no gozadas
+    dias_vacaciones = calcular_dias_vacaciones(años)
+    valor_dia_vacaciones = Decimal(str(salario)) / Decimal('25')
+    vacaciones = valor_dia_vacaciones * Decimal(str(dias_vacaciones))
+    sac_vacaciones = vacaciones / Decimal('12')
+
+    # Total - redondear cada concepto a 2 decimales
+    antiguedad_245 = antiguedad_245.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    sustitutiva_preaviso = sustitutiva_preaviso.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    sac_preaviso = sac_preaviso.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    dias_trabajados = dias_trabajados.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    integracion_mes = integracion_mes.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    sac_integracion = sac_integracion.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    sac_proporcional = sac_proporcional.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    vacaciones = vacaciones.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    sac_vacaciones = sac_vacaciones.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+
+    total = (antiguedad_245 + sustitutiva_preaviso + sac_preaviso +
+             dias_trabajados + integracion_mes + sac_integracion +
+             sac_proporcional + vacaciones + sac_vacaciones)
+
+    return {
+        'años': años,
+        'meses': meses,
+        'antiguedad_245': float(antiguedad_245),
+        'sustitutiva_preaviso': float(sustitutiva_preaviso),
+        'sac_preaviso': float(sac_preaviso),
+        'dias_trabajados': float(dias_trabajados),
+        'integracion_mes': float(integracion_mes),
+        'sac_integracion': float(sac_integracion),
+        'sac_proporcional': float(sac_proporcional),
+        'vacaciones': float(vacaciones),
+        'sac_vacaciones': float(sac_vacaciones),
+        'total': float(total),
+        # Datos adicionales para detalles
+        'dias_trabajados_mes': dias_trabajados_mes,
+        'dias_integracion': dias_mes - dias_trabajados_mes if fecha_despido.day != dias_mes else 0,
+        'dias_desde_sac': dias_desde_sac,
+        'semestre_sac': '1er' if fecha_despido.month <= 6 else '2do',
+        'dias_vacaciones': dias_vacaciones,
+        'salarios_preaviso': 1 if años < 5 else 2
+    }
+
+# Función para actualizar por RIPTE
+def actualizar_ripte(monto_base, fecha_inicial, fecha_final, indice_ripte):
+    """Actualiza un monto por RIPTE + 3% - índice mensual denso"""
+    if indice_ripte.meses == 0:
+        return monto_base
+
+    # Último RIPTE publicado a cada fecha (si no hay, el más antiguo)
+    ripte_pmi = indice_ripte.ultimo_publicado(fecha_inicial)
+    if ripte_pmi is None:
+        ripte_pmi = indice_ripte.mas_antiguo()
+
+    ripte_final = indice_ripte.ultimo_publicado(fecha_final)
+    if ripte_final is None:
+        ripte_final = indice_ripte.mas_antiguo()
+
+    # Calcular coeficiente RIPTE
+    coeficiente = ripte_final / ripte_pmi if ripte_pmi > 0 else 1.0
+
+    # Aplicar RIPTE
+    ripte_actualizado = monto_base * coeficiente
+
+    # Calcular días para interés 3%
+    dias = a_ordinal(fecha_final) - a_ordinal(fecha_inicial)
+    factor_dias = dias / 365.0
+
+    # Aplicar 3% proporcional
+    interes_puro = ripte_actualizado * 0.03 * factor_dias
+
+    total_ripte_3 = ripte_actualizado + interes_puro
+
+    return total_ripte_3
+
+# Función para actualizar por Tasa Activa
+def actualizar_tasa(monto_base, fecha_inicial, fecha_final, indice_tasa):
+    """Actualiza un monto por Tasa Activa (suma prefija sobre el índice diario)"""
+    total_aporte_pct = indice_tasa.acumulado_pct(fecha_inicial, fecha_final)
+    total_actualizado = monto_base * (1.0 + total_aporte_pct / 100.0)
+
+    return total_actualizado
+
+# Función para calcular IPC acumulado
+def calcular_ipc_acumulado(fecha_inicial, fecha_final, indice_ipc):
+    """Calcula el IPC acumulado entre dos fechas"""
+    if indice_ipc.meses == 0:
+        return 0.0
+
+    # Un solo cociente sobre la suma acumulada de logaritmos
+    return indice_ipc.inflacion_pct(fecha_inicial, fecha_final)
+
+# Función para calcular todas las actualizaciones de un total
+@medido('calculo')
+def actualizar_despido(total, fecha_despido, fecha_liquidacion, indice_ripte, indice_tasa, indice_ipc) -> Dict[str, Any]:
+    """
+    Actualiza el total de la liquidación a la fecha de liquidación.
+
+    Returns:
+        Diccionario con 'ripte' (RIPTE + 3%), 'tasa' (Tasa Activa), 'ipc'
+        (inflación acumulada en %) e 'ipc_faltantes' (meses sin IPC publicado)
+    """
+    return {
+        'ripte': actualizar_ripte(total, fecha_despido, fecha_liquidacion, indice_ripte),
+        'tasa': actualizar_tasa(total, fecha_despido, fecha_liquidacion, indice_tasa),
+        'ipc': calcular_ipc_acumulado(fecha_despido, fecha_liquidacion, indice_ipc),
+        'ipc_faltantes': indice_ipc.meses_faltantes(fecha_despido, fecha_liquidacion)
+    }
+
+# Función para validar los datos de un caso
+def error_entrada_despido(datos: DatosDespido) -> str:
+    """
+    Motivo por el que un despido no se puede calcular.
+
+    Args:
+        datos: Datos de entrada del caso
+
+    Returns:
+        str: Descripción del problema, o '' si los datos son válidos
+    """
+    # Comparación por la positiva: NaN no la pasa
+    if not datos.salario >= 0:
+        return f"Salario inválido: {datos.salario:g} (debe ser mayor o igual a 0)"
+    if datos.fecha_despido < datos.fecha_ingreso:
+        return "La fecha de despido no puede ser anterior a la fecha de ingreso"
+    if datos.fecha_liquidacion is not None and datos.fecha_liquidacion < datos.fecha_despido:
+        return "La fecha de liquidación no puede ser anterior a la fecha de despido"
+    return ""
+
+# Función para calcular un caso completo con datos tipados
+def calcular_despido(datos: DatosDespido, indice_ripte=None, indice_tasa=None, indice_ipc=None) -> ResultadoDespido:
+    """
+    Liquida un despido y lo actualiza a la fecha de liquidación.
+
+    Args:
+        datos: Datos de entrada del caso
+        indice_ripte, indice_tasa, indice_ipc: Índices a usar (por defecto,
+            los de los datasets vigentes)
+
+    Returns:
+        ResultadoDespido con los rubros y las actualizaciones
+    """
+    if indice_ripte is None:
+        indice_ripte = obtener_indice_ripte()
+    if indice_tasa is None:
+        indice_tasa = obtener_indice_tasa()
+    if indice_ipc is None:
+        indice_ipc = obtener_indice_ipc()
+    fecha_liquidacion = datos.fecha_liquidacion or date.today()
+
+    rubros = liquidar_despido(datos.fecha_ingreso, datos.fecha_despido, datos.salario, datos.se_pago_preaviso)
+    actualizacion = actualizar_despido(
+        rubros['total'], datos.fecha_despido, fecha_liquidacion,
+        indice_ripte, indice_tasa, indice_ipc
+    )
+    return ResultadoDespido(
+        **rubros,
+        total_ripte=float(actualizacion['ripte']),
+        total_tasa=float(actualizacion['tasa']),
+        inflacion_pct=float(actualizacion['ipc']),
+        ipc_faltantes=tuple(actualizacion['ipc_faltantes'])
+    )
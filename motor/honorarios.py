@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de cálculo - Honorarios profesionales
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Conversión de pesos a JUS según el valor vigente a una fecha. Lo usan la
+calculadora de honorarios y el procesamiento por lotes.
+"""
+
+from datetime import date
+from typing import Any, Dict, Optional
+
+from utils.indices import obtener_indice_jus
+from utils.metricas import medido
+
+from .tipos import DatosConversionJus, ResultadoConversionJus
+
+
+# Función para convertir pesos a JUS
+@medido('calculo')
+def convertir_a_jus(monto_pesos, fecha_conversion, indice_jus) -> Optional[Dict[str, Any]]:
+    """Convierte un monto en pesos a JUS según la fecha (None si no hay valores de JUS)"""
+    # Los registros del índice vienen de una tabla de pandas (fechas Timestamp/NaT)
+    import pandas as pd
+    registro = indice_jus.buscar(fecha_conversion)
+
+    if registro is None:
+        registro = indice_jus.mas_antiguo()
+    if registro is None:
+        return None
+
+    valor_jus = float(registro['VALOR IUS'])
+    fecha_hasta = registro['FECHA DE FINALIZACION']
+
+    jus_exacto = float(monto_pesos) / valor_jus
+    jus_redondeado = round(jus_exacto, 2)
+
+    return {
+        'jus': jus_redondeado,
+        'jus_exacto': jus_exacto,
+        'valor_jus': valor_jus,
+        'acuerdo': registro['ACUERDO'],
+        'fecha_desde': registro['FECHA ENTRADA EN VIGENCIA'],
+        'fecha_hasta': fecha_hasta if pd.notna(fecha_hasta) else "Actualidad"
+    }
+
+# Función para obtener el valor del JUS vigente
+def valor_jus_vigente(indice_jus, fecha: Optional[date] = None) -> Optional[float]:
+    """Valor del JUS vigente a la fecha (hoy por defecto; si no hay, el más reciente)"""
+    registro = indice_jus.buscar(fecha or date.today())
+
+    if registro is None:
+        registro = indice_jus.mas_reciente()
+    if registro is None:
+        return None
+
+    return float(registro['VALOR IUS'])
+
+# Función para validar los datos de un caso
+def error_entrada_jus(datos: DatosConversionJus) -> str:
+    """
+    Motivo por el que una conversión no se puede calcular.
+
+    Args:
+        datos: Monto en pesos y fecha de conversión
+
+    Returns:
+        str: Descripción del problema, o '' si los datos son válidos
+    """
+    # Comparación por la positiva: NaN no la pasa
+    if not datos.monto_pesos > 0:
+        return f"Monto inválido: {datos.monto_pesos:g} (debe ser mayor que 0)"
+    return ""
+
+# Función para convertir un caso con datos tipados
+def calcular_jus(datos: DatosConversionJus, indice_jus=None) -> ResultadoConversionJus:
+    """
+    Convierte un monto en pesos a JUS y lo expresa al valor del JUS vigente hoy.
+
+    Args:
+        datos: Monto en pesos y fecha de conversión
+        indice_jus: IndiceVigencias del JUS (por defecto, el del dataset vigente)
+
+    Returns:
+        ResultadoConversionJus
+
+    Raises:
+        ValueError: Si no hay valores de JUS cargados
+    """
+    if indice_jus is None:
+        indice_jus = obtener_indice_jus()
+
+    import pandas as pd
+    conversion = convertir_a_jus(datos.monto_pesos, datos.fecha_conversion, indice_jus)
+    if conversion is None:
+        raise ValueError("No hay valores de JUS cargados")
+
+    fecha_desde = conversion['fecha_desde']
+    fecha_hasta = conversion['fecha_hasta']
+    return ResultadoConversionJus(
+        jus=conversion['jus'],
+        jus_exacto=conversion['jus_exacto'],
+        valor_jus=conversion['valor_jus'],
+        acuerdo=str(conversion['acuerdo']),
+        fecha_desde=pd.Timestamp(fecha_desde).date() if pd.notna(fecha_desde) else None,
+        fecha_hasta=pd.Timestamp(fecha_hasta).date() if isinstance(fecha_hasta, (date, pd.Timestamp)) else None,
+        monto_actualizado=conversion['jus_exacto'] * valor_jus_vigente(indice_jus)
+    )
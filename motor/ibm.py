@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de cálculo - Ingreso Base Mensual (Ley 24.557, Art. 12 Inc. 1)
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Actualización por RIPTE de los salarios de los 12 meses anteriores a la
+PMI y promedio resultante. Lo usan la calculadora IBM y el procesamiento
+por lotes.
+"""
+
+import calendar
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Dict, List
+
+from utils.indices import obtener_indice_ripte
+from utils.metricas import medido
+
+from .tipos import DatosIBM, ResultadoIBM
+
+
+def obtener_ripte(indice_ripte, año, mes):
+    """Obtiene el índice RIPTE para un año y mes"""
+    return indice_ripte.valor(año, mes)
+
+def calcular_variacion_ripte(indice_ripte, año_desde, mes_desde, año_hasta, mes_hasta):
+    """Calcula la variación RIPTE entre dos fechas"""
+    indice_desde = obtener_ripte(indice_ripte, año_desde, mes_desde)
+    indice_hasta = obtener_ripte(indice_ripte, año_hasta, mes_hasta)
+
+    if indice_desde is None or indice_hasta is None or indice_desde == 0:
+        return None
+
+    return (indice_hasta - indice_desde) / indice_desde
+
+def mes_anterior(fecha):
+    """Misma fecha un mes antes, con el día ajustado al último del mes (como relativedelta)"""
+    año, mes = (fecha.year, fecha.month - 1) if fecha.month > 1 else (fecha.year - 1, 12)
+    return fecha.replace(year=año, month=mes, day=min(fecha.day, calendar.monthrange(año, mes)[1]))
+
+def obtener_meses_anteriores(fecha_pmi, cantidad=12):
+    """Obtiene lista de meses anteriores a la PMI"""
+    meses = []
+    fecha = fecha_pmi
+    for i in range(cantidad):
+        fecha = mes_anterior(fecha)
+        meses.append(fecha)
+    meses.reverse()
+    return meses
+
+def obtener_nombre_mes(fecha):
+    """Obtiene nombre del mes en formato mes-año"""
+    meses = ['ene', 'feb', 'mar', 'abr', 'may', 'jun',
+             'jul', 'ago', 'sep', 'oct', 'nov', 'dic']
+    return f"{meses[fecha.month-1]}.-{str(fecha.year)[2:]}"
+
+def obtener_dias_mes(año, mes):
+    """Obtiene días de un mes"""
+    return calendar.monthrange(año, mes)[1]
+
+def formatear_moneda(valor):
+    """Formatea como moneda argentina"""
+    if valor is None:
+        return "$0,00"
+    decimal_val = Decimal(str(valor))
+    redondeado = decimal_val.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    valor_str = f"{redondeado:,.2f}"
+    valor_str = valor_str.replace(",", "X").replace(".", ",").replace("X", ".")
+    return f"${valor_str}"
+
+def formatear_porcentaje(valor):
+    """Formatea como porcentaje"""
+    if valor is None:
+        return "N/A"
+    return f"{valor:.6f}".replace(".", ",")
+
+@medido('calculo')
+def calcular_fila_ibm(indice_ripte, mes, fecha_pmi, salario, incluir=True) -> Dict[str, Any]:
+    """
+    Actualiza por RIPTE el salario de un mes a la fecha de la PMI.
+
+    Args:
+        indice_ripte: IndiceRipte
+        mes: Fecha del mes del salario
+        fecha_pmi: Fecha de la PMI
+        salario: Salario del mes (0 = sin dato)
+        incluir: Si el mes entra en el promedio
+
+    Returns:
+        Diccionario con periodo, salario, ripte, variacion, salario_act, dias e incluir
+    """
+    nombre = obtener_nombre_mes(mes)
+    mes_nombre = nombre.split('.-')[0]
+    mes_pmi = obtener_nombre_mes(fecha_pmi).split('.-')[0]
+
+    variacion = calcular_variacion_ripte(indice_ripte, mes.year, mes_nombre, fecha_pmi.year, mes_pmi)
+
+    # Calcular salario actualizado
+    if variacion is not None and salario > 0:
+        salario_act = salario * (1 + variacion)
+    else:
+        salario_act = salario
+
+    ripte = obtener_ripte(indice_ripte, mes.year, mes_nombre)
+
+    return {
+        'periodo': nombre,
+        'salario': salario,
+        'ripte': ripte if ripte else 0,
+        'variacion': variacion,
+        'salario_act': salario_act,
+        'dias': obtener_dias_mes(mes.year, mes.month),
+        'incluir': incluir
+    }
+
+@medido('calculo')
+def totalizar_ibm(filas: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Totales e IBM a partir de las filas de calcular_fila_ibm.
+
+    Solo cuentan los meses incluidos y con salario cargado; el IBM es el
+    promedio de los salarios actualizados, redondeado a 2 decimales.
+
+    Returns:
+        Diccionario con total_orig, total_act, total_dias, meses_datos e ibm (Decimal)
+    """
+    validas = [d for d in filas if d['incluir'] and d['salario'] > 0]
+
+    total_orig = sum(Decimal(str(d['salario'])) for d in validas)
+    total_act = sum(Decimal(str(d['salario_act'])) for d in validas)
+    total_dias = sum(d['dias'] for d in validas)
+    meses_datos = len(validas)
+
+    # Calcular IBM
+    if meses_datos > 0:
+        ibm = total_act / Decimal(str(meses_datos))
+        ibm = ibm.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+    else:
+        ibm = Decimal('0')
+
+    return {
+        'total_orig': total_orig,
+        'total_act': total_act,
+        'total_dias': total_dias,
+        'meses_datos': meses_datos,
+        'ibm': ibm
+    }
+
+def calcular_ibm_salarios(indice_ripte, fecha_pmi, salarios: List[float]) -> Dict[str, Any]:
+    """
+    Calcula el IBM a partir de los salarios de los meses anteriores a la PMI.
+
+    Args:
+        indice_ripte: IndiceRipte
+        fecha_pmi: Fecha de la PMI
+        salarios: Salarios del más antiguo al más reciente (12 meses; 0 = sin dato)
+
+    Returns:
+        Diccionario de totalizar_ibm con las filas en 'filas'
+    """
+    meses = obtener_meses_anteriores(fecha_pmi, len(salarios))
+    filas = [calcular_fila_ibm(indice_ripte, mes, fecha_pmi, salario) for mes, salario in zip(meses, salarios)]
+    return {**totalizar_ibm(filas), 'filas': filas}
+
+def error_entrada_ibm(datos: DatosIBM) -> str:
+    """
+    Motivo por el que un IBM no se puede calcular.
+
+    Args:
+        datos: Fecha de la PMI y salarios de los meses anteriores
+
+    Returns:
+        str: Descripción del problema, o '' si los datos son válidos
+    """
+    # Comparación por la positiva: NaN no la pasa
+    for i, salario in enumerate(datos.salarios, start=1):
+        if not salario >= 0:
+            return f"Salario {i} inválido: {salario:g} (debe ser mayor o igual a 0)"
+    return ""
+
+def calcular_ibm(datos: DatosIBM, indice_ripte=None) -> ResultadoIBM:
+    """
+    Calcula el IBM de un caso con datos tipados.
+
+    Args:
+        datos: Fecha de la PMI y salarios de los meses anteriores
+        indice_ripte: IndiceRipte a usar (por defecto, el del dataset vigente)
+
+    Returns:
+        ResultadoIBM con el IBM, los totales y el detalle por mes
+    """
+    if indice_ripte is None:
+        indice_ripte = obtener_indice_ripte()
+
+    resultado = calcular_ibm_salarios(indice_ripte, datos.fecha_pmi, list(datos.salarios))
+    return ResultadoIBM(
+        ibm=float(resultado['ibm']),
+        meses_datos=resultado['meses_datos'],
+        total_orig=float(resultado['total_orig']),
+        total_act=float(resultado['total_act']),
+        total_dias=resultado['total_dias'],
+        filas=tuple(resultado['filas'])
+    )
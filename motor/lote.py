@@ -0,0 +1,587 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Procesamiento por lotes de las calculadoras, sin interfaz
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Lee un CSV o JSONL con un caso por fila, lo reparte en bloques entre varios
+procesos (cada proceso carga el snapshot de datasets una sola vez) y va
+escribiendo los resultados a CSV o JSONL a medida que cada bloque termina.
+La entrada se lee de a un bloque y solo hay unos pocos bloques en vuelo, así
+que la memoria no crece con el tamaño del archivo.
+
+Uso:
+    python -m motor.lote lrt casos.csv resultados.csv
+    python -m motor.lote despidos casos.jsonl resultados.jsonl --procesos 4 --bloque 2000
+
+Columnas de entrada (las de valor por defecto son opcionales):
+    lrt: pmi_date, final_date, ibm, edad, incapacidad_pct, incluir_20_pct=sí
+    despidos: fecha_ingreso, fecha_despido, salario, se_pago_preaviso=no,
+        fecha_liquidacion=hoy
+    ibm: fecha_pmi, salario_1=0 ... salario_12=0 (del mes más antiguo al más
+        reciente; en JSONL también puede ser una lista 'salarios')
+    actualizacion: monto, fecha_inicial, fecha_final, tasa_pura_ripte=3, tasa_pura_ipc=3
+    jus: monto_pesos, fecha_conversion
+
+Cada fila de salida lleva el número de fila de la entrada ('fila'), las
+columnas de entrada, los resultados y 'error' (vacío si el caso se calculó).
+Como los bloques se escriben en el orden en que terminan, la salida puede
+quedar desordenada: 'fila' permite reordenarla.
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from utils.funciones_comunes import safe_parse_date
+from utils.indices import obtener_indice_tasa, obtener_indice_ripte, obtener_indice_ipc, obtener_indice_jus
+from utils.snapshot import obtener_snapshot
+
+from .tipos import (
+    InputData,
+    Results,
+    DatosDespido,
+    ResultadoDespido,
+    DatosIBM,
+    ResultadoIBM,
+    DatosActualizacion,
+    ResultadoActualizacion,
+    DatosConversionJus,
+    ResultadoConversionJus
+)
+from .lrt import Calculator, errores_entrada_lote, obtener_data_manager
+from .despidos import calcular_despido, error_entrada_despido
+from .ibm import calcular_ibm, error_entrada_ibm
+from .actualizacion import calcular_actualizacion, error_entrada_actualizacion
+from .honorarios import calcular_jus, error_entrada_jus
+
+# Casos por bloque y bloques en vuelo por proceso
+BLOQUE_DEFECTO = 1000
+BLOQUES_POR_PROCESO = 2
+
+VERDADEROS = {'1', 'true', 'verdadero', 'si', 'sí', 's', 'yes', 'y', 'x'}
+
+Fila = Dict[str, Any]
+
+
+# ============================================
+# CONVERSIÓN DE VALORES DE ENTRADA
+# ============================================
+
+def _fecha(fila: Fila, campo: str, defecto: Optional[date] = None) -> date:
+    """Fecha de un campo (ISO, DD/MM/YYYY, ...); ValueError si falta o no se reconoce"""
+    valor = fila.get(campo)
+    if valor is None or str(valor).strip() == '':
+        if defecto is not None:
+            return defecto
+        raise ValueError(f"Falta el campo '{campo}'")
+    if isinstance(valor, str) and len(valor) == 10 and valor[4] == '-':
+        try:
+            return date.fromisoformat(valor)
+        except ValueError:
+            pass
+    fecha = safe_parse_date(valor)
+    if fecha is None:
+        raise ValueError(f"Fecha inválida en '{campo}': {valor}")
+    return fecha
+
+
+def _numero(fila: Fila, campo: str, defecto: Optional[float] = None) -> float:
+    """Número de un campo (admite coma decimal); ValueError si falta o no se reconoce"""
+    valor = fila.get(campo)
+    if valor is None or str(valor).strip() == '':
+        if defecto is not None:
+            return defecto
+        raise ValueError(f"Falta el campo '{campo}'")
+    try:
+        if isinstance(valor, (int, float)):
+            numero = float(valor)
+        else:
+            numero = float(str(valor).strip().replace(',', '.'))
+    except (ValueError, OverflowError):
+        numero = math.nan
+    # NaN e infinito (también "1e999") no son montos ni edades válidos
+    if not math.isfinite(numero):
+        raise ValueError(f"Número inválido en '{campo}': {valor}")
+    return numero
+
+
+def _booleano(fila: Fila, campo: str, defecto: bool = False) -> bool:
+    """Booleano de un campo (1/0, true/false, si/no)"""
+    valor = fila.get(campo)
+    if valor is None or str(valor).strip() == '':
+        return defecto
+    if isinstance(valor, bool):
+        return valor
+    return str(valor).strip().lower() in VERDADEROS
+
+
+def _serializable(valor: Any) -> Any:
+    """Valor de salida apto para JSON (fechas ISO, Decimal y NumPy a float/int)"""
+    if isinstance(valor, (datetime, pd.Timestamp)):
+        return valor.date().isoformat() if not pd.isna(valor) else None
+    if isinstance(valor, date):
+        return valor.isoformat()
+    if isinstance(valor, Decimal):
+        return float(valor)
+    if isinstance(valor, np.generic):
+        return valor.item()
+    if isinstance(valor, tuple):
+        return list(valor)
+    return valor
+
+
+# ============================================
+# CALCULADORAS
+# ============================================
+# Cada una tiene un lector (fila de entrada -> datos tipados de motor.tipos)
+# y una función que calcula una lista de casos y devuelve, por cada uno, su
+# resultado tipado o la excepción que impidió calcularlo.
+
+Resultado = Union[Any, Exception]
+
+
+def _por_caso(casos: List[Any], calcular: Callable[[Any], Any],
+              error_entrada: Optional[Callable[[Any], str]] = None) -> List[Resultado]:
+    """Aplica calcular a cada caso, capturando el error de cada uno (los inválidos no se calculan)"""
+    resultados: List[Resultado] = []
+    for datos in casos:
+        error = error_entrada(datos) if error_entrada else ''
+        if error:
+            resultados.append(ValueError(error))
+            continue
+        try:
+            resultados.append(calcular(datos))
+        except Exception as e:
+            resultados.append(e)
+    return resultados
+
+
+def _leer_lrt(fila: Fila) -> InputData:
+    return InputData(
+        pmi_date=_fecha(fila, 'pmi_date'),
+        final_date=_fecha(fila, 'final_date'),
+        ibm=_numero(fila, 'ibm'),
+        edad=int(_numero(fila, 'edad')),
+        incapacidad_pct=_numero(fila, 'incapacidad_pct'),
+        incluir_20_pct=_booleano(fila, 'incluir_20_pct', True)
+    )
+
+
+def _calcular_lrt(casos: List[InputData]) -> List[Resultado]:
+    """Indemnización LRT: los casos válidos del bloque en una pasada vectorizada"""
+    calculadora = Calculator(obtener_data_manager())
+    if not casos:
+        return []
+
+    # Los casos inválidos quedan con su error, como en el cálculo caso por caso
+    errores = errores_entrada_lote(
+        np.array([c.ibm for c in casos], dtype=np.float64),
+        np.array([c.edad for c in casos], dtype=np.float64),
+        np.array([c.incapacidad_pct for c in casos], dtype=np.float64)
+    )
+    resultados: List[Resultado] = [ValueError(e) if e else None for e in errores]
+    validos = [i for i, e in enumerate(errores) if not e]
+    if not validos:
+        return resultados
+
+    try:
+        tabla = calculadora.calcular_indemnizaciones_lote([casos[i] for i in validos])
+        calculados = [Results(**registro) for registro in tabla.to_dict('records')]
+    except Exception:
+        # Un caso que rompe la pasada vectorizada no debe perder el bloque entero
+        calculados = _por_caso([casos[i] for i in validos], calculadora.calcular_indemnizacion)
+    for i, resultado in zip(validos, calculados):
+        resultados[i] = resultado
+    return resultados
+
+
+def _leer_despido(fila: Fila) -> DatosDespido:
+    return DatosDespido(
+        fecha_ingreso=_fecha(fila, 'fecha_ingreso'),
+        fecha_despido=_fecha(fila, 'fecha_despido'),
+        salario=_numero(fila, 'salario'),
+        se_pago_preaviso=_booleano(fila, 'se_pago_preaviso'),
+        fecha_liquidacion=_fecha(fila, 'fecha_liquidacion', date.today())
+    )
+
+
+def _calcular_despidos(casos: List[DatosDespido]) -> List[Resultado]:
+    """Indemnización por despido y sus actualizaciones"""
+    indices = (obtener_indice_ripte(), obtener_indice_tasa(), obtener_indice_ipc())
+    return _por_caso(casos, lambda datos: calcular_despido(datos, *indices), error_entrada_despido)
+
+
+def _leer_ibm(fila: Fila) -> DatosIBM:
+    # En JSON los salarios pueden venir como lista en 'salarios'
+    if isinstance(fila.get('salarios'), list):
+        salarios = {f"salario_{i}": valor for i, valor in enumerate(fila['salarios'], start=1)}
+    else:
+        salarios = fila
+    return DatosIBM(
+        fecha_pmi=_fecha(fila, 'fecha_pmi'),
+        salarios=tuple(_numero(salarios, f"salario_{i}", 0.0) for i in range(1, 13))
+    )
+
+
+def _calcular_ibm(casos: List[DatosIBM]) -> List[Resultado]:
+    """IBM a partir de los 12 salarios anteriores a la PMI"""
+    indice_ripte = obtener_indice_ripte()
+    return _por_caso(casos, lambda datos: calcular_ibm(datos, indice_ripte), error_entrada_ibm)
+
+
+def _leer_actualizacion(fila: Fila) -> DatosActualizacion:
+    return DatosActualizacion(
+        monto=_numero(fila, 'monto'),
+        fecha_inicial=_fecha(fila, 'fecha_inicial'),
+        fecha_final=_fecha(fila, 'fecha_final'),
+        tasa_pura_ripte=_numero(fila, 'tasa_pura_ripte', 3),
+        tasa_pura_ipc=_numero(fila, 'tasa_pura_ipc', 3)
+    )
+
+
+def _calcular_actualizaciones(casos: List[DatosActualizacion]) -> List[Resultado]:
+    """Actualización de montos por RIPTE, Tasa Activa e IPC"""
+    indices = (obtener_indice_ripte(), obtener_indice_tasa(), obtener_indice_ipc())
+    return _por_caso(casos, lambda datos: calcular_actualizacion(datos, *indices), error_entrada_actualizacion)
+
+
+def _leer_jus(fila: Fila) -> DatosConversionJus:
+    return DatosConversionJus(
+        monto_pesos=_numero(fila, 'monto_pesos'),
+        fecha_conversion=_fecha(fila, 'fecha_conversion')
+    )
+
+
+def _calcular_jus(casos: List[DatosConversionJus]) -> List[Resultado]:
+    """Conversión de pesos a JUS y monto actualizado al JUS vigente"""
+    indice_jus = obtener_indice_jus()
+    return _por_caso(casos, lambda datos: calcular_jus(datos, indice_jus), error_entrada_jus)
+
+
+@dataclass(frozen=True)
+class TipoLote:
+    """Calculadora disponible para el procesamiento por lotes"""
+    entradas: Tuple[str, ...]
+    resultado: type
+    leer: Callable[[Fila], Any]
+    calcular: Callable[[List[Any]], List[Resultado]]
+
+    @property
+    def salidas(self) -> Tuple[str, ...]:
+        """Campos del resultado que van al archivo (el detalle por mes del IBM no)"""
+        return tuple(f.name for f in fields(self.resultado) if f.name != 'filas')
+
+
+CALCULADORAS: Dict[str, TipoLote] = {
+    'lrt': TipoLote(
+        entradas=('pmi_date', 'final_date', 'ibm', 'edad', 'incapacidad_pct', 'incluir_20_pct'),
+        resultado=Results,
+        leer=_leer_lrt,
+        calcular=_calcular_lrt
+    ),
+    'despidos': TipoLote(
+        entradas=('fecha_ingreso', 'fecha_despido', 'fecha_liquidacion', 'salario', 'se_pago_preaviso'),
+        resultado=ResultadoDespido,
+        leer=_leer_despido,
+        calcular=_calcular_despidos
+    ),
+    'ibm': TipoLote(
+        entradas=('fecha_pmi',) + tuple(f"salario_{i}" for i in range(1, 13)),
+        resultado=ResultadoIBM,
+        leer=_leer_ibm,
+        calcular=_calcular_ibm
+    ),
+    'actualizacion': TipoLote(
+        entradas=('monto', 'fecha_inicial', 'fecha_final', 'tasa_pura_ripte', 'tasa_pura_ipc'),
+        resultado=ResultadoActualizacion,
+        leer=_leer_actualizacion,
+        calcular=_calcular_actualizaciones
+    ),
+    'jus': TipoLote(
+        entradas=('monto_pesos', 'fecha_conversion'),
+        resultado=ResultadoConversionJus,
+        leer=_leer_jus,
+        calcular=_calcular_jus
+    )
+}
+
+
+# ============================================
+# PROCESOS DE TRABAJO
+# ============================================
+
+def _inicializar_proceso(calculadora: str) -> None:
+    """Carga el snapshot y los índices una sola vez por proceso"""
+    obtener_snapshot()
+    # Un bloque vacío construye los índices y gestores que usa la calculadora
+    CALCULADORAS[calculadora].calcular([])
+
+
+def _error(e: Exception) -> str:
+    return f"{type(e).__name__}: {e}"
+
+
+def calcular_casos(calculadora: str, filas: List[Fila]) -> List[Fila]:
+    """
+    Calcula una lista de casos sin escribir nada (lo usan los bloques y el servicio HTTP).
+
+    Args:
+        calculadora: Clave de CALCULADORAS
+        filas: Casos, con las columnas de entrada de la calculadora (una
+            fila que no es un dict queda con error; leer_bloques entrega así
+            las líneas de JSONL ilegibles)
+
+    Returns:
+        Por cada caso, los campos del resultado (serializables a JSON) y
+        'error' (vacío si el caso se calculó)
+    """
+    tipo = CALCULADORAS[calculadora]
+
+    # Leer los datos tipados; las filas ilegibles quedan con su error
+    errores: Dict[int, str] = {}
+    casos, posiciones = [], []
+    for i, fila in enumerate(filas):
+        if isinstance(fila, Exception):
+            errores[i] = _error(fila)
+            continue
+        if not isinstance(fila, dict):
+            errores[i] = _error(ValueError("Se esperaba un objeto JSON con los datos del caso"))
+            continue
+        try:
+            casos.append(tipo.leer(fila))
+            posiciones.append(i)
+        except Exception as e:
+            errores[i] = _error(e)
+
+    calculados = dict(zip(posiciones, tipo.calcular(casos)))
+
+    salida = []
+    for i in range(len(filas)):
+        registro = {}
+        resultado = calculados.get(i)
+        if isinstance(resultado, Exception):
+            errores[i] = _error(resultado)
+        elif resultado is not None:
+            for campo in tipo.salidas:
+                registro[campo] = _serializable(getattr(resultado, campo))
+            # Un resultado NaN o infinito (montos que desbordan) no es un resultado
+            no_finitos = [c for c, v in registro.items() if isinstance(v, float) and not math.isfinite(v)]
+            if no_finitos:
+                registro = {}
+                errores[i] = _error(ValueError(f"Resultado no finito en '{no_finitos[0]}'"))
+        registro['error'] = errores.get(i, '')
+        salida.append(registro)
+    return salida
+
+
+def procesar_bloque(calculadora: str, numero: int, inicio: int, filas: List[Fila]) -> Tuple[int, List[Fila], float, int]:
+    """
+    Calcula un bloque de casos (se ejecuta en un proceso de trabajo).
+
+    Args:
+        calculadora: Clave de CALCULADORAS
+        numero: Número de bloque
+        inicio: Número de fila de la entrada del primer caso del bloque
+        filas: Casos del bloque
+
+    Returns:
+        tuple: (número de bloque, filas de salida, segundos, pid del proceso)
+    """
+    t0 = time.perf_counter()
+    resultados = calcular_casos(calculadora, filas)
+    salida = [
+        {'fila': inicio + i, **(fila if isinstance(fila, dict) else {}), **resultado}
+        for i, (fila, resultado) in enumerate(zip(filas, resultados))
+    ]
+    return numero, salida, time.perf_counter() - t0, os.getpid()
+
+
+# ============================================
+# LECTURA Y ESCRITURA
+# ============================================
+
+def leer_bloques(ruta: Path, tamaño: int) -> Iterator[List[Fila]]:
+    """
+    Lee la entrada de a bloques de `tamaño` casos.
+
+    Args:
+        ruta: Archivo .csv o .jsonl
+        tamaño: Casos por bloque
+
+    Yields:
+        Lista de filas (dict) de cada bloque; una línea de JSONL que no es
+        un objeto JSON va como ValueError, para que quede con su error
+    """
+    if ruta.suffix.lower() == '.csv':
+        for bloque in pd.read_csv(ruta, dtype=str, keep_default_na=False, chunksize=tamaño, encoding='utf-8'):
+            bloque.columns = [str(c).strip().replace("﻿", "") for c in bloque.columns]
+            yield bloque.to_dict('records')
+        return
+
+    bloque = []
+    with open(ruta, encoding='utf-8') as f:
+        for linea in f:
+            if not linea.strip():
+                continue
+            try:
+                fila = json.loads(linea)
+            except ValueError as e:
+                fila = ValueError(f"JSON inválido: {e}")
+            if not isinstance(fila, (dict, ValueError)):
+                fila = ValueError("Se esperaba un objeto JSON con los datos del caso")
+            bloque.append(fila)
+            if len(bloque) >= tamaño:
+                yield bloque
+                bloque = []
+    if bloque:
+        yield bloque
+
+
+class EscritorResultados:
+    """Escribe las filas de salida a CSV o JSONL a medida que llegan"""
+
+    def __init__(self, ruta: Path, columnas: List[str]):
+        self.ruta = ruta
+        self.columnas = columnas
+        self.es_csv = ruta.suffix.lower() == '.csv'
+        self._archivo = open(ruta, 'w', encoding='utf-8', newline='')
+        if self.es_csv:
+            self._csv = csv.DictWriter(self._archivo, fieldnames=columnas, restval='', extrasaction='ignore')
+            self._csv.writeheader()
+
+    def escribir(self, filas: List[Fila]) -> None:
+        if self.es_csv:
+            for fila in filas:
+                self._csv.writerow({
+                    k: ' '.join(v) if isinstance(v, list) else v
+                    for k, v in fila.items()
+                })
+        else:
+            for fila in filas:
+                self._archivo.write(json.dumps(fila, ensure_ascii=False) + '\n')
+        self._archivo.flush()
+
+    def cerrar(self) -> None:
+        self._archivo.close()
+
+
+# ============================================
+# EJECUCIÓN
+# ============================================
+
+def ejecutar_lote(calculadora: str, entrada: Path, salida: Path, procesos: Optional[int] = None,
+                  tamaño: int = BLOQUE_DEFECTO) -> Dict[str, Any]:
+    """
+    Procesa un archivo de casos completo.
+
+    Args:
+        calculadora: 'lrt', 'despidos', 'ibm', 'actualizacion' o 'jus'
+        entrada: Archivo de casos (.csv o .jsonl)
+        salida: Archivo de resultados (.csv o .jsonl)
+        procesos: Procesos de trabajo (por defecto uno por CPU; 1 = en este proceso)
+        tamaño: Casos por bloque
+
+    Returns:
+        Diccionario con filas, errores, segundos, filas_por_segundo y bloques
+        (número, filas, segundos y pid de cada bloque)
+    """
+    if calculadora not in CALCULADORAS:
+        raise ValueError(
+            f"Calculadora '{calculadora}' no reconocida. "
+            f"Opciones válidas: {list(CALCULADORAS.keys())}"
+        )
+    tipo = CALCULADORAS[calculadora]
+    procesos = procesos or os.cpu_count() or 1
+
+    escritor = EscritorResultados(salida, ['fila', *tipo.entradas, *tipo.salidas, 'error'])
+    resumen = {'filas': 0, 'errores': 0, 'bloques': []}
+
+    def registrar(numero: int, filas: List[Fila], segundos: float, pid: int) -> None:
+        escritor.escribir(filas)
+        resumen['filas'] += len(filas)
+        resumen['errores'] += sum(1 for f in filas if f.get('error'))
+        resumen['bloques'].append({'numero': numero, 'filas': len(filas), 'segundos': segundos, 'pid': pid})
+
+    t0 = time.perf_counter()
+    try:
+        bloques = enumerate(leer_bloques(entrada, tamaño))
+        inicio = 0
+        if procesos == 1:
+            _inicializar_proceso(calculadora)
+            for numero, filas in bloques:
+                registrar(*procesar_bloque(calculadora, numero, inicio, filas))
+                inicio += len(filas)
+        else:
+            with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar_proceso,
+                                     initargs=(calculadora,)) as pool:
+                pendientes = set()
+                for numero, filas in bloques:
+                    # Pocos bloques en vuelo: la entrada se sigue leyendo a medida que se escriben resultados
+                    if len(pendientes) >= procesos * BLOQUES_POR_PROCESO:
+                        listos, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                        for futuro in listos:
+                            registrar(*futuro.result())
+                    pendientes.add(pool.submit(procesar_bloque, calculadora, numero, inicio, filas))
+                    inicio += len(filas)
+                for futuro in wait(pendientes).done:
+                    registrar(*futuro.result())
+    finally:
+        escritor.cerrar()
+
+    resumen['segundos'] = time.perf_counter() - t0
+    resumen['filas_por_segundo'] = resumen['filas'] / resumen['segundos'] if resumen['segundos'] > 0 else 0.0
+    resumen['bloques'].sort(key=lambda b: b['numero'])
+    return resumen
+
+
+def main(argumentos: Optional[List[str]] = None) -> int:
+    """Punto de entrada de python -m motor.lote"""
+    parser = argparse.ArgumentParser(
+        prog='python -m motor.lote',
+        description='Calcula un archivo de casos (CSV o JSONL) sin abrir la interfaz.'
+    )
+    parser.add_argument('calculadora', choices=list(CALCULADORAS.keys()))
+    parser.add_argument('entrada', type=Path, help='Casos de entrada (.csv o .jsonl)')
+    parser.add_argument('salida', type=Path, help='Resultados (.csv o .jsonl)')
+    parser.add_argument('--procesos', type=int, default=None,
+                        help='Procesos de trabajo (por defecto uno por CPU; 1 = sin procesos extra)')
+    parser.add_argument('--bloque', type=int, default=BLOQUE_DEFECTO, help='Casos por bloque')
+    args = parser.parse_args(argumentos)
+
+    for ruta in (args.entrada, args.salida):
+        if ruta.suffix.lower() not in ('.csv', '.jsonl'):
+            parser.error(f"Formato no soportado: {ruta} (usar .csv o .jsonl)")
+    if not args.entrada.exists():
+        parser.error(f"No se encuentra el archivo: {args.entrada}")
+
+    resumen = ejecutar_lote(args.calculadora, args.entrada, args.salida, args.procesos, args.bloque)
+
+    print("=" * 80)
+    print(f"LOTE {args.calculadora.upper()}")
+    print("=" * 80)
+    print(f"Entrada: {args.entrada}")
+    print(f"Salida: {args.salida}")
+    print(f"Filas: {resumen['filas']} ({resumen['errores']} con error)")
+    print(f"Tiempo: {resumen['segundos']:.2f} s - {resumen['filas_por_segundo']:,.0f} filas/s")
+    print("\nBloques:")
+    for bloque in resumen['bloques']:
+        print(f"   #{bloque['numero']:<5} {bloque['filas']:>7} filas  {bloque['segundos'] * 1000:>9.1f} ms  (pid {bloque['pid']})")
+    return 1 if resumen['errores'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de cálculo - Indemnizaciones Ley 24.557 (LRT)
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Gestor de datasets y cálculo (caso por caso y por lote). Las estructuras
+de entrada y resultado (InputData, Results) están en motor.tipos. Lo usan la calculadora LRT y el procesamiento por lotes
+(python -m motor.lote).
+"""
+
+import os
+from dataclasses import asdict, fields
+from datetime import date
+from decimal import Decimal
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Solo la entrada y salida en DataFrame del cálculo por lote usa pandas
+if TYPE_CHECKING:
+    import pandas as pd
+
+from utils.funciones_comunes import redondear, redondear_lote
+from utils.indices import (
+    IndiceTasa,
+    IndiceRipte,
+    IndiceIPC,
+    IndiceVigencias,
+    obtener_indice_tasa,
+    obtener_indice_ripte,
+    obtener_indice_ipc,
+    obtener_indice_pisos,
+    ordinales_lote,
+    claves_mes_lote
+)
+from utils.snapshot import obtener_tabla
+from utils.metricas import medido
+from utils.registro import obtener_registro
+
+from .tipos import InputData, Results
+
+# Paths de datasets
+DATASET_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+PATH_RIPTE = os.path.join(DATASET_DIR, "dataset_ripte.csv")
+PATH_TASA = os.path.join(DATASET_DIR, "dataset_tasa.csv")
+PATH_IPC = os.path.join(DATASET_DIR, "dataset_ipc.csv")
+PATH_PISOS = os.path.join(DATASET_DIR, "dataset_pisos.csv")
+
+def error_entrada(ibm: float, edad: float, incapacidad_pct: float) -> str:
+    """
+    Motivo por el que un caso no se puede calcular.
+
+    Args:
+        ibm: Ingreso base mensual (>= 0)
+        edad: Edad a la PMI (> 0; la fórmula divide por ella)
+        incapacidad_pct: Porcentaje de incapacidad (mayor que 0 y hasta 100)
+
+    Returns:
+        str: Descripción del problema, o '' si los datos son válidos
+    """
+    # Comparaciones por la positiva: NaN no pasa ninguna
+    if not ibm >= 0:
+        return f"IBM inválido: {ibm:g} (debe ser mayor o igual a 0)"
+    if not edad > 0:
+        return f"Edad inválida: {edad:g} (debe ser mayor que 0)"
+    if not 0 < incapacidad_pct <= 100:
+        return f"Incapacidad inválida: {incapacidad_pct:g} (debe estar entre 0 y 100)"
+    return ""
+
+
+def errores_entrada_lote(ibm: np.ndarray, edad: np.ndarray, incapacidad_pct: np.ndarray) -> np.ndarray:
+    """Versión vectorizada de error_entrada: el motivo de cada caso ('' si es válido)"""
+    errores = np.full(len(ibm), "", dtype=object)
+    invalidos = ~((ibm >= 0) & (edad > 0) & (incapacidad_pct > 0) & (incapacidad_pct <= 100))
+    for i in np.flatnonzero(invalidos):
+        errores[i] = error_entrada(ibm[i], edad[i], incapacidad_pct[i])
+    return errores
+
+
+class DataManager:
+    """Gestor de datasets CSV"""
+    
+    def __init__(self):
+        # Problemas de carga (la interfaz los muestra; el lote los informa)
+        self.errores: List[str] = []
+        self.ipc_data = None
+        self.pisos_data = None
+        self.ripte_data = None
+        self.tasa_data = None
+        self.indice_tasa = IndiceTasa.vacio()
+        self.indice_ripte = IndiceRipte.vacio()
+        self.indice_ipc = IndiceIPC.vacio()
+        self.indice_pisos = IndiceVigencias.vacio()
+        self.load_all_datasets()
+
+    @classmethod
+    def desde_indices(cls, indice_tasa: IndiceTasa, indice_ripte: IndiceRipte,
+                      indice_ipc: IndiceIPC, indice_pisos: IndiceVigencias) -> 'DataManager':
+        """Gestor armado con índices ya construidos, sin leer data/ (benchmarks, datos sintéticos)"""
+        data_mgr = cls.__new__(cls)
+        data_mgr.errores = []
+        data_mgr.ipc_data = data_mgr.pisos_data = data_mgr.ripte_data = data_mgr.tasa_data = None
+        data_mgr.indice_tasa = indice_tasa
+        data_mgr.indice_ripte = indice_ripte
+        data_mgr.indice_ipc = indice_ipc
+        data_mgr.indice_pisos = indice_pisos
+        return data_mgr
+
+    def load_all_datasets(self):
+        """Carga todos los datasets desde el snapshot binario compilado (mmap)"""
+        try:
+            for path in (PATH_RIPTE, PATH_TASA, PATH_IPC, PATH_PISOS):
+                if not os.path.exists(path):
+                    self.errores.append(f"No se encontró el dataset: {path}")
+            
+            # Tablas tipadas: más reciente arriba, igual que los CSV
+            self.ripte_data = obtener_tabla('ripte').dropna(subset=["fecha", "indice_ripte"]).reset_index(drop=True)
+            self.tasa_data = obtener_tabla('tasa')
+            self.ipc_data = obtener_tabla('ipc')
+            self.pisos_data = (
+                obtener_tabla('pisos')
+                .dropna(subset=["desde", "piso"])
+                .sort_values("desde")
+                .reset_index(drop=True)
+            )
+            
+            # Índices precalculados (se leen del snapshot, una vez por versión del CSV)
+            self.indice_tasa = obtener_indice_tasa(PATH_TASA, completar_hasta=True)
+            self.indice_ripte = obtener_indice_ripte(PATH_RIPTE)
+            self.indice_ipc = obtener_indice_ipc(PATH_IPC)
+            self.indice_pisos = obtener_indice_pisos(PATH_PISOS)
+                
+        except Exception as e:
+            self.errores.append(f"Error cargando datasets: {str(e)}")
+    
+    def get_piso_minimo(self, fecha_pmi: date) -> Tuple[Optional[float], str]:
+        """Obtiene piso mínimo vigente a la fecha de PMI (bisect sobre el índice de vigencias)"""
+        registro = self.indice_pisos.buscar(fecha_pmi)
+        if registro is None:
+            return (None, "")
+        return (float(registro["piso"]), registro.get("resol", ""))
+    
+    def get_ripte_coeficiente(self, fecha_pmi: date, fecha_final: date) -> Tuple[float, float, float]:
+        """Cálculo RIPTE - búsqueda O(1) en el índice mensual denso"""
+        if self.indice_ripte.meses == 0:
+            return 1.0, 0.0, 0.0
+        
+        # RIPTE más reciente <= fecha; si no hay datos previos, el más antiguo disponible
+        ripte_pmi = self.indice_ripte.ultimo_publicado(fecha_pmi)
+        if ripte_pmi is None:
+            ripte_pmi = self.indice_ripte.mas_antiguo()
+        
+        ripte_final = self.indice_ripte.ultimo_publicado(fecha_final)
+        if ripte_final is None:
+            ripte_final = self.indice_ripte.mas_antiguo()
+        
+        coeficiente = ripte_final / ripte_pmi if ripte_pmi > 0 else 1.0
+        
+        return coeficiente, ripte_pmi, ripte_final
+    
+    def calcular_tasa_activa(self, fecha_pmi: date, fecha_final: date, capital_base: float) -> Tuple[float, float]:
+        """Cálculo de tasa activa (suma prefija sobre el índice diario)"""
+        total_aporte_pct = self.indice_tasa.acumulado_pct(fecha_pmi, fecha_final)
+        total_actualizado = capital_base * (1.0 + total_aporte_pct / 100.0)
+        
+        return total_aporte_pct, total_actualizado
+    
+    def calcular_inflacion(self, fecha_pmi: date, fecha_final: date) -> float:
+        """Cálculo de inflación - cociente sobre la suma acumulada de logaritmos"""
+        if self.indice_ipc.meses == 0:
+            return 0.0
+        
+        return self.indice_ipc.inflacion_pct(fecha_pmi, fecha_final)
+    
+    def meses_sin_ipc(self, fecha_pmi: date, fecha_final: date) -> Tuple[str, ...]:
+        """Meses del período sin IPC publicado (formato YYYY-MM)"""
+        return tuple(self.indice_ipc.meses_faltantes(fecha_pmi, fecha_final))
+    
+    # --- Versiones por lote (un arreglo por columna, ver Calculator.calcular_indemnizaciones_lote) ---
+    
+    def get_pisos_minimos_lote(self, fechas_pmi) -> Tuple[np.ndarray, np.ndarray]:
+        """Posición del piso vigente a cada fecha de PMI (-1 si no hay) y monto de cada registro del índice"""
+        montos = np.array([float(r["piso"]) for r in self.indice_pisos.registros])
+        return self.indice_pisos.buscar_posiciones(fechas_pmi), montos
+    
+    def get_ripte_coeficientes_lote(self, fechas_pmi, fechas_finales) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Coeficiente RIPTE, RIPTE a la PMI y RIPTE final de cada caso"""
+        n = len(fechas_pmi)
+        if self.indice_ripte.meses == 0:
+            return np.ones(n), np.zeros(n), np.zeros(n)
+        
+        mas_antiguo = self.indice_ripte.mas_antiguo()
+        ripte_pmi = self.indice_ripte.ultimo_publicado_lote(fechas_pmi)
+        ripte_pmi[np.isnan(ripte_pmi)] = mas_antiguo
+        ripte_final = self.indice_ripte.ultimo_publicado_lote(fechas_finales)
+        ripte_final[np.isnan(ripte_final)] = mas_antiguo
+        
+        coeficientes = np.ones(n)
+        positivos = ripte_pmi > 0
+        coeficientes[positivos] = ripte_final[positivos] / ripte_pmi[positivos]
+        return coeficientes, ripte_pmi, ripte_final
+    
+    def calcular_tasa_activa_lote(self, fechas_pmi, fechas_finales, capitales_base: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Porcentaje de tasa activa y total actualizado de cada caso"""
+        total_aporte_pct = self.indice_tasa.acumulado_pct_lote(fechas_pmi, fechas_finales)
+        return total_aporte_pct, capitales_base * (1.0 + total_aporte_pct / 100.0)
+    
+    def calcular_inflacion_lote(self, fechas_pmi, fechas_finales) -> np.ndarray:
+        """Inflación acumulada en % de cada caso"""
+        if self.indice_ipc.meses == 0:
+            return np.zeros(len(fechas_pmi))
+        return self.indice_ipc.inflacion_pct_lote(fechas_pmi, fechas_finales)
+
+class Calculator:
+    """Motor de cálculos"""
+    
+    def __init__(self, data_manager: DataManager):
+        self.data_manager = data_manager
+    
+    @medido('calculo')
+    def calcular_indemnizacion(self, input_data: InputData) -> Results:
+        """Realiza todos los cálculos"""
+        error = error_entrada(input_data.ibm, input_data.edad, input_data.incapacidad_pct)
+        if error:
+            raise ValueError(error)
+        
+        capital_formula = self._calcular_capital_formula(input_data)
+        
+        piso_minimo, piso_norma = self.data_manager.get_piso_minimo(input_data.pmi_date)
+        capital_aplicado, piso_aplicado, piso_info, piso_proporcional = self._aplicar_piso_minimo(
+            capital_formula, piso_minimo, piso_norma, input_data.incapacidad_pct
+        )
+        
+        adicional_20_pct = float(redondear(Decimal(str(capital_aplicado)) * Decimal('0.20'))) if input_data.incluir_20_pct else 0.0
+        capital_base = float(redondear(Decimal(str(capital_aplicado)) + Decimal(str(adicional_20_pct))))
+        
+        ripte_coef, ripte_pmi, ripte_final = self.data_manager.get_ripte_coeficiente(
+            input_data.pmi_date, input_data.final_date
+        )
+        ripte_actualizado = float(redondear(Decimal(str(capital_base)) * Decimal(str(ripte_coef))))
+        
+        dias_transcurridos = (input_data.final_date - input_data.pmi_date).days
+        factor_dias = Decimal(str(dias_transcurridos)) / Decimal('365.0')
+        interes_puro_3_pct = float(redondear(Decimal(str(ripte_actualizado)) * Decimal('0.03') * factor_dias))
+        total_ripte_3 = float(redondear(Decimal(str(ripte_actualizado)) + Decimal(str(interes_puro_3_pct))))
+        
+        tasa_activa_pct, total_tasa_activa = self.data_manager.calcular_tasa_activa(
+            input_data.pmi_date, input_data.final_date, capital_base
+        )
+        
+        inflacion_acum_pct = self.data_manager.calcular_inflacion(
+            input_data.pmi_date, input_data.final_date
+        )
+        
+        return Results(
+            capital_formula=capital_formula,
+            capital_base=capital_base,
+            piso_aplicado=piso_aplicado,
+            piso_info=piso_info,
+            piso_monto=piso_minimo if piso_minimo else 0.0,
+            piso_proporcional=piso_proporcional,
+            piso_norma=piso_norma,
+            adicional_20_pct=adicional_20_pct,
+            ripte_coef=ripte_coef,
+            ripte_pmi=ripte_pmi,
+            ripte_final=ripte_final,
+            ripte_actualizado=ripte_actualizado,
+            interes_puro_3_pct=interes_puro_3_pct,
+            total_ripte_3=total_ripte_3,
+            tasa_activa_pct=tasa_activa_pct,
+            total_tasa_activa=total_tasa_activa,
+            inflacion_acum_pct=inflacion_acum_pct,
+            ipc_meses_faltantes=self.data_manager.meses_sin_ipc(
+                input_data.pmi_date, input_data.final_date
+            )
+        )
+    
+    @medido('calculo')
+    def calcular_indemnizaciones_lote(self, casos: Union['pd.DataFrame', Sequence[InputData]]) -> 'pd.DataFrame':
+        """
+        Realiza todos los cálculos para muchos casos a la vez (re-liquidación del padrón).
+        
+        Mismos pasos que calcular_indemnizacion, pero cada paso es una operación
+        NumPy sobre todos los casos y los índices compartidos. Los redondeos que
+        quedan a menos del error de punto flotante de medio centavo se rehacen
+        en Decimal, así que los importes coinciden al centavo con el cálculo
+        caso por caso.
+        
+        Args:
+            casos: DataFrame con las columnas de InputData (pmi_date, final_date,
+                ibm, edad, incapacidad_pct, incluir_20_pct), una fila por caso,
+                o una lista de InputData
+        
+        Returns:
+            DataFrame con una columna por campo de Results y el mismo índice que casos
+        
+        Raises:
+            ValueError: Si algún caso tiene datos inválidos (ver error_entrada;
+                errores_entrada_lote permite separarlos antes)
+        """
+        import pandas as pd
+        if not isinstance(casos, pd.DataFrame):
+            casos = pd.DataFrame([asdict(c) for c in casos], columns=[f.name for f in fields(InputData)])
+        
+        dm = self.data_manager
+        pmi = casos["pmi_date"]
+        final = casos["final_date"]
+        ibm = casos["ibm"].to_numpy(dtype=np.float64)
+        edad = casos["edad"].to_numpy(dtype=np.float64)
+        incapacidad = casos["incapacidad_pct"].to_numpy(dtype=np.float64)
+        incluir_20 = casos["incluir_20_pct"].to_numpy(dtype=bool)
+        
+        # Con edad 0 la pasada vectorizada daría inf en lugar de fallar
+        errores = errores_entrada_lote(ibm, edad, incapacidad)
+        invalidos = np.flatnonzero(errores != "")
+        if len(invalidos):
+            raise ValueError(f"{len(invalidos)} casos con datos inválidos; el primero: {errores[invalidos[0]]}")
+        
+        def d(valores: np.ndarray, i: int) -> Decimal:
+            return Decimal(str(float(valores[i])))
+        
+        capital_formula = self._redondear_lote(
+            ibm * 53 * (65 / edad) * (incapacidad / 100),
+            lambda i: d(ibm, i) * Decimal('53') * (Decimal('65') / d(edad, i)) * (d(incapacidad, i) / Decimal('100'))
+        )
+        
+        # Piso mínimo vigente a la PMI
+        posiciones, montos = dm.get_pisos_minimos_lote(pmi)
+        hay_piso = posiciones >= 0
+        piso_monto = np.where(hay_piso, montos[np.maximum(posiciones, 0)] if len(montos) else 0.0, 0.0)
+        piso_proporcional = np.where(hay_piso, piso_monto * (incapacidad / 100), 0.0)
+        piso_aplicado = hay_piso & ~(capital_formula >= piso_proporcional)
+        capital_aplicado = np.where(piso_aplicado, piso_proporcional, capital_formula)
+        
+        normas = [r.get("resol", "") for r in dm.indice_pisos.registros]
+        textos_supera = np.array([f"Supera piso mínimo {n}" for n in normas] + [""], dtype=object)
+        textos_aplica = np.array([f"Se aplica piso mínimo {n}" for n in normas] + [""], dtype=object)
+        normas = np.array(normas + [""], dtype=object)
+        piso_norma = normas[posiciones]
+        piso_info = np.where(
+            hay_piso,
+            np.where(piso_aplicado, textos_aplica[posiciones], textos_supera[posiciones]),
+            "No se encontró piso mínimo para la fecha"
+        )
+        
+        adicional_20_pct = np.where(incluir_20, self._redondear_lote(
+            capital_aplicado * 0.20,
+            lambda i: d(capital_aplicado, i) * Decimal('0.20')
+        ), 0.0)
+        capital_base = self._redondear_lote(
+            capital_aplicado + adicional_20_pct,
+            lambda i: d(capital_aplicado, i) + d(adicional_20_pct, i)
+        )
+        
+        ripte_coef, ripte_pmi, ripte_final = dm.get_ripte_coeficientes_lote(pmi, final)
+        ripte_actualizado = self._redondear_lote(
+            capital_base * ripte_coef,
+            lambda i: d(capital_base, i) * d(ripte_coef, i)
+        )
+        
+        dias_transcurridos = ordinales_lote(final) - ordinales_lote(pmi)
+        interes_puro_3_pct = self._redondear_lote(
+            ripte_actualizado * 0.03 * (dias_transcurridos / 365.0),
+            lambda i: d(ripte_actualizado, i) * Decimal('0.03') * (Decimal(str(int(dias_transcurridos[i]))) / Decimal('365.0'))
+        )
+        total_ripte_3 = self._redondear_lote(
+            ripte_actualizado + interes_puro_3_pct,
+            lambda i: d(ripte_actualizado, i) + d(interes_puro_3_pct, i)
+        )
+        
+        tasa_activa_pct, total_tasa_activa = dm.calcular_tasa_activa_lote(pmi, final, capital_base)
+        inflacion_acum_pct = dm.calcular_inflacion_lote(pmi, final)
+        
+        # Meses sin IPC: los casos del mismo par de meses comparten el resultado
+        meses_sin_ipc = {}
+        ipc_meses_faltantes = []
+        for desde, hasta, fecha_pmi, fecha_final in zip(claves_mes_lote(pmi), claves_mes_lote(final), pmi, final):
+            if (desde, hasta) not in meses_sin_ipc:
+                meses_sin_ipc[(desde, hasta)] = dm.meses_sin_ipc(fecha_pmi, fecha_final)
+            ipc_meses_faltantes.append(meses_sin_ipc[(desde, hasta)])
+        
+        columnas = {
+            "capital_formula": capital_formula,
+            "capital_base": capital_base,
+            "piso_aplicado": piso_aplicado,
+            "piso_info": piso_info,
+            "piso_monto": piso_monto,
+            "piso_proporcional": piso_proporcional,
+            "piso_norma": piso_norma,
+            "adicional_20_pct": adicional_20_pct,
+            "ripte_coef": ripte_coef,
+            "ripte_pmi": ripte_pmi,
+            "ripte_final": ripte_final,
+            "ripte_actualizado": ripte_actualizado,
+            "interes_puro_3_pct": interes_puro_3_pct,
+            "total_ripte_3": total_ripte_3,
+            "tasa_activa_pct": tasa_activa_pct,
+            "total_tasa_activa": total_tasa_activa,
+            "inflacion_acum_pct": inflacion_acum_pct,
+            "ipc_meses_faltantes": ipc_meses_faltantes
+        }
+        return pd.DataFrame(columnas, index=casos.index, columns=[f.name for f in fields(Results)])
+    
+    @staticmethod
+    def _redondear_lote(valores: np.ndarray, exacto: Callable[[int], Decimal]) -> np.ndarray:
+        """Redondea a 2 decimales un arreglo; los casos dudosos se recalculan con exacto(i) en Decimal"""
+        redondeados, dudosos = redondear_lote(valores)
+        for i in np.flatnonzero(dudosos):
+            redondeados[i] = float(redondear(exacto(i)))
+        return redondeados
+    
+    def _calcular_capital_formula(self, input_data: InputData) -> float:
+        """Calcula capital según fórmula"""
+        capital = Decimal(str(input_data.ibm)) * Decimal('53') * (Decimal('65') / Decimal(str(input_data.edad))) * (Decimal(str(input_data.incapacidad_pct)) / Decimal('100'))
+        return float(redondear(capital))
+    
+    def _aplicar_piso_minimo(self, capital_formula: float, piso_minimo: Optional[float], 
+                           piso_norma: str, incapacidad_pct: float) -> Tuple[float, bool, str, float]:
+        """Aplica piso mínimo si corresponde"""
+        if piso_minimo is None:
+            return capital_formula, False, "No se encontró piso mínimo para la fecha", 0.0
+        
+        piso_proporcional = piso_minimo * (incapacidad_pct / 100)
+        
+        if capital_formula >= piso_proporcional:
+            return capital_formula, False, f"Supera piso mínimo {piso_norma}", piso_proporcional
+        else:
+            return piso_proporcional, True, f"Se aplica piso mínimo {piso_norma}", piso_proporcional
+
+
+def obtener_data_manager() -> DataManager:
+    """
+    Gestor de datasets compartido por todo el proceso.
+    
+    Se reconstruye solo cuando cambia alguno de los CSV; quien lo pide
+    recibe una referencia, no una copia.
+    
+    Returns:
+        DataManager de la versión actual de los datasets
+    """
+    return obtener_registro().obtener(
+        'lrt', (PATH_RIPTE, PATH_TASA, PATH_IPC, PATH_PISOS), None, lambda _: DataManager()
+    )
+
+
+def calcular_lrt(datos: InputData) -> Results:
+    """
+    Calcula la indemnización LRT de un caso con los datasets vigentes.
+
+    Args:
+        datos: Datos de entrada del caso
+
+    Returns:
+        Results del caso
+    """
+    return Calculator(obtener_data_manager()).calcular_indemnizacion(datos)
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Servicio HTTP JSON de las calculadoras
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Expone las calculadoras del motor para otros sistemas. Corre dentro del
+proceso de Streamlit (main.py lo inicia en un hilo si la variable de entorno
+TRIBUNAL_SERVICIO_API=1 lo habilita; así comparte con la interfaz el
+registro de tablas e índices en memoria) o por separado:
+
+    python -m motor.servicio [--host 127.0.0.1] [--puerto 8502]
+
+Endpoints (JSON, autenticación HTTP Basic con los usuarios de AuthSystem):
+    GET  /salud                    Estado y versión de los datasets (sin autenticación)
+    GET  /calculadoras             Calculadoras con sus campos de entrada y de resultado
+    POST /<calculadora>            Un caso: {"campo": valor, ...} -> {"resultado": {...}}
+    POST /<calculadora>/lote       {"casos": [{...}, ...]} -> {"resultados": [...], "errores": n}
+
+Calculadoras: lrt, despidos, ibm, actualizacion, jus (mismos campos que el
+procesamiento por lotes; fechas ISO o DD/MM/YYYY). Cada respuesta de cálculo
+lleva en X-Version-Datasets la versión de los CSV con que se calculó.
+
+Cada llamada (salvo /salud) queda en la auditoría como acción de tipo 'api'
+con el usuario, la ruta, el estado HTTP y la IP de origen.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from utils.auth import AuthSystem
+from utils.eventos import iniciar_vigilancia
+from utils.snapshot import clave_fuentes, obtener_snapshot
+
+from .lote import CALCULADORAS, calcular_casos
+
+HOST_DEFECTO = '127.0.0.1'
+PUERTO_DEFECTO = 8502
+
+# Límites por solicitud
+MAX_CASOS_LOTE = 10000
+MAX_CUERPO_BYTES = 32 * 1024 * 1024
+
+# Segundos que se recuerda una credencial válida (evita un registro de login
+# en la auditoría por cada solicitud; el estado del usuario se verifica igual
+# en cada una)
+VIGENCIA_CREDENCIALES = 300
+
+PATH_USUARIOS = Path(__file__).resolve().parent.parent / "data" / "usuarios.db"
+
+# La interfaz solo inicia el servicio si esta variable lo habilita
+VARIABLE_HABILITACION = 'TRIBUNAL_SERVICIO_API'
+VERDADEROS = {'1', 'true', 'si', 'sí', 'yes'}
+
+
+def servicio_habilitado() -> bool:
+    """Si la variable de entorno TRIBUNAL_SERVICIO_API habilita el servicio (deshabilitado por defecto)"""
+    return os.environ.get(VARIABLE_HABILITACION, '').strip().lower() in VERDADEROS
+
+
+class _Credenciales:
+    """
+    Valida usuario y contraseña contra AuthSystem, recordando las válidas un rato.
+
+    Una credencial recordada se vuelve a verificar contra la tabla usuarios
+    en cada solicitud (credencial_vigente): si el usuario se desactivó o
+    cambió la contraseña, deja de valer en el momento.
+    """
+
+    def __init__(self, auth: AuthSystem):
+        self.auth = auth
+        self._validas: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+        self._lock = threading.Lock()
+
+    def validar(self, usuario: str, password: str) -> Optional[Dict]:
+        clave = (usuario, hashlib.sha256(password.encode()).hexdigest())
+        ahora = time.monotonic()
+        with self._lock:
+            guardada = self._validas.get(clave)
+        if guardada and ahora - guardada[0] < VIGENCIA_CREDENCIALES and self.auth.credencial_vigente(*clave):
+            return guardada[1]
+
+        ok, datos = self.auth.validar_credenciales(usuario, password)
+        with self._lock:
+            if ok:
+                self._validas[clave] = (ahora, datos)
+            else:
+                self._validas.pop(clave, None)
+        return datos if ok else None
+
+
+def version_datasets() -> str:
+    """Versión de los CSV actuales (prefijo de la clave del snapshot)"""
+    try:
+        return clave_fuentes()[0][:16]
+    except FileNotFoundError:
+        return ''
+
+
+class ManejadorAPI(BaseHTTPRequestHandler):
+    """Atiende una conexión (un hilo por conexión)"""
+
+    server_version = 'TribunalAPI/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Sin una línea por solicitud: la consola es la de Streamlit
+        pass
+
+    # ---------- respuestas ----------
+
+    def _responder(self, estado: int, cuerpo: Dict[str, Any], version: Optional[str] = None) -> None:
+        try:
+            datos = json.dumps(cuerpo, ensure_ascii=False, allow_nan=False).encode('utf-8')
+        except ValueError:
+            # NaN o infinito no son JSON válido: el caso no tiene un resultado que devolver
+            estado, cuerpo = 422, {'error': 'El resultado tiene valores no finitos (NaN o infinito)'}
+            datos = json.dumps(cuerpo, ensure_ascii=False).encode('utf-8')
+        self.send_response(estado)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(datos)))
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        if version is not None:
+            self.send_header('X-Version-Datasets', version)
+        if estado == 401:
+            self.send_header('WWW-Authenticate', 'Basic realm="Tribunal de Trabajo 2"')
+        self.end_headers()
+        self.wfile.write(datos)
+        self._registrar(estado, cuerpo)
+
+    def _registrar(self, estado: int, cuerpo: Dict[str, Any]) -> None:
+        """Registra la llamada en la auditoría (se escribe en segundo plano, como las acciones de la interfaz)"""
+        ruta = self.path.split('?', 1)[0].rstrip('/') or '/'
+        if ruta == '/salud':
+            return
+        if 'resultados' in cuerpo:
+            detalle = f"{len(cuerpo['resultados'])} casos, {cuerpo['errores']} con error"
+        elif 'error' in cuerpo:
+            detalle = str(cuerpo['error'])[:200]
+        else:
+            detalle = ''
+        self.server.credenciales.auth.registrar_accion(
+            usuario=self.usuario,
+            accion='calcular' if self.command == 'POST' else 'consultar',
+            tipo='api',
+            detalle=f"{self.command} {ruta} -> HTTP {estado} desde {self.client_address[0]}" + (f": {detalle}" if detalle else ''),
+            objetivo=ruta
+        )
+
+    def _error(self, estado: int, mensaje: str) -> None:
+        self._responder(estado, {'error': mensaje})
+
+    # ---------- autenticación y cuerpo ----------
+
+    def _autenticar(self) -> Optional[Dict]:
+        """Datos del usuario de la solicitud, o None; deja en self.usuario el nombre recibido"""
+        encabezado = self.headers.get('Authorization', '')
+        if not encabezado.startswith('Basic '):
+            return None
+        try:
+            usuario, _, password = base64.b64decode(encabezado[6:]).decode('utf-8').partition(':')
+        except Exception:
+            return None
+        self.usuario = usuario
+        return self.server.credenciales.validar(usuario, password)
+
+    def _largo_cuerpo(self) -> int:
+        """Content-Length de la solicitud; ValueError si no es válido o supera el límite"""
+        try:
+            largo = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            raise ValueError("Content-Length inválido")
+        if largo < 0:
+            raise ValueError("Content-Length inválido")
+        if largo > MAX_CUERPO_BYTES:
+            raise ValueError(f"El cuerpo supera {MAX_CUERPO_BYTES} bytes")
+        return largo
+
+    def _leer_json(self) -> Any:
+        return json.loads(self.rfile.read(self._largo_cuerpo()).decode('utf-8') or 'null')
+
+    def _rechazar(self, estado: int, mensaje: str) -> None:
+        """Responde un error sin leer el cuerpo (puede ser de cualquier tamaño) y cierra la conexión"""
+        self.close_connection = True
+        self._error(estado, mensaje)
+
+    # ---------- métodos ----------
+
+    def do_GET(self) -> None:
+        self.usuario = ''
+        ruta = self.path.split('?', 1)[0].rstrip('/')
+
+        if ruta == '/salud':
+            self._responder(200, {'estado': 'ok', 'version_datasets': version_datasets()})
+            return
+
+        if self._autenticar() is None:
+            self._error(401, 'Credenciales inválidas')
+            return
+
+        if ruta == '/calculadoras':
+            self._responder(200, {
+                nombre: {'entradas': list(tipo.entradas), 'salidas': list(tipo.salidas)}
+                for nombre, tipo in CALCULADORAS.items()
+            })
+            return
+
+        self._error(404, f"Ruta no encontrada: {ruta}")
+
+    def do_POST(self) -> None:
+        self.usuario = ''
+        ruta = self.path.split('?', 1)[0].strip('/')
+        partes = ruta.split('/')
+        calculadora = partes[0]
+        es_lote = len(partes) == 2 and partes[1] == 'lote'
+
+        if calculadora not in CALCULADORAS or len(partes) > 2 or (len(partes) == 2 and not es_lote):
+            self._rechazar(404, f"Ruta no encontrada: /{ruta}")
+            return
+
+        if self._autenticar() is None:
+            self._rechazar(401, 'Credenciales inválidas')
+            return
+
+        try:
+            cuerpo = self._leer_json()
+        except ValueError as e:
+            self._rechazar(400, f"Solicitud inválida: {e}")
+            return
+
+        if es_lote:
+            casos = cuerpo.get('casos') if isinstance(cuerpo, dict) else None
+            if not isinstance(casos, list) or not all(isinstance(c, dict) for c in casos):
+                self._error(400, "Se esperaba {\"casos\": [{...}, ...]}")
+                return
+            if len(casos) > MAX_CASOS_LOTE:
+                self._error(413, f"Máximo {MAX_CASOS_LOTE} casos por solicitud")
+                return
+        elif not isinstance(cuerpo, dict):
+            self._error(400, "Se esperaba un objeto JSON con los datos del caso")
+            return
+        else:
+            casos = [cuerpo]
+
+        version = version_datasets()
+        try:
+            resultados = calcular_casos(calculadora, casos)
+        except Exception as e:
+            self._error(500, f"{type(e).__name__}: {e}")
+            return
+
+        if es_lote:
+            self._responder(200, {
+                'resultados': resultados,
+                'errores': sum(1 for r in resultados if r['error'])
+            }, version)
+            return
+
+        resultado = resultados[0]
+        if resultado['error']:
+            self._responder(422, {'error': resultado['error']}, version)
+        else:
+            resultado.pop('error')
+            self._responder(200, {'resultado': resultado}, version)
+
+
+class ServidorAPI(ThreadingHTTPServer):
+    """Servidor con un hilo por conexión y la validación de credenciales compartida"""
+
+    daemon_threads = True
+
+    def __init__(self, direccion: Tuple[str, int], auth: Optional[AuthSystem] = None):
+        super().__init__(direccion, ManejadorAPI)
+        self.credenciales = _Credenciales(auth or AuthSystem(str(PATH_USUARIOS)))
+
+
+_servidor: Optional[ServidorAPI] = None
+_servidor_lock = threading.Lock()
+
+
+def iniciar_servicio(host: str = HOST_DEFECTO, puerto: int = PUERTO_DEFECTO) -> Optional[ServidorAPI]:
+    """
+    Inicia el servicio en un hilo de fondo (una sola vez por proceso), si
+    TRIBUNAL_SERVICIO_API lo habilita.
+
+    Args:
+        host: Interfaz donde escuchar (por defecto solo local)
+        puerto: Puerto TCP
+
+    Returns:
+        ServidorAPI del proceso, o None si el servicio no está habilitado o
+        el puerto está ocupado (por ejemplo, por otra instancia de la interfaz)
+    """
+    global _servidor
+    if not servicio_habilitado():
+        return None
+    with _servidor_lock:
+        if _servidor is not None:
+            return _servidor
+        try:
+            servidor = ServidorAPI((host, puerto))
+        except OSError as e:
+            print(f"[API] No se pudo iniciar el servicio en {host}:{puerto}: {e}")
+            return None
+        threading.Thread(target=servidor.serve_forever, name='servicio-api', daemon=True).start()
+        _servidor = servidor
+        return servidor
+
+
+def main() -> None:
+    """Punto de entrada de python -m motor.servicio"""
+    parser = argparse.ArgumentParser(
+        prog='python -m motor.servicio',
+        description='Servicio HTTP JSON de las calculadoras.'
+    )
+    parser.add_argument('--host', default=HOST_DEFECTO, help='Interfaz donde escuchar')
+    parser.add_argument('--puerto', type=int, default=PUERTO_DEFECTO, help='Puerto TCP')
+    args = parser.parse_args()
+
+    # Mismo vigilante de CSV que la interfaz; índices cargados antes de la primera solicitud
+    iniciar_vigilancia()
+    obtener_snapshot()
+    for tipo in CALCULADORAS.values():
+        tipo.calcular([])
+
+    servidor = ServidorAPI((args.host, args.puerto))
+    print(f"[API] Escuchando en http://{args.host}:{args.puerto}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == '__main__':
+    main()
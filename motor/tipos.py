@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor de cálculo - Datos de entrada y resultados
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Estructuras tipadas de cada calculadora. Solo usan la biblioteca estándar:
+importarlas no carga pandas, NumPy ni Streamlit, así que sirven igual para
+la interfaz, el procesamiento por lotes, un servicio HTTP o un benchmark.
+
+Los montos de los resultados son float ya redondeados a 2 decimales cuando
+la calculadora lo hace (rubros de despido, IBM, JUS).
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Optional, Tuple
+
+
+# ============================================
+# LRT - Ley 24.557
+# ============================================
+
+@dataclass
+class InputData:
+    """Estructura para los datos de entrada"""
+    pmi_date: date
+    final_date: date
+    ibm: float
+    edad: int
+    incapacidad_pct: float
+    incluir_20_pct: bool
+
+@dataclass
+class Results:
+    """Estructura para los resultados de cálculo"""
+    capital_formula: float
+    capital_base: float
+    piso_aplicado: bool
+    piso_info: str
+    piso_monto: float
+    piso_proporcional: float
+    piso_norma: str
+    adicional_20_pct: float
+
+    ripte_coef: float
+    ripte_pmi: float
+    ripte_final: float
+    ripte_actualizado: float
+    interes_puro_3_pct: float
+    total_ripte_3: float
+
+    tasa_activa_pct: float
+    total_tasa_activa: float
+
+    inflacion_acum_pct: float
+    ipc_meses_faltantes: Tuple[str, ...] = ()
+
+
+# ============================================
+# DESPIDOS - Ley 20.744
+# ============================================
+
+@dataclass(frozen=True)
+class DatosDespido:
+    """Datos de entrada de la liquidación por despido"""
+    fecha_ingreso: date
+    fecha_despido: date
+    salario: float
+    se_pago_preaviso: bool = False
+    fecha_liquidacion: Optional[date] = None  # None = hoy
+
+@dataclass(frozen=True)
+class ResultadoDespido:
+    """Rubros de la liquidación por despido y su actualización"""
+    años: int
+    meses: int
+    antiguedad_245: float
+    sustitutiva_preaviso: float
+    sac_preaviso: float
+    dias_trabajados: float
+    integracion_mes: float
+    sac_integracion: float
+    sac_proporcional: float
+    vacaciones: float
+    sac_vacaciones: float
+    total: float
+
+    dias_trabajados_mes: int
+    dias_integracion: int
+    dias_desde_sac: int
+    semestre_sac: str
+    dias_vacaciones: int
+    salarios_preaviso: int
+
+    total_ripte: float          # RIPTE + 3% anual proporcional
+    total_tasa: float           # Tasa Activa BNA
+    inflacion_pct: float        # IPC acumulado
+    ipc_faltantes: Tuple[str, ...] = ()
+
+
+# ============================================
+# IBM - Ingreso Base Mensual
+# ============================================
+
+@dataclass(frozen=True)
+class DatosIBM:
+    """Salarios de los meses anteriores a la PMI (del más antiguo al más reciente; 0 = sin dato)"""
+    fecha_pmi: date
+    salarios: Tuple[float, ...]
+
+@dataclass(frozen=True)
+class ResultadoIBM:
+    """IBM y totales de los meses con salario cargado"""
+    ibm: float
+    meses_datos: int
+    total_orig: float
+    total_act: float
+    total_dias: int
+    filas: Tuple[Dict[str, Any], ...] = ()  # Detalle por mes (periodo, ripte, variacion, salario_act, ...)
+
+
+# ============================================
+# ACTUALIZACIÓN DE MONTOS
+# ============================================
+
+@dataclass(frozen=True)
+class DatosActualizacion:
+    """Monto a actualizar entre dos fechas, con las tasas puras anuales de RIPTE e IPC"""
+    monto: float
+    fecha_inicial: date
+    fecha_final: date
+    tasa_pura_ripte: float = 3
+    tasa_pura_ipc: float = 3
+
+@dataclass(frozen=True)
+class ResultadoActualizacion:
+    """Monto actualizado por RIPTE, Tasa Activa e IPC"""
+    ripte_total: float
+    ripte_coef: float
+    ripte_interes: float
+    tasa_total: float
+    tasa_pct: float
+    ipc_total: float
+    ipc_inflacion: float
+    ipc_interes: float
+    ipc_faltantes: Tuple[str, ...] = ()
+
+
+# ============================================
+# HONORARIOS - Conversión a JUS
+# ============================================
+
+@dataclass(frozen=True)
+class DatosConversionJus:
+    """Monto en pesos a convertir a JUS según el valor vigente a la fecha"""
+    monto_pesos: float
+    fecha_conversion: date
+
+@dataclass(frozen=True)
+class ResultadoConversionJus:
+    """Monto en JUS, valor aplicado y su equivalente al JUS vigente hoy"""
+    jus: float
+    jus_exacto: float
+    valor_jus: float
+    acuerdo: str
+    fecha_desde: Optional[date]
+    fecha_hasta: Optional[date]  # None = vigente
+    monto_actualizado: float
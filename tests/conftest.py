@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fixtures compartidas de los tests
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+"""
+
+import shutil
+
+import pytest
+
+
+@pytest.fixture
+def datos_temporales(tmp_path, monkeypatch):
+    """
+    Copia los CSV de data/ a un directorio temporal y redirige a él los
+    datasets, el snapshot y las versiones publicadas, para que los tests que
+    compilan o publican no toquen data/.
+    """
+    from utils import esquemas, indices, publicacion, snapshot
+
+    for nombre, ruta in indices.DATASETS.items():
+        destino = tmp_path / ruta.name
+        shutil.copyfile(ruta, destino)
+        monkeypatch.setitem(indices.DATASETS, nombre, destino)
+        monkeypatch.setattr(indices, f"PATH_{nombre.upper()}", destino)
+
+    monkeypatch.setattr(esquemas, 'DATA_DIR', tmp_path)
+    monkeypatch.setattr(snapshot, 'SNAPSHOT_DIR', tmp_path / 'snapshot')
+    monkeypatch.setattr(snapshot, '_snapshot_actual', None)
+    monkeypatch.setattr(publicacion, 'DATA_DIR', tmp_path)
+    monkeypatch.setattr(publicacion, 'DIR_VERSIONES', tmp_path / 'versiones')
+    return tmp_path
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: actualización por IPC cuando el rango no tiene IPC publicado
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Como en la versión original de la calculadora, si ningún mes del rango
+tiene IPC el monto vuelve sin actualizar y sin la tasa pura.
+"""
+
+from datetime import date
+
+import numpy as np
+
+from motor.actualizacion import actualizar_ipc
+from utils.indices import IndiceIPC, clave_mes
+
+# Serie de 2010-01 a 2010-06 con 2010-03 sin dato
+INDICE = IndiceIPC.desde_registros(
+    np.array([clave_mes(2010, m) for m in range(1, 7)]),
+    np.array([1.0, 2.0, np.nan, 1.5, 1.0, 2.5])
+)
+
+
+def test_rango_anterior_a_la_serie():
+    assert actualizar_ipc(1000, date(2005, 1, 1), date(2008, 1, 1), INDICE, 3) == (1000, 0.0, 0.0)
+
+
+def test_rango_posterior_al_ultimo_dato():
+    assert actualizar_ipc(848720.87, date(2011, 1, 1), date(2012, 5, 1), INDICE, 3) == (848720.87, 0.0, 0.0)
+
+
+def test_rango_solo_con_meses_faltantes():
+    assert INDICE.meses_faltantes(date(2010, 3, 1), date(2010, 3, 31)) == ['2010-03']
+    assert actualizar_ipc(1000, date(2010, 3, 1), date(2010, 3, 31), INDICE, 3) == (1000, 0.0, 0.0)
+
+
+def test_rango_invertido():
+    assert actualizar_ipc(1000, date(2010, 5, 1), date(2010, 2, 1), INDICE, 3) == (1000, 0.0, 0.0)
+
+
+def test_rango_con_datos_suma_tasa_pura():
+    total, inflacion, interes = actualizar_ipc(1000, date(2009, 11, 1), date(2010, 2, 1), INDICE, 3)
+    factor = 1.01 * 1.02
+    assert np.isclose(inflacion, (factor - 1) * 100)
+    assert np.isclose(interes, 1000 * factor * 0.03)
+    assert np.isclose(total, 1000 * factor * 1.03)
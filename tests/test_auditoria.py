@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: escritor de auditoría con la base caída
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Un lote que falla se reintenta a lo sumo REINTENTOS_LOTE veces y después
+se aparta en un spool propio, que se escribe cuando la base vuelve (o lo
+recupera el próximo escritor que arranca). Con la cola llena y la base
+caída, agregar no lanza excepciones: la auditoría no debe romper el login.
+Los reportes solo escriben la cola antes de leer si la instancia tiene
+registros propios pendientes.
+"""
+
+import glob
+import json
+import os
+import sqlite3
+
+import pytest
+
+from utils import auditoria
+from utils.auditoria import REINTENTOS_LOTE, EscritorAuditoria
+from utils.auth import MIGRACIONES, AuthSystem
+from utils.base_datos import PoolConexiones
+
+
+class Base:
+    """Pool sobre una base temporal que se puede 'caer'"""
+
+    def __init__(self, ruta):
+        self.pool = PoolConexiones(str(ruta))
+        self.pool.migrar(MIGRACIONES)
+        self.caida = False
+        self.intentos = 0
+        conexion = self.pool.conexion
+
+        def conexion_o_error():
+            if self.caida:
+                self.intentos += 1
+                raise sqlite3.OperationalError("database is locked")
+            return conexion()
+
+        self.pool.conexion = conexion_o_error
+
+    def logins(self) -> int:
+        with self.pool.conexion() as conn:
+            return conn.execute('SELECT COUNT(*) FROM auditoria_logins').fetchone()[0]
+
+
+@pytest.fixture
+def base(tmp_path):
+    base = Base(tmp_path / 'usuarios.db')
+    yield base
+    base.pool.cerrar()
+
+
+def _escritor(base, nombre='propio') -> EscritorAuditoria:
+    """Escritor sin el hilo de fondo: los tests llaman a vaciar()"""
+    ruta = os.path.join(os.path.dirname(base.pool.db_path), f"usuarios.auditoria.{nombre}.spool")
+    escritor = EscritorAuditoria(base.pool, ruta)
+    escritor._detener.set()
+    escritor._hilo.join()
+    return escritor
+
+
+def _login(i) -> tuple:
+    return (f"usuario{i}", f"2026-01-01T00:00:{i:02d}", 1, '', '')
+
+
+def _apartados(base) -> list:
+    patron = os.path.splitext(base.pool.db_path)[0] + '.auditoria.*.*.spool'
+    return [r for r in glob.glob(patron) if not r.endswith(('.propio.spool', '.otro.spool'))]
+
+
+def test_lote_fallido_se_aparta_tras_los_reintentos(base):
+    escritor = _escritor(base)
+    for i in range(3):
+        escritor.agregar('login', _login(i))
+
+    base.caida = True
+    for intento in range(REINTENTOS_LOTE - 1):
+        assert escritor.vaciar() == 0
+        assert len(escritor._fallidos) == 3
+    assert escritor.vaciar() == 0
+    # Ya no se reintenta en memoria: quedó en un spool aparte
+    assert escritor._fallidos == []
+    apartados = _apartados(base)
+    assert len(apartados) == 1 and escritor._derrames == apartados
+    with open(apartados[0], encoding='utf-8') as f:
+        assert [tuple(json.loads(linea)[1]) for linea in f] == [_login(i) for i in range(3)]
+
+    # La base vuelve: la cola sigue y el spool apartado se escribe sin duplicar
+    base.caida = False
+    escritor.agregar('login', _login(3))
+    assert escritor.vaciar() == 1
+    assert os.path.getsize(escritor.ruta_spool) == 0
+    assert escritor._reintentar_derrames() == 3
+    assert _apartados(base) == [] and escritor._derrames == []
+    assert base.logins() == 4
+    escritor.detener()
+
+
+def test_cola_llena_con_la_base_caida_no_lanza(base, monkeypatch):
+    monkeypatch.setattr(auditoria, 'TAMAÑO_COLA', 2)
+    escritor = _escritor(base)
+    escritor.agregar('login', _login(0))
+    escritor.agregar('login', _login(1))
+
+    base.caida = True
+    escritor.agregar('login', _login(2))
+    assert base.intentos == 1
+    assert len(_apartados(base)) == 1
+
+    # Con un lote fallando ni se intenta la base: la sesión no espera
+    escritor.vaciar()
+    escritor.agregar('login', _login(3))
+    escritor.agregar('login', _login(4))
+    intentos = base.intentos
+    escritor.agregar('login', _login(5))
+    assert base.intentos == intentos
+    assert len(_apartados(base)) == 2
+
+    # Tampoco después de detener el escritor
+    escritor.detener()
+    escritor.agregar('login', _login(6))
+    assert len(_apartados(base)) == 3
+
+    # El spool propio (lote fallido y cola) y los apartados los recupera el próximo escritor
+    base.caida = False
+    assert _escritor(base, 'otro').recuperados == 7
+    assert base.logins() == 7
+
+
+def test_spool_abandonado_con_la_base_caida(base):
+    abandonado = os.path.splitext(base.pool.db_path)[0] + '.auditoria.99999.spool'
+    with open(abandonado, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(['login', list(_login(0))]) + '\n')
+
+    base.caida = True
+    escritor = _escritor(base)
+    assert escritor.recuperados == 0 and os.path.exists(abandonado)
+
+    base.caida = False
+    assert _escritor(base, 'otro').recuperados == 1
+    assert base.logins() == 1 and not os.path.exists(abandonado)
+    escritor.detener()
+
+
+def test_reportes_solo_escriben_la_cola_con_registros_propios(tmp_path):
+    ruta = str(tmp_path / 'usuarios.db')
+    AuthSystem(ruta)  # Crea el superadmin (y registra esa acción)
+    admin, otra_sesion = AuthSystem(ruta), AuthSystem(ruta)
+    escritor = admin.auditoria
+    escritor._detener.set()
+    escritor._hilo.join()
+    escritor.vaciar()
+
+    vaciados = []
+    vaciar = escritor.vaciar
+    escritor.vaciar = lambda: vaciados.append(1) or vaciar()
+
+    # Lo encolado por otra sesión no se escribe al leer
+    otra_sesion.registrar_accion('ana', 'crear', 'usuario', 'alta', 'pedro')
+    assert len(admin.obtener_reporte_acciones()) == 1
+    assert admin.resumen_acciones('accion') == [{'clave': 'crear', 'cantidad': 1}]
+    assert vaciados == []
+
+    # Lo propio sí: se lee la acción recién hecha
+    admin.registrar_accion('admin', 'modificar', 'usuario', 'cambio', 'pedro')
+    assert [a['usuario'] for a in admin.obtener_reporte_acciones()] == ['admin', 'ana', 'SISTEMA']
+    assert len(vaciados) == 1
+    admin.obtener_reporte_acciones()
+    admin.resumen_logins()
+    assert len(vaciados) == 1
+    escritor.detener()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: lectura tipada de los CSV por esquema contra las lecturas originales
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+leer_dataset debe dar, para cada CSV distribuido, los mismos valores que
+el parseo que hacía cada app en la versión original (honorarios para JUS,
+actualización/despidos para IPC, RIPTE y tasa, la calculadora LRT para
+pisos), además de informar orden y columnas faltantes.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.esquemas import ESQUEMAS, Columna, convertir_columna, leer_dataset
+from utils.funciones_comunes import safe_parse_date
+
+
+def _jus_original(ruta) -> pd.DataFrame:
+    """cargar_dataset_jus de honorarios"""
+    df = pd.read_csv(ruta, encoding='utf-8')
+    df.columns = df.columns.str.strip()
+    df['FECHA ENTRADA EN VIGENCIA'] = pd.to_datetime(df['FECHA ENTRADA EN VIGENCIA'], dayfirst=True)
+    df['FECHA DE FINALIZACION'] = pd.to_datetime(df['FECHA DE FINALIZACION'], dayfirst=True, errors='coerce')
+    df['VALOR IUS'] = df['VALOR IUS'].str.replace('$', '').str.replace('.', '').str.replace(',', '.').str.strip()
+    df['VALOR IUS'] = pd.to_numeric(df['VALOR IUS'])
+    return df
+
+
+def _ipc_original(ruta) -> pd.DataFrame:
+    """cargar_datasets de actualización"""
+    df = pd.read_csv(ruta, encoding='utf-8')
+    df['periodo'] = pd.to_datetime(df['periodo'], format='ISO8601', errors='coerce')
+    return df
+
+
+def _pisos_original(ruta) -> pd.DataFrame:
+    """DataManager._norm_pisos de la calculadora LRT (sin reordenar, fechas como Timestamp)"""
+    df = pd.read_csv(ruta, sep=',')
+    df['fecha_inicio'] = pd.to_datetime(df['fecha_inicio'].apply(safe_parse_date))
+    df['fecha_fin'] = pd.to_datetime(df['fecha_fin'].apply(safe_parse_date))
+    df['monto_minimo'] = pd.to_numeric(df['monto_minimo'], errors='coerce')
+    return df
+
+
+def _ripte_original(ruta) -> pd.DataFrame:
+    """cargar_datasets de actualización (tipos inferidos por read_csv)"""
+    return pd.read_csv(ruta, encoding='utf-8')
+
+
+def _tasa_original(ruta) -> pd.DataFrame:
+    """cargar_datasets de despidos"""
+    df = pd.read_csv(ruta, encoding='utf-8')
+    df['Desde'] = pd.to_datetime(df['Desde'], format='%d/%m/%Y', dayfirst=True)
+    df['Hasta'] = pd.to_datetime(df['Hasta'], format='%d/%m/%Y', dayfirst=True)
+    df['Valor'] = df['Valor'].astype(str).str.replace(',', '.', regex=False).astype(float)
+    return df
+
+
+ORIGINALES = {
+    'jus': _jus_original,
+    'ipc': _ipc_original,
+    'pisos': _pisos_original,
+    'ripte': _ripte_original,
+    'tasa': _tasa_original
+}
+
+
+@pytest.mark.parametrize('clave', sorted(ORIGINALES))
+def test_csv_distribuido_coincide_con_el_original(clave):
+    esquema = ESQUEMAS[clave]
+    resultado = leer_dataset(clave)
+    original = ORIGINALES[clave](esquema.ruta)
+
+    assert resultado.filas == len(original)
+    assert resultado.orden_esperado
+    assert resultado.columnas_faltantes == ()
+    assert list(resultado.df.columns) == list(esquema.nombres)
+    for columna in esquema.columnas:
+        leido, esperado = resultado.df[columna.nombre], original[columna.nombre]
+        if columna.tipo == 'texto':
+            assert leido.fillna('').tolist() == esperado.fillna('').astype(str).tolist(), columna.nombre
+        elif columna.tipo == 'fecha':
+            assert pd.api.types.is_datetime64_any_dtype(leido), columna.nombre
+            pd.testing.assert_series_equal(leido, esperado.astype(leido.dtype), check_names=False)
+        else:
+            assert np.array_equal(leido.to_numpy(float), esperado.to_numpy(float), equal_nan=True), columna.nombre
+
+
+def test_valores_puntuales():
+    jus = leer_dataset('jus').df.iloc[0]
+    assert jus['VALOR IUS'] == 44330
+    assert jus['FECHA ENTRADA EN VIGENCIA'] == pd.Timestamp(2025, 10, 1)
+    assert pd.isna(jus['FECHA DE FINALIZACION'])
+    assert leer_dataset('ipc').df['periodo'].iloc[0] == pd.Timestamp(2025, 10, 1)
+    assert leer_dataset('tasa').df['Valor'].iloc[0] == 3.174
+
+
+def test_contenido_en_memoria_y_conversiones():
+    contenido = (
+        "\ufeffValor,Desde,Hasta,Año,Mes,Extra\n"
+        "\"3,982\",05/01/2024,,2024,1,x\n"
+        "3.5,2024-01-01,31/01/2024,2024,1,y\n"
+        "abc,Enero 2024,01/01/2024,2024,1,z\n"
+    ).encode('utf-8')
+    resultado = leer_dataset('tasa', contenido=contenido)
+    df = resultado.df
+    # La columna extra no se lee, el BOM no llega al encabezado
+    assert list(df.columns) == ['Valor', 'Desde', 'Hasta', 'Año', 'Mes']
+    assert df['Valor'].iloc[0] == 3.982 and df['Valor'].iloc[1] == 3.5 and pd.isna(df['Valor'].iloc[2])
+    # Las fechas fuera del formato declarado pasan por los demás formatos conocidos
+    assert df['Desde'].tolist() == [pd.Timestamp(2024, 1, 5), pd.Timestamp(2024, 1, 1), pd.Timestamp(2024, 1, 1)]
+    assert pd.isna(df['Hasta'].iloc[0])
+    assert resultado.orden_esperado
+
+
+def test_columnas_faltantes_y_orden(tmp_path):
+    ruta = tmp_path / 'ipc.csv'
+    ruta.write_text("periodo\n2024-01\n2024-03\n2024-02\n", encoding='utf-8')
+    resultado = leer_dataset('ipc', ruta=ruta)
+    assert resultado.columnas_faltantes == ('variacion_mensual',)
+    assert resultado.filas == 3
+    assert not resultado.orden_esperado
+
+
+def test_moneda_con_miles_y_decimales():
+    columna = Columna('VALOR IUS', 'moneda', decimal=',', miles='.', simbolo='$')
+    serie = pd.Series([' $ 44.330 ', '$ 1.234,5', '', None], dtype=str)
+    convertido = convertir_columna(serie, columna)
+    assert convertido.iloc[:2].tolist() == [44330, 1234.5]
+    assert convertido.iloc[2:].isna().all()
+
+
+def test_clave_desconocida():
+    with pytest.raises(ValueError, match='no reconocido'):
+        leer_dataset('uva')
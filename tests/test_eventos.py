@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: eventos de cambio de datasets
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Un cambio publicado llega a todos los suscriptores (aunque alguno falle),
+el vigilante solo avisa cuando cambia el contenido de un CSV (no el
+mtime) y la reconstrucción deja en el registro las tablas e índices de la
+versión nueva. Todo sobre una copia de data/ (ver conftest.datos_temporales)
+y con suscriptores propios, sin el reconstructor de fondo del proceso.
+"""
+
+import os
+import threading
+
+import pytest
+
+from utils import eventos
+from utils.registro import REGISTRO, _version_archivo
+
+
+@pytest.fixture
+def aislado(datos_temporales, monkeypatch):
+    monkeypatch.setattr(eventos, '_suscriptores', [])
+    monkeypatch.setattr(eventos, '_vigilante', eventos.VigilanteDatasets())
+    return datos_temporales
+
+
+def _modificar_ipc(datos, valor=b'2.4'):
+    ruta = datos / 'dataset_ipc.csv'
+    ruta.write_bytes(ruta.read_bytes().replace(b'2025-10,2.3', b'2025-10,' + valor, 1))
+    return ruta
+
+
+def test_publicar_notifica_a_todos_los_suscriptores(aislado, capsys):
+    recibidos = []
+
+    def falla(nombre, origen):
+        raise RuntimeError("suscriptor roto")
+
+    eventos.suscribir(falla)
+    eventos.suscribir(lambda nombre, origen: recibidos.append((nombre, origen)))
+    eventos.suscribir(falla)  # Repetido: se registra una sola vez
+    assert len(eventos._suscriptores) == 2
+
+    eventos.publicar_cambio_dataset('ipc')
+    eventos.publicar_cambio_dataset('tasa', origen='vigilante')
+    assert recibidos == [('ipc', 'editor'), ('tasa', 'vigilante')]
+    assert 'suscriptor roto' in capsys.readouterr().out
+
+
+def test_publicar_dataset_desconocido(aislado):
+    recibidos = []
+    eventos.suscribir(lambda nombre, origen: recibidos.append(nombre))
+    with pytest.raises(ValueError, match='no reconocido'):
+        eventos.publicar_cambio_dataset('uva')
+    assert recibidos == []
+
+
+def test_vigilante_avisa_solo_cambios_de_contenido(aislado):
+    vigilante = eventos._vigilante
+    # Primera revisión: toma el estado, sin eventos
+    assert vigilante.revisar() == []
+
+    ruta = aislado / 'dataset_ipc.csv'
+    os.utime(ruta, ns=(0, ruta.stat().st_mtime_ns + 10**9))
+    assert vigilante.revisar() == []
+
+    _modificar_ipc(aislado)
+    assert vigilante.revisar() == ['ipc']
+    assert vigilante.revisar() == []
+
+    (aislado / 'dataset_pisos.csv').unlink()
+    assert vigilante.revisar() == ['pisos']
+
+
+def test_cambio_publicado_no_se_vuelve_a_avisar(aislado):
+    vigilante = eventos._vigilante
+    vigilante.revisar()
+    _modificar_ipc(aislado)
+    # El editor publica el cambio: el vigilante ya lo conoce
+    eventos.publicar_cambio_dataset('ipc')
+    assert vigilante.revisar() == []
+
+
+def test_reconstruir_deja_la_version_nueva_en_el_registro(aislado):
+    anterior = eventos.obtener_tabla('ipc')['variacion_mensual'].iloc[0]
+    indice = eventos.obtener_indice_ipc()
+    assert anterior == 2.3
+
+    ruta = _modificar_ipc(aislado, b'9.9')
+    assert eventos.reconstruir_dataset('ipc') >= 0
+    version = (_version_archivo(ruta),)
+    entradas = [e for e in REGISTRO.entradas() if e['rutas'] == (os.path.abspath(ruta),)]
+    assert sorted(e['tipo'] for e in entradas) == ['ipc', 'tabla:ipc']
+    assert all(e['version'] == version for e in entradas)
+    assert eventos.obtener_tabla('ipc')['variacion_mensual'].iloc[0] == 9.9
+    nuevo = eventos.obtener_indice_ipc()
+    assert nuevo is not indice and nuevo.prefijo[-1] > indice.prefijo[-1]
+
+
+def test_reconstructor_agrupa_avisos_repetidos(monkeypatch):
+    llamadas, empezado, seguir = [], threading.Event(), threading.Event()
+
+    def reconstruir(nombre):
+        llamadas.append(nombre)
+        empezado.set()
+        seguir.wait(5)
+        return 0.0
+
+    monkeypatch.setattr(eventos, 'reconstruir_dataset', reconstruir)
+    reconstructor = eventos._Reconstructor()
+    reconstructor.encolar('tasa', 'editor')
+    assert empezado.wait(5)
+    hilo = reconstructor._hilo
+
+    # Mientras se reconstruye tasa llegan más avisos: cada dataset se reconstruye una vez más
+    for nombre in ('ipc', 'tasa', 'ipc', 'tasa'):
+        reconstructor.encolar(nombre, 'vigilante')
+    seguir.set()
+    hilo.join(5)
+    assert llamadas == ['tasa', 'ipc', 'tasa']
+    assert reconstructor._hilo is None
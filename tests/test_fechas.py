@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: normalizar_fechas contra safe_parse_date fila por fila
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+La conversión vectorizada de una columna debe dar la misma fecha que
+aplicar safe_parse_date a cada fila (como hacía la versión original) en
+todas las columnas de fecha de los CSV distribuidos y en columnas con
+formatos mezclados. Lo único que agrega son los meses con nombre en
+español ("Marzo 2024", "Ago/2023"), que safe_parse_date no reconoce.
+"""
+
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.esquemas import ESQUEMAS
+from utils.funciones_comunes import normalizar_fechas, safe_parse_date
+
+COLUMNAS_FECHA = [
+    (clave, columna.nombre, columna.formato)
+    for clave, esquema in ESQUEMAS.items()
+    for columna in esquema.columnas
+    if columna.tipo == 'fecha'
+]
+
+# Un valor de cada formato que reconoce safe_parse_date, más vacíos e inválidos
+MEZCLADOS = [
+    "01/12/2024", "2024-12-01", "12/2024", "2024-12", "sep-2025", "September 2025",
+    "Sep 2025", "2024/12/01", "31-12-2024", "2024-12-01 10:20:30", "31/12/2024 23:59:59",
+    "12-2024", "2024/12", "5/1/2024", " 1/10/2025 ", "", None, "nan", "basura", "31/02/2024"
+]
+
+
+def _como_fechas(serie: pd.Series) -> list:
+    return [None if pd.isna(v) else v.date() for v in serie]
+
+
+def _original(serie: pd.Series) -> list:
+    return [safe_parse_date(v) for v in serie]
+
+
+def _leer_columna(clave: str, nombre: str) -> pd.Series:
+    df = pd.read_csv(ESQUEMAS[clave].ruta, dtype=str, encoding='utf-8')
+    df.columns = [c.replace("\ufeff", "").strip() for c in df.columns]
+    return df[nombre]
+
+
+@pytest.mark.parametrize('clave,nombre,formato', COLUMNAS_FECHA)
+def test_columnas_distribuidas_coinciden_con_safe_parse_date(clave, nombre, formato):
+    serie = _leer_columna(clave, nombre)
+    esperado = _original(serie)
+    assert any(esperado)
+    assert _como_fechas(normalizar_fechas(serie, formato)) == esperado
+    # Sin formato declarado se infiere el mismo resultado
+    assert _como_fechas(normalizar_fechas(serie)) == esperado
+
+
+@pytest.mark.parametrize('semilla', range(5))
+def test_formatos_mezclados_coinciden_con_safe_parse_date(semilla):
+    # Se repiten y mezclan para que la muestra de inferencia vea distintos formatos
+    rng = np.random.default_rng(semilla)
+    valores = list(rng.permutation(np.array(MEZCLADOS * 4, dtype=object)))
+    serie = pd.Series(valores, index=np.arange(len(valores)) * 10, dtype=object)
+    resultado = normalizar_fechas(serie)
+    assert resultado.index.equals(serie.index)
+    assert _como_fechas(resultado) == _original(serie)
+
+
+def test_formato_minoritario_despues_de_la_muestra():
+    # Las primeras 60 filas definen el formato; las últimas van por el camino lento
+    valores = ["15/03/2024"] * 60 + ["2024-03-16", "03/2024", "Marzo 2024", "xx"]
+    resultado = _como_fechas(normalizar_fechas(pd.Series(valores)))
+    assert resultado[:60] == [date(2024, 3, 15)] * 60
+    assert resultado[60:] == [date(2024, 3, 16), date(2024, 3, 1), date(2024, 3, 1), None]
+
+
+def test_meses_con_nombre_en_espanol():
+    valores = ["Marzo 2024", "Ago/2023", "setiembre de 2022", "Dic. 2021", "enero-2020"]
+    assert all(safe_parse_date(v) is None for v in valores[:2])
+    assert _como_fechas(normalizar_fechas(pd.Series(valores))) == [
+        date(2024, 3, 1), date(2023, 8, 1), date(2022, 9, 1), date(2021, 12, 1), date(2020, 1, 1)
+    ]
+
+
+def test_valores_ya_convertidos():
+    fechas = pd.Series(pd.to_datetime(["2024-01-05", None]))
+    assert normalizar_fechas(fechas) is fechas
+    objetos = pd.Series([date(2024, 1, 5), datetime(2024, 2, 1, 12, 30), None], dtype=object)
+    assert _como_fechas(normalizar_fechas(objetos)) == _original(objetos)
+
+
+def test_columna_sin_fechas():
+    resultado = normalizar_fechas(pd.Series(["", None, "nan"], dtype=object))
+    assert pd.api.types.is_datetime64_any_dtype(resultado)
+    assert resultado.isna().all()
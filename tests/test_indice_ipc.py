@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: índice IPC de logaritmos acumulados contra el producto original
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+IndiceIPC debe dar la misma inflación acumulada que el producto fila por
+fila de la versión original sobre el dataset_ipc.csv distribuido, y los
+meses faltantes deben ser exactamente los meses del rango que el filtro
+original no encontraba. El CSV distribuido no tiene huecos internos, así
+que también se prueba con una copia a la que se le quitan filas.
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from motor.actualizacion import actualizar_ipc
+from motor.lrt import obtener_data_manager
+from utils.indices import PATH_IPC, IndiceIPC, leer_tabla, obtener_indice_ipc
+
+# Filas que se quitan de la copia del CSV (un mes suelto y tres seguidos)
+QUITADOS = ['2015-06', '2020-02', '2020-03', '2020-04']
+
+
+def _ipc_original(ruta) -> pd.DataFrame:
+    """cargar_datasets de la versión original (periodo como Timestamp del día 1)"""
+    df = pd.read_csv(ruta, encoding='utf-8')
+    df['periodo'] = pd.to_datetime(df['periodo'], format='ISO8601', errors='coerce')
+    return df
+
+
+def _inflacion_original(df: pd.DataFrame, fecha_pmi: date, fecha_final: date) -> tuple:
+    """calcular_inflacion / actualizar_ipc originales, más los meses que el filtro no encontró"""
+    fecha_inicio_mes = pd.Timestamp(fecha_pmi.replace(day=1))
+    fecha_final_mes = pd.Timestamp(fecha_final.replace(day=1))
+    ipc_periodo = df[(df['periodo'] >= fecha_inicio_mes) & (df['periodo'] <= fecha_final_mes)]
+
+    factor_acumulado = 1.0
+    for _, row in ipc_periodo.iterrows():
+        if not pd.isna(row['variacion_mensual']):
+            factor_acumulado *= (1 + row['variacion_mensual'] / 100)
+
+    encontrados = set(ipc_periodo['periodo'].dt.strftime('%Y-%m'))
+    rango = pd.period_range(fecha_inicio_mes, fecha_final_mes, freq='M').strftime('%Y-%m')
+    faltantes = [m for m in rango if m not in encontrados]
+    return (factor_acumulado - 1) * 100, faltantes, not ipc_periodo.empty
+
+
+def _periodos(n: int, semilla: int) -> list:
+    """Períodos al azar entre 2007 y 2028: antes, dentro y después de la serie, y algunos invertidos"""
+    rng = np.random.default_rng(semilla)
+    inicios = rng.integers(date(2007, 1, 1).toordinal(), date(2027, 1, 1).toordinal(), n)
+    finales = inicios + rng.integers(-60, 3000, n)
+    return [(date.fromordinal(int(i)), date.fromordinal(int(f))) for i, f in zip(inicios, finales)]
+
+
+PERIODOS = _periodos(300, semilla=2010)
+
+
+@pytest.fixture(scope='module')
+def csv_con_huecos(tmp_path_factory):
+    ruta = tmp_path_factory.mktemp('ipc') / 'dataset_ipc.csv'
+    df = pd.read_csv(PATH_IPC, dtype=str)
+    df[~df['periodo'].isin(QUITADOS)].to_csv(ruta, index=False)
+    return ruta
+
+
+def _comparar(indice: IndiceIPC, df: pd.DataFrame) -> None:
+    for desde, hasta in PERIODOS + [(date(2015, 6, 20), date(2015, 6, 1)), (date(2020, 1, 31), date(2020, 5, 1))]:
+        inflacion, faltantes, hay_datos = _inflacion_original(df, desde, hasta)
+        assert np.isclose(indice.inflacion_pct(desde, hasta), inflacion, rtol=1e-9, atol=1e-9), (desde, hasta)
+        assert indice.meses_faltantes(desde, hasta) == faltantes, (desde, hasta)
+        assert (indice.meses_con_dato(desde, hasta) > 0) == hay_datos, (desde, hasta)
+
+
+def test_csv_distribuido_coincide_con_el_original():
+    _comparar(obtener_indice_ipc(), _ipc_original(PATH_IPC))
+
+
+def test_csv_con_huecos_coincide_con_el_original(csv_con_huecos):
+    indice = obtener_indice_ipc(csv_con_huecos)
+    _comparar(indice, _ipc_original(csv_con_huecos))
+    assert indice.meses_faltantes(date(2015, 1, 1), date(2020, 12, 31)) == QUITADOS
+    assert indice.meses_con_dato(date(2020, 2, 1), date(2020, 4, 30)) == 0
+
+
+def test_meses_fuera_de_la_serie():
+    indice = obtener_indice_ipc()
+    assert indice.meses_faltantes(date(2009, 11, 15), date(2010, 2, 1)) == ['2009-11', '2009-12']
+    assert indice.meses_faltantes(date(2025, 9, 1), date(2026, 1, 31)) == ['2025-11', '2025-12', '2026-01']
+    assert indice.meses_faltantes(date(2026, 3, 1), date(2026, 1, 1)) == []
+
+
+def test_actualizacion_coincide_con_el_original(csv_con_huecos):
+    indice = obtener_indice_ipc(csv_con_huecos)
+    df = _ipc_original(csv_con_huecos)
+    for desde, hasta in PERIODOS:
+        inflacion, _, hay_datos = _inflacion_original(df, desde, hasta)
+        total, inflacion_nueva, interes = actualizar_ipc(1000.0, desde, hasta, indice, 3)
+        if not hay_datos:
+            assert (total, inflacion_nueva, interes) == (1000.0, 0.0, 0.0)
+        else:
+            assert np.isclose(inflacion_nueva, inflacion, rtol=1e-9, atol=1e-9)
+            assert np.isclose(total, 1000.0 * (1 + inflacion / 100) * 1.03, rtol=1e-9)
+
+
+def test_lrt_usa_el_mismo_indice():
+    dm = obtener_data_manager()
+    df = _ipc_original(PATH_IPC)
+    for desde, hasta in PERIODOS[:50]:
+        assert np.isclose(dm.calcular_inflacion(desde, hasta), _inflacion_original(df, desde, hasta)[0],
+                          rtol=1e-9, atol=1e-9)
+
+
+def test_snapshot_y_csv_dan_el_mismo_indice():
+    desde_csv = IndiceIPC.desde_dataframe(leer_tabla('ipc'))
+    compartido = obtener_indice_ipc()
+    assert compartido.clave_base == desde_csv.clave_base
+    assert np.array_equal(compartido.prefijo, desde_csv.prefijo)
+    assert np.array_equal(compartido.prefijo_faltantes, desde_csv.prefijo_faltantes)
+
+
+def test_lote_coincide_con_caso_por_caso(csv_con_huecos):
+    indice = obtener_indice_ipc(csv_con_huecos)
+    desde, hasta = zip(*PERIODOS)
+    lote = indice.factor_lote(list(desde), list(hasta))
+    assert np.array_equal(lote, [indice.factor(d, h) for d, h in PERIODOS])
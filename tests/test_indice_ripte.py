@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: índice mensual denso de RIPTE contra los filtros originales
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Sobre el dataset_ripte.csv distribuido, IndiceRipte debe devolver los
+mismos valores que los filtros de DataFrame de la versión original: el
+"último RIPTE publicado a la fecha" de LRT/despidos/actualización y el
+valor exacto del mes de la calculadora IBM.
+
+La única diferencia buscada es la fila ' Septiembre' de 2025 (con un
+espacio adelante): IBM y actualización no la reconocían y ahora sí.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from motor.actualizacion import actualizar_ripte
+from motor.ibm import obtener_nombre_mes
+from motor.lrt import obtener_data_manager
+from utils.funciones_comunes import safe_parse_date
+from utils.indices import PATH_RIPTE, IndiceRipte, clave_mes, leer_tabla, obtener_indice_ripte
+
+MESES_ORIGINAL = {
+    'Ene': '01', 'Feb': '02', 'Mar': '03', 'Abr': '04',
+    'May': '05', 'Jun': '06', 'Jul': '07', 'Ago': '08',
+    'Sep': '09', 'Oct': '10', 'Nov': '11', 'Dic': '12'
+}
+# Primer mes que la versión original no reconocía (' Septiembre')
+SEPTIEMBRE_2025 = date(2025, 9, 1)
+
+
+def _ripte_lrt_original() -> pd.DataFrame:
+    """DataManager._norm_ripte de la versión original (respeta el orden del CSV)"""
+    df = pd.read_csv(PATH_RIPTE, sep=',')
+    df.columns = [c.lower() for c in df.columns]
+    meses = {'enero': 1, 'febrero': 2, 'marzo': 3, 'abril': 4, 'mayo': 5, 'junio': 6, 'julio': 7,
+             'agosto': 8, 'septiembre': 9, 'octubre': 10, 'noviembre': 11, 'diciembre': 12}
+
+    def crear_fecha(row):
+        mes = meses.get(str(row['mes']).strip().lower())
+        return None if mes is None else f"{int(row['año'])}-{mes:02d}-01"
+
+    df['fecha'] = df.apply(crear_fecha, axis=1).apply(safe_parse_date)
+    df['ripte'] = pd.to_numeric(df['indice_ripte'], errors='coerce')
+    return df.dropna(subset=['fecha', 'ripte']).reset_index(drop=True)
+
+
+def _coeficiente_lrt_original(df: pd.DataFrame, fecha_pmi: date, fecha_final: date) -> tuple:
+    """DataManager.get_ripte_coeficiente de la versión original"""
+    datos_pmi = df[df['fecha'] <= fecha_pmi]
+    ripte_pmi = float(df.iloc[-1]['ripte']) if datos_pmi.empty else float(datos_pmi.iloc[0]['ripte'])
+    datos_final = df[df['fecha'] <= fecha_final]
+    ripte_final = float(df.iloc[-1]['ripte']) if datos_final.empty else float(datos_final.iloc[0]['ripte'])
+    coeficiente = ripte_final / ripte_pmi if ripte_pmi > 0 else 1.0
+    return coeficiente, ripte_pmi, ripte_final
+
+
+def _ripte_original() -> pd.DataFrame:
+    """cargar_ripte de IBM / cargar_datasets de actualización en la versión original"""
+    df = pd.read_csv(PATH_RIPTE, encoding='utf-8')
+    df['fecha'] = pd.to_datetime(df['año'].astype(str) + '-' + df['mes'].str[:3].map(MESES_ORIGINAL) + '-01')
+    return df
+
+
+def _obtener_ripte_ibm_original(df: pd.DataFrame, año: int, mes: str):
+    fila = df[(df['año'] == año) & (df['mes'].str.lower().str[:3] == mes.lower()[:3])]
+    return float(fila.iloc[0]['indice_ripte']) if not fila.empty else None
+
+
+def _actualizar_ripte_original(df: pd.DataFrame, monto, fecha_inicial, fecha_final, tasa_pura) -> tuple:
+    """actualizar_ripte de la calculadora de actualización original (get_ultimo_dato = fila 0)"""
+    datos_pmi = df[df['fecha'] <= pd.to_datetime(fecha_inicial)]
+    ripte_pmi = float((df if datos_pmi.empty else datos_pmi).iloc[0]['indice_ripte'])
+    datos_final = df[df['fecha'] <= pd.to_datetime(fecha_final)]
+    ripte_final = float((df if datos_final.empty else datos_final).iloc[0]['indice_ripte'])
+    coeficiente = ripte_final / ripte_pmi if ripte_pmi > 0 else 1.0
+    interes_puro = monto * coeficiente * (tasa_pura / 100)
+    return monto * coeficiente + interes_puro, coeficiente, interes_puro
+
+
+def _fechas(n: int, semilla: int, desde: date, hasta: date) -> list:
+    rng = np.random.default_rng(semilla)
+    ordinales = rng.integers(desde.toordinal(), hasta.toordinal(), n)
+    return [date.fromordinal(int(o)) for o in ordinales]
+
+
+def test_coeficiente_lrt_coincide_con_el_original():
+    df = _ripte_lrt_original()
+    dm = obtener_data_manager()
+    pmis = _fechas(300, 11, date(2005, 1, 1), date(2027, 1, 1))
+    finales = [p + timedelta(days=int(d)) for p, d in zip(pmis, np.random.default_rng(12).integers(0, 4000, 300))]
+    for pmi, final in zip(pmis, finales):
+        assert dm.get_ripte_coeficiente(pmi, final) == _coeficiente_lrt_original(df, pmi, final), (pmi, final)
+
+
+def test_valor_del_mes_coincide_con_ibm_original():
+    df = _ripte_original()
+    indice = obtener_indice_ripte()
+    mes = date(2008, 1, 15)
+    while mes < date(2027, 1, 1):
+        nombre = obtener_nombre_mes(mes).split('.-')[0]
+        esperado = _obtener_ripte_ibm_original(df, mes.year, nombre)
+        if mes.replace(day=1) == SEPTIEMBRE_2025:
+            assert esperado is None and indice.valor(mes.year, nombre) == 177378.55
+        else:
+            assert indice.valor(mes.year, nombre) == esperado, mes
+        mes = (mes.replace(day=1) + timedelta(days=32)).replace(day=15)
+
+
+def test_actualizacion_coincide_con_el_original():
+    df = _ripte_original()
+    indice = obtener_indice_ripte()
+    iniciales = _fechas(200, 21, date(2005, 1, 1), SEPTIEMBRE_2025)
+    finales = _fechas(200, 22, date(2005, 1, 1), SEPTIEMBRE_2025)
+    for inicial, final in zip(iniciales, finales):
+        esperado = _actualizar_ripte_original(df, 100000.0, inicial, final, 6)
+        assert actualizar_ripte(100000.0, inicial, final, indice, 6) == esperado, (inicial, final)
+
+
+def test_septiembre_2025_ya_no_se_saltea():
+    indice = obtener_indice_ripte()
+    assert indice.ultimo_publicado(date(2025, 9, 30)) == 177378.55
+    assert indice.ultimo_publicado(date(2030, 1, 1)) == indice.mas_reciente() == 177378.55
+    assert indice.ultimo_publicado(date(2025, 8, 31)) == 174917.11
+
+
+def test_snapshot_y_csv_dan_el_mismo_indice():
+    desde_csv = IndiceRipte.desde_dataframe(leer_tabla('ripte'))
+    compartido = obtener_indice_ripte()
+    assert compartido.clave_base == desde_csv.clave_base
+    assert np.array_equal(compartido.valores, desde_csv.valores, equal_nan=True)
+    assert np.array_equal(compartido.ultimo, desde_csv.ultimo)
+
+
+def test_lote_coincide_con_caso_por_caso():
+    indice = obtener_indice_ripte()
+    fechas = _fechas(500, 31, date(2000, 1, 1), date(2030, 1, 1))
+    lote = indice.ultimo_publicado_lote(fechas)
+    esperado = [indice.ultimo_publicado(f) for f in fechas]
+    assert np.array_equal(lote, [np.nan if e is None else e for e in esperado], equal_nan=True)
+
+
+def test_meses_sin_publicar_y_repetidos():
+    claves = np.array([clave_mes(2020, 3), clave_mes(2020, 1), clave_mes(2020, 1)])
+    indice = IndiceRipte.desde_registros(claves, np.array([30.0, 10.0, 99.0]))
+    # Repetido: queda el primero (más reciente arriba); febrero no está publicado
+    assert indice.valor(2020, 'enero') == 10.0
+    assert indice.valor(2020, 2) is None
+    assert indice.ultimo_publicado(date(2020, 2, 20)) == 10.0
+    assert indice.ultimo_publicado(date(2019, 12, 31)) is None
+    assert indice.valor(2020, 'Marzo') == indice.ultimo_publicado(date(2024, 1, 1)) == 30.0
+
+
+@pytest.mark.parametrize('mes', [3, '03', 'Marzo', ' marzo', 'mar', 'MAR'])
+def test_valor_acepta_numero_o_nombre(mes):
+    assert obtener_indice_ripte().valor(2010, mes) == 369.56
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: índice de sumas prefijas de la Tasa Activa contra el cálculo original
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Sobre el dataset_tasa.csv distribuido, IndiceTasa debe dar el mismo
+porcentaje acumulado que los recorridos fila por fila de la versión
+original: el de la calculadora LRT (registros sin "hasta" extendidos a fin
+de mes) y el de actualización/despidos (registros sin "hasta" descartados).
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.funciones_comunes import days_in_month, safe_parse_date
+from utils.indices import PATH_TASA, IndiceTasa, leer_tabla, obtener_indice_tasa
+
+
+def _filas_lrt_original() -> list:
+    """DataManager._norm_tasa y el recorrido de calcular_tasa_activa de la versión original"""
+    df = pd.read_csv(PATH_TASA, sep=',')
+    df.columns = [str(c).strip().lower().replace("\ufeff", "") for c in df.columns]
+    df['desde'] = df['desde'].apply(safe_parse_date)
+    df['hasta'] = df['hasta'].apply(safe_parse_date)
+    df['fecha'] = df['desde']
+    df['tasa'] = pd.to_numeric(df['valor'].astype(str).str.replace(",", ".", regex=False), errors="coerce")
+    df = df.dropna(subset=["fecha", "tasa"]).reset_index(drop=True)
+
+    filas = []
+    for _, row in df.iterrows():
+        fecha_desde = row["desde"] if not pd.isna(row.get("desde")) else row["fecha"]
+        if not pd.isna(row.get("hasta")):
+            fecha_hasta = row["hasta"]
+        else:
+            fecha_hasta = date(fecha_desde.year, fecha_desde.month, days_in_month(fecha_desde))
+        filas.append((fecha_desde, fecha_hasta, float(row["tasa"])))
+    return filas
+
+
+def _filas_actualizacion_original() -> list:
+    """cargar_datasets y el recorrido de actualizar_tasa de actualización/despidos originales"""
+    df = pd.read_csv(PATH_TASA, encoding='utf-8')
+    df['Desde'] = pd.to_datetime(df['Desde'], format='%d/%m/%Y', dayfirst=True)
+    df['Hasta'] = pd.to_datetime(df['Hasta'], format='%d/%m/%Y', dayfirst=True)
+    df['Valor'] = df['Valor'].astype(str).str.replace(',', '.').astype(float)
+
+    filas = []
+    for _, row in df.iterrows():
+        if pd.isna(row.get("Desde")) or pd.isna(row.get("Hasta")) or pd.isna(row.get("Valor")):
+            continue
+        filas.append((row["Desde"].date(), row["Hasta"].date(), float(row["Valor"])))
+    return filas
+
+
+def _acumulado_original(filas: list, fecha_pmi: date, fecha_final: date) -> float:
+    total_aporte_pct = 0.0
+    for fecha_desde, fecha_hasta, valor_mensual_pct in filas:
+        inicio_interseccion = max(fecha_pmi, fecha_desde)
+        fin_interseccion = min(fecha_final, fecha_hasta)
+        if inicio_interseccion <= fin_interseccion:
+            dias_interseccion = (fin_interseccion - inicio_interseccion).days + 1
+            total_aporte_pct += valor_mensual_pct * (dias_interseccion / 30.0)
+    return total_aporte_pct
+
+
+def _periodos(n: int, semilla: int) -> list:
+    """Períodos al azar entre 2012 y 2027: antes, dentro y después de la serie, y algunos invertidos"""
+    rng = np.random.default_rng(semilla)
+    inicio = date(2012, 1, 1).toordinal()
+    desde = rng.integers(inicio, date(2027, 1, 1).toordinal(), n)
+    dias = rng.integers(-30, 4000, n)
+    periodos = [(date.fromordinal(int(d)), date.fromordinal(int(d)) + timedelta(days=int(x))) for d, x in zip(desde, dias)]
+    # Bordes: el registro sin "hasta" (julio de 2024) y un solo día
+    periodos += [(date(2024, 7, 1), date(2024, 8, 15)), (date(2024, 7, 31), date(2024, 7, 31))]
+    return periodos
+
+
+PERIODOS = _periodos(400, semilla=20240731)
+
+
+@pytest.mark.parametrize('completar_hasta, filas', [
+    (True, _filas_lrt_original),
+    (False, _filas_actualizacion_original),
+])
+def test_coincide_con_el_recorrido_original(completar_hasta, filas):
+    filas = filas()
+    indice = obtener_indice_tasa(completar_hasta=completar_hasta)
+    for desde, hasta in PERIODOS:
+        esperado = _acumulado_original(filas, desde, hasta)
+        assert np.isclose(indice.acumulado_pct(desde, hasta), esperado, rtol=1e-9, atol=1e-9), (desde, hasta)
+
+
+def test_registro_sin_hasta_solo_cuenta_en_lrt():
+    julio = (date(2024, 7, 31), date(2024, 7, 31))
+    assert obtener_indice_tasa(completar_hasta=False).acumulado_pct(*julio) == 0.0
+    assert np.isclose(obtener_indice_tasa(completar_hasta=True).acumulado_pct(*julio), 3.76 / 30)
+
+
+@pytest.mark.parametrize('completar_hasta', [False, True])
+def test_snapshot_y_csv_dan_el_mismo_indice(completar_hasta):
+    desde_csv = IndiceTasa.desde_dataframe(leer_tabla('tasa'), completar_hasta=completar_hasta)
+    compartido = obtener_indice_tasa(completar_hasta=completar_hasta)
+    assert compartido.ordinal_base == desde_csv.ordinal_base
+    assert np.array_equal(compartido.prefijo, desde_csv.prefijo)
+
+
+def test_lote_coincide_con_caso_por_caso():
+    indice = obtener_indice_tasa(completar_hasta=True)
+    desde, hasta = zip(*PERIODOS)
+    lote = indice.acumulado_pct_lote(list(desde), list(hasta))
+    assert np.array_equal(lote, [indice.acumulado_pct(d, h) for d, h in PERIODOS])
+
+
+def test_registros_superpuestos_se_suman():
+    ordinal = date(2020, 1, 1).toordinal()
+    indice = IndiceTasa.desde_registros(
+        np.array([ordinal, ordinal + 10]), np.array([ordinal + 19, ordinal + 29]), np.array([3.0, 6.0])
+    )
+    # Días 10 a 19: 0,1 + 0,2 por día
+    assert np.isclose(indice.acumulado_pct(date(2020, 1, 11), date(2020, 1, 20)), 10 * (0.1 + 0.2))
+    assert np.isclose(indice.acumulado_pct(date(2019, 1, 1), date(2021, 1, 1)), 20 * 0.1 + 20 * 0.2)
+    assert indice.acumulado_pct(date(2020, 2, 1), date(2020, 3, 1)) == 0.0
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: índice de vigencias (JUS y pisos mínimos SRT) contra las búsquedas originales
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Sobre Dataset_JUS.csv y dataset_pisos.csv distribuidos, la búsqueda por
+bisect de IndiceVigencias debe devolver el mismo registro que los filtros
+de la versión original (convertir_a_jus y el "valor actual" de honorarios,
+get_piso_minimo de la calculadora LRT), incluidos los bordes de cada
+vigencia y las fechas que no caen en ninguna.
+
+Con vigencias superpuestas cada dataset conserva el criterio de su
+búsqueda original: en JUS gana la fila de más arriba del CSV y en pisos
+la vigencia cerrada de inicio más antiguo.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from motor.honorarios import convertir_a_jus, valor_jus_vigente
+from motor.lrt import obtener_data_manager
+from utils.funciones_comunes import safe_parse_date
+from utils.indices import (
+    PATH_JUS,
+    PATH_PISOS,
+    PRECEDENCIA_VIGENCIAS,
+    IndiceVigencias,
+    obtener_indice_jus,
+    obtener_indice_pisos,
+    prioridad_vigencias
+)
+
+
+def _jus_original() -> pd.DataFrame:
+    """cargar_dataset_jus de la versión original"""
+    df = pd.read_csv(PATH_JUS, encoding='utf-8')
+    df.columns = df.columns.str.strip()
+    df['FECHA ENTRADA EN VIGENCIA'] = pd.to_datetime(df['FECHA ENTRADA EN VIGENCIA'], dayfirst=True)
+    df['FECHA DE FINALIZACION'] = pd.to_datetime(df['FECHA DE FINALIZACION'], dayfirst=True, errors='coerce')
+    df['VALOR IUS'] = df['VALOR IUS'].str.replace('$', '').str.replace('.', '').str.replace(',', '.').str.strip()
+    df['VALOR IUS'] = pd.to_numeric(df['VALOR IUS'])
+    return df
+
+
+def _vigentes_jus_original(df: pd.DataFrame, fecha) -> pd.DataFrame:
+    fecha = pd.to_datetime(fecha)
+    return df[
+        (df['FECHA ENTRADA EN VIGENCIA'] <= fecha) &
+        ((df['FECHA DE FINALIZACION'] >= fecha) | (df['FECHA DE FINALIZACION'].isna()))
+    ]
+
+
+def _convertir_a_jus_original(monto_pesos, fecha_conversion, df: pd.DataFrame) -> dict:
+    """convertir_a_jus de la versión original (get_ultimo_dato = fila 0; si no hay, la última)"""
+    registro = _vigentes_jus_original(df, fecha_conversion)
+    if registro.empty:
+        registro = df.iloc[-1:]
+    fila = registro.iloc[0]
+    jus_exacto = float(monto_pesos) / float(fila['VALOR IUS'])
+    return {
+        'jus': round(jus_exacto, 2),
+        'jus_exacto': jus_exacto,
+        'valor_jus': float(fila['VALOR IUS']),
+        'acuerdo': fila['ACUERDO'],
+        'fecha_desde': fila['FECHA ENTRADA EN VIGENCIA'],
+        'fecha_hasta': fila['FECHA DE FINALIZACION'] if pd.notna(fila['FECHA DE FINALIZACION']) else "Actualidad"
+    }
+
+
+def _valor_jus_actual_original(df: pd.DataFrame, fecha) -> float:
+    """'Valor JUS actual' de honorarios en la versión original (si no hay vigente, la fila 0)"""
+    registro = _vigentes_jus_original(df, fecha)
+    return float((df if registro.empty else registro).iloc[0]['VALOR IUS'])
+
+
+def _pisos_original() -> pd.DataFrame:
+    """DataManager._norm_pisos de la versión original"""
+    df = pd.read_csv(PATH_PISOS, sep=',')
+    df.columns = [c.lower() for c in df.columns]
+    df['desde'] = df['fecha_inicio'].apply(safe_parse_date)
+    df['hasta'] = df['fecha_fin'].apply(safe_parse_date)
+    df['piso'] = pd.to_numeric(df['monto_minimo'], errors='coerce')
+    df['resol'] = df['norma'].astype(str)
+    return df.dropna(subset=['desde', 'piso']).sort_values('desde').reset_index(drop=True)
+
+
+def _piso_minimo_original(filas: list, fecha_pmi: date) -> tuple:
+    """DataManager.get_piso_minimo de la versión original (filas = df.to_dict('records'))"""
+    candidate = None
+    for r in filas:
+        d0 = r['desde']
+        d1 = r['hasta'] if not pd.isna(r['hasta']) else None
+        if d1 is None:
+            if fecha_pmi >= d0:
+                candidate = (float(r['piso']), r.get('resol', ''))
+        elif d0 <= fecha_pmi <= d1:
+            return (float(r['piso']), r.get('resol', ''))
+    return candidate if candidate else (None, "")
+
+
+def _fechas(bordes: list) -> list:
+    """Un día de cada tres entre 2008 y 2027, más cada borde de vigencia y sus días vecinos"""
+    fechas = [date(2008, 1, 1) + timedelta(days=d) for d in range(0, 7300, 3)]
+    for borde in bordes:
+        if pd.notna(borde):
+            borde = pd.Timestamp(borde).date()
+            fechas += [borde - timedelta(days=1), borde, borde + timedelta(days=1)]
+    return fechas
+
+
+def test_jus_coincide_con_el_original():
+    df = _jus_original()
+    indice = obtener_indice_jus()
+    fechas = _fechas(list(df['FECHA ENTRADA EN VIGENCIA']) + list(df['FECHA DE FINALIZACION']))
+    for fecha in fechas:
+        assert convertir_a_jus(12345.67, fecha, indice) == _convertir_a_jus_original(12345.67, fecha, df), fecha
+        assert valor_jus_vigente(indice, fecha) == _valor_jus_actual_original(df, fecha), fecha
+
+
+def test_pisos_coinciden_con_el_original():
+    df = _pisos_original()
+    filas = df.to_dict('records')
+    dm = obtener_data_manager()
+    for fecha in _fechas(list(df['desde']) + list(df['hasta'])):
+        assert dm.get_piso_minimo(fecha) == _piso_minimo_original(filas, fecha), fecha
+
+
+@pytest.mark.parametrize('obtener', [obtener_indice_jus, obtener_indice_pisos])
+def test_lote_coincide_con_caso_por_caso(obtener):
+    indice = obtener()
+    fechas = _fechas([])
+    posiciones = indice.buscar_posiciones(fechas)
+    for fecha, posicion in zip(fechas, posiciones):
+        registro = indice.buscar(fecha)
+        assert (posicion == -1) if registro is None else (indice.registros[posicion] is registro), fecha
+
+
+def test_registros_ordenados_por_inicio():
+    for indice in (obtener_indice_jus(), obtener_indice_pisos()):
+        assert np.all(np.diff(indice.desde) > 0)
+        assert indice.mas_antiguo() is indice.registros[0]
+        assert indice.mas_reciente() is indice.registros[-1]
+    assert obtener_indice_jus().mas_reciente()['ACUERDO'] == 'Acuerdo 4200/25'
+    assert obtener_indice_pisos().mas_antiguo()['resol'] == 'Decreto 1694/09'
+
+
+# Vigencias superpuestas, con el CSV fuera de orden y una abierta que no es la última
+SUPERPUESTAS = pd.DataFrame({
+    'desde': pd.to_datetime(['2020-03-01', '2020-01-01', '2020-02-01', '2019-06-01', '2020-06-01', '2020-01-01']),
+    'hasta': pd.to_datetime(['2020-12-31', '2020-04-30', None, '2020-01-31', '2020-07-31', '2020-02-15']),
+    'valor': [30.0, 10.0, 20.0, 5.0, 60.0, 11.0]
+})
+FECHAS_SUPERPUESTAS = [date(2019, 5, 31)] + [date(2019, 12, 1) + timedelta(days=d) for d in range(0, 500, 2)]
+
+
+def _valor(registro) -> float:
+    return None if registro is None else registro['valor']
+
+
+def test_superpuestas_jus_gana_la_fila_de_arriba():
+    indice = IndiceVigencias.desde_dataframe(SUPERPUESTAS, 'desde', 'hasta', PRECEDENCIA_VIGENCIAS['jus'])
+    originales = SUPERPUESTAS.rename(columns={'desde': 'FECHA ENTRADA EN VIGENCIA', 'hasta': 'FECHA DE FINALIZACION'})
+    posiciones = indice.buscar_posiciones(FECHAS_SUPERPUESTAS)
+    for fecha, posicion in zip(FECHAS_SUPERPUESTAS, posiciones):
+        vigentes = _vigentes_jus_original(originales, fecha)
+        esperado = None if vigentes.empty else vigentes.iloc[0]['valor']
+        assert _valor(indice.buscar(fecha)) == esperado, fecha
+        assert _valor(indice.registros[posicion] if posicion >= 0 else None) == esperado, fecha
+    # 2020-03-15: la fila 0 (desde marzo) le gana a la 1 y a la abierta
+    assert _valor(indice.buscar(date(2020, 3, 15))) == 30.0
+
+
+def test_superpuestas_pisos_gana_la_primera_cerrada():
+    indice = IndiceVigencias.desde_dataframe(SUPERPUESTAS, 'desde', 'hasta', PRECEDENCIA_VIGENCIAS['pisos'])
+    originales = SUPERPUESTAS.assign(
+        desde=SUPERPUESTAS['desde'].dt.date,
+        hasta=[None if pd.isna(h) else h.date() for h in SUPERPUESTAS['hasta']],
+        piso=SUPERPUESTAS['valor'],
+        resol=''
+    ).sort_values('desde', kind='stable').to_dict('records')
+    posiciones = indice.buscar_posiciones(FECHAS_SUPERPUESTAS)
+    for fecha, posicion in zip(FECHAS_SUPERPUESTAS, posiciones):
+        esperado = _piso_minimo_original(originales, fecha)[0]
+        assert _valor(indice.buscar(fecha)) == esperado, fecha
+        assert _valor(indice.registros[posicion] if posicion >= 0 else None) == esperado, fecha
+    # 2020-03-15: la cerrada de inicio más antiguo (enero) le gana a la de marzo; la abierta solo cubre huecos
+    assert _valor(indice.buscar(date(2020, 3, 15))) == 10.0
+    assert _valor(indice.buscar(date(2021, 1, 1))) == 20.0
+
+
+def test_snapshot_guarda_la_prioridad():
+    for nombre, obtener in (('jus', obtener_indice_jus), ('pisos', obtener_indice_pisos)):
+        compartido = obtener()
+        esperado = prioridad_vigencias(
+            np.arange(compartido.cantidad)[::-1], compartido.desde, compartido.hasta, PRECEDENCIA_VIGENCIAS[nombre]
+        )
+        assert np.array_equal(compartido.prioridad, esperado), nombre
+
+
+def test_precedencia_desconocida():
+    with pytest.raises(ValueError, match='Precedencia'):
+        IndiceVigencias.desde_dataframe(SUPERPUESTAS, 'desde', 'hasta', 'ultima')
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: validación de entradas del procesamiento por lotes
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Los números no finitos, los datos fuera de rango y las líneas de JSONL que
+no son un objeto quedan con su error en la fila, sin cortar el lote ni
+producir NaN/Infinity en la salida.
+"""
+
+import json
+
+import pytest
+
+from motor.lote import _numero, calcular_casos, ejecutar_lote, leer_bloques
+
+ACTUALIZACION = {'monto': 1000, 'fecha_inicial': '2020-01-01', 'fecha_final': '2023-01-01'}
+
+
+@pytest.mark.parametrize('valor', ['nan', 'inf', '-inf', '1e999', float('nan'), float('inf')])
+def test_numero_rechaza_no_finitos(valor):
+    with pytest.raises(ValueError, match="Número inválido en 'monto'"):
+        _numero({'monto': valor}, 'monto')
+
+
+def test_numero_admite_coma_decimal():
+    assert _numero({'monto': ' 1234,5 '}, 'monto') == 1234.5
+
+
+@pytest.mark.parametrize('calculadora, fila, mensaje', [
+    ('actualizacion', {**ACTUALIZACION, 'monto': 'NaN'}, "Número inválido en 'monto'"),
+    ('actualizacion', {**ACTUALIZACION, 'monto': 1e308}, "Resultado no finito"),
+    ('actualizacion', {**ACTUALIZACION, 'fecha_final': '2019-01-01'}, "fecha inicial debe ser anterior"),
+    ('actualizacion', {**ACTUALIZACION, 'tasa_pura_ripte': 101}, "Tasa pura RIPTE inválida"),
+    ('despidos', {'fecha_ingreso': '2020-01-01', 'fecha_despido': '2019-01-01', 'salario': 1000},
+     "fecha de despido no puede ser anterior"),
+    ('despidos', {'fecha_ingreso': '2020-01-01', 'fecha_despido': '2021-01-01', 'salario': -1}, "Salario inválido"),
+    ('ibm', {'fecha_pmi': '2020-01-01', 'salario_3': -5}, "Salario 3 inválido"),
+    ('jus', {'monto_pesos': 0, 'fecha_conversion': '2020-01-01'}, "Monto inválido"),
+])
+def test_casos_invalidos_quedan_con_error(calculadora, fila, mensaje):
+    resultado, = calcular_casos(calculadora, [fila])
+    assert mensaje in resultado['error']
+    assert set(resultado) == {'error'}
+
+
+def test_jsonl_con_lineas_que_no_son_objetos(tmp_path):
+    entrada = tmp_path / 'casos.jsonl'
+    entrada.write_text('\n'.join([
+        json.dumps(ACTUALIZACION), '[1, 2]', '"x"', '{roto', json.dumps({**ACTUALIZACION, 'monto': 'inf'})
+    ]) + '\n', encoding='utf-8')
+    salida = tmp_path / 'resultados.jsonl'
+
+    resumen = ejecutar_lote('actualizacion', entrada, salida, procesos=1)
+
+    filas = sorted((json.loads(linea) for linea in salida.read_text(encoding='utf-8').splitlines()),
+                   key=lambda f: f['fila'])
+    assert resumen['filas'] == 5 and resumen['errores'] == 4
+    assert filas[0]['error'] == '' and filas[0]['ripte_total'] > 1000
+    assert 'Se esperaba un objeto JSON' in filas[1]['error']
+    assert 'Se esperaba un objeto JSON' in filas[2]['error']
+    assert 'JSON inválido' in filas[3]['error']
+    assert "Número inválido en 'monto'" in filas[4]['error']
+
+
+def test_leer_bloques_respeta_el_tamaño(tmp_path):
+    entrada = tmp_path / 'casos.jsonl'
+    entrada.write_text('\n'.join(json.dumps(ACTUALIZACION) for _ in range(5)) + '\n\n', encoding='utf-8')
+    assert [len(b) for b in leer_bloques(entrada, 2)] == [2, 2, 1]
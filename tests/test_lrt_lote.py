@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: cálculo LRT por lote contra el cálculo caso por caso
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+calcular_indemnizaciones_lote debe dar los mismos importes al centavo que
+Calculator.calcular_indemnizacion, también en los redondeos de medio
+centavo que se rehacen en Decimal, y rechazar los mismos casos inválidos.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from motor.lrt import Calculator, error_entrada, errores_entrada_lote, obtener_data_manager
+from motor.lote import calcular_casos
+from motor.tipos import InputData
+from utils.funciones_comunes import redondear_lote
+
+# Importes redondeados a 2 decimales: deben coincidir exactamente
+REDONDEADOS = (
+    'capital_formula', 'capital_base', 'adicional_20_pct',
+    'ripte_actualizado', 'interes_puro_3_pct', 'total_ripte_3'
+)
+# Coeficientes y totales sin redondear: NumPy y Python pueden diferir en el último ulp
+SIN_REDONDEAR = (
+    'piso_monto', 'piso_proporcional', 'ripte_coef', 'ripte_pmi', 'ripte_final',
+    'tasa_activa_pct', 'total_tasa_activa', 'inflacion_acum_pct'
+)
+EXACTOS = ('piso_aplicado', 'piso_info', 'piso_norma', 'ipc_meses_faltantes')
+
+
+@pytest.fixture(scope='module')
+def calculadora() -> Calculator:
+    return Calculator(obtener_data_manager())
+
+
+def _casos_aleatorios(n: int, semilla: int) -> list:
+    rng = np.random.default_rng(semilla)
+    inicio = date(2010, 1, 1).toordinal()
+    pmi = rng.integers(inicio, date(2024, 12, 31).toordinal(), n)
+    dias = rng.integers(0, 3000, n)
+    return [
+        InputData(
+            pmi_date=date.fromordinal(int(p)),
+            final_date=date.fromordinal(int(p)) + timedelta(days=int(d)),
+            ibm=round(float(rng.uniform(0, 3_000_000)), 2),
+            edad=int(rng.integers(18, 80)),
+            incapacidad_pct=round(float(rng.uniform(0.01, 100)), 2),
+            incluir_20_pct=bool(rng.integers(0, 2))
+        )
+        for p, d in zip(pmi, dias)
+    ]
+
+
+def _casos_medio_centavo(n: int, semilla: int) -> list:
+    """Con edad 65 el capital es ibm * 53 * incapacidad / 100: con centavos impares cae en x,xx5"""
+    rng = np.random.default_rng(semilla)
+    return [
+        InputData(
+            pmi_date=date(2018, 1, 1) + timedelta(days=int(rng.integers(0, 2000))),
+            final_date=date(2024, 6, 30),
+            ibm=int(rng.integers(0, 5_000_000)) * 2 / 100 + 0.01,
+            edad=65,
+            incapacidad_pct=float(rng.choice([10, 30, 50, 70, 90])),
+            incluir_20_pct=bool(rng.integers(0, 2))
+        )
+        for _ in range(n)
+    ]
+
+
+def _comparar(calculadora: Calculator, casos: list) -> None:
+    tabla = calculadora.calcular_indemnizaciones_lote(casos)
+    for i, caso in enumerate(casos):
+        esperado = calculadora.calcular_indemnizacion(caso)
+        fila = tabla.iloc[i]
+        for campo in REDONDEADOS:
+            assert fila[campo] == getattr(esperado, campo), (caso, campo)
+        for campo in SIN_REDONDEAR:
+            assert np.isclose(fila[campo], getattr(esperado, campo), rtol=1e-12, atol=0), (caso, campo)
+        for campo in EXACTOS:
+            assert fila[campo] == getattr(esperado, campo), (caso, campo)
+
+
+def test_lote_coincide_con_caso_por_caso(calculadora):
+    _comparar(calculadora, _casos_aleatorios(2000, semilla=20240611))
+
+
+def test_lote_coincide_en_medio_centavo(calculadora):
+    casos = _casos_medio_centavo(500, semilla=7)
+    # Los casos ejercitan el recálculo en Decimal de _redondear_lote
+    capitales = np.array([c.ibm * 53 * (65 / c.edad) * (c.incapacidad_pct / 100) for c in casos])
+    assert redondear_lote(capitales)[1].sum() > 50
+    _comparar(calculadora, casos)
+
+
+INVALIDOS = [
+    (-1.0, 40, 10.0),
+    (100000.0, 0, 10.0),
+    (100000.0, 40, 0.0),
+    (100000.0, 40, 100.5),
+    (float('nan'), 40, 10.0),
+]
+
+
+@pytest.mark.parametrize('ibm, edad, incapacidad', INVALIDOS)
+def test_invalidos_se_rechazan_igual(calculadora, ibm, edad, incapacidad):
+    caso = InputData(date(2020, 1, 1), date(2022, 1, 1), ibm, edad, incapacidad, True)
+    mensaje = errores_entrada_lote(np.array([ibm]), np.array([float(edad)]), np.array([incapacidad]))[0]
+    assert mensaje and mensaje == error_entrada(ibm, edad, incapacidad)
+
+    with pytest.raises(ValueError, match=mensaje.split(':')[0]):
+        calculadora.calcular_indemnizacion(caso)
+    with pytest.raises(ValueError, match='casos con datos inválidos'):
+        calculadora.calcular_indemnizaciones_lote([caso])
+
+
+def test_lote_separa_los_invalidos(calculadora):
+    validos = _casos_aleatorios(20, semilla=3)
+    filas = [
+        {'pmi_date': c.pmi_date.isoformat(), 'final_date': c.final_date.isoformat(), 'ibm': c.ibm,
+         'edad': c.edad, 'incapacidad_pct': c.incapacidad_pct, 'incluir_20_pct': c.incluir_20_pct}
+        for c in validos
+    ]
+    for j, (ibm, edad, incapacidad) in enumerate(INVALIDOS[:-1]):
+        filas.insert(j * 5, {'pmi_date': '2020-01-01', 'final_date': '2022-01-01', 'ibm': ibm,
+                             'edad': edad, 'incapacidad_pct': incapacidad})
+
+    resultados = calcular_casos('lrt', filas)
+
+    calculados = iter(validos)
+    for fila, resultado in zip(filas, resultados):
+        if fila.get('incluir_20_pct') is None:
+            assert resultado['error'] == 'ValueError: ' + error_entrada(fila['ibm'], fila['edad'], fila['incapacidad_pct'])
+        else:
+            esperado = calculadora.calcular_indemnizacion(next(calculados))
+            assert resultado['error'] == ''
+            for campo in REDONDEADOS:
+                assert resultado[campo] == getattr(esperado, campo)
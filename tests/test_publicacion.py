@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: publicación atómica de datasets y vuelta atrás
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Publicar un dataset deja una versión en data/versiones/ y reemplaza el CSV
+de una sola vez; si el reemplazo falla, el CSV vigente queda intacto, sin
+temporales ni versiones huérfanas y sin evento. Volver a publicar una
+versión anterior restaura exactamente su contenido. Todo sobre una copia
+de data/ (ver conftest.datos_temporales).
+"""
+
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from utils import eventos, publicacion
+from utils.esquemas import leer_dataset
+
+
+@pytest.fixture
+def datos(datos_temporales, monkeypatch):
+    monkeypatch.setattr(eventos, '_suscriptores', [])
+    monkeypatch.setattr(eventos, '_vigilante', eventos.VigilanteDatasets())
+    return datos_temporales
+
+
+@pytest.fixture
+def recibidos(datos):
+    """Eventos publicados durante el test"""
+    lista = []
+    eventos.suscribir(lambda nombre, origen: lista.append((nombre, origen)))
+    return lista
+
+
+def _ipc(ruta) -> pd.DataFrame:
+    return pd.read_csv(ruta, dtype=str, keep_default_na=False)
+
+
+def _temporales(datos) -> list:
+    return [p.name for d in (datos, datos / 'versiones') if d.exists() for p in d.glob('.*.tmp')]
+
+
+def test_publicar_reemplaza_el_csv_y_guarda_la_version(datos, recibidos):
+    ruta = datos / 'dataset_ipc.csv'
+    df = _ipc(ruta)
+    df.loc[0, 'variacion_mensual'] = '9.9'
+
+    version = publicacion.publicar_dataset('ipc', df)
+    contenido = df.to_csv(index=False).encode('utf-8')
+    assert ruta.read_bytes() == contenido
+    assert version.read_bytes() == contenido
+    assert version.parent == datos / 'versiones'
+    assert publicacion.versiones_dataset('ipc') == [version]
+    assert leer_dataset('ipc').df['variacion_mensual'].iloc[0] == 9.9
+    assert recibidos == [('ipc', 'editor')]
+    assert _temporales(datos) == []
+
+
+def test_reemplazo_fallido_deja_el_csv_intacto(datos, recibidos, monkeypatch):
+    ruta = datos / 'dataset_ipc.csv'
+    original = ruta.read_bytes()
+    df = _ipc(ruta)
+    df.loc[0, 'variacion_mensual'] = '9.9'
+    reemplazar = os.replace
+
+    def fallar_en_el_csv(origen, destino):
+        if os.path.abspath(destino) == os.path.abspath(ruta):
+            raise OSError("disco lleno")
+        reemplazar(origen, destino)
+
+    monkeypatch.setattr(publicacion.os, 'replace', fallar_en_el_csv)
+    with pytest.raises(OSError, match='disco lleno'):
+        publicacion.publicar_dataset('ipc', df)
+
+    assert ruta.read_bytes() == original
+    assert publicacion.versiones_dataset('ipc') == []
+    assert _temporales(datos) == []
+    assert recibidos == []
+
+
+def test_reintenta_mientras_el_archivo_esta_bloqueado(datos, monkeypatch):
+    intentos = []
+    reemplazar = os.replace
+
+    def bloqueado(origen, destino):
+        intentos.append(destino)
+        if len(intentos) < 3:
+            raise PermissionError("archivo en uso")
+        reemplazar(origen, destino)
+
+    monkeypatch.setattr(publicacion.os, 'replace', bloqueado)
+    monkeypatch.setattr(publicacion.time, 'sleep', lambda segundos: None)
+    destino = datos / 'bloqueado.csv'
+    publicacion.escribir_atomico(destino, b'a\n1\n')
+    assert destino.read_bytes() == b'a\n1\n' and len(intentos) == 3
+
+    intentos.clear()
+    monkeypatch.setattr(publicacion, 'REINTENTOS_REEMPLAZO', 2)
+    with pytest.raises(PermissionError):
+        publicacion.escribir_atomico(destino, b'a\n2\n')
+    assert destino.read_bytes() == b'a\n1\n'
+    assert _temporales(datos) == []
+
+
+def test_volver_a_una_version_anterior(datos, recibidos):
+    ruta = datos / 'dataset_ipc.csv'
+    df = _ipc(ruta)
+    df.loc[0, 'variacion_mensual'] = '2.5'
+    primera = publicacion.publicar_dataset('ipc', df)
+    df.loc[0, 'variacion_mensual'] = '7.0'
+    segunda = publicacion.publicar_dataset('ipc', df)
+    assert publicacion.versiones_dataset('ipc') == [segunda, primera]
+
+    # Vuelta atrás: se publica el contenido de la primera versión
+    restaurada = publicacion.publicar_dataset('ipc', _ipc(primera), origen='restauracion')
+    assert ruta.read_bytes() == primera.read_bytes() == restaurada.read_bytes()
+    assert publicacion.versiones_dataset('ipc') == [restaurada, segunda, primera]
+    assert recibidos[-1] == ('ipc', 'restauracion')
+
+
+def test_limpiar_versiones_respeta_minimo_y_gracia(datos):
+    versiones = datos / 'versiones'
+    versiones.mkdir()
+    viejo = time.time() - 10 * 24 * 3600
+    nombres = [f"dataset_ipc.2025010{i}-000000-000000.csv" for i in range(1, 7)]
+    for i, nombre in enumerate(nombres):
+        (versiones / nombre).write_bytes(b'x')
+        # Las dos más viejas (fuera del mínimo) vencidas; la tercera más vieja todavía no
+        if i < 2:
+            os.utime(versiones / nombre, (viejo, viejo))
+    huerfano = datos / '.dataset_ipc.csv.1.2.tmp'
+    reciente = versiones / '.dataset_ipc.x.csv.1.2.tmp'
+    huerfano.write_bytes(b'')
+    reciente.write_bytes(b'')
+    os.utime(huerfano, (viejo, viejo))
+
+    assert publicacion.limpiar_versiones(minimo=3) == 3
+    assert [p.name for p in publicacion.versiones_dataset('ipc')] == nombres[:1:-1]
+    assert not huerfano.exists() and reciente.exists()
+    # Sin gracia solo quedan las mínimas
+    assert publicacion.limpiar_versiones(gracia=-1, minimo=2) == 2
+    assert [p.name for p in publicacion.versiones_dataset('ipc')] == nombres[:3:-1]
+
+
+def test_lectores_siempre_ven_una_version_completa(datos):
+    ruta = datos / 'dataset_tasa.csv'
+    versiones = (ruta.read_bytes(), ruta.read_bytes() * 2)
+    terminado = threading.Event()
+
+    def escribir():
+        for i in range(30):
+            publicacion.escribir_atomico(ruta, versiones[i % 2])
+        terminado.set()
+
+    escritor = threading.Thread(target=escribir)
+    escritor.start()
+    lecturas = 0
+    while not terminado.is_set() or lecturas == 0:
+        assert publicacion.leer_bytes(ruta) in versiones
+        lecturas += 1
+    escritor.join()
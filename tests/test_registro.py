@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: registro de datasets e índices por versión de archivo
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Una entrada del registro se identifica por (tipo, rutas, variante) y se
+reconstruye solo cuando cambia la versión (mtime, tamaño) de alguno de
+sus archivos. Los índices compartidos de utils.indices deben seguir esa
+regla sobre una copia de los CSV distribuidos.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from utils import indices
+from utils.registro import RegistroDatasets
+
+
+class Constructor:
+    """Constructor que cuenta sus llamadas"""
+
+    def __init__(self):
+        self.llamadas = 0
+
+    def __call__(self, rutas):
+        self.llamadas += 1
+        return {'llamada': self.llamadas, 'rutas': rutas}
+
+
+@pytest.fixture
+def archivo(tmp_path):
+    ruta = tmp_path / 'datos.csv'
+    ruta.write_text("a,b\n1,2\n", encoding='utf-8')
+    return ruta
+
+
+def _tocar(ruta, delta_ns=10**9):
+    stat = ruta.stat()
+    os.utime(ruta, ns=(stat.st_atime_ns, stat.st_mtime_ns + delta_ns))
+
+
+def test_reutiliza_mientras_no_cambia_la_version(archivo):
+    registro, constructor = RegistroDatasets(), Constructor()
+    primero = registro.obtener('tabla:x', archivo, None, constructor)
+    # La misma ruta escrita de otra forma es la misma entrada
+    relativa = os.path.relpath(archivo)
+    assert registro.obtener('tabla:x', relativa, None, constructor) is primero
+    assert registro.obtener('tabla:x', str(archivo), None, constructor) is primero
+    assert constructor.llamadas == 1
+
+
+def test_reconstruye_al_cambiar_mtime_o_tamano(archivo):
+    registro, constructor = RegistroDatasets(), Constructor()
+    primero = registro.obtener('x', archivo, None, constructor)
+
+    _tocar(archivo)
+    segundo = registro.obtener('x', archivo, None, constructor)
+    assert segundo is not primero and constructor.llamadas == 2
+
+    # Mismo mtime, otro tamaño
+    mtime = archivo.stat().st_mtime_ns
+    archivo.write_text("a,b\n1,2\n3,4\n", encoding='utf-8')
+    os.utime(archivo, ns=(mtime, mtime))
+    tercero = registro.obtener('x', archivo, None, constructor)
+    assert tercero is not segundo and constructor.llamadas == 3
+
+    # La entrada se reemplaza, no se acumulan versiones
+    assert registro.memoria()['entradas'] == 1
+    assert registro.entradas()[0]['version'] == ((mtime, archivo.stat().st_size),)
+
+
+def test_tipo_y_variante_distinguen_entradas(archivo):
+    registro, constructor = RegistroDatasets(), Constructor()
+    a = registro.obtener('x', archivo, False, constructor)
+    b = registro.obtener('x', archivo, True, constructor)
+    c = registro.obtener('y', archivo, False, constructor)
+    assert len({id(a), id(b), id(c)}) == 3
+    assert registro.obtener('x', archivo, True, constructor) is b
+    assert constructor.llamadas == 3
+
+
+def test_varias_rutas_y_archivos_faltantes(archivo, tmp_path):
+    registro, constructor = RegistroDatasets(), Constructor()
+    faltante = tmp_path / 'todavia_no.csv'
+    rutas = (archivo, faltante)
+    primero = registro.obtener('lrt', rutas, None, constructor)
+    assert registro.entradas()[0]['version'][1] is None
+    assert registro.obtener('lrt', rutas, None, constructor) is primero
+
+    # Cualquiera de los archivos invalida la entrada, también si aparece uno faltante
+    faltante.write_text("x\n", encoding='utf-8')
+    segundo = registro.obtener('lrt', rutas, None, constructor)
+    assert segundo is not primero
+    _tocar(archivo)
+    assert registro.obtener('lrt', rutas, None, constructor) is not segundo
+    assert constructor.llamadas == 3
+
+
+def test_invalidar_por_tipo_y_por_ruta(archivo, tmp_path):
+    otro = tmp_path / 'otro.csv'
+    otro.write_text("c\n", encoding='utf-8')
+    registro, constructor = RegistroDatasets(), Constructor()
+    registro.obtener('tasa', archivo, False, constructor)
+    registro.obtener('tasa', archivo, True, constructor)
+    registro.obtener('tabla:tasa', archivo, None, constructor)
+    registro.obtener('ipc', otro, None, constructor)
+    registro.obtener('lrt', (archivo, otro), None, constructor)
+
+    assert registro.invalidar(tipo='tasa') == 3
+    assert registro.invalidar(ruta=otro) == 2
+    assert registro.memoria()['entradas'] == 0
+
+    registro.obtener('ipc', otro, None, constructor)
+    registro.obtener('ripte', archivo, None, constructor)
+    assert registro.invalidar() == 2
+    assert registro.obtener('ipc', otro, None, constructor)['llamada'] == constructor.llamadas
+
+
+def test_memoria_separa_propios_y_mapeados(datos_temporales, monkeypatch):
+    monkeypatch.setattr(indices, 'REGISTRO', RegistroDatasets())
+    # El índice de data/ sale del snapshot (mmap); el de otra ruta se construye en memoria
+    mapeado = indices.obtener_indice_tasa()
+    copia = datos_temporales / 'tasa_copia.csv'
+    copia.write_bytes(indices.PATH_TASA.read_bytes())
+    propio = indices.obtener_indice_tasa(copia)
+
+    detalle = {d['rutas'][0]: d for d in indices.REGISTRO.entradas()}
+    assert detalle[str(indices.PATH_TASA)]['bytes_mapeados'] >= mapeado.prefijo.nbytes
+    assert detalle[str(copia)]['bytes_mapeados'] == 0
+    assert detalle[str(copia)]['bytes'] >= propio.prefijo.nbytes
+    memoria = indices.REGISTRO.memoria()
+    assert memoria['entradas'] == 2
+    assert memoria['bytes'] == sum(d['bytes'] for d in detalle.values())
+
+
+def test_indices_compartidos_siguen_la_version_del_csv(datos_temporales, monkeypatch):
+    monkeypatch.setattr(indices, 'REGISTRO', RegistroDatasets())
+    primero = indices.obtener_indice_tasa()
+    assert indices.obtener_indice_tasa() is primero
+    assert indices.obtener_indice_tasa(completar_hasta=True) is not primero
+
+    ruta = indices.PATH_TASA
+    ruta.write_bytes(ruta.read_bytes().replace(b'3.174,28/11/2025', b'9.174,28/11/2025', 1))
+    segundo = indices.obtener_indice_tasa()
+    assert segundo is not primero
+    assert not np.array_equal(segundo.prefijo, primero.prefijo)
+    assert indices.obtener_indice_tasa() is segundo
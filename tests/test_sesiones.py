@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: caché de sesiones contra la tabla compartida
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Dos almacenes sobre la misma base hacen de dos procesos (la interfaz y
+motor.servicio): una sesión cerrada o vencida en uno deja de valer en el
+otro cuando su caché se vuelve a comprobar contra la tabla.
+"""
+
+import re
+from datetime import datetime
+
+import pytest
+
+from utils import simple_session
+from utils.auth import MIGRACIONES
+from utils.base_datos import PoolConexiones
+from utils.simple_session import VIGENCIA, AlmacenSesiones
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = PoolConexiones(str(tmp_path / 'usuarios.db'))
+    pool.migrar(MIGRACIONES)
+    yield pool
+    pool.cerrar()
+
+
+@pytest.fixture
+def sin_cache(monkeypatch):
+    """Cada búsqueda vuelve a leer la base"""
+    monkeypatch.setattr(simple_session, 'VERIFICACION', -1.0)
+
+
+def test_token_largo_y_apto_para_url(pool):
+    almacen = AlmacenSesiones(pool)
+    tokens = {almacen.crear('juan') for _ in range(50)}
+    assert len(tokens) == 50
+    for token in tokens:
+        assert re.fullmatch(r'[A-Za-z0-9_-]{43}', token)
+        assert almacen.obtener(token) == 'juan'
+
+
+def test_tokens_anteriores_siguen_valiendo(pool):
+    ahora = datetime.now().isoformat()
+    with pool.conexion() as conn:
+        conn.execute('INSERT INTO sesiones VALUES (?, ?, ?, ?)', ('0123456789abcdef', 'ana', ahora, ahora))
+    assert AlmacenSesiones(pool).obtener('0123456789abcdef') == 'ana'
+
+
+def test_sesion_cerrada_en_otro_proceso(pool, sin_cache):
+    interfaz, servicio = AlmacenSesiones(pool), AlmacenSesiones(pool)
+    token = interfaz.crear('juan')
+    assert servicio.obtener(token) == 'juan'
+
+    interfaz.eliminar(token)
+    assert servicio.obtener(token) is None
+    assert token not in servicio._cache
+
+    otro = servicio.crear('ana')
+    assert interfaz.obtener(otro) == 'ana'
+    servicio.eliminar_de_usuario('ana')
+    assert interfaz.obtener(otro) is None
+
+
+def test_sesion_vencida_en_la_base(pool, sin_cache):
+    almacen = AlmacenSesiones(pool)
+    token = almacen.crear('juan')
+    vencida = (datetime.now() - VIGENCIA * 2).isoformat()
+    with pool.conexion() as conn:
+        conn.execute('UPDATE sesiones SET ultimo_acceso = ? WHERE token = ?', (vencida, token))
+    # El acceso en memoria, más nuevo, todavía no se escribió: sigue valiendo
+    assert almacen.obtener(token) == 'juan'
+
+    otro = AlmacenSesiones(pool)
+    assert otro.obtener(token) is None
+
+
+def test_cache_dentro_de_la_verificacion(pool):
+    interfaz, servicio = AlmacenSesiones(pool), AlmacenSesiones(pool)
+    token = interfaz.crear('juan')
+    assert servicio.obtener(token) == 'juan'
+    interfaz.eliminar(token)
+    # Dentro de VERIFICACION se confía en el caché...
+    assert servicio.obtener(token) == 'juan'
+    # ...y al vencer se vuelve a leer la base
+    usuario, acceso, verificada = servicio._cache[token]
+    servicio._cache[token] = (usuario, acceso, verificada - simple_session.VERIFICACION - 1)
+    assert servicio.obtener(token) is None
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regresión: snapshot binario de los datasets
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+El snapshot debe devolver las mismas tablas e índices que la lectura del
+CSV, cambiar de clave cuando cambia el contenido de algún CSV (y solo
+entonces) y compilarse de forma atómica: una compilación fallida no deja
+archivos a medias ni pisa el snapshot vigente. Todo sobre una copia de
+data/ (ver conftest.datos_temporales).
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils import snapshot
+from utils.indices import (
+    PRECEDENCIA_VIGENCIAS,
+    IndiceIPC,
+    IndiceRipte,
+    IndiceTasa,
+    IndiceVigencias,
+    leer_tabla
+)
+
+
+def _modificar(ruta, reemplazo):
+    ruta.write_bytes(ruta.read_bytes().replace(*reemplazo, 1))
+
+
+def test_tablas_e_indices_coinciden_con_el_csv(datos_temporales):
+    abierto = snapshot.Snapshot(snapshot.compilar_snapshot())
+    for nombre, ruta in snapshot.DATASETS.items():
+        pd.testing.assert_frame_equal(abierto.tabla(nombre), leer_tabla(nombre, ruta), check_dtype=False)
+
+    for completar in (False, True):
+        esperado = IndiceTasa.desde_dataframe(leer_tabla('tasa', snapshot.DATASETS['tasa']), completar)
+        assert np.array_equal(abierto.indice('tasa', completar).prefijo, esperado.prefijo)
+    ripte = IndiceRipte.desde_dataframe(leer_tabla('ripte', snapshot.DATASETS['ripte']))
+    assert np.array_equal(abierto.indice('ripte').valores, ripte.valores, equal_nan=True)
+    ipc = IndiceIPC.desde_dataframe(leer_tabla('ipc', snapshot.DATASETS['ipc']))
+    assert np.array_equal(abierto.indice('ipc').prefijo, ipc.prefijo)
+
+    for nombre, (col_desde, col_hasta) in snapshot.COLUMNAS_VIGENCIA.items():
+        esperado = IndiceVigencias.desde_dataframe(
+            leer_tabla(nombre, snapshot.DATASETS[nombre]), col_desde, col_hasta, PRECEDENCIA_VIGENCIAS[nombre]
+        )
+        leido = abierto.indice(nombre)
+        for arreglo in ('desde', 'hasta', 'max_hasta', 'prioridad'):
+            assert np.array_equal(getattr(leido, arreglo), getattr(esperado, arreglo)), (nombre, arreglo)
+        assert leido.registros == esperado.registros
+
+
+def test_arreglos_sin_copia_sobre_el_mmap(datos_temporales):
+    abierto = snapshot.Snapshot(snapshot.compilar_snapshot())
+    prefijo = abierto.indice('tasa', True).prefijo
+    assert not prefijo.flags.writeable and not prefijo.flags.owndata
+    # La copia de la tabla es superficial: modificarla no altera la registrada
+    tabla = abierto.tabla('ipc')
+    tabla['variacion_mensual'] = 0.0
+    assert abierto.tabla('ipc')['variacion_mensual'].abs().sum() > 0
+
+
+def test_clave_cambia_solo_con_el_contenido(datos_temporales):
+    clave, hashes = snapshot.clave_fuentes()
+    ruta_ipc = snapshot.DATASETS['ipc']
+
+    # Otro mtime con el mismo contenido: misma clave
+    os.utime(ruta_ipc, ns=(0, 10**18))
+    assert snapshot.clave_fuentes()[0] == clave
+
+    _modificar(ruta_ipc, (b'2025-10,2.3', b'2025-10,2.4'))
+    nueva, nuevos = snapshot.clave_fuentes()
+    assert nueva != clave
+    assert {n for n in hashes if hashes[n] != nuevos[n]} == {'ipc'}
+
+
+def test_clave_incluye_la_version_del_formato(datos_temporales, monkeypatch):
+    clave, hashes = snapshot.clave_fuentes()
+    monkeypatch.setattr(snapshot, 'FORMATO_VERSION', snapshot.FORMATO_VERSION + 1)
+    assert snapshot._clave_de_hashes(hashes) != clave
+
+
+def test_obtener_recompila_al_cambiar_un_csv(datos_temporales):
+    primero = snapshot.obtener_snapshot()
+    assert primero is not None and primero.ruta.parent == datos_temporales / 'snapshot'
+    assert snapshot.obtener_snapshot() is primero
+
+    _modificar(snapshot.DATASETS['ipc'], (b'2025-10,2.3', b'2025-10,9.9'))
+    segundo = snapshot.obtener_snapshot()
+    assert segundo is not primero and segundo.clave != primero.clave
+    assert segundo.tabla('ipc')['variacion_mensual'].iloc[0] == 9.9
+    # El snapshot anterior se borra, pero quien lo tenía abierto lo sigue leyendo
+    assert list((datos_temporales / 'snapshot').glob('datasets_*.bin')) == [segundo.ruta]
+    assert primero.tabla('ipc')['variacion_mensual'].iloc[0] == 2.3
+
+
+def test_compilacion_fallida_no_deja_archivos(datos_temporales, monkeypatch):
+    vigente = snapshot.compilar_snapshot()
+    contenido = vigente.read_bytes()
+
+    def fallar(origen, destino):
+        raise OSError("disco lleno")
+
+    monkeypatch.setattr(snapshot.os, 'replace', fallar)
+    with pytest.raises(OSError, match='disco lleno'):
+        snapshot.compilar_snapshot(vigente)
+    with pytest.raises(OSError):
+        snapshot.compilar_snapshot(datos_temporales / 'snapshot' / 'otro.bin')
+
+    assert vigente.read_bytes() == contenido
+    assert sorted(p.name for p in (datos_temporales / 'snapshot').iterdir()) == [vigente.name]
+
+
+def test_archivos_invalidos_se_rechazan(datos_temporales):
+    ruta = snapshot.compilar_snapshot()
+    datos = bytearray(ruta.read_bytes())
+
+    otro = datos_temporales / 'otro.bin'
+    otro.write_bytes(b'NOSNAPSH' + bytes(datos[8:]))
+    with pytest.raises(ValueError, match='no es un snapshot'):
+        snapshot.Snapshot(otro)
+
+    encabezado = bytes(datos).replace(b'"formato": %d' % snapshot.FORMATO_VERSION, b'"formato": 1', 1)
+    otro.write_bytes(encabezado)
+    with pytest.raises(ValueError, match='no soportada'):
+        snapshot.Snapshot(otro)
@@ -3,19 +3,64 @@ Utilidades compartidas del Sistema de Cálculos y Herramientas
 Tribunal de Trabajo 2 de Quilmes
 """
 
-from .data_loader import (
-    DataLoader,
-    cargar_dataset_jus,
-    cargar_dataset_ipc,
-    cargar_dataset_pisos,
-    cargar_dataset_ripte,
-    cargar_dataset_tasa,
-    get_ultimo_dato
-)
+import importlib
+
+# Los submódulos se importan recién al pedir uno de sus nombres: así
+# "from utils.indices import ..." (motor de cálculo, procesos de lote) no
+# carga Streamlit a través de auth, navegacion o data_loader.
+_EXPORTACIONES = {
+    'DataLoader': 'data_loader',
+    'cargar_dataset_jus': 'data_loader',
+    'cargar_dataset_ipc': 'data_loader',
+    'cargar_dataset_pisos': 'data_loader',
+    'cargar_dataset_ripte': 'data_loader',
+    'cargar_dataset_tasa': 'data_loader',
+    'get_ultimo_dato': 'data_loader',
+    'Columna': 'esquemas',
+    'EsquemaDataset': 'esquemas',
+    'ESQUEMAS': 'esquemas',
+    'leer_dataset': 'esquemas',
+    'RegistroDatasets': 'registro',
+    'obtener_registro': 'registro',
+    'IndiceTasa': 'indices',
+    'IndiceRipte': 'indices',
+    'IndiceIPC': 'indices',
+    'IndiceVigencias': 'indices',
+    'obtener_indice_tasa': 'indices',
+    'obtener_indice_ripte': 'indices',
+    'obtener_indice_ipc': 'indices',
+    'obtener_indice_jus': 'indices',
+    'obtener_indice_pisos': 'indices',
+    'Snapshot': 'snapshot',
+    'compilar_snapshot': 'snapshot',
+    'obtener_snapshot': 'snapshot',
+    'obtener_tabla': 'snapshot',
+    'publicar_cambio_dataset': 'eventos',
+    'iniciar_vigilancia': 'eventos',
+    'publicar_dataset': 'publicacion',
+    'leer_bytes': 'publicacion',
+    'medir_ejecucion': 'metricas',
+    'medir_fase': 'metricas',
+    'medido': 'metricas',
+    'obtener_percentiles': 'metricas',
+    'armar_perfilado': 'perfilado',
+    'cargar_aplicacion': 'aplicaciones',
+    'perfilar_ejecucion': 'perfilado',
+    'PoolConexiones': 'base_datos',
+    'obtener_pool': 'base_datos',
+    'AuthSystem': 'auth',
+    'SimpleSessionManager': 'simple_session',
+    'mostrar_sidebar_navegacion': 'navegacion'
+}
+
+
+def __getattr__(nombre):
+    if nombre not in _EXPORTACIONES:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{_EXPORTACIONES[nombre]}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
 
-from .auth import AuthSystem
-from .simple_session import SimpleSessionManager
-from .navegacion import mostrar_sidebar_navegacion
 
 __all__ = [
     'DataLoader',
@@ -25,6 +70,38 @@ __all__ = [
     'cargar_dataset_ripte',
     'cargar_dataset_tasa',
     'get_ultimo_dato',
+    'Columna',
+    'EsquemaDataset',
+    'ESQUEMAS',
+    'leer_dataset',
+    'RegistroDatasets',
+    'obtener_registro',
+    'IndiceTasa',
+    'IndiceRipte',
+    'IndiceIPC',
+    'IndiceVigencias',
+    'obtener_indice_tasa',
+    'obtener_indice_ripte',
+    'obtener_indice_ipc',
+    'obtener_indice_jus',
+    'obtener_indice_pisos',
+    'Snapshot',
+    'compilar_snapshot',
+    'obtener_snapshot',
+    'obtener_tabla',
+    'publicar_cambio_dataset',
+    'iniciar_vigilancia',
+    'publicar_dataset',
+    'leer_bytes',
+    'medir_ejecucion',
+    'medir_fase',
+    'medido',
+    'obtener_percentiles',
+    'armar_perfilado',
+    'cargar_aplicacion',
+    'perfilar_ejecucion',
+    'PoolConexiones',
+    'obtener_pool',
     'AuthSystem',
     'SimpleSessionManager',
     'mostrar_sidebar_navegacion'
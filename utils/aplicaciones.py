@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ciclo de vida de las aplicaciones de apps/
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Cada aplicación es un módulo con su preparación a nivel de módulo (imports,
+funciones, clases, objetos que no dependen de la sesión) y una función
+render() que dibuja la página. El módulo se compila y ejecuta una sola vez
+por proceso y por versión del archivo; en cada rerun de Streamlit solo se
+llama a render(). Si el archivo cambia, se vuelve a cargar.
+
+Los datasets e índices no se guardan en el módulo: render() los pide al
+registro del proceso (utils/registro.py), que ya los construye una vez por
+versión de los CSV y los renueva cuando se publica un cambio.
+
+Un módulo sin render() (script de Streamlit a la antigua) se compila una
+vez y su código se ejecuta completo en cada rerun.
+"""
+
+import ast
+import sys
+import threading
+import types
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+
+def _version_archivo(ruta: Path) -> Tuple[int, int]:
+    """Versión de un archivo: (mtime en ns, tamaño en bytes)"""
+    # Igual que en registro.py, sin importarlo: registro carga pandas y
+    # este módulo forma parte del arranque de main.py
+    stat = ruta.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+class AplicacionCargada:
+    """Módulo de una aplicación listo para dibujarse"""
+
+    def __init__(self, nombre: str, ruta: Path, version: Tuple[int, int], codigo: types.CodeType,
+                 modulo: types.ModuleType, con_render: bool):
+        self.nombre = nombre
+        self.ruta = ruta
+        self.version = version
+        self.codigo = codigo
+        self.modulo = modulo
+        self.con_render = con_render
+
+    def render(self) -> None:
+        """Dibuja la aplicación (una vez por rerun)"""
+        if self.con_render:
+            self.modulo.render()
+        else:
+            # Script sin render(): se reutiliza el bytecode, no el estado
+            exec(self.codigo, {'__name__': self.nombre, '__file__': str(self.ruta), '__builtins__': __builtins__})
+
+
+_cargadas: Dict[str, AplicacionCargada] = {}
+_locks: Dict[str, threading.Lock] = {}
+_locks_lock = threading.Lock()
+
+
+def _lock_de(nombre: str) -> threading.Lock:
+    with _locks_lock:
+        return _locks.setdefault(nombre, threading.Lock())
+
+
+def _define_render(arbol: ast.Module) -> bool:
+    return any(isinstance(n, ast.FunctionDef) and n.name == 'render' for n in arbol.body)
+
+
+def cargar_aplicacion(nombre: str, ruta: Optional[Path] = None) -> AplicacionCargada:
+    """
+    Devuelve el módulo de una aplicación, cargándolo si es la primera vez o cambió el archivo.
+
+    Args:
+        nombre: Nombre del módulo ('apps.ibm')
+        ruta: Archivo fuente (por defecto el que corresponde al nombre)
+
+    Returns:
+        AplicacionCargada
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        Exception: Cualquier error de sintaxis o de la preparación del módulo
+            (la versión anterior, si la había, se descarta)
+    """
+    ruta = Path(ruta) if ruta else RAIZ / f"{nombre.replace('.', '/')}.py"
+    version = _version_archivo(ruta)
+
+    cargada = _cargadas.get(nombre)
+    if cargada is not None and cargada.version == version:
+        return cargada
+
+    # Un lock por aplicación: dos sesiones que abren la misma app a la vez
+    # la cargan una sola vez, sin frenar a las demás apps
+    with _lock_de(nombre):
+        cargada = _cargadas.get(nombre)
+        if cargada is not None and cargada.version == version:
+            return cargada
+        _cargadas.pop(nombre, None)
+
+        fuente = ruta.read_bytes()
+        arbol = ast.parse(fuente, filename=str(ruta))
+        codigo = compile(arbol, str(ruta), 'exec')
+        con_render = _define_render(arbol)
+
+        modulo = types.ModuleType(nombre)
+        modulo.__file__ = str(ruta)
+        if con_render:
+            # Preparación del módulo: una vez por versión del archivo
+            sys.modules[nombre] = modulo
+            try:
+                exec(codigo, modulo.__dict__)
+            except BaseException:
+                sys.modules.pop(nombre, None)
+                raise
+
+        cargada = AplicacionCargada(nombre, ruta, version, codigo, modulo, con_render)
+        _cargadas[nombre] = cargada
+        return cargada
+
+
+_tareas: Dict[str, threading.Thread] = {}
+_tareas_lock = threading.Lock()
+
+
+def iniciar_en_segundo_plano(nombre: str, tarea: Callable[[], None]) -> threading.Thread:
+    """
+    Ejecuta una tarea de arranque en un hilo de fondo, una sola vez por proceso.
+
+    main.py se vuelve a ejecutar en cada rerun: las tareas que arrancan
+    servicios del proceso se registran acá para no repetirse.
+
+    Args:
+        nombre: Identificador de la tarea
+        tarea: Función sin argumentos
+
+    Returns:
+        El hilo de la tarea (el ya iniciado si se llama de nuevo)
+    """
+    with _tareas_lock:
+        hilo = _tareas.get(nombre)
+        if hilo is None:
+            def ejecutar() -> None:
+                try:
+                    tarea()
+                except Exception as e:
+                    print(f"[ARRANQUE] Error en {nombre}: {type(e).__name__}: {e}")
+
+            hilo = threading.Thread(target=ejecutar, name=f"arranque-{nombre}", daemon=True)
+            _tareas[nombre] = hilo
+            hilo.start()
+        return hilo
+
+
+def descartar_aplicaciones() -> int:
+    """
+    Olvida los módulos cargados (la próxima ejecución de cada app los vuelve a cargar).
+
+    Returns:
+        int: Cantidad de aplicaciones descartadas
+    """
+    cantidad = len(_cargadas)
+    _cargadas.clear()
+    return cantidad
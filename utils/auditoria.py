@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Escritura asíncrona de la auditoría de logins y acciones
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+AuthSystem.registrar_login y registrar_accion ya no escriben en la base en
+el hilo de la sesión: cada registro se agrega a un archivo de respaldo
+(spool) y a una cola en memoria, y un hilo de fondo lo inserta en
+auditoria_logins / auditoria_acciones en lotes, una transacción por lote.
+
+El spool es un archivo de líneas JSON junto a la base, escrito sin fsync
+(queda en el caché del sistema operativo, que sobrevive a la caída del
+proceso). Cada proceso tiene el suyo (usuarios.auditoria.<pid>.spool),
+bloqueado en exclusiva mientras vive: la interfaz y un motor.servicio
+independiente pueden escribir en la misma base sin pisarse.
+
+El spool se vacía cuando todo lo encolado ya está confirmado en la base;
+un lote que falla se reintenta en las escrituras siguientes, hasta
+REINTENTOS_LOTE veces: después se aparta en un spool propio
+(usuarios.auditoria.<pid>.<n>.spool) y el escritor sigue con la cola.
+Los spools apartados se vuelven a intentar cuando la base responde. Si el
+proceso termina antes, su spool queda sin bloqueo y el próximo escritor
+que arranca inserta lo que quedó, salteando los registros que ya estaban
+(misma fecha_hora y usuario).
+
+La cola es acotada: si se llena (la base no responde), el registro se
+escribe directamente, como antes, y si tampoco se puede se aparta en un
+spool. La auditoría nunca hace fallar el login ni la acción auditada.
+"""
+
+import atexit
+import glob
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from .base_datos import PoolConexiones
+
+# Registros que se insertan por transacción
+TAMAÑO_LOTE = 200
+
+# Registros en memoria a la espera de escribirse
+TAMAÑO_COLA = 10000
+
+# Segundos entre escrituras del hilo de fondo
+INTERVALO_ESCRITURA = 0.5
+
+# Escrituras fallidas de un mismo lote antes de apartarlo en un spool propio
+REINTENTOS_LOTE = 5
+
+_INSERTS = {
+    'login': '''
+        INSERT INTO auditoria_logins (username, fecha_hora, exito, ip_address, user_agent)
+        VALUES (?, ?, ?, ?, ?)
+    ''',
+    'accion': '''
+        INSERT INTO auditoria_acciones (fecha_hora, usuario, accion, tipo, detalle, objetivo)
+        VALUES (?, ?, ?, ?, ?, ?)
+    '''
+}
+
+# Al recuperar el spool: los mismos inserts, salvo que el registro ya esté
+_INSERTS_RECUPERACION = {
+    'login': '''
+        INSERT INTO auditoria_logins (username, fecha_hora, exito, ip_address, user_agent)
+        SELECT ?1, ?2, ?3, ?4, ?5
+        WHERE NOT EXISTS (SELECT 1 FROM auditoria_logins WHERE fecha_hora = ?2 AND username = ?1)
+    ''',
+    'accion': '''
+        INSERT INTO auditoria_acciones (fecha_hora, usuario, accion, tipo, detalle, objetivo)
+        SELECT ?1, ?2, ?3, ?4, ?5, ?6
+        WHERE NOT EXISTS (SELECT 1 FROM auditoria_acciones WHERE fecha_hora = ?1 AND usuario = ?2)
+    '''
+}
+
+Registro = Tuple[str, tuple]
+
+
+def _bloquear(archivo) -> bool:
+    """
+    Bloqueo exclusivo, sin esperar, de un spool abierto.
+
+    El sistema operativo lo libera cuando el proceso termina, aunque sea por
+    una caída: un spool que se puede bloquear no tiene dueño vivo.
+    """
+    try:
+        if fcntl is not None:
+            fcntl.flock(archivo.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            archivo.seek(0)
+            msvcrt.locking(archivo.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _insertar(conn: sqlite3.Connection, registros: List[Registro], inserts=_INSERTS) -> None:
+    for tabla in ('login', 'accion'):
+        filas = [valores for tipo, valores in registros if tipo == tabla]
+        if filas:
+            conn.executemany(inserts[tabla], filas)
+
+
+class EscritorAuditoria:
+    """Cola de registros de auditoría de una base, con spool y escritura en lote"""
+
+    def __init__(self, pool: PoolConexiones, ruta_spool: Optional[str] = None):
+        self.pool = pool
+        base = os.path.splitext(pool.db_path)[0]
+        self._base = base
+        self.ruta_spool = ruta_spool or f"{base}.auditoria.{os.getpid()}.spool"
+        # Spools de otros procesos (y el único spool de versiones anteriores)
+        self._patron_spools = f"{glob.escape(base)}.auditoria*.spool"
+        self._cola: "queue.Queue[Registro]" = queue.Queue(TAMAÑO_COLA)
+        # Spool y cola se modifican juntos: con la cola vacía, todo lo del
+        # spool ya está en la base
+        self._lock = threading.Lock()
+        self._escritura = threading.Lock()
+        self._detener = threading.Event()
+        # Lote que no se pudo escribir: se reintenta antes que la cola, y
+        # mientras tanto el spool no se vacía
+        self._fallidos: List[Registro] = []
+        self._intentos = 0
+        # Registros encolados y ya resueltos (escritos, descartados o
+        # apartados), en orden de llegada: ver pendiente()
+        self._encolados = 0
+        self._procesados = 0
+        # Spools apartados por este proceso, pendientes de escribir en la base
+        self._derrames: List[str] = []
+        # Un spool con el mismo nombre es de un proceso terminado que tuvo
+        # este pid: se recupera antes de reutilizarlo (si la base no responde,
+        # se aparta para no mezclarlo con el nuevo)
+        try:
+            recuperados = self._recuperar_spool(self.ruta_spool)
+        except sqlite3.Error as e:
+            print(f"[AUDITORIA] No se pudo recuperar el spool anterior: {e}")
+            os.replace(self.ruta_spool, self._ruta_derrame())
+            recuperados = 0
+        # El spool propio se bloquea antes de buscar los abandonados, para
+        # que otro proceso que arranca a la vez no lo tome por uno de ellos
+        self._spool = open(self.ruta_spool, 'a', encoding='utf-8')
+        _bloquear(self._spool)
+        self.recuperados = recuperados + self._recuperar_spools()
+        self._hilo = threading.Thread(target=self._ciclo, name='auditoria', daemon=True)
+        self._hilo.start()
+        atexit.register(self.detener)
+
+    def _recuperar_spools(self) -> int:
+        """Inserta los registros que quedaron en los spools de procesos que ya terminaron"""
+        total = 0
+        for ruta in glob.glob(self._patron_spools):
+            if os.path.abspath(ruta) != os.path.abspath(self.ruta_spool):
+                try:
+                    total += self._recuperar_spool(ruta)
+                except sqlite3.Error as e:
+                    # Queda en disco: lo recupera el próximo escritor que arranque
+                    print(f"[AUDITORIA] No se pudo recuperar {os.path.basename(ruta)}: {e}")
+        if total:
+            print(f"[AUDITORIA] Recuperados {total} registros del spool")
+        return total
+
+    def _recuperar_spool(self, ruta: str) -> int:
+        try:
+            f = open(ruta, 'r+', encoding='utf-8')
+        except FileNotFoundError:
+            return 0  # ya lo recuperó otro proceso
+        with f:
+            # Bloqueado: su dueño sigue escribiendo (o lo está recuperando otro)
+            if not _bloquear(f):
+                return 0
+            f.seek(0)
+            registros = []
+            for linea in f:
+                try:
+                    tipo, valores = json.loads(linea)
+                except ValueError:
+                    continue  # línea cortada por la caída
+                if tipo in _INSERTS:
+                    registros.append((tipo, tuple(valores)))
+
+            with self.pool.conexion() as conn:
+                _insertar(conn, registros, _INSERTS_RECUPERACION)
+            # Vacío antes de soltar el bloqueo: quien lo abra después no
+            # vuelve a insertar nada
+            f.truncate(0)
+        try:
+            os.remove(ruta)
+        except OSError:
+            pass
+        return len(registros)
+
+    def agregar(self, tipo: str, valores: tuple) -> int:
+        """
+        Encola un registro ('login' o 'accion', con los valores del INSERT).
+
+        Si la cola está llena (o el escritor ya se detuvo), el registro se
+        escribe en el momento; si la base no responde, se aparta en un
+        spool. Nunca lanza excepciones: la auditoría no debe interrumpir
+        el login ni la acción auditada.
+
+        Returns:
+            int: Número del registro en la cola (para pendiente()), o 0 si
+            ya se resolvió en el momento
+        """
+        numero = 0
+        with self._lock:
+            # Después de detener() (al terminar el proceso) ya no hay spool
+            if self._spool.closed:
+                lleno = True
+            else:
+                try:
+                    self._cola.put_nowait((tipo, valores))
+                except queue.Full:
+                    lleno = True
+                else:
+                    lleno = False
+                    self._encolados += 1
+                    numero = self._encolados
+                    self._spool.write(json.dumps([tipo, valores], ensure_ascii=False) + '\n')
+                    self._spool.flush()
+        if not lleno:
+            return numero
+        try:
+            # Con un lote fallando la base no responde: no se hace esperar a la sesión
+            if self._fallidos:
+                self._derramar([(tipo, valores)])
+                return numero
+            try:
+                with self.pool.conexion() as conn:
+                    _insertar(conn, [(tipo, valores)])
+            except sqlite3.IntegrityError as e:
+                print(f"[AUDITORIA] Se descarta un registro inválido: {e}")
+            except sqlite3.Error as e:
+                print(f"[AUDITORIA] No se pudo guardar el registro: {e}")
+                self._derramar([(tipo, valores)])
+        except Exception as e:
+            print(f"[AUDITORIA] Se pierde un registro de {tipo}: {type(e).__name__}: {e}")
+        return numero
+
+    def pendiente(self, numero: int) -> bool:
+        """
+        Indica si un registro encolado todavía no llegó a la base.
+
+        Args:
+            numero: Valor devuelto por agregar()
+
+        Returns:
+            bool: True si todavía está en la cola o en un lote por reintentar
+        """
+        return self._procesados < numero
+
+    def _ruta_derrame(self) -> str:
+        """Nombre nuevo para un spool apartado (lo encuentra _recuperar_spools)"""
+        return f"{self._base}.auditoria.{os.getpid()}.{time.time_ns()}.spool"
+
+    def _derramar(self, registros: List[Registro]) -> None:
+        """
+        Aparta registros que no se pudieron escribir en un spool propio.
+
+        El archivo se escribe completo y recién entonces toma su nombre
+        definitivo: quien lo recupere (este proceso u otro que arranque)
+        nunca ve uno a medias.
+        """
+        with self._lock:
+            ruta = self._ruta_derrame()
+            temporal = f"{ruta}.tmp"
+            with open(temporal, 'w', encoding='utf-8') as f:
+                for tipo, valores in registros:
+                    f.write(json.dumps([tipo, valores], ensure_ascii=False) + '\n')
+            os.replace(temporal, ruta)
+            self._derrames.append(ruta)
+        print(f"[AUDITORIA] {len(registros)} registros apartados en {os.path.basename(ruta)}")
+
+    def _reintentar_derrames(self) -> int:
+        """Escribe en la base los spools apartados por este proceso (los que ya no están, los recuperó otro)"""
+        with self._lock:
+            derrames = list(self._derrames)
+        escritos = 0
+        for ruta in derrames:
+            try:
+                escritos += self._recuperar_spool(ruta)
+            except sqlite3.Error:
+                break  # La base sigue sin responder: se intenta en el próximo ciclo
+            with self._lock:
+                self._derrames.remove(ruta)
+        return escritos
+
+    def _tomar_lote(self) -> List[Registro]:
+        lote, self._fallidos = self._fallidos, []
+        while len(lote) < TAMAÑO_LOTE:
+            try:
+                lote.append(self._cola.get_nowait())
+            except queue.Empty:
+                break
+        return lote
+
+    def _escribir(self, lote: List[Registro]) -> bool:
+        try:
+            with self.pool.conexion() as conn:
+                _insertar(conn, lote)
+        except sqlite3.IntegrityError as e:
+            # Reintentar no lo arregla: se descarta, como si se hubiera escrito
+            print(f"[AUDITORIA] Se descartan {len(lote)} registros inválidos: {e}")
+        except sqlite3.Error as e:
+            self._intentos += 1
+            print(f"[AUDITORIA] No se pudieron guardar {len(lote)} registros "
+                  f"(intento {self._intentos} de {REINTENTOS_LOTE}): {e}")
+            if self._intentos < REINTENTOS_LOTE:
+                # Siguen en el spool; se reintentan en la próxima escritura
+                self._fallidos = lote
+                return False
+            # Se apartan para que el lote no se reintente para siempre ni
+            # impida vaciar el spool cuando la base vuelva
+            self._intentos = 0
+            try:
+                self._derramar(lote)
+            except OSError as e_spool:
+                # Sin disco tampoco: se sigue reintentando en memoria
+                self._fallidos = lote
+                print(f"[AUDITORIA] No se pudo apartar el lote: {e_spool}")
+            else:
+                self._procesados += len(lote)
+            return False
+        self._intentos = 0
+        self._procesados += len(lote)
+        with self._lock:
+            if self._cola.empty():
+                self._spool.truncate(0)
+        return True
+
+    def vaciar(self) -> int:
+        """
+        Escribe todo lo encolado hasta ahora (ver AuthSystem._lectura_auditoria).
+
+        Returns:
+            int: Cantidad de registros escritos
+        """
+        escritos = 0
+        with self._escritura:
+            # Detenido: lo pendiente quedó en el spool, que recupera el próximo arranque
+            if self._spool.closed:
+                return escritos
+            while True:
+                lote = self._tomar_lote()
+                if not lote:
+                    return escritos
+                if not self._escribir(lote):
+                    return escritos
+                escritos += len(lote)
+
+    def _ciclo(self) -> None:
+        while not self._detener.wait(INTERVALO_ESCRITURA):
+            self.vaciar()
+            if self._derrames and not self._fallidos:
+                self._reintentar_derrames()
+
+    def detener(self) -> None:
+        """Detiene el hilo de fondo y escribe lo pendiente (al terminar el proceso)"""
+        self._detener.set()
+        self._hilo.join(timeout=INTERVALO_ESCRITURA * 2)
+        self.vaciar()
+        # Los que sigan sin escribirse quedan en disco para el próximo arranque
+        self._reintentar_derrames()
+        with self._lock:
+            pendiente = bool(self._fallidos) or not self._cola.empty()
+            self._spool.close()
+        # Con registros sin escribir el spool queda para el próximo arranque
+        if not pendiente:
+            try:
+                os.remove(self.ruta_spool)
+            except OSError:
+                pass
+
+
+_escritores = {}
+_escritores_lock = threading.Lock()
+
+
+def obtener_escritor(pool: PoolConexiones) -> EscritorAuditoria:
+    """Escritor de auditoría del proceso para la base del pool"""
+    escritor = _escritores.get(pool.db_path)
+    if escritor is not None:
+        return escritor
+    with _escritores_lock:
+        escritor = _escritores.get(pool.db_path)
+        if escritor is None:
+            escritor = EscritorAuditoria(pool)
+            _escritores[pool.db_path] = escritor
+        return escritor
@@ -10,71 +10,207 @@ Tribunal de Trabajo 2 de Quilmes
 
 import sqlite3
 import hashlib
-import os
-from datetime import datetime
-from typing import Optional, Tuple, List, Dict
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, List, Dict
+
+from .auditoria import obtener_escritor as obtener_escritor_auditoria
+from .base_datos import obtener_pool
+from .busqueda import consulta_fts, crear_indices as crear_indices_busqueda, ranking
+from .metricas import crear_tabla as crear_tabla_metricas
+from .perfilado import crear_tabla as crear_tabla_perfiles
+from .retencion import crear_tablas as crear_tablas_retencion, ruta_archivo
+from .simple_session import crear_tabla as crear_tabla_sesiones, importar_json as importar_sesiones_json
+
+
+def _crear_tablas(conn: sqlite3.Connection):
+    """Migración 1: tablas de usuarios, auditoría, métricas y perfiles"""
+    cursor = conn.cursor()
+    
+    # Tabla de usuarios con 3 niveles
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS usuarios (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            nivel TEXT NOT NULL CHECK(nivel IN ('superadmin', 'admin', 'usuario')),
+            nombre_completo TEXT,
+            cargo TEXT,
+            email TEXT,
+            fecha_creacion TEXT NOT NULL,
+            ultimo_acceso TEXT,
+            creado_por TEXT,
+            activo INTEGER DEFAULT 1,
+            primer_login INTEGER DEFAULT 1
+        )
+    ''')
+    
+    # Tabla de auditoría de logins
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS auditoria_logins (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT NOT NULL,
+            fecha_hora TEXT NOT NULL,
+            exito INTEGER NOT NULL,
+            ip_address TEXT,
+            user_agent TEXT
+        )
+    ''')
+    
+    # Tabla de auditoría de acciones (CRUD usuarios y tablas)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS auditoria_acciones (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fecha_hora TEXT NOT NULL,
+            usuario TEXT NOT NULL,
+            accion TEXT NOT NULL,
+            tipo TEXT NOT NULL,
+            detalle TEXT,
+            objetivo TEXT
+        )
+    ''')
+    
+    # Tabla de métricas de tiempo de las aplicaciones (ver utils/metricas.py)
+    crear_tabla_metricas(conn)
+    
+    # Tabla de perfiles cProfile capturados bajo demanda (ver utils/perfilado.py)
+    crear_tabla_perfiles(conn)
+
+
+def _crear_indices(conn: sqlite3.Connection):
+    """Migración 2: índices del login y de los reportes de auditoría"""
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_usuarios_username_activo ON usuarios (username, activo)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_logins_fecha ON auditoria_logins (fecha_hora)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_logins_usuario ON auditoria_logins (username, fecha_hora)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_acciones_fecha ON auditoria_acciones (fecha_hora)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_acciones_usuario ON auditoria_acciones (usuario, fecha_hora)')
+
+
+def _crear_sesiones(conn: sqlite3.Connection):
+    """Migración 3: tabla de sesiones, con las del antiguo data/sessions.json"""
+    crear_tabla_sesiones(conn)
+    importar_sesiones_json(conn)
+
+
+def _crear_indices_reportes(conn: sqlite3.Connection):
+    """Migración 4: índices de los reportes por tipo de acción y de los resúmenes de logins"""
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_acciones_tipo ON auditoria_acciones (tipo, fecha_hora)')
+    # Cubre el conteo por resultado o por día sin leer la tabla
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_logins_fecha_exito ON auditoria_logins (fecha_hora, exito)')
+
+
+def _crear_resumenes_mensuales(conn: sqlite3.Connection):
+    """Migración 5: resúmenes mensuales de la auditoría archivada (ver utils/retencion.py)"""
+    crear_tablas_retencion(conn)
+
+
+def _crear_busqueda(conn: sqlite3.Connection):
+    """Migración 6: índices de texto completo de usuarios y acciones (ver utils/busqueda.py)"""
+    crear_indices_busqueda(conn)
+
+
+# Esquema de usuarios.db, en orden (ver utils/base_datos.py): agregar al
+# final, nunca modificar una migración ya publicada
+MIGRACIONES = (
+    _crear_tablas, _crear_indices, _crear_sesiones, _crear_indices_reportes, _crear_resumenes_mensuales,
+    _crear_busqueda
+)
+
+# Agrupaciones de los resúmenes de auditoría: nombre -> expresión SQL
+AGRUPACIONES_LOGINS = {
+    'resultado': 'exito',
+    'usuario': 'username',
+    'dia': 'substr(fecha_hora, 1, 10)'
+}
+AGRUPACIONES_ACCIONES = {
+    'accion': 'accion',
+    'usuario': 'usuario',
+    'tipo': 'tipo',
+    'dia': 'substr(fecha_hora, 1, 10)'
+}
+
+# Agrupaciones que también se cuentan en los resúmenes mensuales de lo
+# archivado: tabla de detalle -> (tabla resumen, agrupación -> columna)
+RESUMENES_MENSUALES = {
+    'auditoria_logins': ('resumen_mensual_logins', {'resultado': 'exito', 'usuario': 'username'}),
+    'auditoria_acciones': ('resumen_mensual_acciones', {'accion': 'accion', 'usuario': 'usuario', 'tipo': 'tipo'})
+}
+
+
+def _meses_completos(desde: Optional[date], hasta: Optional[date]) -> Tuple[str, str]:
+    """Primer y último mes ('AAAA-MM') enteramente dentro del rango"""
+    if desde is None:
+        primero = '0000-00'
+    elif desde.day == 1:
+        primero = desde.strftime('%Y-%m')
+    else:
+        primero = (desde.replace(day=28) + timedelta(days=4)).strftime('%Y-%m')
+    if hasta is None:
+        ultimo = '9999-99'
+    elif (hasta + timedelta(days=1)).day == 1:
+        ultimo = hasta.strftime('%Y-%m')
+    else:
+        ultimo = (hasta.replace(day=1) - timedelta(days=1)).strftime('%Y-%m')
+    return primero, ultimo
+
+
+def _filtros_auditoria(
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    antes_de: Optional[Tuple[str, int]] = None,
+    **iguales
+) -> Tuple[str, list]:
+    """
+    WHERE de los reportes de auditoría (fecha_hora es ISO, así que compara como texto)
+    
+    Args:
+        desde: Primer día incluido
+        hasta: Último día incluido
+        antes_de: Cursor (fecha_hora, id) de la última fila de la página anterior
+        **iguales: columna=valor (los None se ignoran)
+    """
+    condiciones, parametros = [], []
+    for columna, valor in iguales.items():
+        if valor is not None:
+            condiciones.append(f"{columna} = ?")
+            parametros.append(valor)
+    if desde is not None:
+        condiciones.append("fecha_hora >= ?")
+        parametros.append(desde.isoformat())
+    if hasta is not None:
+        condiciones.append("fecha_hora < ?")
+        parametros.append((hasta + timedelta(days=1)).isoformat())
+    if antes_de is not None:
+        condiciones.append("(fecha_hora, id) < (?, ?)")
+        parametros.extend(antes_de)
+    return (f"WHERE {' AND '.join(condiciones)}" if condiciones else ""), parametros
+
+# Bases en las que este proceso ya verificó el superadmin por defecto
+_inicializadas = set()
+_inicializacion_lock = threading.Lock()
+
 
 class AuthSystem:
     """Sistema de autenticación con SQLite y auditoría"""
     
     def __init__(self, db_path: str = "data/usuarios.db"):
-        """Inicializa el sistema de autenticación"""
-        self.db_path = db_path
-        self._crear_base_datos()
-        self._crear_superadmin_default()
-    
-    def _crear_base_datos(self):
-        """Crea la base de datos y tablas si no existen"""
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Tabla de usuarios con 3 niveles
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS usuarios (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                nivel TEXT NOT NULL CHECK(nivel IN ('superadmin', 'admin', 'usuario')),
-                nombre_completo TEXT,
-                cargo TEXT,
-                email TEXT,
-                fecha_creacion TEXT NOT NULL,
-                ultimo_acceso TEXT,
-                creado_por TEXT,
-                activo INTEGER DEFAULT 1,
-                primer_login INTEGER DEFAULT 1
-            )
-        ''')
-        
-        # Tabla de auditoría de logins
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS auditoria_logins (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT NOT NULL,
-                fecha_hora TEXT NOT NULL,
-                exito INTEGER NOT NULL,
-                ip_address TEXT,
-                user_agent TEXT
-            )
-        ''')
-        
-        # Tabla de auditoría de acciones (CRUD usuarios y tablas)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS auditoria_acciones (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                fecha_hora TEXT NOT NULL,
-                usuario TEXT NOT NULL,
-                accion TEXT NOT NULL,
-                tipo TEXT NOT NULL,
-                detalle TEXT,
-                objetivo TEXT
-            )
-        ''')
+        """
+        Inicializa el sistema de autenticación.
         
-        conn.commit()
-        conn.close()
+        Se construye en cada rerun: el esquema y el superadmin se verifican
+        una sola vez por proceso, y las conexiones salen del pool compartido.
+        """
+        self.db_path = db_path
+        self.pool = obtener_pool(db_path, MIGRACIONES)
+        self.auditoria = obtener_escritor_auditoria(self.pool)
+        # Último registro de auditoría encolado por esta instancia (ver _lectura_auditoria)
+        self._ultimo_registro = 0
+        with _inicializacion_lock:
+            if self.pool.db_path not in _inicializadas:
+                self._crear_superadmin_default()
+                _inicializadas.add(self.pool.db_path)
     
     def _hash_password(self, password: str) -> str:
         """Hashea una contraseña usando SHA-256"""
@@ -94,34 +230,18 @@ class AuthSystem:
             )
     
     def registrar_login(self, username: str, exito: bool, ip: str = "", user_agent: str = ""):
-        """Registra un intento de login en auditoría"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO auditoria_logins (username, fecha_hora, exito, ip_address, user_agent)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (username, datetime.now().isoformat(), 1 if exito else 0, ip, user_agent))
-        
-        conn.commit()
-        conn.close()
+        """Registra un intento de login en auditoría (se escribe en segundo plano, ver utils/auditoria.py)"""
+        numero = self.auditoria.agregar('login', (username, datetime.now().isoformat(), 1 if exito else 0, ip, user_agent))
+        self._ultimo_registro = max(self._ultimo_registro, numero)
     
     def registrar_accion(self, usuario: str, accion: str, tipo: str, detalle: str = "", objetivo: str = ""):
         """
-        Registra una acción administrativa
+        Registra una acción administrativa (se escribe en segundo plano, ver utils/auditoria.py)
         accion: 'crear', 'modificar', 'eliminar'
         tipo: 'usuario', 'tabla'
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            INSERT INTO auditoria_acciones (fecha_hora, usuario, accion, tipo, detalle, objetivo)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (datetime.now().isoformat(), usuario, accion, tipo, detalle, objetivo))
-        
-        conn.commit()
-        conn.close()
+        numero = self.auditoria.agregar('accion', (datetime.now().isoformat(), usuario, accion, tipo, detalle, objetivo))
+        self._ultimo_registro = max(self._ultimo_registro, numero)
     
     def crear_usuario(
         self,
@@ -144,19 +264,14 @@ class AuthSystem:
             return False, "Nivel debe ser 'superadmin', 'admin' o 'usuario'"
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             password_hash = self._hash_password(password)
             fecha_creacion = datetime.now().isoformat()
             
-            cursor.execute('''
-                INSERT INTO usuarios (username, password_hash, nivel, nombre_completo, cargo, email, fecha_creacion, creado_por)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (username, password_hash, nivel, nombre_completo, cargo, email, fecha_creacion, creado_por))
-            
-            conn.commit()
-            conn.close()
+            with self.pool.conexion() as conn:
+                conn.execute('''
+                    INSERT INTO usuarios (username, password_hash, nivel, nombre_completo, cargo, email, fecha_creacion, creado_por)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (username, password_hash, nivel, nombre_completo, cargo, email, fecha_creacion, creado_por))
             
             # Registrar en auditoría
             self.registrar_accion(
@@ -175,73 +290,73 @@ class AuthSystem:
     
     def usuario_existe(self, username: str) -> bool:
         """Verifica si un usuario existe"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT COUNT(*) FROM usuarios WHERE username = ?', (username,))
-        existe = cursor.fetchone()[0] > 0
-        conn.close()
-        return existe
+        with self.pool.conexion() as conn:
+            return conn.execute('SELECT COUNT(*) FROM usuarios WHERE username = ?', (username,)).fetchone()[0] > 0
     
     def validar_credenciales(self, username: str, password: str) -> Tuple[bool, Optional[Dict]]:
         """Valida credenciales y retorna datos del usuario"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         password_hash = self._hash_password(password)
         
-        cursor.execute('''
-            SELECT id, username, nivel, nombre_completo, cargo, email, activo, primer_login
-            FROM usuarios
-            WHERE username = ? AND password_hash = ?
-        ''', (username, password_hash))
+        # Consulta y último acceso en una sola conexión (la auditoría se escribe aparte)
+        with self.pool.conexion() as conn:
+            resultado = conn.execute('''
+                SELECT id, username, nivel, nombre_completo, cargo, email, activo, primer_login
+                FROM usuarios
+                WHERE username = ? AND password_hash = ?
+            ''', (username, password_hash)).fetchone()
+            
+            if resultado and resultado[6] != 0:  # existe y está activo
+                # Actualizar último acceso
+                conn.execute('''
+                    UPDATE usuarios
+                    SET ultimo_acceso = ?
+                    WHERE username = ?
+                ''', (datetime.now().isoformat(), username))
         
-        resultado = cursor.fetchone()
+        if not resultado or resultado[6] == 0:
+            self.registrar_login(username, False)
+            return False, None
         
-        if resultado:
-            if resultado[6] == 0:  # activo
-                conn.close()
-                self.registrar_login(username, False)
-                return False, None
-            
-            # Actualizar último acceso
-            cursor.execute('''
-                UPDATE usuarios
-                SET ultimo_acceso = ?
-                WHERE username = ?
-            ''', (datetime.now().isoformat(), username))
-            conn.commit()
-            
-            usuario_data = {
-                'id': resultado[0],
-                'username': resultado[1],
-                'nivel': resultado[2],
-                'nombre_completo': resultado[3],
-                'cargo': resultado[4],
-                'email': resultado[5],
-                'primer_login': resultado[7]
-            }
-            
-            conn.close()
-            self.registrar_login(username, True)
-            return True, usuario_data
+        self.registrar_login(username, True)
         
-        conn.close()
-        self.registrar_login(username, False)
-        return False, None
+        usuario_data = {
+            'id': resultado[0],
+            'username': resultado[1],
+            'nivel': resultado[2],
+            'nombre_completo': resultado[3],
+            'cargo': resultado[4],
+            'email': resultado[5],
+            'primer_login': resultado[7]
+        }
+        return True, usuario_data
     
+    def credencial_vigente(self, username: str, password_hash: str) -> bool:
+        """
+        Verifica que una credencial ya validada siga sirviendo: misma contraseña
+        y usuario activo (consulta por índice, sin registrar un login)
+
+        Args:
+            username: Nombre de usuario
+            password_hash: Hash SHA-256 de la contraseña validada
+        """
+        with self.pool.conexion() as conn:
+            fila = conn.execute('''
+                SELECT 1 FROM usuarios
+                WHERE username = ? AND password_hash = ? AND activo != 0
+            ''', (username, password_hash)).fetchone()
+        return fila is not None
+
     def listar_usuarios(self) -> List[Dict]:
         """Lista todos los usuarios"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT id, username, nivel, nombre_completo, cargo, email, fecha_creacion, ultimo_acceso, creado_por, activo
-            FROM usuarios
-            ORDER BY fecha_creacion DESC
-        ''')
+        with self.pool.conexion() as conn:
+            filas = conn.execute('''
+                SELECT id, username, nivel, nombre_completo, cargo, email, fecha_creacion, ultimo_acceso, creado_por, activo
+                FROM usuarios
+                ORDER BY fecha_creacion DESC
+            ''').fetchall()
         
         usuarios = []
-        for row in cursor.fetchall():
+        for row in filas:
             usuarios.append({
                 'id': row[0],
                 'username': row[1],
@@ -255,22 +370,16 @@ class AuthSystem:
                 'activo': row[9]
             })
         
-        conn.close()
         return usuarios
     
     def obtener_usuario(self, username: str) -> Optional[Dict]:
         """Obtiene datos de un usuario"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT id, username, nivel, nombre_completo, cargo, email, fecha_creacion, ultimo_acceso, creado_por, activo
-            FROM usuarios
-            WHERE username = ?
-        ''', (username,))
-        
-        row = cursor.fetchone()
-        conn.close()
+        with self.pool.conexion() as conn:
+            row = conn.execute('''
+                SELECT id, username, nivel, nombre_completo, cargo, email, fecha_creacion, ultimo_acceso, creado_por, activo
+                FROM usuarios
+                WHERE username = ?
+            ''', (username,)).fetchone()
         
         if row:
             return {
@@ -287,6 +396,37 @@ class AuthSystem:
             }
         return None
     
+    def buscar_usuarios(self, texto: str, limit: int = 50, desplazamiento: int = 0) -> List[Dict]:
+        """
+        Busca usuarios por username, nombre, cargo o email, del más relevante al menos
+        
+        Args:
+            texto: Palabras a buscar (sin distinguir acentos; la última, como prefijo)
+            limit: Cantidad máxima de resultados
+            desplazamiento: Resultados que se saltean (páginas anteriores)
+            
+        Returns:
+            Usuarios con los mismos campos que listar_usuarios
+        """
+        consulta = consulta_fts(texto)
+        if consulta is None:
+            return []
+        
+        with self.pool.conexion() as conn:
+            filas = conn.execute(f'''
+                SELECT u.id, u.username, u.nivel, u.nombre_completo, u.cargo, u.email,
+                       u.fecha_creacion, u.ultimo_acceso, u.creado_por, u.activo
+                FROM usuarios_fts
+                JOIN usuarios u ON u.id = usuarios_fts.rowid
+                WHERE usuarios_fts MATCH ?
+                ORDER BY {ranking('usuarios_fts')}
+                LIMIT ? OFFSET ?
+            ''', (consulta, limit, desplazamiento)).fetchall()
+        
+        claves = ('id', 'username', 'nivel', 'nombre_completo', 'cargo', 'email',
+                  'fecha_creacion', 'ultimo_acceso', 'creado_por', 'activo')
+        return [dict(zip(claves, row)) for row in filas]
+    
     def modificar_usuario(
         self,
         username: str,
@@ -299,9 +439,6 @@ class AuthSystem:
     ) -> Tuple[bool, str]:
         """Modifica datos de un usuario (NO contraseña)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             campos_update = []
             valores = []
             detalle_cambios = []
@@ -337,9 +474,8 @@ class AuthSystem:
             valores.append(username)
             query = f"UPDATE usuarios SET {', '.join(campos_update)} WHERE username = ?"
             
-            cursor.execute(query, valores)
-            conn.commit()
-            conn.close()
+            with self.pool.conexion() as conn:
+                conn.execute(query, valores)
             
             # Registrar en auditoría
             self.registrar_accion(
@@ -360,14 +496,9 @@ class AuthSystem:
             return False, "La contraseña debe tener al menos 6 caracteres"
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
             nuevo_hash = self._hash_password(nueva_password)
-            cursor.execute('UPDATE usuarios SET password_hash = ?, primer_login = 0 WHERE username = ?', (nuevo_hash, username))
-            
-            conn.commit()
-            conn.close()
+            with self.pool.conexion() as conn:
+                conn.execute('UPDATE usuarios SET password_hash = ?, primer_login = 0 WHERE username = ?', (nuevo_hash, username))
             
             # Registrar en auditoría
             self.registrar_accion(
@@ -388,16 +519,11 @@ class AuthSystem:
             return False, "No se puede eliminar el usuario admin"
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Obtener datos antes de eliminar para auditoría
-            cursor.execute('SELECT nombre_completo, nivel FROM usuarios WHERE username = ?', (username,))
-            usuario_data = cursor.fetchone()
-            
-            cursor.execute('DELETE FROM usuarios WHERE username = ?', (username,))
-            conn.commit()
-            conn.close()
+            with self.pool.conexion() as conn:
+                # Obtener datos antes de eliminar para auditoría
+                usuario_data = conn.execute('SELECT nombre_completo, nivel FROM usuarios WHERE username = ?', (username,)).fetchone()
+                
+                conn.execute('DELETE FROM usuarios WHERE username = ?', (username,))
             
             # Registrar en auditoría
             detalle = f"Usuario eliminado: {usuario_data[0]}, Nivel: {usuario_data[1]}" if usuario_data else ""
@@ -413,20 +539,37 @@ class AuthSystem:
         except Exception as e:
             return False, f"Error al eliminar usuario: {str(e)}"
     
-    def obtener_reporte_logins(self, limit: int = 100) -> List[Dict]:
-        """Obtiene reporte de logins (solo superadmin)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT id, username, fecha_hora, exito, ip_address, user_agent
-            FROM auditoria_logins
-            ORDER BY fecha_hora DESC
-            LIMIT ?
-        ''', (limit,))
+    def obtener_reporte_logins(
+        self,
+        limit: int = 100,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        username: str = None,
+        antes_de: Optional[Tuple[str, int]] = None,
+        archivo: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Obtiene reporte de logins, del más reciente al más antiguo (solo superadmin)
+        
+        Paginación por cursor: para la página siguiente se pasa en antes_de
+        (fecha_hora, id) de la última fila recibida. La consulta recorre el
+        índice de fecha_hora desde ese punto, sin OFFSET.
+        
+        Con archivo=AAAA se consulta el detalle archivado de ese año
+        (ver utils/retencion.py) en lugar de la base viva.
+        """
+        where, parametros = _filtros_auditoria(desde, hasta, antes_de, username=username)
+        with self._lectura_auditoria(archivo) as conn:
+            filas = conn.execute(f'''
+                SELECT id, username, fecha_hora, exito, ip_address, user_agent
+                FROM auditoria_logins
+                {where}
+                ORDER BY fecha_hora DESC, id DESC
+                LIMIT ?
+            ''', parametros + [limit]).fetchall()
         
         logins = []
-        for row in cursor.fetchall():
+        for row in filas:
             logins.append({
                 'id': row[0],
                 'username': row[1],
@@ -436,32 +579,35 @@ class AuthSystem:
                 'user_agent': row[5]
             })
         
-        conn.close()
         return logins
     
-    def obtener_reporte_acciones(self, limit: int = 100, tipo: str = None) -> List[Dict]:
-        """Obtiene reporte de acciones administrativas (solo superadmin)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def obtener_reporte_acciones(
+        self,
+        limit: int = 100,
+        tipo: str = None,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        usuario: str = None,
+        antes_de: Optional[Tuple[str, int]] = None,
+        archivo: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Obtiene reporte de acciones administrativas, de la más reciente a la más antigua (solo superadmin)
         
-        if tipo:
-            cursor.execute('''
-                SELECT id, fecha_hora, usuario, accion, tipo, detalle, objetivo
-                FROM auditoria_acciones
-                WHERE tipo = ?
-                ORDER BY fecha_hora DESC
-                LIMIT ?
-            ''', (tipo, limit))
-        else:
-            cursor.execute('''
+        Paginación por cursor y archivo como en obtener_reporte_logins.
+        """
+        where, parametros = _filtros_auditoria(desde, hasta, antes_de, tipo=tipo, usuario=usuario)
+        with self._lectura_auditoria(archivo) as conn:
+            filas = conn.execute(f'''
                 SELECT id, fecha_hora, usuario, accion, tipo, detalle, objetivo
                 FROM auditoria_acciones
-                ORDER BY fecha_hora DESC
+                {where}
+                ORDER BY fecha_hora DESC, id DESC
                 LIMIT ?
-            ''', (limit,))
+            ''', parametros + [limit]).fetchall()
         
         acciones = []
-        for row in cursor.fetchall():
+        for row in filas:
             acciones.append({
                 'id': row[0],
                 'fecha_hora': row[1],
@@ -472,5 +618,155 @@ class AuthSystem:
                 'objetivo': row[6]
             })
         
-        conn.close()
-        return acciones
\ No newline at end of file
+        return acciones
+    
+    def buscar_acciones(
+        self,
+        texto: str,
+        limit: int = 50,
+        desplazamiento: int = 0,
+        recientes: bool = False
+    ) -> List[Dict]:
+        """
+        Busca acciones por detalle, objetivo o usuario (solo superadmin)
+        
+        Solo abarca la base viva: lo archivado por la retención no se indexa.
+        
+        Args:
+            texto: Palabras a buscar (sin distinguir acentos; la última, como prefijo)
+            limit: Cantidad máxima de resultados
+            desplazamiento: Resultados que se saltean (páginas anteriores)
+            recientes: Ordenar de la más reciente a la más antigua en lugar
+                de por relevancia (no necesita puntuar todas las coincidencias)
+            
+        Returns:
+            Acciones con los campos de obtener_reporte_acciones y 'fragmento',
+            el pasaje que coincide con las palabras marcadas entre « »
+        """
+        consulta = consulta_fts(texto)
+        if consulta is None:
+            return []
+        
+        orden = 'acciones_fts.rowid DESC' if recientes else ranking('acciones_fts')
+        with self._lectura_auditoria() as conn:
+            filas = conn.execute(f'''
+                SELECT a.id, a.fecha_hora, a.usuario, a.accion, a.tipo, a.detalle, a.objetivo,
+                       snippet(acciones_fts, -1, '«', '»', '…', 12)
+                FROM acciones_fts
+                JOIN auditoria_acciones a ON a.id = acciones_fts.rowid
+                WHERE acciones_fts MATCH ?
+                ORDER BY {orden}
+                LIMIT ? OFFSET ?
+            ''', (consulta, limit, desplazamiento)).fetchall()
+        
+        claves = ('id', 'fecha_hora', 'usuario', 'accion', 'tipo', 'detalle', 'objetivo', 'fragmento')
+        return [dict(zip(claves, row)) for row in filas]
+    
+    @contextmanager
+    def _lectura_auditoria(self, archivo: Optional[int] = None) -> Iterator[sqlite3.Connection]:
+        """
+        Conexión para leer la auditoría: la base viva o el archivo de un año (solo lectura)
+        
+        Lo que otras sesiones encolaron lo escribe el hilo de fondo de
+        utils/auditoria.py en menos de un segundo; solo si esta instancia tiene
+        registros propios sin escribir (p. ej. la acción que se acaba de
+        hacer en el mismo rerun) se escribe la cola antes de consultar.
+        """
+        if archivo is None:
+            if self.auditoria.pendiente(self._ultimo_registro):
+                self.auditoria.vaciar()
+            with self.pool.conexion() as conn:
+                yield conn
+            return
+        
+        conn = sqlite3.connect(f"file:{ruta_archivo(archivo, Path(self.pool.db_path))}?mode=ro", uri=True)
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    def _resumir(
+        self,
+        tabla: str,
+        agrupar: str,
+        expresion: str,
+        desde: Optional[date],
+        hasta: Optional[date],
+        tipo: str = None
+    ) -> List[Dict]:
+        """Conteo del detalle vivo más los resúmenes mensuales de los meses enteros del rango"""
+        where, parametros = _filtros_auditoria(desde, hasta, tipo=tipo)
+        consultas = [f"SELECT {expresion} AS clave, COUNT(*) AS cantidad FROM {tabla} {where} GROUP BY clave"]
+        
+        resumen, columnas = RESUMENES_MENSUALES[tabla]
+        if agrupar in columnas:
+            condiciones = ["mes >= ?", "mes <= ?"]
+            parametros.extend(_meses_completos(desde, hasta))
+            if tipo is not None:
+                condiciones.append("tipo = ?")
+                parametros.append(tipo)
+            consultas.append(
+                f"SELECT {columnas[agrupar]} AS clave, SUM(cantidad) AS cantidad FROM {resumen} "
+                f"WHERE {' AND '.join(condiciones)} GROUP BY clave"
+            )
+        
+        orden = "clave" if agrupar == "dia" else "cantidad DESC, clave"
+        with self._lectura_auditoria() as conn:
+            filas = conn.execute(f'''
+                SELECT clave, SUM(cantidad) AS cantidad
+                FROM ({' UNION ALL '.join(consultas)})
+                GROUP BY clave
+                ORDER BY {orden}
+            ''', parametros).fetchall()
+        return [{'clave': clave, 'cantidad': cantidad} for clave, cantidad in filas]
+    
+    def resumen_logins(
+        self,
+        agrupar: str = "resultado",
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None
+    ) -> List[Dict]:
+        """
+        Cuenta los intentos de login en un rango de fechas, calculado en la base (solo superadmin)
+        
+        Args:
+            agrupar: 'resultado' (clave True/False), 'usuario' o 'dia' (clave 'AAAA-MM-DD')
+            desde: Primer día incluido (None = desde el principio)
+            hasta: Último día incluido (None = hasta hoy)
+            
+        Returns:
+            Lista de dicts con clave y cantidad (por día en orden cronológico,
+            el resto de mayor a menor cantidad). Lo archivado cuenta por los
+            resúmenes mensuales de los meses enteros del rango; por día solo
+            cuenta el detalle vivo.
+        """
+        if agrupar not in AGRUPACIONES_LOGINS:
+            raise ValueError(f"Agrupación '{agrupar}' no válida. Opciones: {list(AGRUPACIONES_LOGINS)}")
+        resumen = self._resumir("auditoria_logins", agrupar, AGRUPACIONES_LOGINS[agrupar], desde, hasta)
+        if agrupar == "resultado":
+            for fila in resumen:
+                fila['clave'] = bool(fila['clave'])
+        return resumen
+    
+    def resumen_acciones(
+        self,
+        agrupar: str = "accion",
+        tipo: str = None,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None
+    ) -> List[Dict]:
+        """
+        Cuenta las acciones administrativas en un rango de fechas, calculado en la base (solo superadmin)
+        
+        Args:
+            agrupar: 'accion', 'usuario' (quien la realizó), 'tipo' o 'dia' (clave 'AAAA-MM-DD')
+            tipo: Si se indica, solo acciones de ese tipo ('usuario', 'tabla')
+            desde: Primer día incluido (None = desde el principio)
+            hasta: Último día incluido (None = hasta hoy)
+            
+        Returns:
+            Lista de dicts con clave y cantidad, como resumen_logins
+        """
+        if agrupar not in AGRUPACIONES_ACCIONES:
+            raise ValueError(f"Agrupación '{agrupar}' no válida. Opciones: {list(AGRUPACIONES_ACCIONES)}")
+        return self._resumir("auditoria_acciones", agrupar, AGRUPACIONES_ACCIONES[agrupar], desde, hasta, tipo)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Acceso a las bases SQLite del sistema
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Un pool de conexiones por archivo y por proceso, compartido por todos los
+hilos (Streamlit corre cada sesión en su propio hilo, el servicio HTTP uno
+por pedido). Cada conexión se abre una sola vez con:
+
+- journal_mode=WAL: las lecturas no esperan a las escrituras ni al revés,
+  y los commits no reescriben la base entera;
+- busy_timeout: si otra conexión está escribiendo se espera en lugar de
+  fallar con "database is locked";
+- un caché de sentencias preparadas, que se reutiliza entre reruns porque
+  la conexión sigue abierta.
+
+El esquema se migra una sola vez, al crear el pool: las migraciones se
+numeran con PRAGMA user_version, así que una base existente solo aplica
+las que le faltan.
+"""
+
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Sequence
+
+# Conexiones abiertas por archivo (las que sobran esperan a que se libere una)
+TAMAÑO_POOL = 8
+
+# Segundos que una escritura espera a que se libere el lock de la base
+ESPERA_OCUPADA = 10.0
+
+# Sentencias preparadas que guarda cada conexión
+SENTENCIAS_CACHEADAS = 128
+
+Migracion = Callable[[sqlite3.Connection], None]
+
+
+class PoolConexiones:
+    """Conexiones SQLite reutilizables a un archivo, seguras entre hilos"""
+
+    def __init__(self, db_path: str, tamaño: int = TAMAÑO_POOL, espera: float = ESPERA_OCUPADA):
+        self.db_path = db_path
+        self.espera = espera
+        self._libres: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._disponibles = threading.BoundedSemaphore(tamaño)
+
+    def _abrir(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.espera,
+            check_same_thread=False,
+            cached_statements=SENTENCIAS_CACHEADAS
+        )
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute(f'PRAGMA busy_timeout = {int(self.espera * 1000)}')
+        # Con WAL, NORMAL no pierde consistencia ante un corte: a lo sumo
+        # las últimas transacciones confirmadas
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    @contextmanager
+    def conexion(self) -> Iterator[sqlite3.Connection]:
+        """
+        Presta una conexión del pool.
+
+        Al salir del bloque se confirma la transacción abierta, o se
+        deshace si hubo una excepción, y la conexión vuelve al pool.
+        """
+        self._disponibles.acquire()
+        try:
+            try:
+                conn = self._libres.get_nowait()
+            except queue.Empty:
+                conn = self._abrir()
+            try:
+                yield conn
+                if conn.in_transaction:
+                    conn.commit()
+            except BaseException:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            finally:
+                self._libres.put(conn)
+        finally:
+            self._disponibles.release()
+
+    def migrar(self, migraciones: Sequence[Migracion]) -> int:
+        """
+        Aplica las migraciones que la base todavía no tiene.
+
+        La migración i (desde 1) se aplica si PRAGMA user_version < i. Todas
+        corren en una transacción IMMEDIATE: si dos procesos arrancan a la
+        vez, el segundo espera y ya no encuentra nada que aplicar.
+
+        Args:
+            migraciones: Funciones que reciben la conexión, en orden
+
+        Returns:
+            int: Cantidad de migraciones aplicadas
+        """
+        with self.conexion() as conn:
+            conn.execute('BEGIN IMMEDIATE')
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            for migracion in migraciones[version:]:
+                migracion(conn)
+            if version < len(migraciones):
+                conn.execute(f'PRAGMA user_version = {len(migraciones)}')
+            return max(len(migraciones) - version, 0)
+
+    def cerrar(self) -> int:
+        """
+        Cierra las conexiones libres (las prestadas vuelven abiertas al pool).
+
+        Returns:
+            int: Cantidad de conexiones cerradas
+        """
+        cerradas = 0
+        while True:
+            try:
+                self._libres.get_nowait().close()
+            except queue.Empty:
+                return cerradas
+            cerradas += 1
+
+
+_pools: Dict[str, PoolConexiones] = {}
+_pools_lock = threading.Lock()
+
+
+def obtener_pool(db_path: str, migraciones: Sequence[Migracion] = ()) -> PoolConexiones:
+    """
+    Pool del proceso para un archivo, creándolo y migrando el esquema la primera vez.
+
+    Args:
+        db_path: Ruta de la base (se crea el directorio si no existe)
+        migraciones: Esquema de la base, ver PoolConexiones.migrar
+
+    Returns:
+        PoolConexiones
+    """
+    clave = os.path.abspath(db_path)
+    pool = _pools.get(clave)
+    if pool is not None:
+        return pool
+    with _pools_lock:
+        pool = _pools.get(clave)
+        if pool is None:
+            os.makedirs(os.path.dirname(clave), exist_ok=True)
+            pool = PoolConexiones(clave)
+            pool.migrar(migraciones)
+            _pools[clave] = pool
+        return pool
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Búsqueda de texto completo sobre usuarios y auditoría (SQLite FTS5)
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Dos tablas virtuales FTS5 de contenido externo indexan, sin duplicar el
+texto:
+
+- usuarios_fts: username, nombre_completo, cargo y email de usuarios
+- acciones_fts: detalle, objetivo y usuario de auditoria_acciones
+
+Los triggers las mantienen al día con cada INSERT, UPDATE y DELETE de la
+tabla original (también las escrituras en lote de utils/auditoria.py y
+los borrados de utils/retencion.py). Lo archivado por la retención deja
+de aparecer en la búsqueda.
+
+El tokenizador ignora mayúsculas y acentos ("gomez" encuentra "Gómez") y
+la última palabra se busca como prefijo, para buscar mientras se escribe.
+AuthSystem.buscar_usuarios y buscar_acciones ordenan por relevancia (bm25).
+"""
+
+import re
+import sqlite3
+from typing import Optional
+
+# Tokenizador de ambas tablas: sin distinguir acentos, con índices de
+# prefijos de 2 y 3 caracteres para las búsquedas parciales
+_OPCIONES = "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'"
+
+# Tabla virtual -> (tabla original, columnas indexadas)
+INDICES = {
+    'usuarios_fts': ('usuarios', ('username', 'nombre_completo', 'cargo', 'email')),
+    'acciones_fts': ('auditoria_acciones', ('detalle', 'objetivo', 'usuario'))
+}
+
+# Peso de cada columna en el ranking bm25, en el orden de INDICES
+PESOS = {
+    'usuarios_fts': (10.0, 5.0, 2.0, 3.0),
+    'acciones_fts': (1.0, 3.0, 2.0)
+}
+
+_PALABRA = re.compile(r'\w+')
+
+
+def _crear_indice(conn: sqlite3.Connection, indice: str, tabla: str, columnas) -> None:
+    lista = ', '.join(columnas)
+    nuevos = ', '.join(f'new.{c}' for c in columnas)
+    viejos = ', '.join(f'old.{c}' for c in columnas)
+
+    conn.execute(f'''
+        CREATE VIRTUAL TABLE IF NOT EXISTS {indice} USING fts5(
+            {lista}, content = '{tabla}', content_rowid = 'id', {_OPCIONES}
+        )
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS {indice}_ai AFTER INSERT ON {tabla} BEGIN
+            INSERT INTO {indice} (rowid, {lista}) VALUES (new.id, {nuevos});
+        END
+    ''')
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS {indice}_ad AFTER DELETE ON {tabla} BEGIN
+            INSERT INTO {indice} ({indice}, rowid, {lista}) VALUES ('delete', old.id, {viejos});
+        END
+    ''')
+    # Solo las columnas indexadas: el login actualiza ultimo_acceso y no
+    # debe tocar el índice
+    conn.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS {indice}_au AFTER UPDATE OF {lista} ON {tabla} BEGIN
+            INSERT INTO {indice} ({indice}, rowid, {lista}) VALUES ('delete', old.id, {viejos});
+            INSERT INTO {indice} (rowid, {lista}) VALUES (new.id, {nuevos});
+        END
+    ''')
+    # Indexa lo que ya estaba en la tabla
+    conn.execute(f"INSERT INTO {indice} ({indice}) VALUES ('rebuild')")
+
+
+def crear_indices(conn: sqlite3.Connection) -> None:
+    """Crea las tablas FTS5 con sus triggers y las llena con el contenido actual"""
+    for indice, (tabla, columnas) in INDICES.items():
+        _crear_indice(conn, indice, tabla, columnas)
+
+
+def consulta_fts(texto: str) -> Optional[str]:
+    """
+    Convierte lo que escribió el usuario en una consulta MATCH de FTS5.
+
+    Cada palabra se busca entre comillas (los operadores de FTS5 no se
+    interpretan) y todas deben aparecer; la última, como prefijo.
+
+    Args:
+        texto: Texto libre de la caja de búsqueda
+
+    Returns:
+        Consulta para MATCH, o None si no hay palabras que buscar
+    """
+    palabras = _PALABRA.findall(texto or '')
+    if not palabras:
+        return None
+    terminos = [f'"{p}"' for p in palabras]
+    terminos[-1] += '*'
+    return ' '.join(terminos)
+
+
+def ranking(indice: str) -> str:
+    """Expresión bm25 con los pesos de columna del índice (menor es más relevante)"""
+    pesos = ', '.join(str(p) for p in PESOS[indice])
+    return f'bm25({indice}, {pesos})'
+
+
+def optimizar(conn: sqlite3.Connection) -> None:
+    """Junta los segmentos de los índices FTS5 (lo corre el mantenimiento diario)"""
+    existentes = {fila[0] for fila in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    for indice in INDICES.keys() & existentes:
+        conn.execute(f"INSERT INTO {indice} ({indice}) VALUES ('optimize')")
@@ -14,6 +14,9 @@ from typing import Optional, Dict, Any
 import streamlit as st
 from datetime import datetime
 
+from .esquemas import ESQUEMAS, leer_dataset
+from .registro import _version_archivo
+
 class DataLoader:
     """Clase para cargar y gestionar datasets del sistema"""
     
@@ -21,14 +24,11 @@ class DataLoader:
     BASE_DIR = Path(__file__).parent.parent
     DATA_DIR = BASE_DIR / 'data'
     
-    # Nombres de archivos
-    DATASETS = {
-        'jus': 'Dataset_JUS.csv',
-        'ipc': 'dataset_ipc.csv',
-        'pisos': 'dataset_pisos.csv',
-        'ripte': 'dataset_ripte.csv',
-        'tasa': 'dataset_tasa.csv'
-    }
+    # Nombres de archivos (definidos en los esquemas de utils/esquemas.py)
+    DATASETS = {clave: esquema.archivo for clave, esquema in ESQUEMAS.items()}
+    
+    # Métricas de la última lectura de cada dataset (compartidas entre instancias)
+    _tiempos_parseo: Dict[str, Dict[str, Any]] = {}
     
     @staticmethod
     def get_ultimo_dato(df):
@@ -83,11 +83,16 @@ class DataLoader:
         
         return self.DATA_DIR / self.DATASETS[dataset_key]
     
-    @st.cache_data(ttl=3600)  # Cache por 1 hora
-    def cargar_dataset(_self, dataset_key: str, **kwargs) -> pd.DataFrame:
+    def cargar_dataset(self, dataset_key: str, **kwargs) -> pd.DataFrame:
         """
         Carga un dataset desde el directorio data/
         
+        El archivo se lee una sola vez con las columnas y tipos declarados
+        en su esquema (sin inferencia de tipos de pandas). El resultado queda
+        en cache por versión del archivo: cuando el CSV cambia (editor de
+        administración o edición manual) la siguiente carga lo vuelve a leer,
+        y mientras no cambie no se relee.
+        
         Args:
             dataset_key: Clave del dataset a cargar
             **kwargs: Argumentos adicionales para pd.read_csv()
@@ -99,7 +104,7 @@ class DataLoader:
             FileNotFoundError: Si el archivo no existe
             ValueError: Si la clave del dataset no es válida
         """
-        ruta = _self._obtener_ruta(dataset_key)
+        ruta = self._obtener_ruta(dataset_key)
         
         if not ruta.exists():
             raise FileNotFoundError(
@@ -107,102 +112,49 @@ class DataLoader:
                 f"Verifica que el dataset '{dataset_key}' esté en la carpeta data/"
             )
         
-        try:
-            # Configuración por defecto para cada dataset
-            config_defecto = _self._obtener_config_defecto(dataset_key)
-            config_defecto.update(kwargs)
-            
-            df = pd.read_csv(ruta, **config_defecto)
-            
-            # Post-procesamiento específico por dataset
-            df = _self._procesar_dataset(df, dataset_key)
-            
-            return df
-        
-        except Exception as e:
-            raise Exception(f"Error al cargar {dataset_key}: {str(e)}")
+        return self._cargar_version(dataset_key, _version_archivo(ruta), **kwargs)
     
-    def _obtener_config_defecto(self, dataset_key: str) -> Dict[str, Any]:
+    @st.cache_data(ttl=None, max_entries=20)  # Una entrada por versión del archivo
+    def _cargar_version(_self, dataset_key: str, version: tuple, **kwargs) -> pd.DataFrame:
         """
-        Obtiene la configuración por defecto para cada dataset
+        Lee la versión indicada de un dataset (la versión forma parte de la clave del cache)
         
         Args:
-            dataset_key: Clave del dataset
+            dataset_key: Clave del dataset a cargar
+            version: (mtime en ns, tamaño) del archivo
+            **kwargs: Argumentos adicionales para pd.read_csv()
         
         Returns:
-            Diccionario con configuración para pd.read_csv()
-        """
-        configs = {
-            'jus': {
-                'encoding': 'utf-8',
-                'parse_dates': ['Fecha'] if 'Fecha' in self._peek_columns(dataset_key) else []
-            },
-            'ipc': {
-                'encoding': 'utf-8',
-                'parse_dates': ['Fecha'] if 'Fecha' in self._peek_columns(dataset_key) else []
-            },
-            'pisos': {
-                'encoding': 'utf-8',
-                'parse_dates': ['Fecha'] if 'Fecha' in self._peek_columns(dataset_key) else []
-            },
-            'ripte': {
-                'encoding': 'utf-8',
-                'parse_dates': ['Fecha'] if 'Fecha' in self._peek_columns(dataset_key) else []
-            },
-            'tasa': {
-                'encoding': 'utf-8',
-                'parse_dates': ['Fecha'] if 'Fecha' in self._peek_columns(dataset_key) else []
-            }
-        }
-        
-        return configs.get(dataset_key, {'encoding': 'utf-8'})
-    
-    def _peek_columns(self, dataset_key: str) -> list:
+            DataFrame con los datos cargados
         """
-        Obtiene los nombres de columnas sin cargar todo el dataset
-        
-        Args:
-            dataset_key: Clave del dataset
+        ruta = _self._obtener_ruta(dataset_key)
         
-        Returns:
-            Lista con nombres de columnas
-        """
-        ruta = self._obtener_ruta(dataset_key)
         try:
-            return pd.read_csv(ruta, nrows=0).columns.tolist()
-        except:
-            return []
+            lectura = leer_dataset(dataset_key, ruta, **kwargs)
+            
+            DataLoader._tiempos_parseo[dataset_key] = {
+                'segundos': lectura.segundos,
+                'filas': lectura.filas,
+                'orden_esperado': lectura.orden_esperado,
+                'columnas_faltantes': list(lectura.columnas_faltantes)
+            }
+            
+            # Post-procesamiento común
+            return _self._procesar_dataset(lectura.df)
+        
+        except Exception as e:
+            raise Exception(f"Error al cargar {dataset_key}: {str(e)}")
     
-    def _procesar_dataset(self, df: pd.DataFrame, dataset_key: str) -> pd.DataFrame:
+    def _procesar_dataset(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Aplica procesamiento específico a cada dataset después de cargarlo
+        Aplica el procesamiento común a cada dataset después de cargarlo
         
         Args:
             df: DataFrame cargado
-            dataset_key: Clave del dataset
         
         Returns:
             DataFrame procesado
         """
-        # Procesamiento específico por dataset
-        if dataset_key == 'jus':
-            # Asegurar que las fechas estén en formato correcto
-            if 'Fecha' in df.columns:
-                df['Fecha'] = pd.to_datetime(df['Fecha'], errors='coerce')
-        
-        elif dataset_key == 'ipc':
-            if 'Fecha' in df.columns:
-                df['Fecha'] = pd.to_datetime(df['Fecha'], errors='coerce')
-            # Ordenar por fecha
-            if 'Fecha' in df.columns:
-                df = df.sort_values('Fecha')
-        
-        elif dataset_key == 'ripte':
-            if 'Fecha' in df.columns:
-                df['Fecha'] = pd.to_datetime(df['Fecha'], errors='coerce')
-            if 'Fecha' in df.columns:
-                df = df.sort_values('Fecha')
-        
         # Eliminar duplicados
         df = df.drop_duplicates()
         
@@ -211,6 +163,17 @@ class DataLoader:
         
         return df
     
+    @classmethod
+    def obtener_tiempos_parseo(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtiene las métricas de la última lectura de cada dataset
+        
+        Returns:
+            Diccionario {dataset: {'segundos', 'filas', 'orden_esperado',
+            'columnas_faltantes'}} con los datasets leídos en este proceso
+        """
+        return {clave: dict(datos) for clave, datos in cls._tiempos_parseo.items()}
+    
     def cargar_jus(self) -> pd.DataFrame:
         """Carga el dataset de índice JUS"""
         return self.cargar_dataset('jus')
@@ -255,7 +218,8 @@ class DataLoader:
                         'ultima_modificacion': datetime.fromtimestamp(
                             ruta.stat().st_mtime
                         ).strftime('%Y-%m-%d %H:%M'),
-                        'columnas_lista': df.columns.tolist()
+                        'columnas_lista': df.columns.tolist(),
+                        'parseo': self._tiempos_parseo.get(key)
                     }
                 except Exception as e:
                     info[key] = {
@@ -357,6 +321,8 @@ if __name__ == '__main__':
             print(f"   Columnas: {data['columnas']}")
             print(f"   Tamaño: {data['tamaño']}")
             print(f"   Última modificación: {data['ultima_modificacion']}")
+            if data.get('parseo'):
+                print(f"   Parseo: {data['parseo']['segundos'] * 1000:.1f} ms")
     
     # Validar datasets
     print("\n" + "=" * 80)
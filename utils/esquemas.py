@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Esquemas declarativos de los datasets CSV
+Columnas, tipos, formatos de fecha, convenciones decimales y orden esperado
+
+Cada CSV se lee una sola vez con usecols y dtype=str explícitos (sin
+inferencia de tipos de pandas) y luego cada columna se convierte según su
+esquema. Es la única definición del formato de los archivos de data/:
+la usan el DataLoader y la compilación del snapshot binario.
+"""
+
+import io
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from .funciones_comunes import normalizar_fechas
+from .metricas import medido
+from .publicacion import leer_bytes
+
+# Rutas base
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / 'data'
+
+
+@dataclass(frozen=True)
+class Columna:
+    """Definición de una columna de un dataset"""
+    nombre: str                      # Encabezado en el CSV (sin espacios ni BOM)
+    tipo: str                        # 'texto', 'entero', 'decimal', 'moneda' o 'fecha'
+    formato: Optional[str] = None    # Formato strptime para columnas de fecha
+    decimal: str = '.'               # Separador decimal
+    miles: Optional[str] = None      # Separador de miles (se elimina)
+    simbolo: Optional[str] = None    # Símbolo de moneda a quitar (p. ej. '$')
+
+
+@dataclass(frozen=True)
+class EsquemaDataset:
+    """Definición de un archivo CSV del directorio data/"""
+    clave: str
+    archivo: str
+    columnas: Tuple[Columna, ...]
+    orden: Optional[str] = None      # Columna por la que está ordenado el archivo
+    descendente: bool = True         # Más reciente arriba (convención de todos los datasets)
+    descripcion: str = ''
+
+    @property
+    def ruta(self) -> Path:
+        """Ruta completa al CSV"""
+        return DATA_DIR / self.archivo
+
+    @property
+    def nombres(self) -> Tuple[str, ...]:
+        """Nombres de las columnas declaradas"""
+        return tuple(c.nombre for c in self.columnas)
+
+
+ESQUEMAS: Dict[str, EsquemaDataset] = {
+    'jus': EsquemaDataset(
+        clave='jus',
+        archivo='Dataset_JUS.csv',
+        descripcion='Valor del JUS (IUS) por acuerdo de la SCBA',
+        columnas=(
+            Columna('FECHA ENTRADA EN VIGENCIA', 'fecha', formato='%d/%m/%Y'),
+            Columna('FECHA DE FINALIZACION', 'fecha', formato='%d/%m/%Y'),
+            # "$ 44.330": punto de miles, coma decimal
+            Columna('VALOR IUS', 'moneda', decimal=',', miles='.', simbolo='$'),
+            Columna('ACUERDO', 'texto')
+        ),
+        orden='FECHA ENTRADA EN VIGENCIA'
+    ),
+    'ipc': EsquemaDataset(
+        clave='ipc',
+        archivo='dataset_ipc.csv',
+        descripcion='Variación mensual del IPC (INDEC)',
+        columnas=(
+            # 'YYYY-MM' (también acepta 'YYYY-MM-DD' si el archivo se editó a mano)
+            Columna('periodo', 'fecha', formato='ISO8601'),
+            Columna('variacion_mensual', 'decimal', decimal=',')
+        ),
+        orden='periodo'
+    ),
+    'pisos': EsquemaDataset(
+        clave='pisos',
+        archivo='dataset_pisos.csv',
+        descripcion='Pisos mínimos de indemnización SRT',
+        columnas=(
+            Columna('fecha_inicio', 'fecha', formato='%d/%m/%Y'),
+            Columna('fecha_fin', 'fecha', formato='%d/%m/%Y'),
+            Columna('norma', 'texto'),
+            Columna('monto_minimo', 'decimal'),
+            Columna('enlace', 'texto')
+        ),
+        orden='fecha_inicio'
+    ),
+    'ripte': EsquemaDataset(
+        clave='ripte',
+        archivo='dataset_ripte.csv',
+        descripcion='Índice RIPTE mensual',
+        columnas=(
+            Columna('año', 'entero'),
+            Columna('mes', 'texto'),
+            Columna('indice_ripte', 'decimal'),
+            Columna('variacion_mensual', 'decimal'),
+            Columna('monto_en_pesos', 'decimal')
+        ),
+        orden='año'
+    ),
+    'tasa': EsquemaDataset(
+        clave='tasa',
+        archivo='dataset_tasa.csv',
+        descripcion='Tasa Activa Banco Nación (porcentaje mensual por vigencia)',
+        columnas=(
+            # Admite "3,982" además de "3.982"
+            Columna('Valor', 'decimal', decimal=','),
+            Columna('Desde', 'fecha', formato='%d/%m/%Y'),
+            Columna('Hasta', 'fecha', formato='%d/%m/%Y'),
+            Columna('Año', 'entero'),
+            Columna('Mes', 'entero')
+        ),
+        orden='Desde'
+    )
+}
+
+
+@dataclass
+class ResultadoLectura:
+    """DataFrame tipado y métricas de la lectura de un CSV"""
+    df: 'pd.DataFrame'
+    segundos: float
+    filas: int
+    orden_esperado: bool
+    columnas_faltantes: Tuple[str, ...] = field(default_factory=tuple)
+
+
+def _normalizar_encabezado(nombre) -> str:
+    """Encabezado sin BOM ni espacios (JUS trae 'FECHA ENTRADA EN VIGENCIA ')"""
+    return str(nombre).replace("﻿", "").strip()
+
+
+def convertir_columna(serie: 'pd.Series', columna: Columna) -> 'pd.Series':
+    """
+    Convierte una columna leída como texto al tipo declarado.
+
+    Args:
+        serie: Valores tal como vienen en el CSV (dtype str)
+        columna: Definición de la columna
+
+    Returns:
+        pd.Series tipada (los valores inválidos quedan en NaN/NaT). Las
+        fechas que no respetan el formato declarado se intentan con los
+        demás formatos conocidos (ver normalizar_fechas)
+    """
+    if columna.tipo == 'texto':
+        return serie
+
+    texto = serie.str.strip()
+    if columna.tipo == 'fecha':
+        return normalizar_fechas(texto, formato=columna.formato)
+
+    if columna.simbolo:
+        texto = texto.str.replace(columna.simbolo, '', regex=False).str.strip()
+    if columna.miles:
+        texto = texto.str.replace(columna.miles, '', regex=False)
+    if columna.decimal != '.':
+        texto = texto.str.replace(columna.decimal, '.', regex=False)
+    import pandas as pd
+    return pd.to_numeric(texto, errors='coerce')
+
+
+def _orden_esperado(df: 'pd.DataFrame', esquema: EsquemaDataset) -> bool:
+    """Verifica que el archivo respete el orden declarado (ignora valores vacíos)"""
+    if not esquema.orden or esquema.orden not in df.columns:
+        return True
+    valores = df[esquema.orden].dropna()
+    if esquema.descendente:
+        return bool(valores.is_monotonic_decreasing)
+    return bool(valores.is_monotonic_increasing)
+
+
+@medido('datasets')
+def leer_dataset(clave: str, ruta: Optional[Path] = None, contenido: Optional[bytes] = None,
+                 **kwargs: Any) -> ResultadoLectura:
+    """
+    Lee un CSV en una sola pasada según su esquema.
+
+    El archivo se lee entero de una vez y se parsea desde memoria: la lectura
+    corresponde a una única versión aunque el CSV se publique mientras tanto.
+
+    Args:
+        clave: Clave del dataset ('jus', 'ipc', 'pisos', 'ripte', 'tasa')
+        ruta: Ruta alternativa al CSV (por defecto la del esquema)
+        contenido: Bytes ya leídos del CSV (se usan en lugar de leer la ruta)
+        **kwargs: Argumentos adicionales para pd.read_csv()
+
+    Returns:
+        ResultadoLectura con el DataFrame tipado y el tiempo de parseo
+
+    Raises:
+        ValueError: Si la clave no corresponde a un esquema
+    """
+    # Import diferido: el motor importa este módulo sin leer ningún CSV
+    import pandas as pd
+
+    if clave not in ESQUEMAS:
+        raise ValueError(
+            f"Dataset '{clave}' no reconocido. "
+            f"Opciones válidas: {list(ESQUEMAS.keys())}"
+        )
+    esquema = ESQUEMAS[clave]
+    ruta = Path(ruta) if ruta else esquema.ruta
+    nombres = set(esquema.nombres)
+
+    inicio = time.perf_counter()
+    if contenido is None:
+        contenido = leer_bytes(ruta)
+    opciones = {
+        'encoding': 'utf-8',
+        'usecols': lambda c: _normalizar_encabezado(c) in nombres,
+        'dtype': str
+    }
+    opciones.update(kwargs)
+    df = pd.read_csv(io.BytesIO(contenido), **opciones)
+    df.columns = [_normalizar_encabezado(c) for c in df.columns]
+
+    faltantes = tuple(c.nombre for c in esquema.columnas if c.nombre not in df.columns)
+    for columna in esquema.columnas:
+        if columna.nombre in df.columns:
+            df[columna.nombre] = convertir_columna(df[columna.nombre], columna)
+    segundos = time.perf_counter() - inicio
+
+    return ResultadoLectura(
+        df=df,
+        segundos=segundos,
+        filas=len(df),
+        orden_esperado=_orden_esperado(df, esquema),
+        columnas_faltantes=faltantes
+    )
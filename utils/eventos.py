@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Eventos de cambio de datasets
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Cuando un CSV de data/ cambia se publica un evento con la clave del dataset:
+lo hace el editor de administración al guardar y, como respaldo para las
+ediciones hechas fuera de la interfaz, un vigilante que revisa periódicamente
+la versión (mtime, tamaño) y el hash de los archivos. Ante cada evento se
+invalidan solo las entradas del registro que dependen de ese archivo y se
+reconstruyen una vez, en segundo plano; entre cambios el cache no vence.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .esquemas import ESQUEMAS
+from .registro import REGISTRO, _version_archivo
+from .indices import (
+    obtener_indice_tasa,
+    obtener_indice_ripte,
+    obtener_indice_ipc,
+    obtener_indice_jus,
+    obtener_indice_pisos
+)
+from .snapshot import hash_archivo, obtener_snapshot, obtener_tabla
+
+# Índices derivados de cada dataset (se reconstruyen tras un cambio)
+INDICES_DATASET: Dict[str, Tuple[Callable[[], object], ...]] = {
+    'tasa': (obtener_indice_tasa, lambda: obtener_indice_tasa(completar_hasta=True)),
+    'ripte': (obtener_indice_ripte,),
+    'ipc': (obtener_indice_ipc,),
+    'jus': (obtener_indice_jus,),
+    'pisos': (obtener_indice_pisos,)
+}
+
+_suscriptores: List[Callable[[str, str], None]] = []
+_suscriptores_lock = threading.Lock()
+
+
+def suscribir(callback: Callable[[str, str], None]) -> None:
+    """
+    Registra una función a llamar ante cada cambio de dataset.
+
+    Args:
+        callback: Recibe (clave del dataset, origen del evento)
+    """
+    with _suscriptores_lock:
+        if callback not in _suscriptores:
+            _suscriptores.append(callback)
+
+
+def publicar_cambio_dataset(nombre: str, origen: str = 'editor') -> None:
+    """
+    Avisa que el CSV de un dataset cambió.
+
+    Args:
+        nombre: Clave del dataset ('jus', 'ipc', 'pisos', 'ripte', 'tasa')
+        origen: Quién detectó el cambio ('editor', 'vigilante', ...)
+
+    Raises:
+        ValueError: Si la clave no corresponde a un dataset
+    """
+    if nombre not in ESQUEMAS:
+        raise ValueError(
+            f"Dataset '{nombre}' no reconocido. "
+            f"Opciones válidas: {list(ESQUEMAS.keys())}"
+        )
+
+    # El vigilante no debe volver a publicar un cambio ya avisado
+    _vigilante.registrar(nombre)
+
+    with _suscriptores_lock:
+        suscriptores = list(_suscriptores)
+    for callback in suscriptores:
+        try:
+            callback(nombre, origen)
+        except Exception as e:
+            print(f"[DATASETS] Error notificando el cambio de {nombre}: {type(e).__name__}: {e}")
+
+
+def reconstruir_dataset(nombre: str) -> float:
+    """
+    Invalida y reconstruye las tablas e índices derivados de un dataset.
+
+    Args:
+        nombre: Clave del dataset
+
+    Returns:
+        float: Segundos que llevó la reconstrucción
+    """
+    inicio = time.perf_counter()
+    REGISTRO.invalidar(ruta=ESQUEMAS[nombre].ruta)
+    # El snapshot reúne todos los datasets: se recompila una sola vez
+    obtener_snapshot()
+    obtener_tabla(nombre)
+    for obtener in INDICES_DATASET[nombre]:
+        obtener()
+    return time.perf_counter() - inicio
+
+
+class _Reconstructor:
+    """Reconstruye en segundo plano los datasets avisados, agrupando avisos repetidos"""
+
+    def __init__(self):
+        self._pendientes: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._hilo: Optional[threading.Thread] = None
+
+    def encolar(self, nombre: str, origen: str) -> None:
+        """Agrega un dataset a reconstruir (si ya estaba pendiente, se reconstruye una sola vez)"""
+        with self._lock:
+            self._pendientes[nombre] = origen
+            if self._hilo is None:
+                self._hilo = threading.Thread(
+                    target=self._trabajar, name='reconstruccion-datasets', daemon=True
+                )
+                self._hilo.start()
+
+    def _trabajar(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pendientes:
+                    self._hilo = None
+                    return
+                pendientes, self._pendientes = self._pendientes, {}
+
+            for nombre, origen in pendientes.items():
+                try:
+                    segundos = reconstruir_dataset(nombre)
+                    print(f"[DATASETS] {nombre} reconstruido en {segundos * 1000:.0f} ms ({origen})")
+                except Exception as e:
+                    print(f"[DATASETS] No se pudo reconstruir {nombre}: {type(e).__name__}: {e}")
+
+
+class VigilanteDatasets:
+    """
+    Respaldo para cambios hechos fuera del editor (copiar un CSV, editarlo a mano).
+
+    Revisa cada `intervalo` segundos la versión de los archivos; si cambió,
+    compara el hash del contenido y publica el evento solo si el contenido
+    es distinto.
+    """
+
+    def __init__(self, intervalo: float = 5.0):
+        self.intervalo = intervalo
+        self._conocidos: Dict[str, Tuple[Optional[tuple], Optional[str]]] = {}
+        self._lock = threading.Lock()
+        self._detener = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _estado(nombre: str) -> Tuple[Optional[tuple], Optional[str]]:
+        """(versión, hash) actuales del CSV, o (None, None) si no existe"""
+        ruta = ESQUEMAS[nombre].ruta
+        if not ruta.exists():
+            return None, None
+        return _version_archivo(ruta), hash_archivo(ruta)
+
+    def registrar(self, nombre: str) -> None:
+        """Toma como conocido el estado actual de un dataset"""
+        estado = self._estado(nombre)
+        with self._lock:
+            self._conocidos[nombre] = estado
+
+    def revisar(self) -> List[str]:
+        """
+        Compara el estado de cada CSV con el último conocido.
+
+        Returns:
+            Lista de datasets cuyo contenido cambió desde la revisión anterior
+        """
+        cambiados = []
+        for nombre, esquema in ESQUEMAS.items():
+            ruta = esquema.ruta
+            version = _version_archivo(ruta) if ruta.exists() else None
+            with self._lock:
+                conocido = self._conocidos.get(nombre)
+            if conocido is not None and conocido[0] == version:
+                continue
+
+            estado = self._estado(nombre)
+            with self._lock:
+                self._conocidos[nombre] = estado
+            # Primera revisión o mismo contenido con otro mtime: no hay evento
+            if conocido is not None and conocido[1] != estado[1]:
+                cambiados.append(nombre)
+        return cambiados
+
+    def _trabajar(self, detener: threading.Event) -> None:
+        while not detener.wait(self.intervalo):
+            try:
+                for nombre in self.revisar():
+                    publicar_cambio_dataset(nombre, origen='vigilante')
+            except Exception as e:
+                print(f"[DATASETS] Error revisando los datasets: {type(e).__name__}: {e}")
+
+    def iniciar(self) -> None:
+        """Inicia la revisión periódica en un hilo de fondo (una sola vez por proceso)"""
+        with self._lock:
+            if self._hilo is not None and not self._detener.is_set():
+                return
+            self._detener = threading.Event()
+            self._hilo = threading.Thread(
+                target=self._trabajar, args=(self._detener,), name='vigilante-datasets', daemon=True
+            )
+        self.revisar()
+        self._hilo.start()
+
+    def detener(self) -> None:
+        """Detiene la revisión periódica"""
+        self._detener.set()
+
+
+_reconstructor = _Reconstructor()
+_vigilante = VigilanteDatasets()
+suscribir(_reconstructor.encolar)
+
+
+def iniciar_vigilancia(intervalo: Optional[float] = None) -> VigilanteDatasets:
+    """
+    Inicia el vigilante de archivos del proceso (llamadas repetidas no hacen nada).
+
+    Args:
+        intervalo: Segundos entre revisiones (por defecto 5)
+
+    Returns:
+        VigilanteDatasets del proceso
+    """
+    if intervalo is not None:
+        _vigilante.intervalo = intervalo
+    _vigilante.iniciar()
+    return _vigilante
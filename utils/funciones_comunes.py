@@ -8,11 +8,36 @@ Funciones compartidas entre todas las aplicaciones del sistema.
 Consolidación realizada para evitar duplicación de código.
 """
 
-import pandas as pd
+import numpy as np
 import math
 from datetime import datetime, date
 from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Tuple
+
+# pandas se importa en las funciones que lo usan: el motor de cálculo
+# importa este módulo y no debe cargarlo al arrancar
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Prefijos de 3 letras de los nombres de mes (español e inglés)
+MESES_PREFIJO = {
+    'ene': 1, 'feb': 2, 'mar': 3, 'abr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'ago': 8, 'sep': 9, 'set': 9, 'oct': 10, 'nov': 11, 'dic': 12,
+    'jan': 1, 'apr': 4, 'aug': 8, 'dec': 12
+}
+
+# Formatos numéricos que reconoce normalizar_fechas (los mismos de safe_parse_date)
+FORMATOS_FECHA = [
+    "%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%m/%Y", "%Y/%m/%d", "%Y-%m",
+    "%Y-%m-%d %H:%M:%S", "%d/%m/%Y %H:%M:%S", "%Y/%m", "%m-%Y",
+]
+
+# "Septiembre 2025", "sep-2025", "Marzo de 2024", "Ago/2023"
+_PATRON_MES_NOMBRE = r'^(?P<mes>[^\W\d_]+)\.?[\s/\-]*(?:de\s+)?(?P<anio>\d{4})$'
+
+# Cantidad de valores con la que se infiere el formato de una columna
+_MUESTRA_FORMATO = 50
 
 
 def safe_parse_date(s) -> Optional[date]:
@@ -70,6 +95,7 @@ def safe_parse_date(s) -> Optional[date]:
                 pass
     
     # Último intento con pandas
+    import pandas as pd
     try:
         dt = pd.to_datetime(s, dayfirst=True, errors="coerce")
         if pd.isna(dt):
@@ -81,6 +107,97 @@ def safe_parse_date(s) -> Optional[date]:
         return None
 
 
+def _inferir_formato(muestra: 'pd.Series', formato: Optional[str] = None) -> Optional[str]:
+    """
+    Elige el formato que mejor parsea una muestra de fechas.
+
+    Args:
+        muestra: Valores de texto no vacíos
+        formato: Formato preferido (se prueba primero)
+
+    Returns:
+        El primer formato que parsea toda la muestra, o el que más valores
+        parsea; None si ninguno parsea alguno
+    """
+    import pandas as pd
+    candidatos = ([formato] if formato else []) + [f for f in FORMATOS_FECHA if f != formato]
+    mejor, mejor_ok = None, 0
+    for f in candidatos:
+        ok = int(pd.to_datetime(muestra, format=f, errors="coerce").notna().sum())
+        if ok == len(muestra):
+            return f
+        if ok > mejor_ok:
+            mejor, mejor_ok = f, ok
+    return mejor
+
+
+def normalizar_fechas(serie: 'pd.Series', formato: Optional[str] = None) -> 'pd.Series':
+    """
+    Versión vectorizada de safe_parse_date para una columna completa.
+    
+    Infiere el formato una sola vez a partir de una muestra y convierte la
+    columna en una sola llamada. Las filas que no respetan ese formato se
+    intentan como meses escritos con nombre ("Septiembre 2025", "sep-2025",
+    mapeo vectorizado al día 1 del mes) y solo las que siguen sin convertirse
+    pasan por safe_parse_date.
+    
+    Args:
+        serie: Columna con fechas (texto, date, datetime o datetime64)
+        formato: Formato esperado (se prueba antes que los demás)
+        
+    Returns:
+        pd.Series datetime64 con el mismo índice (NaT si no se puede parsear)
+        
+    Ejemplos:
+        >>> normalizar_fechas(pd.Series(["01/12/2024", "Marzo 2024", None]))
+        0   2024-12-01
+        1   2024-03-01
+        2          NaT
+    """
+    import pandas as pd
+    if pd.api.types.is_datetime64_any_dtype(serie):
+        return serie
+
+    if not pd.api.types.is_string_dtype(serie):
+        serie = serie.astype("string")
+    texto = serie.str.strip()
+    texto = texto.mask(texto.isin(["", "nan", "NaN", "NaT", "None"]))
+    validos = texto.notna()
+
+    # Un único formato, inferido de una muestra, para toda la columna
+    elegido = _inferir_formato(texto[validos].iloc[:_MUESTRA_FORMATO], formato) if validos.any() else None
+    if elegido is None:
+        resultado = pd.Series(pd.NaT, index=serie.index, dtype="datetime64[us]")
+    else:
+        resultado = pd.to_datetime(texto, format=elegido, errors="coerce")
+
+    fallidas = validos & resultado.isna()
+    if not fallidas.any():
+        return resultado
+
+    # Meses con nombre: mapeo vectorizado de los 3 primeros caracteres
+    partes = texto[fallidas].str.lower().str.extract(_PATRON_MES_NOMBRE)
+    meses = partes["mes"].str[:3].map(MESES_PREFIJO)
+    con_nombre = meses.notna()
+    if con_nombre.any():
+        resultado[con_nombre[con_nombre].index] = pd.to_datetime(
+            pd.DataFrame({
+                "year": pd.to_numeric(partes.loc[con_nombre, "anio"]),
+                "month": meses[con_nombre].astype(int),
+                "day": 1
+            })
+        )
+
+    # Camino lento solo para las filas que no respetan el formato
+    fallidas = validos & resultado.isna()
+    if fallidas.any():
+        resultado[fallidas] = pd.to_datetime(
+            texto[fallidas].map(safe_parse_date, na_action="ignore"), errors="coerce"
+        )
+
+    return resultado
+
+
 def days_in_month(d: date) -> int:
     """
     Retorna la cantidad de días en el mes de una fecha dada.
@@ -127,6 +244,29 @@ def redondear(valor):
     return Decimal(str(valor)).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
 
 
+def redondear_lote(valores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Versión vectorizada de redondear() para arreglos de float.
+    
+    Redondea a 2 decimales con el mismo criterio (0.5 se aleja del cero).
+    Los valores que quedan a menos del error de punto flotante de un medio
+    centavo exacto se marcan como dudosos: para esos el resultado debe
+    confirmarse con redondear() sobre el cálculo en Decimal.
+    
+    Args:
+        valores: Arreglo de float
+        
+    Returns:
+        tuple: (valores redondeados como float, máscara de valores dudosos)
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    centavos = np.abs(valores) * 100
+    # Margen de unos pocos ulp: el error acumulado por las operaciones en float
+    dudosos = np.abs(centavos - np.floor(centavos) - 0.5) <= np.spacing(centavos) * 64
+    redondeados = np.copysign(np.floor(centavos + 0.5), valores) / 100
+    return redondeados, dudosos
+
+
 def formato_moneda(valor):
     """
     Formatea un valor numérico como moneda argentina.
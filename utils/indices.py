@@ -0,0 +1,1184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+Módulo: Índices - Estructuras de consulta precalculadas sobre los datasets
+
+Los índices se construyen una sola vez por versión de cada CSV (mtime y
+tamaño del archivo) y se comparten entre todas las aplicaciones, de modo
+que cada consulta cuesta lo mismo sin importar cuánto crezca el historial.
+"""
+
+from datetime import date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Las consultas trabajan con NumPy; pandas solo hace falta para construir
+# los índices desde un DataFrame y se importa ahí
+if TYPE_CHECKING:
+    import pandas as pd
+
+from .esquemas import ESQUEMAS, leer_dataset
+from .funciones_comunes import MESES_PREFIJO, normalizar_fechas
+from .registro import REGISTRO
+
+# Rutas base
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / 'data'
+PATH_TASA = ESQUEMAS['tasa'].ruta
+PATH_RIPTE = ESQUEMAS['ripte'].ruta
+PATH_IPC = ESQUEMAS['ipc'].ruta
+PATH_JUS = ESQUEMAS['jus'].ruta
+PATH_PISOS = ESQUEMAS['pisos'].ruta
+
+# Datasets que se compilan al snapshot binario (ver utils/snapshot.py)
+DATASETS = {
+    'ripte': PATH_RIPTE,
+    'tasa': PATH_TASA,
+    'ipc': PATH_IPC,
+    'jus': PATH_JUS,
+    'pisos': PATH_PISOS
+}
+
+# Criterio de cada dataset de vigencias ante superposiciones (ver prioridad_vigencias)
+PRECEDENCIA_VIGENCIAS = {
+    'jus': 'csv',
+    'pisos': 'cerradas'
+}
+
+# Ordinal (date.toordinal) del 1/1/1970, para convertir datetime64[D]
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+# Ordinal usado como "hasta" de los registros vigentes (sin fecha de finalización)
+ORDINAL_ABIERTO = date.max.toordinal()
+
+# Clave de mes de enero de 1970, para convertir datetime64[M]
+CLAVE_MES_EPOCH = 1970 * 12 + 1
+
+def a_ordinal(fecha) -> int:
+    """
+    Convierte una fecha (date, datetime, Timestamp o string) a ordinal de día.
+
+    Args:
+        fecha: Fecha a convertir
+
+    Returns:
+        int: Ordinal según date.toordinal()
+    """
+    if isinstance(fecha, datetime):
+        return fecha.date().toordinal()
+    if isinstance(fecha, date):
+        return fecha.toordinal()
+    if isinstance(fecha, np.datetime64):
+        return int(fecha.astype('datetime64[D]').astype(np.int64)) + EPOCH_ORDINAL
+    import pandas as pd
+    return pd.Timestamp(fecha).date().toordinal()
+
+
+def clave_mes(año: int, mes: int) -> int:
+    """
+    Clave entera de un mes: año*12 + mes.
+
+    Meses consecutivos tienen claves consecutivas (dic-2020 → ene-2021 suma 1).
+    """
+    return int(año) * 12 + int(mes)
+
+
+def clave_mes_fecha(fecha) -> int:
+    """Clave de mes (año*12 + mes) de una fecha"""
+    if isinstance(fecha, np.datetime64):
+        return int(fecha.astype('datetime64[M]').astype(np.int64)) + CLAVE_MES_EPOCH
+    if not isinstance(fecha, date):
+        import pandas as pd
+        fecha = pd.Timestamp(fecha)
+    return clave_mes(fecha.year, fecha.month)
+
+
+def mes_a_numero(mes) -> Optional[int]:
+    """
+    Convierte un mes (número o nombre en español/inglés) a número 1-12.
+
+    Args:
+        mes: 3, '03', 'Marzo', ' marzo', 'mar', ...
+
+    Returns:
+        int entre 1 y 12, o None si no se reconoce
+    """
+    if mes is None or (isinstance(mes, float) and np.isnan(mes)):
+        return None
+    texto = str(mes).strip().lower()
+    try:
+        numero = int(float(texto))
+        return numero if 1 <= numero <= 12 else None
+    except ValueError:
+        return MESES_PREFIJO.get(texto[:3])
+
+
+def texto_clave_mes(clave: int) -> str:
+    """Clave de mes en formato 'YYYY-MM' (el mismo de la columna periodo del IPC)"""
+    año, mes = divmod(int(clave) - 1, 12)
+    return f"{año:04d}-{mes + 1:02d}"
+
+
+def _serie_meses_a_numero(serie: 'pd.Series') -> 'pd.Series':
+    """Versión vectorizada de mes_a_numero para una columna completa"""
+    import pandas as pd
+    texto = serie.astype(str).str.strip().str.lower()
+    numeros = pd.to_numeric(texto, errors='coerce')
+    por_nombre = texto.str[:3].map(MESES_PREFIJO)
+    numeros = numeros.where(numeros.between(1, 12), por_nombre)
+    return numeros
+
+
+def _serie_a_ordinales(serie) -> np.ndarray:
+    """Convierte una serie o arreglo datetime64 a ordinales de día (NaT → -1)"""
+    # Directo a días: pasar por nanosegundos desborda antes de 1677
+    valores = np.asarray(serie).astype('datetime64[D]')
+    nulos = np.isnat(valores)
+    ordinales = valores.astype(np.int64) + EPOCH_ORDINAL
+    ordinales[nulos] = -1
+    return ordinales
+
+
+def _fechas_lote(fechas) -> np.ndarray:
+    """
+    Fechas como arreglo datetime64[D] (NaT para las vacías).
+
+    date, datetime, datetime64 y texto ISO los convierte NumPy; el resto
+    (otros formatos de texto, NaN) pasa por pandas, como antes.
+    """
+    if hasattr(fechas, 'to_numpy'):
+        fechas = fechas.to_numpy()
+    try:
+        return np.asarray(fechas, dtype='datetime64[D]')
+    except (TypeError, ValueError):
+        import pandas as pd
+        return pd.to_datetime(pd.Series(list(fechas))).to_numpy().astype('datetime64[D]')
+
+
+def ordinales_lote(fechas) -> np.ndarray:
+    """
+    Versión vectorizada de a_ordinal.
+
+    Args:
+        fechas: Secuencia o Series de fechas (date, datetime, Timestamp o string)
+
+    Returns:
+        np.ndarray de ordinales de día (-1 para fechas vacías)
+    """
+    return _serie_a_ordinales(_fechas_lote(fechas))
+
+
+def claves_mes_lote(fechas) -> np.ndarray:
+    """
+    Versión vectorizada de clave_mes_fecha.
+
+    Args:
+        fechas: Secuencia o Series de fechas (date, datetime, Timestamp o string)
+
+    Returns:
+        np.ndarray de claves de mes (-1 para fechas vacías)
+    """
+    meses = _fechas_lote(fechas).astype('datetime64[M]')
+    claves = meses.astype(np.int64) + CLAVE_MES_EPOCH
+    claves[np.isnat(meses)] = -1
+    return claves
+
+
+class IndiceTasa:
+    """
+    Índice de sumas prefijas de la Tasa Activa BNA.
+
+    Cada registro del dataset aporta `valor / 30` puntos porcentuales por
+    cada día de su vigencia [desde, hasta]. El índice guarda un arreglo
+    contiguo de aportes diarios (uno por día desde el primer registro) y su
+    suma acumulada, por lo que el porcentaje acumulado entre dos fechas se
+    resuelve con dos accesos y una resta.
+
+    Los registros superpuestos se suman, igual que en el cálculo fila por fila.
+    """
+
+    def __init__(self, ordinal_base: int, diario: np.ndarray, prefijo: Optional[np.ndarray] = None):
+        """
+        Args:
+            ordinal_base: Ordinal del primer día cubierto por el índice
+            diario: Aporte porcentual de cada día a partir de ordinal_base
+            prefijo: Suma acumulada ya calculada (p. ej. leída del snapshot)
+        """
+        self.ordinal_base = int(ordinal_base)
+        self.diario = diario
+        # prefijo[i] = suma de los aportes de los primeros i días
+        self.prefijo = prefijo if prefijo is not None else np.concatenate(([0.0], np.cumsum(diario)))
+
+    @property
+    def dias(self) -> int:
+        """Cantidad de días cubiertos por el índice"""
+        return len(self.diario)
+
+    @property
+    def ordinal_final(self) -> int:
+        """Ordinal del último día cubierto por el índice"""
+        return self.ordinal_base + self.dias - 1
+
+    @classmethod
+    def vacio(cls) -> 'IndiceTasa':
+        """Índice sin datos: todas las consultas devuelven 0%"""
+        return cls(0, np.zeros(0))
+
+    @classmethod
+    def desde_registros(cls, desde: np.ndarray, hasta: np.ndarray, valores: np.ndarray) -> 'IndiceTasa':
+        """
+        Construye el índice a partir de arreglos de vigencias y valores.
+
+        Args:
+            desde: Ordinales de inicio de cada registro
+            hasta: Ordinales de fin de cada registro (inclusive)
+            valores: Tasa mensual (%) de cada registro
+
+        Returns:
+            IndiceTasa construido
+        """
+        desde = np.asarray(desde, dtype=np.int64)
+        hasta = np.asarray(hasta, dtype=np.int64)
+        valores = np.asarray(valores, dtype=np.float64)
+
+        # Los registros con hasta < desde no aportan días
+        validos = (desde > 0) & (hasta >= desde) & ~np.isnan(valores)
+        desde, hasta, valores = desde[validos], hasta[validos], valores[validos]
+
+        if len(desde) == 0:
+            return cls.vacio()
+
+        base = int(desde.min())
+        dias = int(hasta.max()) - base + 1
+
+        # Arreglo de diferencias: +aporte al inicio, -aporte al día siguiente al fin
+        diferencias = np.zeros(dias + 1)
+        aporte = valores / 30.0
+        np.add.at(diferencias, desde - base, aporte)
+        np.add.at(diferencias, hasta - base + 1, -aporte)
+
+        return cls(base, np.cumsum(diferencias[:-1]))
+
+    @classmethod
+    def desde_dataframe(cls, df: 'pd.DataFrame', completar_hasta: bool = False) -> 'IndiceTasa':
+        """
+        Construye el índice a partir del DataFrame de dataset_tasa.csv (crudo o tipado por su esquema).
+
+        Args:
+            df: DataFrame con columnas Valor/Desde/Hasta (sin importar mayúsculas)
+            completar_hasta: Si es True, los registros sin "hasta" se extienden
+                hasta fin de mes (criterio de la calculadora LRT). Si es False
+                se descartan (criterio de actualización y despidos).
+
+        Returns:
+            IndiceTasa construido
+        """
+        if df is None or df.empty:
+            return cls.vacio()
+
+        df = df.copy()
+        df.columns = [str(c).strip().lower().replace("\ufeff", "") for c in df.columns]
+
+        base_col = next((c for c in ("valor", "porcentaje", "tasa") if c in df.columns), None)
+        if base_col is None or "desde" not in df.columns:
+            return cls.vacio()
+
+        import pandas as pd
+        valores = pd.to_numeric(
+            df[base_col].astype(str).str.replace(",", ".", regex=False),
+            errors="coerce"
+        ).to_numpy(dtype=np.float64)
+
+        fechas_desde = normalizar_fechas(df["desde"], "%d/%m/%Y")
+        if "hasta" in df.columns:
+            fechas_hasta = normalizar_fechas(df["hasta"], "%d/%m/%Y")
+        else:
+            fechas_hasta = pd.Series(pd.NaT, index=df.index)
+
+        if completar_hasta:
+            fin_de_mes = fechas_desde + pd.offsets.MonthEnd(0)
+            fechas_hasta = fechas_hasta.fillna(fin_de_mes)
+
+        return cls.desde_registros(
+            _serie_a_ordinales(fechas_desde),
+            _serie_a_ordinales(fechas_hasta),
+            valores
+        )
+
+    def acumulado_pct(self, fecha_desde, fecha_hasta) -> float:
+        """
+        Porcentaje de tasa activa acumulado entre dos fechas (ambas inclusive).
+
+        Args:
+            fecha_desde: Fecha inicial
+            fecha_hasta: Fecha final
+
+        Returns:
+            float: Suma de los aportes diarios del período
+        """
+        if self.dias == 0:
+            return 0.0
+
+        inicio = max(a_ordinal(fecha_desde), self.ordinal_base)
+        fin = min(a_ordinal(fecha_hasta), self.ordinal_final)
+        if inicio > fin:
+            return 0.0
+
+        return float(self.prefijo[fin - self.ordinal_base + 1] - self.prefijo[inicio - self.ordinal_base])
+
+    def acumulado_pct_lote(self, fechas_desde, fechas_hasta) -> np.ndarray:
+        """
+        Versión vectorizada de acumulado_pct para muchos períodos a la vez.
+
+        Args:
+            fechas_desde: Fechas iniciales
+            fechas_hasta: Fechas finales (misma longitud)
+
+        Returns:
+            np.ndarray con el porcentaje acumulado de cada período
+        """
+        desde = ordinales_lote(fechas_desde)
+        hasta = ordinales_lote(fechas_hasta)
+        resultado = np.zeros(len(desde))
+        if self.dias == 0:
+            return resultado
+
+        inicio = np.maximum(desde, self.ordinal_base) - self.ordinal_base
+        fin = np.minimum(hasta, self.ordinal_final) - self.ordinal_base
+        validos = inicio <= fin
+        resultado[validos] = self.prefijo[fin[validos] + 1] - self.prefijo[inicio[validos]]
+        return resultado
+
+
+class IndiceRipte:
+    """
+    Tabla densa del índice RIPTE indexada por mes.
+
+    Los valores se guardan en un arreglo NumPy donde la posición de cada mes
+    es `clave_mes(año, mes) - clave_base`. Los meses sin publicación quedan
+    en NaN. Un segundo arreglo guarda, para cada posición, la posición del
+    último mes publicado hasta ese momento, así "último RIPTE publicado a
+    una fecha" también se resuelve en O(1).
+    """
+
+    def __init__(self, clave_base: int, valores: np.ndarray, ultimo: Optional[np.ndarray] = None):
+        """
+        Args:
+            clave_base: Clave de mes (año*12 + mes) de la primera posición
+            valores: Índice RIPTE por mes a partir de clave_base (NaN = sin dato)
+            ultimo: Arreglo de últimas posiciones ya calculado (p. ej. leído del snapshot)
+        """
+        self.clave_base = int(clave_base)
+        self.valores = valores
+
+        # ultimo[i] = posición del último mes publicado <= i (-1 si no hay)
+        if ultimo is None:
+            posiciones = np.where(~np.isnan(valores), np.arange(len(valores)), -1)
+            ultimo = np.maximum.accumulate(posiciones) if len(valores) else posiciones
+        self.ultimo = ultimo
+
+    @property
+    def meses(self) -> int:
+        """Cantidad de meses cubiertos por el arreglo"""
+        return len(self.valores)
+
+    @property
+    def clave_final(self) -> int:
+        """Clave de mes de la última posición del arreglo"""
+        return self.clave_base + len(self.valores) - 1
+
+    @classmethod
+    def vacio(cls) -> 'IndiceRipte':
+        """Índice sin datos"""
+        return cls(0, np.zeros(0))
+
+    @classmethod
+    def desde_registros(cls, claves: np.ndarray, valores: np.ndarray) -> 'IndiceRipte':
+        """
+        Construye la tabla densa a partir de pares (clave de mes, valor).
+
+        Si un mes aparece repetido se conserva el primero (el CSV tiene el
+        dato más reciente arriba).
+
+        Args:
+            claves: Claves de mes (año*12 + mes)
+            valores: Índice RIPTE de cada mes
+
+        Returns:
+            IndiceRipte construido
+        """
+        claves = np.asarray(claves, dtype=np.int64)
+        valores = np.asarray(valores, dtype=np.float64)
+
+        validos = (claves > 0) & ~np.isnan(valores)
+        claves, valores = claves[validos], valores[validos]
+        if len(claves) == 0:
+            return cls.vacio()
+
+        # np.unique devuelve la primera aparición de cada clave
+        claves, primeras = np.unique(claves, return_index=True)
+        valores = valores[primeras]
+
+        base = int(claves[0])
+        densos = np.full(int(claves[-1]) - base + 1, np.nan)
+        densos[claves - base] = valores
+        return cls(base, densos)
+
+    @classmethod
+    def desde_dataframe(cls, df: 'pd.DataFrame') -> 'IndiceRipte':
+        """
+        Construye el índice a partir del DataFrame de dataset_ripte.csv (crudo o tipado por su esquema).
+
+        Args:
+            df: DataFrame con columnas año, mes (nombre o número) e indice_ripte
+
+        Returns:
+            IndiceRipte construido
+        """
+        if df is None or df.empty:
+            return cls.vacio()
+
+        import pandas as pd
+        df = df.copy()
+        df.columns = [str(c).strip().lower() for c in df.columns]
+
+        if 'año' in df.columns and 'mes' in df.columns:
+            años = pd.to_numeric(df['año'], errors='coerce')
+            meses = _serie_meses_a_numero(df['mes'])
+        else:
+            fecha_col = next((c for c in df.columns if 'fecha' in c or 'periodo' in c), df.columns[0])
+            fechas = normalizar_fechas(df[fecha_col])
+            años, meses = fechas.dt.year, fechas.dt.month
+
+        if 'indice_ripte' in df.columns:
+            val_col = 'indice_ripte'
+        else:
+            val_col = next((c for c in df.columns if 'ripte' in c or 'indice' in c or 'valor' in c), None)
+            if val_col is None:
+                return cls.vacio()
+
+        claves = (años * 12 + meses).fillna(-1).to_numpy(dtype=np.int64)
+        valores = pd.to_numeric(df[val_col], errors='coerce').to_numpy(dtype=np.float64)
+        return cls.desde_registros(claves, valores)
+
+    def valor(self, año: int, mes) -> Optional[float]:
+        """
+        Índice RIPTE publicado para un mes exacto.
+
+        Args:
+            año: Año
+            mes: Mes (número o nombre)
+
+        Returns:
+            float o None si ese mes no está publicado
+        """
+        numero = mes_a_numero(mes)
+        if numero is None or self.meses == 0:
+            return None
+        posicion = clave_mes(año, numero) - self.clave_base
+        if posicion < 0 or posicion >= len(self.valores):
+            return None
+        valor = self.valores[posicion]
+        return None if np.isnan(valor) else float(valor)
+
+    def ultimo_publicado(self, fecha) -> Optional[float]:
+        """
+        Último índice RIPTE publicado en el mes de la fecha o antes.
+
+        Args:
+            fecha: Fecha de referencia
+
+        Returns:
+            float o None si no hay publicaciones anteriores a la fecha
+        """
+        if self.meses == 0:
+            return None
+        posicion = min(clave_mes_fecha(fecha), self.clave_final) - self.clave_base
+        if posicion < 0:
+            return None
+        ultimo = self.ultimo[posicion]
+        return None if ultimo < 0 else float(self.valores[ultimo])
+
+    def ultimo_publicado_lote(self, fechas) -> np.ndarray:
+        """
+        Versión vectorizada de ultimo_publicado.
+
+        Args:
+            fechas: Fechas de referencia
+
+        Returns:
+            np.ndarray con el último índice publicado a cada fecha (NaN si no hay)
+        """
+        claves = claves_mes_lote(fechas)
+        resultado = np.full(len(claves), np.nan)
+        if self.meses == 0:
+            return resultado
+
+        posiciones = np.minimum(claves, self.clave_final) - self.clave_base
+        ultimos = np.full(len(claves), -1, dtype=np.int64)
+        validos = posiciones >= 0
+        ultimos[validos] = self.ultimo[posiciones[validos]]
+        publicados = ultimos >= 0
+        resultado[publicados] = self.valores[ultimos[publicados]]
+        return resultado
+
+    def mas_antiguo(self) -> Optional[float]:
+        """Primer índice publicado de la serie"""
+        return None if self.meses == 0 else float(self.valores[0])
+
+    def mas_reciente(self) -> Optional[float]:
+        """Último índice publicado de la serie"""
+        return None if self.meses == 0 else float(self.valores[-1])
+
+
+class IndiceIPC:
+    """
+    Serie mensual de IPC con suma acumulada de logaritmos.
+
+    `prefijo[i]` es la suma de log(1 + v/100) de las posiciones anteriores a i,
+    de modo que el factor de inflación acumulado entre dos meses es
+    exp(prefijo[fin + 1] - prefijo[inicio]). Los meses sin dato cuentan como
+    variación 0 y se informan con meses_faltantes().
+    """
+
+    def __init__(self, clave_base: int, variaciones: np.ndarray,
+                 prefijo: Optional[np.ndarray] = None, prefijo_faltantes: Optional[np.ndarray] = None):
+        """
+        Args:
+            clave_base: Clave de mes (año*12 + mes) de la primera posición
+            variaciones: Variación mensual en % a partir de clave_base (NaN = sin dato)
+            prefijo: Suma acumulada de logaritmos ya calculada (p. ej. leída del snapshot)
+            prefijo_faltantes: Conteo acumulado de meses sin dato ya calculado
+        """
+        self.clave_base = int(clave_base)
+        self.variaciones = variaciones
+
+        if prefijo is None or prefijo_faltantes is None:
+            faltante = np.isnan(variaciones)
+            logs = np.where(faltante, 0.0, np.log1p(np.where(faltante, 0.0, variaciones) / 100))
+            prefijo = np.concatenate(([0.0], np.cumsum(logs)))
+            prefijo_faltantes = np.concatenate(([0], np.cumsum(faltante)))
+        self.prefijo = prefijo
+        self.prefijo_faltantes = prefijo_faltantes
+
+    @property
+    def meses(self) -> int:
+        """Cantidad de meses cubiertos por el arreglo"""
+        return len(self.variaciones)
+
+    @property
+    def clave_final(self) -> int:
+        """Clave de mes de la última posición del arreglo"""
+        return self.clave_base + len(self.variaciones) - 1
+
+    @classmethod
+    def vacio(cls) -> 'IndiceIPC':
+        """Índice sin datos"""
+        return cls(0, np.zeros(0))
+
+    @classmethod
+    def desde_registros(cls, claves: np.ndarray, variaciones: np.ndarray) -> 'IndiceIPC':
+        """
+        Construye la serie densa a partir de pares (clave de mes, variación %).
+
+        Si un mes aparece repetido se conserva el primero (más reciente arriba).
+
+        Args:
+            claves: Claves de mes (año*12 + mes)
+            variaciones: Variación mensual en %
+
+        Returns:
+            IndiceIPC construido
+        """
+        claves = np.asarray(claves, dtype=np.int64)
+        variaciones = np.asarray(variaciones, dtype=np.float64)
+
+        validos = (claves > 0) & ~np.isnan(variaciones)
+        claves, variaciones = claves[validos], variaciones[validos]
+        if len(claves) == 0:
+            return cls.vacio()
+
+        claves, primeras = np.unique(claves, return_index=True)
+        base = int(claves[0])
+        densas = np.full(int(claves[-1]) - base + 1, np.nan)
+        densas[claves - base] = variaciones[primeras]
+        return cls(base, densas)
+
+    @classmethod
+    def desde_dataframe(cls, df: 'pd.DataFrame') -> 'IndiceIPC':
+        """
+        Construye el índice a partir del DataFrame de dataset_ipc.csv (crudo o tipado por su esquema).
+
+        Args:
+            df: DataFrame con columnas periodo (YYYY-MM) y variacion_mensual
+
+        Returns:
+            IndiceIPC construido
+        """
+        if df is None or df.empty:
+            return cls.vacio()
+
+        df = df.copy()
+        df.columns = [str(c).strip().lower().replace("\ufeff", "") for c in df.columns]
+
+        if 'periodo' in df.columns:
+            fecha_col = 'periodo'
+        else:
+            fecha_col = next((c for c in df.columns if 'fecha' in c or 'periodo' in c or 'mes' in c), df.columns[0])
+
+        if 'variacion_mensual' in df.columns:
+            val_col = 'variacion_mensual'
+        else:
+            val_col = next(
+                (c for c in df.columns if c != fecha_col and any(k in c for k in ('variacion', 'inflacion', 'ipc', 'porcentaje', 'mensual'))),
+                None
+            )
+            if val_col is None:
+                return cls.vacio()
+
+        import pandas as pd
+        fechas = normalizar_fechas(df[fecha_col], 'ISO8601')
+        claves = (fechas.dt.year * 12 + fechas.dt.month).fillna(-1).to_numpy(dtype=np.int64)
+        variaciones = pd.to_numeric(
+            df[val_col].astype(str).str.replace(',', '.'), errors='coerce'
+        ).to_numpy(dtype=np.float64)
+        return cls.desde_registros(claves, variaciones)
+
+    def _rango(self, fecha_desde, fecha_hasta) -> Tuple[int, int]:
+        """Posiciones [inicio, fin] del arreglo para el rango pedido, recortadas a la serie"""
+        inicio = max(clave_mes_fecha(fecha_desde), self.clave_base) - self.clave_base
+        fin = min(clave_mes_fecha(fecha_hasta), self.clave_final) - self.clave_base
+        return inicio, fin
+
+    def factor(self, fecha_desde, fecha_hasta) -> float:
+        """
+        Factor de inflación acumulado entre los meses de dos fechas (ambos incluidos).
+
+        Args:
+            fecha_desde: Fecha inicial (se toma su mes)
+            fecha_hasta: Fecha final (se toma su mes)
+
+        Returns:
+            float: Producto de (1 + v/100); 1.0 si el rango no tiene datos
+        """
+        if self.meses == 0:
+            return 1.0
+        inicio, fin = self._rango(fecha_desde, fecha_hasta)
+        if fin < inicio:
+            return 1.0
+        return float(np.exp(self.prefijo[fin + 1] - self.prefijo[inicio]))
+
+    def inflacion_pct(self, fecha_desde, fecha_hasta) -> float:
+        """
+        Inflación acumulada en % entre los meses de dos fechas (ambos incluidos).
+
+        Args:
+            fecha_desde: Fecha inicial
+            fecha_hasta: Fecha final
+
+        Returns:
+            float: Inflación acumulada en porcentaje
+        """
+        return (self.factor(fecha_desde, fecha_hasta) - 1) * 100
+
+    def factor_lote(self, fechas_desde, fechas_hasta) -> np.ndarray:
+        """
+        Versión vectorizada de factor para muchos períodos a la vez.
+
+        Args:
+            fechas_desde: Fechas iniciales
+            fechas_hasta: Fechas finales (misma longitud)
+
+        Returns:
+            np.ndarray con el factor de inflación de cada período
+        """
+        desde = claves_mes_lote(fechas_desde)
+        hasta = claves_mes_lote(fechas_hasta)
+        resultado = np.ones(len(desde))
+        if self.meses == 0:
+            return resultado
+
+        inicio = np.maximum(desde, self.clave_base) - self.clave_base
+        fin = np.minimum(hasta, self.clave_final) - self.clave_base
+        validos = fin >= inicio
+        resultado[validos] = np.exp(self.prefijo[fin[validos] + 1] - self.prefijo[inicio[validos]])
+        return resultado
+
+    def inflacion_pct_lote(self, fechas_desde, fechas_hasta) -> np.ndarray:
+        """Versión vectorizada de inflacion_pct"""
+        return (self.factor_lote(fechas_desde, fechas_hasta) - 1) * 100
+
+    def meses_con_dato(self, fecha_desde, fecha_hasta) -> int:
+        """
+        Cantidad de meses del rango pedido con IPC publicado.
+
+        Es 0 cuando meses_faltantes() abarca todo el rango (o el rango está
+        invertido).
+
+        Args:
+            fecha_desde: Fecha inicial
+            fecha_hasta: Fecha final
+
+        Returns:
+            int: Meses con variación publicada
+        """
+        if self.meses == 0:
+            return 0
+        inicio, fin = self._rango(fecha_desde, fecha_hasta)
+        if fin < inicio:
+            return 0
+        huecos = self.prefijo_faltantes[fin + 1] - self.prefijo_faltantes[inicio]
+        return int(fin - inicio + 1 - huecos)
+
+    def meses_faltantes(self, fecha_desde, fecha_hasta) -> List[str]:
+        """
+        Meses del rango pedido que no tienen IPC publicado.
+
+        Incluye los meses anteriores al inicio de la serie y los posteriores
+        al último dato publicado.
+
+        Args:
+            fecha_desde: Fecha inicial
+            fecha_hasta: Fecha final
+
+        Returns:
+            Lista de meses en formato 'YYYY-MM' (vacía si el rango está completo)
+        """
+        clave_desde = clave_mes_fecha(fecha_desde)
+        clave_hasta = clave_mes_fecha(fecha_hasta)
+        if clave_hasta < clave_desde:
+            return []
+        if self.meses == 0:
+            return [texto_clave_mes(c) for c in range(clave_desde, clave_hasta + 1)]
+
+        faltantes = list(range(clave_desde, min(clave_hasta + 1, self.clave_base)))
+
+        inicio, fin = self._rango(fecha_desde, fecha_hasta)
+        if fin >= inicio and self.prefijo_faltantes[fin + 1] > self.prefijo_faltantes[inicio]:
+            huecos = np.flatnonzero(np.isnan(self.variaciones[inicio:fin + 1])) + inicio
+            faltantes.extend(int(p) + self.clave_base for p in huecos)
+
+        faltantes.extend(range(max(clave_desde, self.clave_final + 1), clave_hasta + 1))
+        return [texto_clave_mes(c) for c in faltantes]
+
+
+def ordenar_vigencias(df: 'pd.DataFrame', col_desde: str, col_hasta: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Orden de las filas de un dataset de vigencias por fecha de inicio.
+
+    Las filas sin fecha de inicio se descartan. Ante dos registros con el
+    mismo inicio queda último el que aparece primero en el CSV, que tiene
+    el dato más reciente arriba.
+
+    Args:
+        df: DataFrame con una fila por vigencia
+        col_desde: Columna con la fecha de entrada en vigencia
+        col_hasta: Columna con la fecha de finalización (vacía = vigente)
+
+    Returns:
+        (posiciones de las filas en orden, ordinales desde, ordinales hasta)
+    """
+    desde = _serie_a_ordinales(normalizar_fechas(df[col_desde]))
+    hasta = _serie_a_ordinales(normalizar_fechas(df[col_hasta]))
+    hasta = np.where(hasta < 0, ORDINAL_ABIERTO, hasta)
+
+    # Orden estable sobre el CSV invertido: en empates, la fila de arriba queda última
+    validos = np.flatnonzero(desde >= 0)[::-1]
+    orden = validos[np.argsort(desde[validos], kind='stable')]
+    return orden, desde[orden], hasta[orden]
+
+
+def prioridad_vigencias(orden: np.ndarray, desde: np.ndarray, hasta: np.ndarray, precedencia: str) -> np.ndarray:
+    """
+    Prioridad de cada vigencia para cuando varias contienen la misma fecha (gana la mayor).
+
+    Reproduce el criterio de las búsquedas originales de cada dataset:
+
+    - 'csv': gana la fila de más arriba del CSV (convertir_a_jus filtraba
+      las vigentes y tomaba la primera).
+    - 'cerradas': gana la vigencia con fecha de finalización de inicio más
+      antiguo; si ninguna la tiene, la abierta de inicio más reciente
+      (get_piso_minimo recorría las filas ordenadas por inicio y devolvía
+      la primera cerrada que contenía la fecha).
+
+    Args:
+        orden: Posición en el CSV de cada vigencia (ver ordenar_vigencias)
+        desde: Ordinales de inicio, en el mismo orden
+        hasta: Ordinales de finalización (ORDINAL_ABIERTO si está vigente)
+        precedencia: 'csv' o 'cerradas'
+
+    Returns:
+        np.ndarray int64 alineado con desde
+
+    Raises:
+        ValueError: Si la precedencia no es ninguna de las anteriores
+    """
+    orden = np.asarray(orden, dtype=np.int64)
+    if precedencia == 'csv':
+        return -orden
+    if precedencia == 'cerradas':
+        n = len(orden)
+        # Rango por inicio y, en empates, por fila del CSV
+        rango = np.empty(n, dtype=np.int64)
+        rango[np.lexsort((orden, desde))] = np.arange(n)
+        # Toda cerrada (n+1..2n) le gana a toda abierta (0..n-1)
+        return np.where(np.asarray(hasta) == ORDINAL_ABIERTO, rango, 2 * n - rango)
+    raise ValueError(f"Precedencia de vigencias desconocida: {precedencia}")
+
+
+class IndiceVigencias:
+    """
+    Intervalos de vigencia [desde, hasta] ordenados por fecha de inicio.
+
+    Sirve para cualquier dataset del tipo "valor vigente entre dos fechas"
+    (JUS, pisos mínimos SRT). Los registros sin fecha de finalización se
+    consideran vigentes hasta hoy en adelante. La búsqueda hace bisect sobre
+    los ordinales de inicio y devuelve el registro completo que contiene la
+    fecha; si varios se superponen, gana el de mayor prioridad (ver
+    prioridad_vigencias).
+    """
+
+    def __init__(self, desde: np.ndarray, hasta: np.ndarray, registros: List[Dict[str, Any]],
+                 max_hasta: Optional[np.ndarray] = None, prioridad: Optional[np.ndarray] = None):
+        """
+        Args:
+            desde: Ordinales de inicio, ordenados de menor a mayor
+            hasta: Ordinales de finalización (ORDINAL_ABIERTO si está vigente)
+            registros: Filas originales, en el mismo orden que desde
+            max_hasta: Máximo acumulado de hasta ya calculado (p. ej. leído del snapshot)
+            prioridad: Prioridad de cada registro ante superposiciones (por
+                defecto gana el de inicio más reciente)
+        """
+        self.desde = desde
+        self.hasta = hasta
+        self.registros = registros
+        # Máximo "hasta" acumulado: corta la búsqueda hacia atrás en O(1) si no hay superposiciones
+        if max_hasta is None:
+            max_hasta = np.maximum.accumulate(hasta) if len(hasta) else hasta
+        self.max_hasta = max_hasta
+        self.prioridad = prioridad if prioridad is not None else np.arange(len(desde), dtype=np.int64)
+
+    @property
+    def cantidad(self) -> int:
+        """Cantidad de registros del índice"""
+        return len(self.registros)
+
+    @classmethod
+    def vacio(cls) -> 'IndiceVigencias':
+        """Índice sin registros"""
+        return cls(np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), [])
+
+    @classmethod
+    def desde_dataframe(cls, df: 'pd.DataFrame', col_desde: str, col_hasta: str,
+                        precedencia: str = 'csv') -> 'IndiceVigencias':
+        """
+        Construye el índice a partir de un DataFrame con fechas ya parseadas.
+
+        Las filas sin fecha de inicio se descartan.
+
+        Args:
+            df: DataFrame con una fila por vigencia
+            col_desde: Columna con la fecha de entrada en vigencia
+            col_hasta: Columna con la fecha de finalización (vacía = vigente)
+            precedencia: Criterio ante superposiciones (ver prioridad_vigencias)
+
+        Returns:
+            IndiceVigencias construido
+        """
+        if df is None or df.empty:
+            return cls.vacio()
+
+        orden, desde, hasta = ordenar_vigencias(df, col_desde, col_hasta)
+        registros = df.iloc[orden].to_dict('records')
+        return cls(desde, hasta, registros, prioridad=prioridad_vigencias(orden, desde, hasta, precedencia))
+
+    def _resolver(self, posicion: int, ordinal: int) -> int:
+        """Recorre hacia atrás desde posicion y devuelve el registro de mayor prioridad que contiene ordinal (-1 si ninguno)"""
+        elegido = -1
+        while posicion >= 0 and self.max_hasta[posicion] >= ordinal:
+            if self.hasta[posicion] >= ordinal and (elegido < 0 or self.prioridad[posicion] > self.prioridad[elegido]):
+                elegido = posicion
+            posicion -= 1
+        return elegido
+
+    def buscar(self, fecha) -> Optional[Dict[str, Any]]:
+        """
+        Registro vigente en una fecha.
+
+        Args:
+            fecha: Fecha a buscar (date, datetime, Timestamp o string)
+
+        Returns:
+            dict con la fila completa, o None si ninguna vigencia contiene la fecha
+        """
+        if not self.registros:
+            return None
+        ordinal = a_ordinal(fecha)
+        posicion = self._resolver(int(np.searchsorted(self.desde, ordinal, side='right')) - 1, ordinal)
+        return self.registros[posicion] if posicion >= 0 else None
+
+    def buscar_posiciones(self, fechas) -> np.ndarray:
+        """
+        Versión vectorizada de buscar: posición del registro vigente en cada fecha.
+
+        Args:
+            fechas: Fechas a buscar
+
+        Returns:
+            np.ndarray de posiciones en self.registros (-1 si ninguna vigencia contiene la fecha)
+        """
+        ordinales = ordinales_lote(fechas)
+        resultado = np.full(len(ordinales), -1, dtype=np.int64)
+        if not self.registros:
+            return resultado
+
+        posiciones = np.searchsorted(self.desde, ordinales, side='right') - 1
+        candidatos = np.flatnonzero(posiciones >= 0)
+        posicion, ordinal = posiciones[candidatos], ordinales[candidatos]
+
+        # Si ningún registro anterior llega a la fecha, el último que empezó es el único posible
+        anteriores = np.where(posicion > 0, self.max_hasta[np.maximum(posicion - 1, 0)], -1)
+        unicos = (self.hasta[posicion] >= ordinal) & (anteriores < ordinal)
+        resultado[candidatos[unicos]] = posicion[unicos]
+
+        # Fechas en un hueco o con registros superpuestos: se resuelven por prioridad
+        for i in candidatos[~unicos]:
+            resultado[i] = self._resolver(int(posiciones[i]), int(ordinales[i]))
+        return resultado
+
+    def mas_antiguo(self) -> Optional[Dict[str, Any]]:
+        """Registro con la fecha de inicio más antigua"""
+        return self.registros[0] if self.registros else None
+
+    def mas_reciente(self) -> Optional[Dict[str, Any]]:
+        """Registro con la fecha de inicio más reciente"""
+        return self.registros[-1] if self.registros else None
+
+
+def _obtener_cacheado(tipo: str, ruta: Path, variante, constructor: Callable[[Path], object]):
+    """
+    Devuelve el índice registrado para la versión actual de un archivo.
+
+    Los índices viven en el registro del proceso (ver utils/registro.py) y
+    se comparten entre todas las sesiones y aplicaciones.
+
+    Args:
+        tipo: Nombre del índice ('tasa', 'ripte', ...)
+        ruta: Ruta al CSV de origen
+        variante: Parámetros de construcción que distinguen entradas del registro
+        constructor: Función que construye el índice a partir de la ruta
+
+    Returns:
+        El índice construido (o reutilizado)
+    """
+    return REGISTRO.obtener(tipo, ruta, variante, constructor)
+
+
+def _indice_desde_snapshot(tipo: str, ruta: Path, variante=None):
+    """
+    Índice leído del snapshot binario, si la ruta es la del dataset compilado.
+
+    Returns:
+        El índice, o None si la ruta no es la de data/ o el snapshot no está disponible
+    """
+    if ruta.resolve() != DATASETS[tipo].resolve():
+        return None
+    # Import diferido: snapshot importa este módulo
+    from .snapshot import obtener_snapshot
+    snapshot = obtener_snapshot()
+    if snapshot is None:
+        return None
+    return snapshot.indice(tipo, variante)
+
+
+def _preparar_ripte(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Agrega a la tabla de RIPTE la fecha (día 1 del mes)"""
+    import pandas as pd
+    meses = _serie_meses_a_numero(df['mes'])
+    df['fecha'] = pd.to_datetime(
+        pd.DataFrame({'year': df['año'], 'month': meses, 'day': 1}), errors='coerce'
+    )
+    return df
+
+
+def _preparar_tasa(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """La tabla de tasa activa se usa tal como la tipa su esquema"""
+    return df
+
+
+def _preparar_ipc(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """La tabla de IPC se usa tal como la tipa su esquema"""
+    return df
+
+
+def _preparar_jus(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Descarta de la tabla de JUS las filas sin valor"""
+    return df.dropna(subset=['VALOR IUS'])
+
+
+def _preparar_pisos(df: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Agrega a la tabla de pisos mínimos SRT las columnas desde/hasta/piso/resol/enlace"""
+    df['desde'] = df['fecha_inicio']
+    df['hasta'] = df['fecha_fin']
+    df['piso'] = df['monto_minimo']
+    df['resol'] = df['norma'].astype(str)
+    df['enlace'] = df['enlace'].fillna('').astype(str) if 'enlace' in df.columns else ''
+    return df.dropna(subset=['piso'])
+
+
+# Columnas derivadas de cada dataset sobre la tabla tipada por su esquema
+# (el resultado es la misma tabla que guarda el snapshot)
+PREPARADORES = {
+    'ripte': _preparar_ripte,
+    'tasa': _preparar_tasa,
+    'ipc': _preparar_ipc,
+    'jus': _preparar_jus,
+    'pisos': _preparar_pisos
+}
+
+
+def leer_tabla(nombre: str, ruta: Optional[Path] = None, contenido: Optional[bytes] = None) -> 'pd.DataFrame':
+    """
+    Lee un dataset según su esquema y le agrega sus columnas derivadas.
+
+    Args:
+        nombre: ripte, tasa, ipc, jus o pisos
+        ruta: Ruta alternativa al CSV (por defecto la del esquema)
+        contenido: Bytes ya leídos del CSV (ver esquemas.leer_dataset)
+
+    Returns:
+        pd.DataFrame tipado en el orden del CSV (más reciente arriba)
+    """
+    df = leer_dataset(nombre, ruta, contenido).df
+    return PREPARADORES[nombre](df).reset_index(drop=True)
+
+
+def obtener_indice_tasa(ruta: Optional[Path] = None, completar_hasta: bool = False) -> IndiceTasa:
+    """
+    Devuelve el índice de tasa activa para la versión actual del CSV.
+
+    El índice se construye una sola vez por versión del archivo y se
+    reutiliza en todas las ejecuciones y aplicaciones del proceso.
+
+    Args:
+        ruta: Ruta al CSV de tasa (por defecto data/dataset_tasa.csv)
+        completar_hasta: Ver IndiceTasa.desde_dataframe
+
+    Returns:
+        IndiceTasa para la versión vigente del archivo
+    """
+    ruta = Path(ruta) if ruta else PATH_TASA
+    if not ruta.exists():
+        return IndiceTasa.vacio()
+
+    def construir(r: Path) -> IndiceTasa:
+        indice = _indice_desde_snapshot('tasa', r, completar_hasta)
+        if indice is not None:
+            return indice
+        return IndiceTasa.desde_dataframe(leer_tabla('tasa', r), completar_hasta=completar_hasta)
+
+    return _obtener_cacheado('tasa', ruta, completar_hasta, construir)
+
+
+def obtener_indice_ripte(ruta: Optional[Path] = None) -> IndiceRipte:
+    """
+    Devuelve el índice RIPTE por mes para la versión actual del CSV.
+
+    Args:
+        ruta: Ruta al CSV de RIPTE (por defecto data/dataset_ripte.csv)
+
+    Returns:
+        IndiceRipte para la versión vigente del archivo
+    """
+    ruta = Path(ruta) if ruta else PATH_RIPTE
+    if not ruta.exists():
+        return IndiceRipte.vacio()
+
+    def construir(r: Path) -> IndiceRipte:
+        indice = _indice_desde_snapshot('ripte', r, None)
+        if indice is not None:
+            return indice
+        return IndiceRipte.desde_dataframe(leer_tabla('ripte', r))
+
+    return _obtener_cacheado('ripte', ruta, None, construir)
+
+
+def obtener_indice_ipc(ruta: Optional[Path] = None) -> IndiceIPC:
+    """
+    Devuelve el índice IPC acumulado para la versión actual del CSV.
+
+    Args:
+        ruta: Ruta al CSV de IPC (por defecto data/dataset_ipc.csv)
+
+    Returns:
+        IndiceIPC para la versión vigente del archivo
+    """
+    ruta = Path(ruta) if ruta else PATH_IPC
+    if not ruta.exists():
+        return IndiceIPC.vacio()
+
+    def construir(r: Path) -> IndiceIPC:
+        indice = _indice_desde_snapshot('ipc', r, None)
+        if indice is not None:
+            return indice
+        return IndiceIPC.desde_dataframe(leer_tabla('ipc', r))
+
+    return _obtener_cacheado('ipc', ruta, None, construir)
+
+
+def obtener_indice_jus(ruta: Optional[Path] = None) -> IndiceVigencias:
+    """
+    Devuelve el índice de vigencias del valor JUS para la versión actual del CSV.
+
+    Cada registro conserva las columnas del CSV ('VALOR IUS', 'ACUERDO',
+    'FECHA ENTRADA EN VIGENCIA', 'FECHA DE FINALIZACION').
+
+    Args:
+        ruta: Ruta al CSV de JUS (por defecto data/Dataset_JUS.csv)
+
+    Returns:
+        IndiceVigencias para la versión vigente del archivo
+    """
+    ruta = Path(ruta) if ruta else PATH_JUS
+    if not ruta.exists():
+        return IndiceVigencias.vacio()
+
+    def construir(r: Path) -> IndiceVigencias:
+        indice = _indice_desde_snapshot('jus', r, None)
+        if indice is not None:
+            return indice
+        df = leer_tabla('jus', r)
+        return IndiceVigencias.desde_dataframe(
+            df, 'FECHA ENTRADA EN VIGENCIA', 'FECHA DE FINALIZACION', PRECEDENCIA_VIGENCIAS['jus']
+        )
+
+    return _obtener_cacheado('jus', ruta, None, construir)
+
+
+def obtener_indice_pisos(ruta: Optional[Path] = None) -> IndiceVigencias:
+    """
+    Devuelve el índice de vigencias de los pisos mínimos SRT para la versión actual del CSV.
+
+    Cada registro tiene las claves desde, hasta, piso, resol y enlace.
+
+    Args:
+        ruta: Ruta al CSV de pisos (por defecto data/dataset_pisos.csv)
+
+    Returns:
+        IndiceVigencias para la versión vigente del archivo
+    """
+    ruta = Path(ruta) if ruta else PATH_PISOS
+    if not ruta.exists():
+        return IndiceVigencias.vacio()
+
+    def construir(r: Path) -> IndiceVigencias:
+        indice = _indice_desde_snapshot('pisos', r, None)
+        if indice is not None:
+            return indice
+        df = leer_tabla('pisos', r)
+        return IndiceVigencias.desde_dataframe(df, 'desde', 'hasta', PRECEDENCIA_VIGENCIAS['pisos'])
+
+    return _obtener_cacheado('pisos', ruta, None, construir)
@@ -8,12 +8,14 @@ VERSIÓN: 2025-12-09 v2 - CON DEBUGGING HABILITADO
 import streamlit as st
 import pandas as pd
 
+from .snapshot import obtener_tabla
+
 
 def mostrar_ultimos_datos_universal():
     """
     Muestra una alerta informativa con los últimos datos disponibles de TODOS los datasets.
     
-    Carga directamente desde los CSV sin depender de data_manager.
+    Lee las tablas del snapshot binario (sin depender de data_manager ni re-parsear los CSV).
     Incluye: RIPTE, IPC, TASA, PISO, JUS
     """
     
@@ -21,7 +23,7 @@ def mostrar_ultimos_datos_universal():
     
     # ========== RIPTE ==========
     try:
-        df_ripte = pd.read_csv("data/dataset_ripte.csv", encoding='utf-8')
+        df_ripte = obtener_tabla('ripte')
         if not df_ripte.empty:
             ultimo = df_ripte.iloc[0]
             mes = ultimo['mes'].strip()[:3]
@@ -34,10 +36,10 @@ def mostrar_ultimos_datos_universal():
     
     # ========== IPC ==========
     try:
-        df_ipc = pd.read_csv("data/dataset_ipc.csv", encoding='utf-8')
+        df_ipc = obtener_tabla('ipc')
         if not df_ipc.empty:
             ultimo = df_ipc.iloc[0]
-            fecha = pd.to_datetime(ultimo['periodo'], format='%Y-%m')
+            fecha = ultimo['periodo']
             valor = ultimo['variacion_mensual']
             valor_fmt = f"{valor:.2f}".replace('.', ',')
             textos_datos.append(f"IPC {fecha.month}/{fecha.year}: {valor_fmt}%")
@@ -46,14 +48,12 @@ def mostrar_ultimos_datos_universal():
     
     # ========== TASA ACTIVA ==========
     try:
-        df_tasa = pd.read_csv("data/dataset_tasa.csv", encoding='utf-8')
-        df_tasa['Desde'] = pd.to_datetime(df_tasa['Desde'], format='%d/%m/%Y', dayfirst=True)
-        df_tasa['Hasta'] = pd.to_datetime(df_tasa['Hasta'], format='%d/%m/%Y', dayfirst=True)
+        df_tasa = obtener_tabla('tasa')
         if not df_tasa.empty:
             df_tasa = df_tasa.sort_values('Desde', ascending=False)
             ultimo = df_tasa.iloc[0]
             fecha = ultimo['Hasta']
-            valor = float(str(ultimo['Valor']).replace(',', '.'))
+            valor = float(ultimo['Valor'])
             valor_fmt = f"{valor:.2f}".replace('.', ',')
             resultado = f"TASA ACTIVA {fecha.strftime('%d/%m/%Y')}: {valor_fmt}%"
             textos_datos.append(resultado)
@@ -64,14 +64,11 @@ def mostrar_ultimos_datos_universal():
     
     # ========== JUS ==========
     try:
-        df_jus = pd.read_csv("data/Dataset_JUS.csv", encoding='utf-8')
-        df_jus.columns = df_jus.columns.str.strip()
+        df_jus = obtener_tabla('jus')
         if not df_jus.empty:
             ultimo = df_jus.iloc[0]
-            fecha_str = ultimo['FECHA ENTRADA EN VIGENCIA'].strip()
-            fecha = pd.to_datetime(fecha_str, format='%d/%m/%Y', dayfirst=True)
-            valor_str = ultimo['VALOR IUS'].strip().replace('$', '').replace('.', '').replace(',', '.')
-            valor = float(valor_str)
+            fecha = ultimo['FECHA ENTRADA EN VIGENCIA']
+            valor = float(ultimo['VALOR IUS'])
             acuerdo = ultimo['ACUERDO'].strip().replace('Acuerdo ', 'Ac.')
             valor_fmt = f"{valor:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
             textos_datos.append(f"JUS {fecha.strftime('%d/%m/%Y')} {acuerdo}: $ {valor_fmt}")
@@ -80,16 +77,14 @@ def mostrar_ultimos_datos_universal():
     
     # ========== PISO SRT ==========
     try:
-        df_pisos = pd.read_csv("data/dataset_pisos.csv", encoding='utf-8')
-        df_pisos['fecha_inicio'] = pd.to_datetime(df_pisos['fecha_inicio'], format='%d/%m/%Y')
-        df_pisos['fecha_fin'] = pd.to_datetime(df_pisos['fecha_fin'], format='%d/%m/%Y', errors='coerce')
+        df_pisos = obtener_tabla('pisos')
         if not df_pisos.empty:
-            df_pisos = df_pisos.sort_values('fecha_inicio', ascending=False)
+            df_pisos = df_pisos.sort_values('desde', ascending=False)
             ultimo = df_pisos.iloc[0]
             norma = ultimo['norma']
-            desde = ultimo['fecha_inicio']
-            hasta = ultimo['fecha_fin']
-            monto = float(ultimo['monto_minimo'])
+            desde = ultimo['desde']
+            hasta = ultimo['hasta']
+            monto = float(ultimo['piso'])
             
             if pd.isna(hasta):
                 periodo = f"({desde.strftime('%d/%m/%Y')} - Vigente)"
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Métricas de tiempo de las ejecuciones de cada aplicación
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+main.ejecutar_aplicacion envuelve cada rerun de una aplicación en
+medir_ejecucion(); dentro de ella, el código que carga datasets, construye
+índices, calcula o arma reportes marca su tramo con medir_fase() o con el
+decorador @medido. Cada fase cuenta su tiempo exclusivo (una lectura de CSV
+dentro de la construcción de un índice se descuenta del índice) y lo que no
+cae en ninguna fase es la ejecución del módulo en sí.
+
+Fuera de una ejecución medida (servicio HTTP, lotes, benchmarks) las fases
+no hacen nada más que consultar una variable de contexto.
+
+Las ejecuciones se guardan por lotes en la tabla metricas_ejecucion de
+usuarios.db, junto a las tablas de auditoría.
+"""
+
+import atexit
+import functools
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .base_datos import PoolConexiones, obtener_pool
+
+# Fases medidas, en el orden en que se muestran
+FASES = ('modulo', 'datasets', 'indices', 'calculo', 'render')
+
+# Ejecuciones que se acumulan antes de escribir, y antigüedad máxima del lote
+TAMAÑO_LOTE = 50
+INTERVALO_ESCRITURA = 30.0
+
+PATH_USUARIOS = Path(__file__).resolve().parent.parent / "data" / "usuarios.db"
+
+
+class EjecucionMedida:
+    """Duraciones por fase de un rerun de una aplicación"""
+
+    def __init__(self, app: str, usuario: str):
+        self.app = app
+        self.usuario = usuario
+        self.version_datasets = ''
+        self.duraciones: Dict[str, float] = {fase: 0.0 for fase in FASES}
+        self.total = 0.0
+        # Fases abiertas: [fase, inicio del tramo actual]
+        self._pila: List[List[Any]] = []
+
+    def _abrir(self, fase: str) -> None:
+        ahora = time.perf_counter()
+        if self._pila:
+            # La fase exterior se pausa mientras corre la interior
+            exterior = self._pila[-1]
+            self.duraciones[exterior[0]] += ahora - exterior[1]
+        self._pila.append([fase, ahora])
+
+    def _cerrar(self) -> None:
+        ahora = time.perf_counter()
+        fase, inicio = self._pila.pop()
+        self.duraciones[fase] += ahora - inicio
+        if self._pila:
+            self._pila[-1][1] = ahora
+
+    def fila(self) -> Dict[str, Any]:
+        """Registro a guardar (duraciones en milisegundos)"""
+        fila = {
+            'fecha_hora': datetime.now().isoformat(timespec='seconds'),
+            'app': self.app,
+            'usuario': self.usuario,
+            'version_datasets': self.version_datasets,
+            'total_ms': round(self.total * 1000, 3)
+        }
+        for fase in FASES:
+            fila[f"{fase}_ms"] = round(self.duraciones[fase] * 1000, 3)
+        return fila
+
+
+_actual: ContextVar[Optional[EjecucionMedida]] = ContextVar('ejecucion_medida', default=None)
+
+
+@contextmanager
+def medir_fase(fase: str) -> Iterator[None]:
+    """
+    Cuenta el tiempo del bloque en una fase de la ejecución en curso.
+
+    Args:
+        fase: Una de FASES
+    """
+    ejecucion = _actual.get()
+    if ejecucion is None:
+        yield
+        return
+    ejecucion._abrir(fase)
+    try:
+        yield
+    finally:
+        ejecucion._cerrar()
+
+
+def medido(fase: str) -> Callable[[Callable], Callable]:
+    """Decorador: cada llamada a la función cuenta en `fase` de la ejecución en curso"""
+    def decorador(funcion: Callable) -> Callable:
+        @functools.wraps(funcion)
+        def envoltura(*args, **kwargs):
+            ejecucion = _actual.get()
+            if ejecucion is None:
+                return funcion(*args, **kwargs)
+            ejecucion._abrir(fase)
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                ejecucion._cerrar()
+        return envoltura
+    return decorador
+
+
+@contextmanager
+def medir_ejecucion(app: str, usuario: str) -> Iterator[EjecucionMedida]:
+    """
+    Mide un rerun completo de una aplicación y lo encola para guardarlo.
+
+    El tiempo del bloque que no cae en otra fase cuenta como 'modulo'.
+    Si la ejecución termina con una excepción también se registra (incluido
+    el st.rerun() o st.stop() de Streamlit, que se propagan como excepciones).
+
+    Args:
+        app: Clave de la aplicación en main.APLICACIONES
+        usuario: Usuario de la sesión
+    """
+    ejecucion = EjecucionMedida(app, usuario)
+    token = _actual.set(ejecucion)
+    inicio = time.perf_counter()
+    ejecucion._abrir('modulo')
+    try:
+        yield ejecucion
+    finally:
+        while ejecucion._pila:
+            ejecucion._cerrar()
+        ejecucion.total = time.perf_counter() - inicio
+        _actual.reset(token)
+        ejecucion.version_datasets = _version_datasets()
+        obtener_escritor().agregar(ejecucion.fila())
+
+
+def _version_datasets() -> str:
+    """Versión de los CSV actuales (solo un stat por archivo si no cambiaron)"""
+    # Import diferido: snapshot carga pandas y numpy
+    from .snapshot import clave_fuentes
+    try:
+        return clave_fuentes()[0][:16]
+    except FileNotFoundError:
+        return ''
+
+
+# ============================================
+# ALMACENAMIENTO
+# ============================================
+
+_COLUMNAS = ('fecha_hora', 'app', 'usuario', 'version_datasets', 'total_ms') + tuple(f"{f}_ms" for f in FASES)
+
+
+def crear_tabla(conn: sqlite3.Connection) -> None:
+    """Crea la tabla de métricas si no existe"""
+    conn.execute(f'''
+        CREATE TABLE IF NOT EXISTS metricas_ejecucion (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fecha_hora TEXT NOT NULL,
+            app TEXT NOT NULL,
+            usuario TEXT,
+            version_datasets TEXT,
+            total_ms REAL NOT NULL,
+            {', '.join(f"{fase}_ms REAL NOT NULL DEFAULT 0" for fase in FASES)}
+        )
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_metricas_fecha ON metricas_ejecucion (fecha_hora)')
+
+
+def _pool(db_path: Path) -> PoolConexiones:
+    """Pool de la base de usuarios (la tabla la crea la migración 1 de utils/auth.py)"""
+    # Import diferido: auth importa crear_tabla de este módulo
+    from .auth import MIGRACIONES
+    return obtener_pool(str(db_path), MIGRACIONES)
+
+
+class EscritorMetricas:
+    """
+    Acumula ejecuciones en memoria y las escribe en lote.
+
+    Se escribe en un hilo aparte cuando el lote llega a TAMAÑO_LOTE filas o
+    la más vieja supera INTERVALO_ESCRITURA segundos, y al terminar el proceso.
+    """
+
+    def __init__(self, db_path: Path = PATH_USUARIOS):
+        self.db_path = Path(db_path)
+        self._pendientes: List[Dict[str, Any]] = []
+        self._primera = 0.0
+        self._lock = threading.Lock()
+        self._escritura = threading.Lock()
+
+    def agregar(self, fila: Dict[str, Any]) -> None:
+        with self._lock:
+            if not self._pendientes:
+                self._primera = time.monotonic()
+            self._pendientes.append(fila)
+            vencido = (len(self._pendientes) >= TAMAÑO_LOTE
+                       or time.monotonic() - self._primera >= INTERVALO_ESCRITURA)
+        if vencido:
+            threading.Thread(target=self.vaciar, name='metricas', daemon=True).start()
+
+    def vaciar(self) -> int:
+        """
+        Escribe las ejecuciones pendientes.
+
+        Returns:
+            int: Cantidad de filas escritas
+        """
+        with self._escritura:
+            with self._lock:
+                filas, self._pendientes = self._pendientes, []
+            if not filas:
+                return 0
+            try:
+                with _pool(self.db_path).conexion() as conn:
+                    conn.executemany(
+                        f"INSERT INTO metricas_ejecucion ({', '.join(_COLUMNAS)}) "
+                        f"VALUES ({', '.join('?' for _ in _COLUMNAS)})",
+                        [tuple(f[c] for c in _COLUMNAS) for f in filas]
+                    )
+            except sqlite3.Error as e:
+                # Las métricas nunca interrumpen a la aplicación
+                print(f"[METRICAS] No se pudieron guardar {len(filas)} ejecuciones: {e}")
+                return 0
+            return len(filas)
+
+
+_escritor: Optional[EscritorMetricas] = None
+_escritor_lock = threading.Lock()
+
+
+def obtener_escritor() -> EscritorMetricas:
+    """Escritor de métricas del proceso (se vacía al terminar)"""
+    global _escritor
+    with _escritor_lock:
+        if _escritor is None:
+            _escritor = EscritorMetricas()
+            atexit.register(_escritor.vaciar)
+        return _escritor
+
+
+# ============================================
+# CONSULTA
+# ============================================
+
+def _percentil(ordenados: List[float], p: float) -> float:
+    """Percentil por rango más cercano de una lista ordenada"""
+    k = max(int(-(-p * len(ordenados) // 100)) - 1, 0)
+    return ordenados[k]
+
+
+def obtener_percentiles(horas: Optional[float] = 24, app: Optional[str] = None,
+                        db_path: Path = PATH_USUARIOS) -> List[Dict[str, Any]]:
+    """
+    p50/p95/p99 por aplicación y fase en una ventana de tiempo.
+
+    Args:
+        horas: Antigüedad máxima de las ejecuciones (None = todas)
+        app: Si se indica, solo esa aplicación
+        db_path: Base de usuarios donde están las métricas
+
+    Returns:
+        Lista de dicts con app, fase ('total' y cada una de FASES),
+        ejecuciones, p50_ms, p95_ms, p99_ms y max_ms
+    """
+    # Las pendientes se escriben antes de consultar
+    if _escritor is not None and _escritor.db_path == Path(db_path):
+        _escritor.vaciar()
+
+    condiciones, parametros = [], []
+    if horas is not None:
+        condiciones.append('fecha_hora >= ?')
+        parametros.append((datetime.now() - timedelta(hours=horas)).isoformat(timespec='seconds'))
+    if app:
+        condiciones.append('app = ?')
+        parametros.append(app)
+    where = f"WHERE {' AND '.join(condiciones)}" if condiciones else ''
+
+    fases = ('total',) + FASES
+    with _pool(db_path).conexion() as conn:
+        filas = conn.execute(
+            f"SELECT app, {', '.join(f'{f}_ms' for f in fases)} FROM metricas_ejecucion {where}",
+            parametros
+        ).fetchall()
+
+    por_app: Dict[str, List[tuple]] = {}
+    for fila in filas:
+        por_app.setdefault(fila[0], []).append(fila[1:])
+
+    resultado = []
+    for nombre in sorted(por_app):
+        ejecuciones = por_app[nombre]
+        for i, fase in enumerate(fases):
+            valores = sorted(e[i] for e in ejecuciones)
+            resultado.append({
+                'app': nombre,
+                'fase': fase,
+                'ejecuciones': len(valores),
+                'p50_ms': _percentil(valores, 50),
+                'p95_ms': _percentil(valores, 95),
+                'p99_ms': _percentil(valores, 99),
+                'max_ms': valores[-1]
+            })
+    return resultado
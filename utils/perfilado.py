@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Perfilado bajo demanda de ejecuciones de las aplicaciones
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Desde Administración un superadmin arma el perfilado de las próximas N
+ejecuciones de una aplicación (o de un usuario). main.ejecutar_aplicacion
+envuelve cada rerun en perfilar_ejecucion(): si hay un armado que coincide,
+la ejecución corre bajo cProfile y las estadísticas se guardan comprimidas en
+la tabla perfiles_ejecucion de usuarios.db.
+
+Los armados viven en memoria del proceso (el de Streamlit, donde corren
+tanto Administración como las aplicaciones): sin armados, cada ejecución
+solo evalúa una lista vacía.
+"""
+
+import cProfile
+import io
+import marshal
+import pstats
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from .base_datos import PoolConexiones, obtener_pool
+
+PATH_USUARIOS = Path(__file__).resolve().parent.parent / "data" / "usuarios.db"
+
+# Columnas de pstats por las que se puede ordenar la tabla de funciones
+ORDENES = ('cumulative', 'tottime', 'ncalls')
+
+
+@dataclass
+class Armado:
+    """Perfilado pendiente de las próximas ejecuciones que coinciden"""
+    id: int
+    app: Optional[str]
+    usuario: Optional[str]
+    restantes: int
+    armado_por: str
+    fecha_hora: str
+
+    def coincide(self, app: str, usuario: str) -> bool:
+        return (self.app is None or self.app == app) and (self.usuario is None or self.usuario == usuario)
+
+
+_armados: List[Armado] = []
+_armados_lock = threading.Lock()
+_proximo_id = 1
+
+
+def armar_perfilado(ejecuciones: int, armado_por: str, app: Optional[str] = None,
+                    usuario: Optional[str] = None) -> Armado:
+    """
+    Arma el perfilado de las próximas ejecuciones de una aplicación o usuario.
+
+    Args:
+        ejecuciones: Cantidad de ejecuciones a perfilar
+        armado_por: Usuario que lo arma
+        app: Clave de la aplicación (None = cualquiera)
+        usuario: Usuario cuyas ejecuciones se perfilan (None = cualquiera)
+
+    Returns:
+        El armado registrado
+
+    Raises:
+        ValueError: Si ejecuciones no es positivo
+    """
+    global _proximo_id
+    if ejecuciones < 1:
+        raise ValueError("La cantidad de ejecuciones debe ser al menos 1")
+    with _armados_lock:
+        armado = Armado(_proximo_id, app or None, usuario or None, int(ejecuciones),
+                        armado_por, datetime.now().isoformat(timespec='seconds'))
+        _proximo_id += 1
+        _armados.append(armado)
+    return armado
+
+
+def desarmar_perfilado(armado_id: Optional[int] = None) -> int:
+    """
+    Cancela un armado (o todos).
+
+    Returns:
+        int: Cantidad de armados cancelados
+    """
+    with _armados_lock:
+        antes = len(_armados)
+        _armados[:] = [a for a in _armados if armado_id is not None and a.id != armado_id]
+        return antes - len(_armados)
+
+
+def perfilados_armados() -> List[Armado]:
+    """Armados pendientes (copia)"""
+    with _armados_lock:
+        return [Armado(**vars(a)) for a in _armados]
+
+
+def _tomar_armado(app: str, usuario: str) -> Optional[Armado]:
+    """Descuenta una ejecución del primer armado que coincide"""
+    with _armados_lock:
+        for armado in _armados:
+            if armado.coincide(app, usuario):
+                armado.restantes -= 1
+                if armado.restantes <= 0:
+                    _armados.remove(armado)
+                return armado
+    return None
+
+
+@contextmanager
+def perfilar_ejecucion(app: str, usuario: str) -> Iterator[None]:
+    """
+    Perfila el bloque con cProfile si hay un armado para esta app/usuario.
+
+    Args:
+        app: Clave de la aplicación en main.APLICACIONES
+        usuario: Usuario de la sesión
+    """
+    if not _armados:
+        yield
+        return
+    armado = _tomar_armado(app, usuario)
+    if armado is None:
+        yield
+        return
+
+    perfil = cProfile.Profile()
+    inicio = time.perf_counter()
+    perfil.enable()
+    try:
+        yield
+    finally:
+        perfil.disable()
+        duracion_ms = (time.perf_counter() - inicio) * 1000
+        try:
+            guardar_perfil(perfil, app, usuario, duracion_ms, armado.armado_por)
+        except sqlite3.Error as e:
+            # El perfilado nunca interrumpe a la aplicación
+            print(f"[PERFILADO] No se pudo guardar el perfil de {app}: {e}")
+
+
+# ============================================
+# ALMACENAMIENTO
+# ============================================
+
+def crear_tabla(conn: sqlite3.Connection) -> None:
+    """Crea la tabla de perfiles si no existe"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS perfiles_ejecucion (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fecha_hora TEXT NOT NULL,
+            app TEXT NOT NULL,
+            usuario TEXT,
+            armado_por TEXT,
+            duracion_ms REAL NOT NULL,
+            funciones INTEGER NOT NULL,
+            bytes_perfil INTEGER NOT NULL,
+            estadisticas BLOB NOT NULL
+        )
+    ''')
+
+
+def _pool(db_path: Path) -> PoolConexiones:
+    """Pool de la base de usuarios (la tabla la crea la migración 1 de utils/auth.py)"""
+    # Import diferido: auth importa crear_tabla de este módulo
+    from .auth import MIGRACIONES
+    return obtener_pool(str(db_path), MIGRACIONES)
+
+
+def guardar_perfil(perfil: cProfile.Profile, app: str, usuario: str, duracion_ms: float,
+                   armado_por: str = '', db_path: Path = PATH_USUARIOS) -> int:
+    """
+    Guarda las estadísticas de un perfil (formato .prof comprimido con zlib).
+
+    Returns:
+        int: id del perfil guardado
+    """
+    perfil.create_stats()
+    # Mismo contenido que escribe pstats.Stats.dump_stats (archivo .prof)
+    datos = marshal.dumps(perfil.stats)
+    with _pool(db_path).conexion() as conn:
+        cursor = conn.execute('''
+            INSERT INTO perfiles_ejecucion
+                (fecha_hora, app, usuario, armado_por, duracion_ms, funciones, bytes_perfil, estadisticas)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (datetime.now().isoformat(timespec='seconds'), app, usuario, armado_por,
+              round(duracion_ms, 3), len(perfil.stats), len(datos), zlib.compress(datos, 6)))
+    return cursor.lastrowid
+
+
+def listar_perfiles(limit: int = 100, db_path: Path = PATH_USUARIOS) -> List[Dict[str, Any]]:
+    """Perfiles guardados, del más reciente al más antiguo (sin las estadísticas)"""
+    with _pool(db_path).conexion() as conn:
+        filas = conn.execute('''
+            SELECT id, fecha_hora, app, usuario, armado_por, duracion_ms, funciones,
+                   bytes_perfil, length(estadisticas)
+            FROM perfiles_ejecucion
+            ORDER BY id DESC
+            LIMIT ?
+        ''', (limit,)).fetchall()
+    claves = ('id', 'fecha_hora', 'app', 'usuario', 'armado_por', 'duracion_ms', 'funciones',
+              'bytes_perfil', 'bytes_guardados')
+    return [dict(zip(claves, fila)) for fila in filas]
+
+
+def obtener_perfil_prof(perfil_id: int, db_path: Path = PATH_USUARIOS) -> Optional[bytes]:
+    """
+    Contenido del archivo .prof de un perfil (se abre con pstats, snakeviz, etc.).
+
+    Returns:
+        bytes, o None si el perfil no existe
+    """
+    with _pool(db_path).conexion() as conn:
+        fila = conn.execute('SELECT estadisticas FROM perfiles_ejecucion WHERE id = ?', (perfil_id,)).fetchone()
+    return zlib.decompress(fila[0]) if fila else None
+
+
+def eliminar_perfil(perfil_id: int, db_path: Path = PATH_USUARIOS) -> bool:
+    """Borra un perfil guardado"""
+    with _pool(db_path).conexion() as conn:
+        cursor = conn.execute('DELETE FROM perfiles_ejecucion WHERE id = ?', (perfil_id,))
+    return cursor.rowcount > 0
+
+
+class _EstadisticasGuardadas:
+    """Adaptador para que pstats.Stats cargue estadísticas ya deserializadas"""
+
+    def __init__(self, stats: dict):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+def tabla_perfil(perfil_id: int, orden: str = 'cumulative', top: int = 30,
+                 db_path: Path = PATH_USUARIOS) -> List[Dict[str, Any]]:
+    """
+    Funciones más costosas de un perfil.
+
+    Args:
+        perfil_id: id del perfil guardado
+        orden: 'cumulative' (tiempo acumulado), 'tottime' (tiempo propio) o 'ncalls'
+        top: Cantidad de funciones
+
+    Returns:
+        Lista de dicts con funcion, ubicacion, llamadas, llamadas_primitivas,
+        tottime_ms, cumtime_ms y percall_ms (acumulado por llamada)
+
+    Raises:
+        ValueError: Si el orden no es válido
+    """
+    if orden not in ORDENES:
+        raise ValueError(f"Orden '{orden}' no válido. Opciones: {list(ORDENES)}")
+    datos = obtener_perfil_prof(perfil_id, db_path)
+    if datos is None:
+        return []
+
+    stats = pstats.Stats(_EstadisticasGuardadas(marshal.loads(datos)), stream=io.StringIO())
+    stats.sort_stats(orden)
+
+    filas = []
+    for archivo, linea, funcion in stats.fcn_list[:top]:
+        primitivas, llamadas, tottime, cumtime, _ = stats.stats[(archivo, linea, funcion)]
+        filas.append({
+            'funcion': funcion,
+            'ubicacion': f"{archivo}:{linea}" if linea else archivo,
+            'llamadas': llamadas,
+            'llamadas_primitivas': primitivas,
+            'tottime_ms': tottime * 1000,
+            'cumtime_ms': cumtime * 1000,
+            'percall_ms': cumtime * 1000 / primitivas if primitivas else 0.0
+        })
+    return filas
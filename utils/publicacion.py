@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Publicación atómica de datasets
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Las escrituras nunca se hacen sobre el CSV en uso: cada versión nueva se
+escribe completa en data/versiones/, se sincroniza a disco y recién entonces
+reemplaza al CSV vigente con un rename atómico (os.replace). Los lectores
+leen el archivo entero de una vez (leer_bytes) y trabajan sobre esa copia,
+así que siempre ven una versión completa, la misma de principio a fin, y no
+bloquean a los escritores. Las versiones viejas se borran pasado un período
+de gracia.
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Rutas base
+BASE_DIR = Path(__file__).parent.parent
+DATA_DIR = BASE_DIR / 'data'
+DIR_VERSIONES = DATA_DIR / 'versiones'
+
+# Las versiones anteriores se conservan al menos este tiempo...
+GRACIA_VERSIONES = 7 * 24 * 3600
+# ...y siempre quedan por lo menos las últimas
+MINIMO_VERSIONES = 3
+
+# Temporales huérfanos (escritor interrumpido) que se pueden borrar
+GRACIA_TEMPORALES = 3600
+
+# Reintentos de os.replace: en Windows falla mientras otro proceso tiene el archivo abierto
+REINTENTOS_REEMPLAZO = 8
+
+_locks_escritura: Dict[str, threading.Lock] = {}
+_locks_lock = threading.Lock()
+
+
+def _lock_escritura(ruta: Path) -> threading.Lock:
+    """Lock por archivo: las publicaciones de un mismo dataset se serializan"""
+    with _locks_lock:
+        return _locks_escritura.setdefault(os.path.abspath(str(ruta)), threading.Lock())
+
+
+def leer_bytes(ruta: Path) -> bytes:
+    """
+    Lee un archivo completo de una sola vez.
+
+    El contenido devuelto corresponde a una única versión del archivo (el
+    reemplazo es atómico) y el archivo queda abierto el menor tiempo posible.
+
+    Args:
+        ruta: Archivo a leer
+
+    Returns:
+        bytes con el contenido
+    """
+    with open(ruta, 'rb') as f:
+        return f.read()
+
+
+def _sincronizar_directorio(directorio: Path) -> None:
+    """Persiste en disco el rename (POSIX; en Windows no se puede abrir un directorio)"""
+    if os.name == 'nt':
+        return
+    fd = os.open(directorio, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def reemplazar_atomico(origen: Path, destino: Path) -> None:
+    """
+    Reemplaza destino por origen con un rename atómico.
+
+    Args:
+        origen: Archivo ya escrito y sincronizado
+        destino: Archivo a reemplazar
+
+    Raises:
+        PermissionError: Si el archivo sigue bloqueado después de los reintentos
+    """
+    espera = 0.05
+    for intento in range(REINTENTOS_REEMPLAZO):
+        try:
+            os.replace(origen, destino)
+            break
+        except PermissionError:
+            if intento == REINTENTOS_REEMPLAZO - 1:
+                raise
+            time.sleep(espera)
+            espera *= 2
+    _sincronizar_directorio(destino.parent)
+
+
+def escribir_atomico(ruta: Path, contenido: bytes) -> None:
+    """
+    Escribe un archivo sin que ningún lector pueda ver una escritura a medias.
+
+    Args:
+        ruta: Archivo de destino
+        contenido: Contenido completo
+    """
+    ruta = Path(ruta)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    temporal = ruta.with_name(f".{ruta.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temporal, 'wb') as f:
+            f.write(contenido)
+            f.flush()
+            os.fsync(f.fileno())
+        reemplazar_atomico(temporal, ruta)
+    finally:
+        if temporal.exists():
+            temporal.unlink()
+
+
+def versiones_dataset(nombre: str) -> List[Path]:
+    """
+    Versiones publicadas de un dataset, de la más nueva a la más vieja.
+
+    Args:
+        nombre: Clave del dataset
+
+    Returns:
+        Lista de rutas en data/versiones/
+    """
+    from .esquemas import ESQUEMAS
+    ruta = ESQUEMAS[nombre].ruta
+    if not DIR_VERSIONES.exists():
+        return []
+    # El sello de tiempo del nombre ordena cronológicamente
+    return sorted(DIR_VERSIONES.glob(f"{ruta.stem}.*{ruta.suffix}"), reverse=True)
+
+
+def limpiar_versiones(gracia: float = GRACIA_VERSIONES, minimo: int = MINIMO_VERSIONES) -> int:
+    """
+    Borra las versiones viejas y los temporales huérfanos.
+
+    Args:
+        gracia: Segundos que se conserva cada versión
+        minimo: Versiones más recientes de cada dataset que nunca se borran
+
+    Returns:
+        int: Cantidad de archivos borrados
+    """
+    from .esquemas import ESQUEMAS
+    ahora = time.time()
+    borrados = 0
+
+    for nombre in ESQUEMAS:
+        for ruta in versiones_dataset(nombre)[minimo:]:
+            try:
+                if ahora - ruta.stat().st_mtime > gracia:
+                    ruta.unlink()
+                    borrados += 1
+            except OSError:
+                continue
+
+    for directorio in (DATA_DIR, DIR_VERSIONES):
+        if not directorio.exists():
+            continue
+        for temporal in directorio.glob('.*.tmp'):
+            try:
+                if ahora - temporal.stat().st_mtime > GRACIA_TEMPORALES:
+                    temporal.unlink()
+                    borrados += 1
+            except OSError:
+                continue
+
+    return borrados
+
+
+def publicar_dataset(nombre: str, df: 'pd.DataFrame', origen: str = 'editor') -> Path:
+    """
+    Publica una nueva versión de un dataset.
+
+    La versión se escribe completa en data/versiones/, se sincroniza a disco
+    y luego reemplaza atómicamente al CSV vigente. Al terminar se avisa el
+    cambio (ver utils/eventos.py) y se borran las versiones vencidas.
+
+    Args:
+        nombre: Clave del dataset ('jus', 'ipc', 'pisos', 'ripte', 'tasa')
+        df: Contenido completo del dataset
+        origen: Quién publica (se informa en el evento)
+
+    Returns:
+        Path de la versión publicada en data/versiones/
+    """
+    # Imports diferidos: esquemas usa leer_bytes de este módulo
+    from .esquemas import ESQUEMAS
+    from .eventos import publicar_cambio_dataset
+
+    ruta = ESQUEMAS[nombre].ruta
+    contenido = df.to_csv(index=False).encode('utf-8')
+
+    with _lock_escritura(ruta):
+        sello = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+        version = DIR_VERSIONES / f"{ruta.stem}.{sello}{ruta.suffix}"
+        escribir_atomico(version, contenido)
+        try:
+            escribir_atomico(ruta, contenido)
+        except Exception:
+            # El CSV vigente no cambió: la versión no llegó a publicarse
+            version.unlink(missing_ok=True)
+            raise
+
+    publicar_cambio_dataset(nombre, origen)
+
+    try:
+        limpiar_versiones()
+    except Exception as e:
+        print(f"[DATASETS] No se pudieron limpiar las versiones viejas: {type(e).__name__}: {e}")
+
+    return version
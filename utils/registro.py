@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Registro de datasets e índices compartido por todo el proceso
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Streamlit ejecuta todas las sesiones en el mismo proceso: las tablas, los
+índices y los gestores de datos se construyen una sola vez por versión de
+los CSV y se comparten entre todas las sesiones y aplicaciones. Los objetos
+registrados se tratan como inmutables; quien necesite modificar una tabla
+debe trabajar sobre una copia.
+"""
+
+import mmap
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .metricas import medir_fase
+
+Rutas = Union[Path, Sequence[Path]]
+
+
+def _version_archivo(ruta: Path) -> Tuple[int, int]:
+    """Versión de un archivo: (mtime en ns, tamaño en bytes)"""
+    stat = ruta.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _normalizar_rutas(rutas: Rutas) -> Tuple[str, ...]:
+    """Rutas absolutas de uno o varios archivos, como tupla de strings"""
+    if isinstance(rutas, (str, Path)):
+        rutas = (rutas,)
+    return tuple(os.path.abspath(str(r)) for r in rutas)
+
+
+def _version_rutas(rutas: Tuple[str, ...]) -> tuple:
+    """Versión de uno o varios archivos (los faltantes cuentan como None)"""
+    return tuple(
+        _version_archivo(Path(r)) if os.path.exists(r) else None
+        for r in rutas
+    )
+
+
+def _es_mapeado(arreglo: np.ndarray) -> bool:
+    """True si el arreglo se apoya sobre un mmap (páginas compartidas con el snapshot)"""
+    base = arreglo.base
+    while base is not None:
+        if isinstance(base, mmap.mmap):
+            return True
+        if isinstance(base, memoryview):
+            return isinstance(base.obj, mmap.mmap)
+        base = getattr(base, 'base', None)
+    return False
+
+
+def _medir(objeto: Any, vistos: set, profundidad: int = 0) -> Tuple[int, int]:
+    """
+    Estima la memoria de un objeto registrado.
+
+    Returns:
+        (bytes propios del proceso, bytes mapeados desde el snapshot)
+    """
+    if id(objeto) in vistos or profundidad > 3:
+        return 0, 0
+    vistos.add(id(objeto))
+
+    if isinstance(objeto, np.ndarray):
+        return (0, objeto.nbytes) if _es_mapeado(objeto) else (objeto.nbytes, 0)
+
+    # Si hay un DataFrame registrado, pandas ya está importado
+    pd = sys.modules.get('pandas')
+    if pd is not None and isinstance(objeto, pd.DataFrame):
+        propios, mapeados = int(objeto.index.memory_usage(deep=True)), 0
+        for col in objeto.columns:
+            valores = objeto[col].values
+            if isinstance(valores, np.ndarray) and _es_mapeado(valores):
+                mapeados += valores.nbytes
+            else:
+                propios += int(objeto[col].memory_usage(index=False, deep=True))
+        return propios, mapeados
+
+    if isinstance(objeto, (list, tuple)):
+        propios, mapeados = sys.getsizeof(objeto), 0
+        for item in objeto:
+            p, m = _medir(item, vistos, profundidad + 1)
+            propios, mapeados = propios + p, mapeados + m
+        return propios, mapeados
+
+    if isinstance(objeto, dict):
+        propios, mapeados = sys.getsizeof(objeto), 0
+        for valor in objeto.values():
+            p, m = _medir(valor, vistos, profundidad + 1)
+            propios, mapeados = propios + p, mapeados + m
+        return propios, mapeados
+
+    if hasattr(objeto, '__dict__'):
+        propios, mapeados = sys.getsizeof(objeto), 0
+        for valor in vars(objeto).values():
+            p, m = _medir(valor, vistos, profundidad + 1)
+            propios, mapeados = propios + p, mapeados + m
+        return propios, mapeados
+
+    return sys.getsizeof(objeto), 0
+
+
+class RegistroDatasets:
+    """
+    Registro thread-safe de objetos derivados de los CSV de data/.
+
+    Cada entrada se identifica por (tipo, rutas, variante) y guarda la versión
+    de los archivos con la que se construyó; si algún archivo cambia, la
+    entrada se reconstruye en el siguiente acceso.
+    """
+
+    def __init__(self):
+        self._entradas: Dict[tuple, Tuple[tuple, Any]] = {}
+        # Reentrante: un constructor puede pedir otras entradas (p. ej. el
+        # gestor de la calculadora LRT pide tablas e índices)
+        self._lock = threading.RLock()
+
+    def obtener(self, tipo: str, rutas: Rutas, variante: Any, constructor: Callable[[Any], Any]) -> Any:
+        """
+        Devuelve el objeto registrado para la versión actual de los archivos.
+
+        Args:
+            tipo: Nombre de la entrada ('tasa', 'tabla:ripte', 'lrt', ...)
+            rutas: Archivo o archivos de origen
+            variante: Parámetros de construcción que distinguen entradas
+            constructor: Función que construye el objeto a partir de las rutas
+
+        Returns:
+            El objeto construido (o reutilizado)
+        """
+        clave = (tipo, _normalizar_rutas(rutas), variante)
+        version = _version_rutas(clave[1])
+        with self._lock:
+            registrado = self._entradas.get(clave)
+            if registrado is not None and registrado[0] == version:
+                return registrado[1]
+            # Tablas: carga de datasets; el resto: construcción de índices
+            with medir_fase('datasets' if tipo.startswith('tabla:') else 'indices'):
+                objeto = constructor(rutas)
+            # Se reemplaza la versión anterior de la misma entrada
+            self._entradas[clave] = (version, objeto)
+        return objeto
+
+    def invalidar(self, tipo: Optional[str] = None, ruta: Optional[Path] = None) -> int:
+        """
+        Descarta entradas del registro para forzar su reconstrucción.
+
+        Args:
+            tipo: Si se indica, solo las entradas de ese tipo (o las tablas
+                'tabla:<tipo>')
+            ruta: Si se indica, solo las entradas construidas a partir de ese
+                archivo (incluye las que dependen de varios, como el gestor LRT)
+
+        Returns:
+            int: Cantidad de entradas descartadas (todas si no se indica filtro)
+        """
+        ruta_abs = os.path.abspath(str(ruta)) if ruta is not None else None
+        with self._lock:
+            claves = [
+                c for c in self._entradas
+                if (tipo is None or c[0] in (tipo, f"tabla:{tipo}"))
+                and (ruta_abs is None or ruta_abs in c[1])
+            ]
+            for clave in claves:
+                del self._entradas[clave]
+        return len(claves)
+
+    def entradas(self) -> List[Dict[str, Any]]:
+        """
+        Detalle de las entradas registradas con su memoria estimada.
+
+        Returns:
+            Lista de dicts con tipo, variante, version, bytes y bytes_mapeados
+        """
+        with self._lock:
+            items = list(self._entradas.items())
+
+        # Los objetos compartidos entre entradas (p. ej. una tabla dentro del
+        # gestor LRT) se cuentan una sola vez
+        vistos: set = set()
+        detalle = []
+        for (tipo, rutas, variante), (version, objeto) in items:
+            propios, mapeados = _medir(objeto, vistos)
+            detalle.append({
+                'tipo': tipo,
+                'rutas': rutas,
+                'variante': variante,
+                'version': version,
+                'bytes': propios,
+                'bytes_mapeados': mapeados
+            })
+        return detalle
+
+    def memoria(self) -> Dict[str, int]:
+        """
+        Memoria estimada del registro.
+
+        Returns:
+            Dict con 'entradas', 'bytes' (memoria propia del proceso) y
+            'bytes_mapeados' (páginas del snapshot, compartidas con el SO)
+        """
+        detalle = self.entradas()
+        return {
+            'entradas': len(detalle),
+            'bytes': sum(d['bytes'] for d in detalle),
+            'bytes_mapeados': sum(d['bytes_mapeados'] for d in detalle)
+        }
+
+
+# Único registro del proceso
+REGISTRO = RegistroDatasets()
+
+
+def obtener_registro() -> RegistroDatasets:
+    """Devuelve el registro de datasets compartido por todo el proceso"""
+    return REGISTRO
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Reportes PDF de las calculadoras
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Generadores de PDF (reportlab) de la liquidación por despido y del IBM.
+Están fuera de las páginas para poder usarlos y medirlos sin Streamlit; el
+motor de cálculo no los importa, así que reportlab solo se carga al generar
+un reporte.
+"""
+
+from decimal import Decimal
+from io import BytesIO
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import cm
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
+
+from motor.ibm import formatear_moneda, formatear_porcentaje
+from .funciones_comunes import formato_moneda
+from .metricas import medido
+
+
+# Función para generar PDF
+@medido('render')
+def generar_pdf_despidos(datos_calculo, datos_actualizacion):
+    """Genera el PDF de la liquidación por despido (datos_calculo y datos_actualizacion como en session_state)"""
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=2*cm, leftMargin=2*cm, 
+                           topMargin=2*cm, bottomMargin=2*cm)
+    
+    elements = []
+    styles = getSampleStyleSheet()
+    
+    # Título
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=16,
+        textColor=colors.HexColor('#2E86AB'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    
+    elements.append(Paragraph("LIQUIDACIÓN DE INDEMNIZACIÓN POR DESPIDO", title_style))
+    
+    # Expediente y carátula si están disponibles
+    if datos_calculo.get('nro_expediente') or datos_calculo.get('caratula'):
+        expediente_style = ParagraphStyle(
+            'Expediente',
+            parent=styles['Normal'],
+            fontSize=11,
+            textColor=colors.HexColor('#666666'),
+            spaceAfter=10,
+            alignment=TA_CENTER
+        )
+        
+        if datos_calculo.get('nro_expediente'):
+            elements.append(Paragraph(f"<b>Expediente Nro:</b> {datos_calculo['nro_expediente']}", expediente_style))
+        
+        if datos_calculo.get('caratula'):
+            elements.append(Paragraph(f"<b>Carátula:</b> {datos_calculo['caratula']}", expediente_style))
+    
+    elements.append(Spacer(1, 0.5*cm))
+    
+    # Datos del trabajador
+    data_trabajador = [
+        ['Fecha de Ingreso:', datos_calculo['fecha_ingreso']],
+        ['Fecha de Despido:', datos_calculo['fecha_despido']],
+        ['Antigüedad:', f"{datos_calculo['años']} años"],
+        ['Salario Mensual Bruto:', formato_moneda(datos_calculo['salario'])],
+        ['Preaviso:', datos_calculo['preaviso']],
+    ]
+    
+    t1 = Table(data_trabajador, colWidths=[6*cm, 8*cm])
+    t1.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#E8F5E8')),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ]))
+    
+    elements.append(t1)
+    elements.append(Spacer(1, 0.7*cm))
+    
+    # Conceptos
+    elements.append(Paragraph("DETALLE DE CONCEPTOS", styles['Heading2']))
+    elements.append(Spacer(1, 0.3*cm))
+    
+    data_conceptos = [
+        ['Concepto', 'Importe'],
+        ['Antigüedad Art. 245', formato_moneda(datos_calculo['antiguedad_245'])],
+    ]
+    
+    if datos_calculo.get('sustitutiva_preaviso', 0) > 0:
+        data_conceptos.append(['Sustitutiva de Preaviso', formato_moneda(datos_calculo['sustitutiva_preaviso'])])
+        data_conceptos.append(['SAC Preaviso', formato_moneda(datos_calculo['sac_preaviso'])])
+    
+    data_conceptos.extend([
+        ['Días trabajados del Mes', formato_moneda(datos_calculo['dias_trabajados'])],
+        ['Integración mes de Despido', formato_moneda(datos_calculo['integracion_mes'])],
+        ['SAC Integración mes', formato_moneda(datos_calculo['sac_integracion'])],
+        ['SAC Proporcional', formato_moneda(datos_calculo['sac_proporcional'])],
+        ['Vacaciones no Gozadas', formato_moneda(datos_calculo['vacaciones'])],
+        ['SAC Vacaciones', formato_moneda(datos_calculo['sac_vacaciones'])],
+    ])
+    
+    # Agregar otros conceptos si existe
+    if datos_calculo.get('otros_conceptos', 0) > 0:
+        data_conceptos.append(['Otros Conceptos', formato_moneda(datos_calculo['otros_conceptos'])])
+    
+    t2 = Table(data_conceptos, colWidths=[10*cm, 4*cm])
+    t2.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E86AB')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ]))
+    
+    elements.append(t2)
+    elements.append(Spacer(1, 0.5*cm))
+    
+    # Total - usar total_final si existe, sino usar total
+    total_a_mostrar = datos_calculo.get('total_final', datos_calculo['total'])
+    data_total = [
+        ['INDEMNIZACIÓN TOTAL', formato_moneda(total_a_mostrar)]
+    ]
+    
+    t3 = Table(data_total, colWidths=[10*cm, 4*cm])
+    t3.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#F18F01')),
+        ('TEXTCOLOR', (0, 0), (-1, -1), colors.whitesmoke),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ]))
+    
+    elements.append(t3)
+    elements.append(Spacer(1, 0.7*cm))
+    
+    # Actualizaciones
+    elements.append(Paragraph("ACTUALIZACIONES", styles['Heading2']))
+    elements.append(Spacer(1, 0.3*cm))
+    
+    data_act = [
+        ['Método', 'Monto Actualizado'],
+        ['Actualización RIPTE + 3%', formato_moneda(datos_actualizacion['ripte'])],
+        ['Actualización Tasa Activa', formato_moneda(datos_actualizacion['tasa'])],
+    ]
+    
+    t4 = Table(data_act, colWidths=[10*cm, 4*cm])
+    t4.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#28a745')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+        ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ]))
+    
+    elements.append(t4)
+    elements.append(Spacer(1, 0.5*cm))
+    
+    # Nota
+    nota_style = ParagraphStyle(
+        'Note',
+        parent=styles['Normal'],
+        fontSize=8,
+        textColor=colors.grey,
+        alignment=TA_CENTER
+    )
+    elements.append(Paragraph("Nota: Los resultados indicados son aproximados.", nota_style))
+    
+    doc.build(elements)
+    buffer.seek(0)
+    return buffer
+
+
+# Función para generar el PDF del IBM
+@medido('render')
+def generar_pdf_ibm(datos, fecha_pmi, ibm):
+    """Genera PDF con el cálculo del IBM"""
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=2*cm, leftMargin=2*cm,
+                           topMargin=2*cm, bottomMargin=2*cm)
+    
+    elementos = []
+    styles = getSampleStyleSheet()
+    
+    # Título
+    titulo_style = ParagraphStyle(
+        'TituloCustom',
+        parent=styles['Title'],
+        fontSize=16,
+        textColor=colors.HexColor('#1f4788'),
+        spaceAfter=10,
+        alignment=TA_CENTER
+    )
+    
+    subtitulo_style = ParagraphStyle(
+        'SubtituloCustom',
+        parent=styles['Normal'],
+        fontSize=12,
+        textColor=colors.grey,
+        spaceAfter=20,
+        alignment=TA_CENTER
+    )
+    
+    elementos.append(Paragraph("CÁLCULO DEL INGRESO BASE MENSUAL (IBM)", titulo_style))
+    elementos.append(Paragraph("Ley 24.557 - Art. 12 Inc. 1", subtitulo_style))
+    elementos.append(Spacer(1, 0.5*cm))
+    
+    # Fecha PMI
+    elementos.append(Paragraph(f"<b>Fecha PMI:</b> {fecha_pmi.strftime('%d/%m/%Y')}", styles['Normal']))
+    elementos.append(Spacer(1, 0.5*cm))
+    
+    # Tabla de datos
+    data_tabla = [
+        ['Período', 'Salario', 'RIPTE', 'Variación', 'Actualizado', 'Días']
+    ]
+    
+    total_orig = Decimal('0')
+    total_act = Decimal('0')
+    total_dias = 0
+    meses_datos = 0
+    
+    for d in datos:
+        if d['incluir'] and d['salario'] > 0:
+            total_orig += Decimal(str(d['salario']))
+            total_act += Decimal(str(d['salario_act']))
+            total_dias += d['dias']
+            meses_datos += 1
+            
+            var_texto = formatear_porcentaje(d['variacion']) if d['variacion'] else "N/A"
+            
+            data_tabla.append([
+                d['periodo'],
+                formatear_moneda(d['salario']),
+                f"{d['ripte']:.2f}" if d['ripte'] else "N/A",
+                var_texto,
+                formatear_moneda(d['salario_act']),
+                str(d['dias'])
+            ])
+    
+    # Fila de totales
+    data_tabla.append([
+        'TOTALES',
+        formatear_moneda(total_orig),
+        '',
+        '',
+        formatear_moneda(total_act),
+        str(total_dias)
+    ])
+    
+    tabla = Table(data_tabla, colWidths=[3*cm, 3*cm, 2*cm, 2.5*cm, 3*cm, 1.5*cm])
+    tabla.setStyle(TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f4788')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, -1), (-1, -1), colors.lightgrey),
+        ('FONTNAME', (0, -1), (-1, -1), 'Helvetica-Bold'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+        ('FONTSIZE', (0, 1), (-1, -1), 9),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -2), [colors.white, colors.HexColor('#f0f0f0')]),
+    ]))
+    
+    elementos.append(tabla)
+    elementos.append(Spacer(1, 0.5*cm))
+    
+    # Resultado IBM
+    resultado_style = ParagraphStyle(
+        'ResultadoCustom',
+        parent=styles['Normal'],
+        fontSize=14,
+        textColor=colors.HexColor('#1f4788'),
+        spaceAfter=10,
+        alignment=TA_CENTER,
+        fontName='Helvetica-Bold'
+    )
+    
+    elementos.append(Paragraph(f"<b>Meses con datos:</b> {meses_datos}", styles['Normal']))
+    elementos.append(Spacer(1, 0.3*cm))
+    elementos.append(Paragraph(f"INGRESO BASE MENSUAL (IBM): {formatear_moneda(ibm)}", resultado_style))
+    elementos.append(Paragraph(
+        f"Fórmula: {formatear_moneda(total_act)} / {meses_datos} = {formatear_moneda(ibm)}",
+        styles['Normal']
+    ))
+    
+    doc.build(elementos)
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Retención de la auditoría de usuarios.db
+Sistema de Cálculos y Herramientas - Tribunal de Trabajo 2 de Quilmes
+
+Los registros de auditoria_logins y auditoria_acciones más antiguos que la
+retención (RETENCION_DIAS, redondeada al inicio del mes) salen de la base
+viva:
+
+- sus conteos se suman a las tablas resumen_mensual_logins y
+  resumen_mensual_acciones, que AuthSystem.resumen_logins/resumen_acciones
+  combinan con el detalle vivo, así los totales de los reportes no cambian;
+- el detalle se mueve a un archivo por año, data/archivo/auditoria_AAAA.db,
+  con las mismas tablas, que los reportes consultan bajo demanda
+  (parámetro archivo= de obtener_reporte_logins/obtener_reporte_acciones).
+
+Después se optimizan los índices de búsqueda (ver utils/busqueda.py), se
+corre ANALYZE y, si se archivó algo, VACUUM, para que la base
+viva quede chica y con estadísticas al día para el planificador.
+
+El mantenimiento corre en un hilo de fondo una vez por día (lo inicia
+main.py) y también se puede correr a mano:
+    python -m utils.retencion [--dias 365] [--sin-vacuum]
+"""
+
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from .base_datos import PoolConexiones, obtener_pool
+from .busqueda import optimizar as optimizar_busqueda
+
+PATH_USUARIOS = Path(__file__).resolve().parent.parent / "data" / "usuarios.db"
+
+# Antigüedad a partir de la cual el detalle se archiva
+RETENCION_DIAS = 365
+
+# Horas entre mantenimientos automáticos
+INTERVALO_HORAS = 24
+
+# Segundos que espera el hilo de fondo antes del primer mantenimiento
+DEMORA_INICIAL = 300
+
+DIRECTORIO_ARCHIVO = "archivo"
+
+# Tabla de detalle -> (tabla resumen, columnas que se agrupan)
+RESUMENES = {
+    'auditoria_logins': ('resumen_mensual_logins', ('username', 'exito')),
+    'auditoria_acciones': ('resumen_mensual_acciones', ('usuario', 'tipo', 'accion'))
+}
+
+
+def crear_tablas(conn: sqlite3.Connection) -> None:
+    """Crea las tablas de resúmenes mensuales y el registro de mantenimientos"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS resumen_mensual_logins (
+            mes TEXT NOT NULL,
+            username TEXT NOT NULL,
+            exito INTEGER NOT NULL,
+            cantidad INTEGER NOT NULL,
+            PRIMARY KEY (mes, username, exito)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS resumen_mensual_acciones (
+            mes TEXT NOT NULL,
+            usuario TEXT NOT NULL,
+            tipo TEXT NOT NULL,
+            accion TEXT NOT NULL,
+            cantidad INTEGER NOT NULL,
+            PRIMARY KEY (mes, usuario, tipo, accion)
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS mantenimiento_auditoria (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            fecha_hora TEXT NOT NULL,
+            corte TEXT NOT NULL,
+            logins_archivados INTEGER NOT NULL,
+            acciones_archivadas INTEGER NOT NULL,
+            vacuum INTEGER NOT NULL,
+            duracion_ms REAL NOT NULL
+        )
+    ''')
+
+
+def _pool(db_path: Path) -> PoolConexiones:
+    """Pool de la base de usuarios (las tablas las crea la migración 5 de utils/auth.py)"""
+    # Import diferido: auth importa crear_tablas de este módulo
+    from .auth import MIGRACIONES
+    return obtener_pool(str(db_path), MIGRACIONES)
+
+
+def fecha_corte(dias: int = RETENCION_DIAS, hoy: Optional[date] = None) -> date:
+    """Primer día del mes que contiene hoy - dias: lo anterior se archiva (meses completos)"""
+    limite = (hoy or date.today()) - timedelta(days=dias)
+    return limite.replace(day=1)
+
+
+def ruta_archivo(año: int, db_path: Path = PATH_USUARIOS) -> Path:
+    """Archivo de la auditoría de un año"""
+    return Path(db_path).parent / DIRECTORIO_ARCHIVO / f"auditoria_{año}.db"
+
+
+def años_archivados(db_path: Path = PATH_USUARIOS) -> List[int]:
+    """Años con archivo de auditoría, del más reciente al más antiguo"""
+    directorio = Path(db_path).parent / DIRECTORIO_ARCHIVO
+    años = []
+    for ruta in directorio.glob("auditoria_*.db"):
+        sufijo = ruta.stem.rsplit('_', 1)[-1]
+        if sufijo.isdigit():
+            años.append(int(sufijo))
+    return sorted(años, reverse=True)
+
+
+def _columnas(conn: sqlite3.Connection, tabla: str) -> List[str]:
+    return [fila[1] for fila in conn.execute(f"PRAGMA main.table_info({tabla})")]
+
+
+def _archivar_año(conn: sqlite3.Connection, db_path: Path, tabla: str, año: int, corte: str) -> int:
+    """
+    Mueve el detalle de un año (anterior al corte) a su archivo.
+
+    Primero se copia y confirma en el archivo (INSERT OR IGNORE por id, así
+    que repetirlo tras una caída no duplica); después, en una transacción de
+    la base viva, se suma al resumen mensual y se borra el detalle.
+    """
+    desde, hasta = f"{año}-01-01", min(f"{año + 1}-01-01", corte)
+    ruta = ruta_archivo(año, db_path)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+
+    conn.execute("ATTACH DATABASE ? AS archivo", (str(ruta),))
+    try:
+        # Misma definición que en la base viva (sqlite_master guarda el CREATE)
+        sql = conn.execute(
+            "SELECT sql FROM main.sqlite_master WHERE type = 'table' AND name = ?", (tabla,)
+        ).fetchone()[0]
+        conn.execute(sql.replace(f"CREATE TABLE {tabla}", f"CREATE TABLE IF NOT EXISTS archivo.{tabla}", 1))
+        conn.execute(f"CREATE INDEX IF NOT EXISTS archivo.idx_{tabla}_fecha ON {tabla} (fecha_hora)")
+        columnas = ', '.join(_columnas(conn, tabla))
+
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(f'''
+            INSERT OR IGNORE INTO archivo.{tabla} ({columnas})
+            SELECT {columnas} FROM main.{tabla}
+            WHERE fecha_hora >= ? AND fecha_hora < ?
+        ''', (desde, hasta))
+        conn.execute("COMMIT")
+    finally:
+        conn.execute("DETACH DATABASE archivo")
+
+    resumen, grupo = RESUMENES[tabla]
+    claves = ', '.join(grupo)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute(f'''
+            INSERT INTO {resumen} (mes, {claves}, cantidad)
+            SELECT substr(fecha_hora, 1, 7), {claves}, COUNT(*)
+            FROM {tabla}
+            WHERE fecha_hora >= ? AND fecha_hora < ?
+            GROUP BY 1, {claves}
+            ON CONFLICT DO UPDATE SET cantidad = cantidad + excluded.cantidad
+        ''', (desde, hasta))
+        borrados = conn.execute(
+            f"DELETE FROM {tabla} WHERE fecha_hora >= ? AND fecha_hora < ?", (desde, hasta)
+        ).rowcount
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return borrados
+
+
+def aplicar_retencion(
+    dias: int = RETENCION_DIAS,
+    db_path: Path = PATH_USUARIOS,
+    vacuum: bool = True,
+    hoy: Optional[date] = None
+) -> Dict[str, int]:
+    """
+    Archiva la auditoría anterior al corte y compacta la base viva.
+
+    Args:
+        dias: Antigüedad mínima del detalle que se archiva
+        db_path: Base de usuarios
+        vacuum: Si se archivó algo, correr VACUUM después
+        hoy: Fecha de referencia (por defecto la de hoy)
+
+    Returns:
+        Dict con corte, auditoria_logins y auditoria_acciones (filas archivadas)
+    """
+    inicio = time.perf_counter()
+    corte = fecha_corte(dias, hoy).isoformat()
+    resultado: Dict[str, int] = {}
+
+    # Esquema al día (las tablas de resúmenes son de la migración 5)
+    _pool(db_path)
+    # Conexión propia, en modo autocommit: ATTACH y VACUUM no pueden correr
+    # dentro de una transacción, y el ATTACH no debe quedar en una conexión del pool
+    conn = sqlite3.connect(str(db_path), timeout=30, isolation_level=None)
+    try:
+        for tabla in RESUMENES:
+            primera = conn.execute(f"SELECT min(fecha_hora) FROM {tabla} WHERE fecha_hora < ?", (corte,)).fetchone()[0]
+            archivadas = 0
+            if primera:
+                for año in range(int(primera[:4]), int(corte[:4]) + 1):
+                    archivadas += _archivar_año(conn, Path(db_path), tabla, año, corte)
+            resultado[tabla] = archivadas
+
+        # Los índices de búsqueda acumulan segmentos con cada alta y borrado
+        optimizar_busqueda(conn)
+        compactar = vacuum and any(resultado.values())
+        if compactar:
+            conn.execute("VACUUM")
+        conn.execute("ANALYZE")
+
+        conn.execute('''
+            INSERT INTO mantenimiento_auditoria
+                (fecha_hora, corte, logins_archivados, acciones_archivadas, vacuum, duracion_ms)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (datetime.now().isoformat(timespec='seconds'), corte, resultado['auditoria_logins'],
+              resultado['auditoria_acciones'], int(compactar), round((time.perf_counter() - inicio) * 1000, 1)))
+    finally:
+        conn.close()
+
+    resultado['corte'] = corte
+    return resultado
+
+
+def ultimos_mantenimientos(limit: int = 10, db_path: Path = PATH_USUARIOS) -> List[Dict]:
+    """Mantenimientos registrados, del más reciente al más antiguo"""
+    with _pool(db_path).conexion() as conn:
+        filas = conn.execute('''
+            SELECT fecha_hora, corte, logins_archivados, acciones_archivadas, vacuum, duracion_ms
+            FROM mantenimiento_auditoria
+            ORDER BY id DESC
+            LIMIT ?
+        ''', (limit,)).fetchall()
+    claves = ('fecha_hora', 'corte', 'logins_archivados', 'acciones_archivadas', 'vacuum', 'duracion_ms')
+    return [dict(zip(claves, fila)) for fila in filas]
+
+
+def _toca_mantenimiento(db_path: Path) -> bool:
+    ultimo = ultimos_mantenimientos(1, db_path)
+    if not ultimo:
+        return True
+    return datetime.now() - datetime.fromisoformat(ultimo[0]['fecha_hora']) >= timedelta(hours=INTERVALO_HORAS)
+
+
+_hilo: Optional[threading.Thread] = None
+_hilo_lock = threading.Lock()
+
+
+def iniciar_mantenimiento(dias: int = RETENCION_DIAS, db_path: Path = PATH_USUARIOS) -> threading.Thread:
+    """
+    Inicia el mantenimiento diario en un hilo de fondo (una sola vez por proceso).
+
+    El último mantenimiento queda registrado en la base, así que reiniciar
+    la aplicación no lo repite antes de INTERVALO_HORAS.
+    """
+    global _hilo
+
+    def ciclo() -> None:
+        time.sleep(DEMORA_INICIAL)
+        while True:
+            try:
+                if _toca_mantenimiento(db_path):
+                    resultado = aplicar_retencion(dias, db_path)
+                    print(f"[RETENCION] Corte {resultado['corte']}: "
+                          f"{resultado['auditoria_logins']} logins y "
+                          f"{resultado['auditoria_acciones']} acciones archivados")
+            except sqlite3.Error as e:
+                # Se reintenta en el próximo ciclo
+                print(f"[RETENCION] Error de mantenimiento: {e}")
+            time.sleep(3600)
+
+    with _hilo_lock:
+        if _hilo is None:
+            _hilo = threading.Thread(target=ciclo, name='retencion', daemon=True)
+            _hilo.start()
+        return _hilo
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Retención de la auditoría de usuarios.db")
+    parser.add_argument('--dias', type=int, default=RETENCION_DIAS, help='Antigüedad mínima a archivar')
+    parser.add_argument('--db', default=str(PATH_USUARIOS), help='Base de usuarios')
+    parser.add_argument('--sin-vacuum', action='store_true', help='No compactar la base')
+    args = parser.parse_args(argv)
+
+    resultado = aplicar_retencion(args.dias, Path(args.db), vacuum=not args.sin_vacuum)
+    print(f"Corte: {resultado['corte']}")
+    print(f"Logins archivados: {resultado['auditoria_logins']}")
+    print(f"Acciones archivadas: {resultado['auditoria_acciones']}")
+    tamaño = os.path.getsize(args.db)
+    print(f"Tamaño de la base: {tamaño / 1024:.0f} KB")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
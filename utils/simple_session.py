@@ -1,112 +1,315 @@
 """
 Gestor de sesiones persistentes - Sistema Simple
-Token en URL + Archivo JSON
+Token en URL + tabla sesiones de usuarios.db
+
+El token viaja en la URL (?st=...) y se busca por clave primaria en la
+tabla sesiones, con un caché en memoria de las sesiones ya vistas por este
+proceso. Cada sesión del caché se vuelve a comprobar contra la tabla cada
+VERIFICACION segundos: otro proceso con la misma base (la interfaz y
+motor.servicio) puede haberla cerrado o dado por vencida. El último acceso
+se actualiza en memoria y se escribe en lote cada INTERVALO_ESCRITURA
+segundos; un hilo de fondo borra además las sesiones sin uso por más de
+VIGENCIA.
+
+Las sesiones del antiguo data/sessions.json se importan una sola vez, con
+la migración del esquema (ver utils/auth.py).
 """
 
+import atexit
 import json
-import hashlib
 import os
-from datetime import datetime
+import secrets
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Tuple
 
-class SimpleSessionManager:
-    """Gestiona sesiones usando tokens en URL y archivo JSON"""
-    
-    def __init__(self, session_file="data/sessions.json"):
-        self.session_file = session_file
-        self._ensure_file_exists()
-    
-    def _ensure_file_exists(self):
-        """Crear archivo de sesiones si no existe"""
-        if not os.path.exists(self.session_file):
-            os.makedirs(os.path.dirname(self.session_file), exist_ok=True)
-            self._save_sessions({})
-    
-    def _load_sessions(self):
-        """Cargar sesiones desde archivo"""
+from .base_datos import PoolConexiones, obtener_pool
+
+# Una sesión sin uso por más de este tiempo deja de valer
+VIGENCIA = timedelta(days=7)
+
+# Segundos que se confía en el caché antes de volver a leer la sesión de la
+# base (una sesión cerrada desde otro proceso vale a lo sumo este tiempo)
+VERIFICACION = 5.0
+
+# Bytes aleatorios del token (secrets.token_urlsafe: 43 caracteres)
+BYTES_TOKEN = 32
+
+# Segundos entre escrituras del último acceso y entre purgas de vencidas
+INTERVALO_ESCRITURA = 60.0
+INTERVALO_PURGA = 600.0
+
+# Archivo del gestor anterior, junto a la base
+ARCHIVO_JSON = "sessions.json"
+
+
+def crear_tabla(conn: sqlite3.Connection):
+    """Crea la tabla de sesiones si no existe"""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS sesiones (
+            token TEXT PRIMARY KEY,
+            username TEXT NOT NULL,
+            creada TEXT NOT NULL,
+            ultimo_acceso TEXT NOT NULL
+        ) WITHOUT ROWID
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_sesiones_username ON sesiones (username)')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_sesiones_acceso ON sesiones (ultimo_acceso)')
+
+
+def importar_json(conn: sqlite3.Connection, ruta: Optional[str] = None) -> int:
+    """
+    Importa las sesiones del archivo JSON del gestor anterior.
+
+    El archivo no se modifica; las sesiones ya vencidas se importan igual
+    y las borra la próxima purga.
+
+    Args:
+        conn: Conexión a la base
+        ruta: Archivo JSON (por defecto sessions.json junto a la base)
+
+    Returns:
+        Cantidad de sesiones importadas
+    """
+    if ruta is None:
+        archivo_db = conn.execute('PRAGMA database_list').fetchone()[2]
+        if not archivo_db:
+            return 0
+        ruta = os.path.join(os.path.dirname(archivo_db), ARCHIVO_JSON)
+
+    try:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            sessions = json.load(f)
+    except (OSError, ValueError):
+        return 0
+
+    filas = []
+    for token, data in sessions.items():
         try:
-            with open(self.session_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-    
-    def _save_sessions(self, sessions):
-        """Guardar sesiones en archivo"""
-        with open(self.session_file, 'w', encoding='utf-8') as f:
-            json.dump(sessions, f, indent=2, ensure_ascii=False)
-    
+            filas.append((token, data['username'], data['created'], data.get('last_access', data['created'])))
+        except (KeyError, TypeError):
+            continue
+    cursor = conn.executemany('''
+        INSERT OR IGNORE INTO sesiones (token, username, creada, ultimo_acceso)
+        VALUES (?, ?, ?, ?)
+    ''', filas)
+    return cursor.rowcount
+
+
+class AlmacenSesiones:
+    """Sesiones de una base, con caché en memoria y escritura diferida del último acceso"""
+
+    def __init__(self, pool: PoolConexiones):
+        self.pool = pool
+        # token -> (username, último acceso, time.monotonic() de la última lectura de la base)
+        self._cache: Dict[str, Tuple[str, datetime, float]] = {}
+        # token -> último acceso aún no escrito
+        self._pendientes: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._escritura = threading.Lock()
+        self._detener = threading.Event()
+        self._hilo: Optional[threading.Thread] = None
+
+    def crear(self, username: str) -> str:
+        """Crea una sesión y retorna su token (ver BYTES_TOKEN)"""
+        token = secrets.token_urlsafe(BYTES_TOKEN)
+        ahora = datetime.now()
+        with self.pool.conexion() as conn:
+            conn.execute('''
+                INSERT INTO sesiones (token, username, creada, ultimo_acceso)
+                VALUES (?, ?, ?, ?)
+            ''', (token, username, ahora.isoformat(), ahora.isoformat()))
+        with self._lock:
+            self._cache[token] = (username, ahora, time.monotonic())
+        return token
+
+    def obtener(self, token: str) -> Optional[str]:
+        """Username de una sesión vigente (y registra el acceso), o None"""
+        ahora = datetime.now()
+        reloj = time.monotonic()
+        with self._lock:
+            sesion = self._cache.get(token)
+
+        if sesion is None or reloj - sesion[2] > VERIFICACION:
+            with self.pool.conexion() as conn:
+                fila = conn.execute(
+                    'SELECT username, ultimo_acceso FROM sesiones WHERE token = ?', (token,)
+                ).fetchone()
+            if fila is None:
+                # Cerrada (o purgada) desde otro proceso
+                with self._lock:
+                    self._cache.pop(token, None)
+                    self._pendientes.pop(token, None)
+                return None
+            acceso = datetime.fromisoformat(fila[1])
+            # Los accesos de este proceso pueden no estar escritos todavía
+            if sesion is not None and sesion[0] == fila[0]:
+                acceso = max(acceso, sesion[1])
+            sesion = (fila[0], acceso, reloj)
+
+        if ahora - sesion[1] > VIGENCIA:
+            self.eliminar(token)
+            return None
+
+        with self._lock:
+            self._cache[token] = (sesion[0], ahora, sesion[2])
+            self._pendientes[token] = ahora.isoformat()
+        return sesion[0]
+
+    def eliminar(self, token: str):
+        """Elimina una sesión"""
+        with self._lock:
+            self._cache.pop(token, None)
+            self._pendientes.pop(token, None)
+        with self.pool.conexion() as conn:
+            conn.execute('DELETE FROM sesiones WHERE token = ?', (token,))
+
+    def eliminar_de_usuario(self, username: str):
+        """Elimina todas las sesiones de un usuario"""
+        with self._lock:
+            for token in [t for t, s in self._cache.items() if s[0] == username]:
+                self._cache.pop(token)
+                self._pendientes.pop(token, None)
+        with self.pool.conexion() as conn:
+            conn.execute('DELETE FROM sesiones WHERE username = ?', (username,))
+
+    def vaciar(self) -> int:
+        """
+        Escribe los últimos accesos pendientes.
+
+        Returns:
+            Cantidad de sesiones actualizadas
+        """
+        with self._escritura:
+            with self._lock:
+                pendientes, self._pendientes = self._pendientes, {}
+            if not pendientes:
+                return 0
+            try:
+                with self.pool.conexion() as conn:
+                    conn.executemany(
+                        'UPDATE sesiones SET ultimo_acceso = ? WHERE token = ?',
+                        [(acceso, token) for token, acceso in pendientes.items()]
+                    )
+            except sqlite3.Error as e:
+                # Se reintenta en la próxima escritura (salvo accesos más nuevos)
+                with self._lock:
+                    for token, acceso in pendientes.items():
+                        self._pendientes.setdefault(token, acceso)
+                print(f"[SESIONES] No se pudieron guardar {len(pendientes)} accesos: {e}")
+                return 0
+            return len(pendientes)
+
+    def purgar(self) -> int:
+        """
+        Borra las sesiones sin uso por más de VIGENCIA.
+
+        Returns:
+            Cantidad de sesiones borradas
+        """
+        # Primero los accesos en memoria, para no borrar sesiones en uso
+        self.vaciar()
+        limite = datetime.now() - VIGENCIA
+        with self.pool.conexion() as conn:
+            cursor = conn.execute('DELETE FROM sesiones WHERE ultimo_acceso < ?', (limite.isoformat(),))
+        with self._lock:
+            for token in [t for t, s in self._cache.items() if s[1] < limite]:
+                self._cache.pop(token)
+        return cursor.rowcount
+
+    def iniciar(self):
+        """Inicia el hilo que escribe los accesos y purga las vencidas (una vez)"""
+        if self._hilo is not None:
+            return
+        self._hilo = threading.Thread(target=self._ciclo, name='sesiones', daemon=True)
+        self._hilo.start()
+        atexit.register(self.detener)
+
+    def detener(self):
+        """Detiene el hilo de fondo y escribe lo pendiente"""
+        self._detener.set()
+        self.vaciar()
+
+    def _ciclo(self):
+        proxima_purga = 0.0
+        while True:
+            try:
+                if time.monotonic() >= proxima_purga:
+                    self.purgar()
+                    proxima_purga = time.monotonic() + INTERVALO_PURGA
+                else:
+                    self.vaciar()
+            except sqlite3.Error as e:
+                print(f"[SESIONES] Error de mantenimiento: {e}")
+            if self._detener.wait(INTERVALO_ESCRITURA):
+                return
+
+
+_almacenes: Dict[str, AlmacenSesiones] = {}
+_almacenes_lock = threading.Lock()
+
+
+def obtener_almacen(db_path: str = "data/usuarios.db") -> AlmacenSesiones:
+    """Almacén de sesiones del proceso para una base (con su hilo de mantenimiento)"""
+    # Import diferido: auth importa crear_tabla de este módulo
+    from .auth import MIGRACIONES
+
+    pool = obtener_pool(db_path, MIGRACIONES)
+    with _almacenes_lock:
+        almacen = _almacenes.get(pool.db_path)
+        if almacen is None:
+            almacen = AlmacenSesiones(pool)
+            almacen.iniciar()
+            _almacenes[pool.db_path] = almacen
+        return almacen
+
+
+class SimpleSessionManager:
+    """Gestiona sesiones usando tokens en URL y la tabla sesiones"""
+
+    def __init__(self, db_path="data/usuarios.db"):
+        self.almacen = obtener_almacen(db_path)
+
     def create_session(self, username):
         """
         Crea una nueva sesión y retorna el token
-        
+
         Args:
             username: Nombre de usuario
-            
+
         Returns:
-            token: Token único de 16 caracteres
+            token: Token único (ver BYTES_TOKEN)
         """
-        sessions = self._load_sessions()
-        
-        # Generar token único y corto
-        timestamp = datetime.now().isoformat()
-        token = hashlib.sha256(f"{username}{timestamp}".encode()).hexdigest()[:16]
-        
-        # Guardar sesión
-        sessions[token] = {
-            'username': username,
-            'created': timestamp,
-            'last_access': timestamp
-        }
-        
-        self._save_sessions(sessions)
-        return token
-    
+        return self.almacen.crear(username)
+
     def get_session(self, token):
         """
         Obtiene datos de sesión por token
-        
+
         Args:
             token: Token de sesión
-            
+
         Returns:
-            username o None si no existe
+            username o None si no existe o venció
         """
-        sessions = self._load_sessions()
-        
-        if token in sessions:
-            # Actualizar último acceso
-            sessions[token]['last_access'] = datetime.now().isoformat()
-            self._save_sessions(sessions)
-            
-            return sessions[token]['username']
-        
-        return None
-    
+        return self.almacen.obtener(token)
+
     def delete_session(self, token):
         """
         Elimina una sesión
-        
+
         Args:
             token: Token de sesión a eliminar
         """
-        sessions = self._load_sessions()
-        
-        if token in sessions:
-            del sessions[token]
-            self._save_sessions(sessions)
-    
+        self.almacen.eliminar(token)
+
     def delete_user_sessions(self, username):
         """
         Elimina todas las sesiones de un usuario
-        
+
         Args:
             username: Nombre de usuario
         """
-        sessions = self._load_sessions()
-        
-        # Filtrar sesiones que no sean del usuario
-        sessions = {
-            token: data for token, data in sessions.items()
-            if data['username'] != username
-        }
-        
-        self._save_sessions(sessions)
+        self.almacen.eliminar_de_usuario(username)
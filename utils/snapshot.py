@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Snapshot binario de los datasets normalizados
+Compila los cinco CSV de data/ a un único archivo versionado que se lee con mmap
+
+Formato del archivo:
+    MAGIA (8 bytes) | largo del encabezado (uint64) | encabezado JSON | arreglos
+
+El encabezado describe los hashes SHA-256 de los CSV de origen, las tablas
+tipadas (columnas numéricas y de fecha como arreglos, columnas de texto en
+el propio JSON) y los arreglos precalculados de cada índice. Cada arreglo
+empieza alineado a 64 bytes y se expone con np.frombuffer sobre el mmap, de
+modo que varios procesos del servidor comparten la misma copia física.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from .indices import (
+    DATA_DIR,
+    DATASETS,
+    leer_tabla,
+    IndiceTasa,
+    IndiceRipte,
+    IndiceIPC,
+    IndiceVigencias,
+    PRECEDENCIA_VIGENCIAS,
+    ordenar_vigencias,
+    prioridad_vigencias
+)
+from .metricas import medido
+from .registro import REGISTRO, _version_archivo
+from .publicacion import leer_bytes
+
+SNAPSHOT_DIR = DATA_DIR / 'snapshot'
+
+MAGIA = b'TT2QSNAP'
+FORMATO_VERSION = 3
+ALINEACION = 64
+
+# Columnas de fecha de inicio/fin de los datasets de vigencias
+COLUMNAS_VIGENCIA = {
+    'jus': ('FECHA ENTRADA EN VIGENCIA', 'FECHA DE FINALIZACION'),
+    'pisos': ('desde', 'hasta')
+}
+
+
+# ============================================================================
+# HASHES DE LOS CSV DE ORIGEN
+# ============================================================================
+
+_hashes_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def hash_archivo(ruta: Path) -> str:
+    """
+    SHA-256 de un archivo, memorizado por versión (mtime, tamaño).
+
+    Args:
+        ruta: Archivo a hashear
+
+    Returns:
+        str: Hash hexadecimal
+    """
+    version = _version_archivo(ruta)
+    guardado = _hashes_cache.get(str(ruta))
+    if guardado and guardado[0] == version:
+        return guardado[1]
+
+    sha = hashlib.sha256()
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 16), b''):
+            sha.update(bloque)
+    digest = sha.hexdigest()
+    _hashes_cache[str(ruta)] = (version, digest)
+    return digest
+
+
+def clave_fuentes() -> Tuple[str, Dict[str, str]]:
+    """
+    Clave del snapshot correspondiente a los CSV actuales.
+
+    Returns:
+        (clave, {dataset: hash del CSV})
+
+    Raises:
+        FileNotFoundError: Si falta alguno de los CSV
+    """
+    hashes = {nombre: hash_archivo(ruta) for nombre, ruta in DATASETS.items()}
+    return _clave_de_hashes(hashes), hashes
+
+
+def _clave_de_hashes(hashes: Dict[str, str]) -> str:
+    """Clave del snapshot a partir del hash de cada CSV"""
+    sha = hashlib.sha256(f"formato={FORMATO_VERSION}".encode())
+    for nombre in sorted(hashes):
+        sha.update(f"|{nombre}={hashes[nombre]}".encode())
+    return sha.hexdigest()
+
+
+def ruta_snapshot(clave: str) -> Path:
+    """Ruta del archivo de snapshot para una clave"""
+    return SNAPSHOT_DIR / f"datasets_{clave[:16]}.bin"
+
+
+# ============================================================================
+# COMPILACIÓN
+# ============================================================================
+
+class _Escritor:
+    """Acumula arreglos alineados y su descripción para el encabezado"""
+
+    def __init__(self):
+        self.arreglos: Dict[str, Dict[str, Any]] = {}
+        self.datos: List[Tuple[int, bytes]] = []
+        self.offset = 0
+
+    def agregar(self, nombre: str, arreglo: np.ndarray) -> str:
+        arreglo = np.ascontiguousarray(arreglo)
+        self.offset = -(-self.offset // ALINEACION) * ALINEACION
+        self.arreglos[nombre] = {
+            'dtype': arreglo.dtype.str,
+            'offset': self.offset,
+            'largo': int(arreglo.shape[0])
+        }
+        self.datos.append((self.offset, arreglo.tobytes()))
+        self.offset += arreglo.nbytes
+        return nombre
+
+
+def _describir_tabla(escritor: _Escritor, nombre: str, df: 'pd.DataFrame') -> Dict[str, Any]:
+    """Guarda las columnas de una tabla: numéricas y fechas como arreglos, el resto como texto"""
+    import pandas as pd
+    columnas = []
+    for col in df.columns:
+        serie = df[col]
+        clave = f"tabla.{nombre}.{col}"
+        if pd.api.types.is_datetime64_any_dtype(serie):
+            valores = serie.to_numpy()
+            unidad = np.datetime_data(valores.dtype)[0]
+            columnas.append({
+                'nombre': col,
+                'tipo': 'fecha',
+                'unidad': unidad,
+                'arreglo': escritor.agregar(clave, valores.view(np.int64))
+            })
+        elif pd.api.types.is_bool_dtype(serie) or not pd.api.types.is_numeric_dtype(serie):
+            textos = [None if pd.isna(v) else str(v) for v in serie.tolist()]
+            columnas.append({'nombre': col, 'tipo': 'texto', 'valores': textos})
+        else:
+            columnas.append({'nombre': col, 'tipo': 'numero', 'arreglo': escritor.agregar(clave, serie.to_numpy())})
+    return {'filas': int(len(df)), 'columnas': columnas}
+
+
+def compilar_snapshot(destino: Optional[Path] = None) -> Path:
+    """
+    Compila los CSV de data/ a un snapshot binario.
+
+    Lee cada CSV una sola vez, arma su tabla tipada y los índices
+    (tasa activa, RIPTE, IPC, JUS y pisos) con sus arreglos precalculados.
+    La clave se calcula sobre los mismos bytes que se compilan, así que un
+    CSV publicado durante la compilación no puede mezclarse con otra versión.
+    La escritura es atómica: se escribe a un temporal y se renombra.
+
+    Args:
+        destino: Ruta del archivo (por defecto data/snapshot/datasets_<clave>.bin)
+
+    Returns:
+        Path del snapshot compilado
+    """
+    contenidos = {nombre: leer_bytes(ruta) for nombre, ruta in DATASETS.items()}
+    hashes = {nombre: hashlib.sha256(datos).hexdigest() for nombre, datos in contenidos.items()}
+    clave = _clave_de_hashes(hashes)
+    destino = Path(destino) if destino else ruta_snapshot(clave)
+
+    escritor = _Escritor()
+    tablas: Dict[str, Any] = {}
+    indices: Dict[str, Any] = {}
+
+    for nombre, ruta in DATASETS.items():
+        tabla = leer_tabla(nombre, ruta, contenidos[nombre])
+        tablas[nombre] = _describir_tabla(escritor, nombre, tabla)
+
+        if nombre == 'tasa':
+            for completar in (False, True):
+                indice = IndiceTasa.desde_dataframe(tabla, completar_hasta=completar)
+                prefijo = f"indice.tasa.{int(completar)}"
+                indices[f"tasa:{completar}"] = {
+                    'ordinal_base': indice.ordinal_base,
+                    'diario': escritor.agregar(f"{prefijo}.diario", indice.diario),
+                    'prefijo': escritor.agregar(f"{prefijo}.prefijo", indice.prefijo)
+                }
+        elif nombre == 'ripte':
+            indice = IndiceRipte.desde_dataframe(tabla)
+            indices['ripte'] = {
+                'clave_base': indice.clave_base,
+                'valores': escritor.agregar('indice.ripte.valores', indice.valores),
+                'ultimo': escritor.agregar('indice.ripte.ultimo', indice.ultimo)
+            }
+        elif nombre == 'ipc':
+            indice = IndiceIPC.desde_dataframe(tabla)
+            indices['ipc'] = {
+                'clave_base': indice.clave_base,
+                'variaciones': escritor.agregar('indice.ipc.variaciones', indice.variaciones),
+                'prefijo': escritor.agregar('indice.ipc.prefijo', indice.prefijo),
+                'prefijo_faltantes': escritor.agregar('indice.ipc.prefijo_faltantes', indice.prefijo_faltantes)
+            }
+        else:
+            col_desde, col_hasta = COLUMNAS_VIGENCIA[nombre]
+            orden, desde, hasta = ordenar_vigencias(tabla, col_desde, col_hasta)
+            prioridad = prioridad_vigencias(orden, desde, hasta, PRECEDENCIA_VIGENCIAS[nombre])
+            indice = IndiceVigencias(desde, hasta, [], prioridad=prioridad)
+            indices[nombre] = {
+                'orden': escritor.agregar(f"indice.{nombre}.orden", orden.astype(np.int64)),
+                'desde': escritor.agregar(f"indice.{nombre}.desde", desde),
+                'hasta': escritor.agregar(f"indice.{nombre}.hasta", hasta),
+                'max_hasta': escritor.agregar(f"indice.{nombre}.max_hasta", indice.max_hasta),
+                'prioridad': escritor.agregar(f"indice.{nombre}.prioridad", indice.prioridad)
+            }
+
+    encabezado = json.dumps({
+        'formato': FORMATO_VERSION,
+        'clave': clave,
+        'fuentes': hashes,
+        'creado': datetime.now().isoformat(timespec='seconds'),
+        'arreglos': escritor.arreglos,
+        'tablas': tablas,
+        'indices': indices
+    }).encode('utf-8')
+
+    # Los offsets de los arreglos son relativos al inicio de la zona de datos
+    inicio_datos = len(MAGIA) + 8 + len(encabezado)
+    inicio_datos = -(-inicio_datos // ALINEACION) * ALINEACION
+
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    temporal = destino.with_name(f".{destino.name}.{os.getpid()}.tmp")
+    try:
+        with open(temporal, 'wb') as f:
+            f.write(MAGIA)
+            f.write(struct.pack('<Q', len(encabezado)))
+            f.write(encabezado)
+            f.write(b'\0' * (inicio_datos - f.tell()))
+            for offset, datos in escritor.datos:
+                f.write(b'\0' * (inicio_datos + offset - f.tell()))
+                f.write(datos)
+            f.flush()
+            os.fsync(f.fileno())
+
+        try:
+            os.replace(temporal, destino)
+        except PermissionError:
+            # En Windows no se puede reemplazar un archivo mapeado: si ya existe, es el mismo contenido
+            if not destino.exists():
+                raise
+    finally:
+        # Si la escritura falló no queda un temporal a medias
+        temporal.unlink(missing_ok=True)
+    return destino
+
+
+# ============================================================================
+# LECTURA
+# ============================================================================
+
+class Snapshot:
+    """Snapshot abierto con mmap: tablas e índices sin volver a leer los CSV"""
+
+    def __init__(self, ruta: Path):
+        """
+        Args:
+            ruta: Archivo de snapshot compilado
+
+        Raises:
+            ValueError: Si el archivo no es un snapshot válido de esta versión
+        """
+        self.ruta = Path(ruta)
+        with open(self.ruta, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[:len(MAGIA)] != MAGIA:
+            raise ValueError(f"{self.ruta.name} no es un snapshot de datasets")
+        (largo,) = struct.unpack_from('<Q', self._mmap, len(MAGIA))
+        inicio = len(MAGIA) + 8
+        self.encabezado = json.loads(self._mmap[inicio:inicio + largo].decode('utf-8'))
+        if self.encabezado.get('formato') != FORMATO_VERSION:
+            raise ValueError(f"Versión de snapshot no soportada: {self.encabezado.get('formato')}")
+
+        self._inicio_datos = -(-(inicio + largo) // ALINEACION) * ALINEACION
+        self._tablas: Dict[str, 'pd.DataFrame'] = {}
+        self._indices: Dict[str, object] = {}
+
+    @property
+    def clave(self) -> str:
+        """Clave (hash combinado de los CSV) con la que se compiló"""
+        return self.encabezado['clave']
+
+    def arreglo(self, nombre: str) -> np.ndarray:
+        """
+        Arreglo de solo lectura apoyado directamente sobre el mmap.
+
+        Args:
+            nombre: Nombre del arreglo en el encabezado
+
+        Returns:
+            np.ndarray sin copia
+        """
+        info = self.encabezado['arreglos'][nombre]
+        return np.frombuffer(
+            self._mmap,
+            dtype=np.dtype(info['dtype']),
+            count=info['largo'],
+            offset=self._inicio_datos + info['offset']
+        )
+
+    def tabla(self, nombre: str) -> 'pd.DataFrame':
+        """
+        Tabla tipada de un dataset, en el orden del CSV (más reciente arriba).
+
+        Las columnas numéricas y de fecha se apoyan sobre el mmap; la copia
+        devuelta es superficial, así que modificarla no altera el snapshot.
+
+        Args:
+            nombre: ripte, tasa, ipc, jus o pisos
+
+        Returns:
+            pd.DataFrame
+        """
+        if nombre not in self._tablas:
+            # Import diferido: las consultas del motor usan los índices, no las tablas
+            import pandas as pd
+            info = self.encabezado['tablas'][nombre]
+            columnas = {}
+            for col in info['columnas']:
+                if col['tipo'] == 'texto':
+                    columnas[col['nombre']] = pd.Series(col['valores'], dtype=object)
+                elif col['tipo'] == 'fecha':
+                    columnas[col['nombre']] = self.arreglo(col['arreglo']).view(f"datetime64[{col['unidad']}]")
+                else:
+                    columnas[col['nombre']] = self.arreglo(col['arreglo'])
+            self._tablas[nombre] = pd.DataFrame(columnas, copy=False)
+        return self._tablas[nombre].copy(deep=False)
+
+    def indice(self, tipo: str, variante=None):
+        """
+        Índice precalculado de un dataset.
+
+        Args:
+            tipo: tasa, ripte, ipc, jus o pisos
+            variante: Para tasa, el valor de completar_hasta
+
+        Returns:
+            IndiceTasa, IndiceRipte, IndiceIPC o IndiceVigencias
+        """
+        clave = f"{tipo}:{bool(variante)}" if tipo == 'tasa' else tipo
+        if clave in self._indices:
+            return self._indices[clave]
+
+        info = self.encabezado['indices'][clave]
+        if tipo == 'tasa':
+            indice = IndiceTasa(info['ordinal_base'], self.arreglo(info['diario']), self.arreglo(info['prefijo']))
+        elif tipo == 'ripte':
+            indice = IndiceRipte(info['clave_base'], self.arreglo(info['valores']), self.arreglo(info['ultimo']))
+        elif tipo == 'ipc':
+            indice = IndiceIPC(
+                info['clave_base'],
+                self.arreglo(info['variaciones']),
+                self.arreglo(info['prefijo']),
+                self.arreglo(info['prefijo_faltantes'])
+            )
+        else:
+            orden = self.arreglo(info['orden'])
+            registros = self.tabla(tipo).iloc[orden].to_dict('records')
+            indice = IndiceVigencias(
+                self.arreglo(info['desde']),
+                self.arreglo(info['hasta']),
+                registros,
+                self.arreglo(info['max_hasta']),
+                self.arreglo(info['prioridad'])
+            )
+        self._indices[clave] = indice
+        return indice
+
+
+# ============================================================================
+# ACCESO CACHEADO
+# ============================================================================
+
+_snapshot_actual: Optional[Snapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def _limpiar_snapshots_viejos(vigente: Path):
+    """Borra snapshots de versiones anteriores (los que sigan mapeados se ignoran)"""
+    for ruta in SNAPSHOT_DIR.glob('datasets_*.bin'):
+        if ruta != vigente:
+            try:
+                ruta.unlink()
+            except OSError:
+                pass
+
+
+@medido('datasets')
+def obtener_snapshot() -> Optional[Snapshot]:
+    """
+    Devuelve el snapshot de los CSV actuales, compilándolo si hace falta.
+
+    Cada llamada solo hace un stat de los CSV: los hashes se recalculan
+    cuando cambia la versión de algún archivo, y en ese caso se compila
+    un snapshot nuevo.
+
+    Returns:
+        Snapshot, o None si no se pudo compilar/abrir (se usa el CSV directo)
+    """
+    global _snapshot_actual
+
+    with _snapshot_lock:
+        try:
+            clave, _ = clave_fuentes()
+            if _snapshot_actual is not None and _snapshot_actual.clave == clave:
+                return _snapshot_actual
+
+            ruta = ruta_snapshot(clave)
+            if not ruta.exists():
+                compilar_snapshot(ruta)
+                _limpiar_snapshots_viejos(ruta)
+
+            snapshot = Snapshot(ruta)
+            if snapshot.clave != clave:
+                raise ValueError(f"{ruta.name} no corresponde a los CSV actuales")
+
+            _snapshot_actual = snapshot
+            return snapshot
+        except Exception as e:
+            print(f"[SNAPSHOT] No se pudo usar el snapshot binario: {type(e).__name__}: {e}")
+            return None
+
+
+def obtener_tabla(nombre: str) -> 'pd.DataFrame':
+    """
+    Tabla tipada de un dataset, leída del snapshot (o del CSV si no está disponible).
+
+    La tabla se registra una vez por versión del CSV y la comparten todas
+    las sesiones; se devuelve una copia superficial, así que modificarla no
+    altera la tabla registrada.
+
+    Args:
+        nombre: ripte, tasa, ipc, jus o pisos
+
+    Returns:
+        pd.DataFrame en el orden del CSV (más reciente arriba)
+    """
+    import pandas as pd
+    ruta = DATASETS[nombre]
+    if not ruta.exists():
+        return pd.DataFrame()
+
+    def construir(r: Path) -> 'pd.DataFrame':
+        snapshot = obtener_snapshot()
+        if snapshot is not None:
+            return snapshot.tabla(nombre)
+        return leer_tabla(nombre, r)
+
+    return REGISTRO.obtener(f"tabla:{nombre}", ruta, None, construir).copy(deep=False)
+
+
+# Compilación manual: python -m utils.snapshot
+if __name__ == '__main__':
+    ruta = compilar_snapshot()
+    snapshot = Snapshot(ruta)
+    print("=" * 80)
+    print("SNAPSHOT DE DATASETS")
+    print("=" * 80)
+    print(f"Archivo: {ruta}")
+    print(f"Tamaño: {ruta.stat().st_size / 1024:.1f} KB")
+    print(f"Clave: {snapshot.clave}")
+    for nombre, digest in snapshot.encabezado['fuentes'].items():
+        filas = snapshot.encabezado['tablas'][nombre]['filas']
+        print(f"   {nombre.upper()}: {filas} filas - sha256 {digest[:16]}")